@@ -13,11 +13,28 @@ Valid types: "FIX", "engine"
 
 Don't send BeginString or BodyLength.
 
+Commands are sent framed, see util/apiproto.py. "FIX" commands go out as the
+pre-encoded FIX fields, either a list of fields or their concatenation; a
+concatenation is passed on as is, so it must not hold MsgSeqNum,
+SenderCompID, TargetCompID or SendingTime either. Pass legacy=True to send
+the old unframed dict format instead.
+
+One engine runs many FIX sessions. Pass session='SenderCompID-TargetCompID'
+to address one; messages from the engine name theirs in their own CompIDs.
+
+The "engine" command {'command': 'stats'} returns the counters and latency
+percentiles of every session (or of kwargs 'session'), as a FIX message of
+MsgType apiproto.REPLY_MSGTYPE; read it with apiproto.decode_reply.
+{'command': 'recorder'} logs the sessions' flight recorders on the engine and
+returns their records, oldest first, as (direction, time_ns, processing_ns,
+length, frame) tuples.
+
 
 """
 import socket
 
 from .. import SOCKET_args, CONNECTION_args
+from ..util import apiproto
 
 def init_client():
     #socket.setdefaulttimeout(0)
@@ -30,7 +47,12 @@ def init_client():
     
     return sock
 
-def build_command(command, data):
+def build_command(command, data, legacy=False, session=None):
+    # 'session' is the session ID, 'SenderCompID-TargetCompID', of the FIX
+    # session the command is for; by default the last one connected
+    if not legacy:
+        return apiproto.encode_command(command, data, session)
+    
     msg_dict = {}
     msg_dict['type'] = command
     msg_dict['kwargs'] = data
@@ -41,13 +63,19 @@ def build_command(command, data):
     return msg
     
 
-def command(socket, command, data):
-    cmd = build_command(command, data)
+def command(socket, command, data, legacy=False, session=None):
+    cmd = build_command(command, data, legacy, session)
     
+    # The client socket is non-blocking for reads; a frame is sent whole,
+    # or the engine would see it cut short
+    timeout = socket.gettimeout()
     try:
-        socket.send(cmd)
+        socket.settimeout(None)
+        socket.sendall(cmd)
         
         return True
     except:
         return False
+    finally:
+        socket.settimeout(timeout)
 
@@ -4,22 +4,42 @@ This is the FIX engine.
 The engine handles communication between an exchange and a local process. The
 communicates to local processes via a socket server.
 
+    python engine.py [--workers N]
+
+With --workers, the FIX sessions are spread over N worker processes, each with
+its own event loop, and this process only routes API commands to them; see
+server/supervisor.py.
+
 """
 from __init__ import API_address, API_port
 
 import os
 import ssl
+import argparse
 import asyncio
 import logging
 import logging.handlers
 
 from server.FIXclient import FIXclient
 from server.APIserver import APIserver
+from server.router import APIrouter
+from server.supervisor import Supervisor
+from util import logs
 """
 from FIXclient import FIXclient
 from APIserver import APIserver
 """
 
+#------------------------------------------------------------------------------
+
+parser = argparse.ArgumentParser(description='FIX engine')
+parser.add_argument('--workers', type=int, default=0,
+        help='worker processes to host the FIX sessions, 0 to host them here')
+parser.add_argument('--log-level', default='DEBUG',
+        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+        help='lowest level logged')
+args = parser.parse_args()
+
 #------------------------------------------------------------------------------
 # Set up logging
 
@@ -28,9 +48,6 @@ if not os.path.exists('./logs/'):
 
 LOG_FILENAME = './logs/FIX_Engine.log'
 
-logger = logging.getLogger()
-logger.setLevel(logging.DEBUG)
-
 file_handler = logging.handlers.RotatingFileHandler(LOG_FILENAME,
                                                maxBytes=1048576,
                                                backupCount=9,
@@ -43,23 +60,37 @@ formatter = logging.Formatter(
         )
 file_handler.setFormatter(formatter)
 
-logger.addHandler(file_handler)
-logger.addHandler(console)
+# The handlers run in a background thread, fed by a queue
+log_listener = logs.start([file_handler, console],
+        level=getattr(logging, args.log_level),
+        processes=bool(args.workers),
+        )
+
+logger = logging.getLogger()
 
 #------------------------------------------------------------------------------
 # Start your engines
 
 loop = asyncio.get_event_loop()
 
+if args.workers:
+    supervisor = Supervisor(args.workers)
+    supervisor.start()
+    loop.run_until_complete(supervisor.wait_ready())
+    protocol_factory = lambda: APIrouter(supervisor)
+else:
+    supervisor = None
+    protocol_factory = APIserver
+
 api_server_coro = loop.create_server(
-        APIserver,
+        protocol_factory,
         API_address,
         API_port,
         )
 
 server = loop.run_until_complete(api_server_coro)
 
-logger.info('Serving API on {}'.format(server.sockets[0].getsockname()))
+logger.info('Serving API on %s', server.sockets[0].getsockname())
 
 try:
     loop.run_forever()
@@ -70,5 +101,8 @@ except Exception as e:
     logger.exception()
 finally:
     server.close()
+    if supervisor is not None:
+        supervisor.stop()
     loop.close()
-    logger.info("Exiting\n\n")
\ No newline at end of file
+    logger.info("Exiting\n\n")
+    log_listener.stop()
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""
+Replay recorded FIX traffic through the engine.
+
+    python replay.py SOURCE [--speed X] [--workers N] [--api]
+
+SOURCE is a session's wire journal directory (e.g. ./wirelog/SENDER-TARGET)
+or a capture file of FIX messages. By default the frames are replayed as fast
+as possible; --speed 1 paces them to the recorded times. With --api the
+replayed session is served to an API client on the engine's API port, as if
+it were live: connect and FIX_connect (or FIX_attach) to it to start. With
+--workers the source's segments are replayed in a process pool instead, for
+throughput runs. See server/replay.py.
+"""
+from __init__ import API_address, API_port
+
+import argparse
+import asyncio
+import logging
+
+from server.APIserver import APIserver
+from server import replay
+from util import logs
+
+#------------------------------------------------------------------------------
+
+parser = argparse.ArgumentParser(description='FIX replay')
+parser.add_argument('source', help='wire journal directory or capture file')
+parser.add_argument('--speed', type=float, default=0.0,
+        help='1.0 for the recorded pace, 2.0 for twice as fast, 0 for as '
+        'fast as possible')
+parser.add_argument('--workers', type=int, default=0,
+        help='replay segments in a pool of N processes')
+parser.add_argument('--api', action='store_true',
+        help='serve the replayed session to an API client')
+parser.add_argument('--log-level', default='WARNING',
+        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+        help='lowest level logged')
+args = parser.parse_args()
+
+if args.workers and args.api:
+    parser.error('--api replays in one process, without --workers')
+
+#------------------------------------------------------------------------------
+
+log_listener = logs.start([logging.StreamHandler()],
+        level=getattr(logging, args.log_level),
+        processes=bool(args.workers),
+        )
+
+logger = logging.getLogger()
+
+#------------------------------------------------------------------------------
+
+if args.workers:
+    stats = replay.replay_pool(args.source, args.workers, args.speed)
+else:
+    loop = asyncio.get_event_loop()
+    server = None
+    if args.api:
+        server = loop.run_until_complete(
+                loop.create_server(APIserver, API_address, API_port))
+        print('Serving API on {}'.format(server.sockets[0].getsockname()))
+    try:
+        stats = loop.run_until_complete(replay.replay(args.source, args.speed,
+                api_server=server))
+    except KeyboardInterrupt:
+        stats = None
+    finally:
+        if server is not None:
+            server.close()
+        loop.close()
+
+if stats:
+    rate = stats['frames'] / stats['elapsed'] if stats['elapsed'] else 0.0
+    print('{frames} frames in {elapsed:.3f}s, {rate:.0f}/s; {api_messages} '
+            'to the API, {api_dropped} dropped, {written} bytes '
+            'written'.format(rate=rate, **stats))
+
+log_listener.stop()
+
+#------------------------------------------------------------------------------
@@ -1,22 +1,34 @@
 import __init__
 
-import ast
 import asyncio
 import logging
 import time
 import ssl
 
-from .FIXclient import FIXclient
+from util import apiproto
+from util.journal import OutboundJournal, DIRECTORY as JOURNAL_DIRECTORY
+from util.seqstore import SequenceStore
+from util.wirelog import (WireJournal, DIRECTORY as WIRELOG_DIRECTORY,
+        SEGMENT_SIZE as WIRELOG_SEGMENT_SIZE)
+from util.book import BookBuilder, DEPTH as BOOK_DEPTH
+from util import ratelimit
+from util import logs
+from util.metrics import monotonic_ns
+from util.recorder import (FlightRecorder, SLOTS as RECORDER_SLOTS,
+        SLOT_SIZE as RECORDER_SLOT_SIZE)
+
+from .FIXclient import FIXclient, MAX_BATCH, MAX_DELAY, OVERFLOW_PAUSE
+from .flow import FlowControl, WatermarkQueue, HIGH_WATER, LOW_WATER
+from . import sessions
 #import test
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
 #------------------------------------------------------------------------------
 
-class APIserver(asyncio.Protocol):
+class APIserver(FlowControl, asyncio.Protocol):
     
-    def __init__(self, FIX_handler=None, engine_handler=None):
+    def __init__(self, FIX_handler=None, engine_handler=None, registry=None):
         super().__init__()
         
         self.loop = asyncio.get_event_loop()
@@ -24,18 +36,37 @@ class APIserver(asyncio.Protocol):
         self.connected = False
         self.transport = None
         
-        self.FIX_transport = None
-        self.FIX_protocol = None
+        # FIX sessions live in the engine wide registry; this connection keeps
+        # the ones attached to it, by session ID, and a default for commands
+        # that don't name one
+        self.registry = sessions.registry if registry is None else registry
+        self.sessions = {}
+        self.session = None
         
-        self._in_queue = asyncio.Queue()
-        self._out_queue = asyncio.Queue()
+        # Commands stop being read while they queue up faster than they are
+        # handled. Once messages for the API client back up, the FIX session
+        # is told so it can apply its overflow policy.
+        self._init_flow_control()
+        self._in_queue = WatermarkQueue(HIGH_WATER, LOW_WATER,
+                on_pause=lambda: self._pause_reading('queue'),
+                on_resume=lambda: self._resume_reading('queue'),
+                )
+        self._out_queue = WatermarkQueue(HIGH_WATER, LOW_WATER,
+                on_pause=lambda: self._FIX_backlog(True),
+                on_resume=lambda: self._FIX_backlog(False),
+                )
         self._in_put_nowait = self._in_queue.put_nowait
         self._out_put_nowait = self._out_queue.put_nowait
         
+        self._decoder = apiproto.Decoder()
+        
         self.commands = {}
         self.commands['FIX_connect'] = self.FIX_connect
         self.commands['FIX_disconnect'] = self.FIX_disconnect
-        self.commands['FIX'] = None
+        self.commands['FIX_attach'] = self.FIX_attach
+        self.commands['FIX_book'] = self.FIX_book
+        self.commands['FIX'] = self.FIX_send
+        self.commands['engine'] = self.engine_command
         
     
     def connection_made(self, transport):
@@ -52,15 +83,31 @@ class APIserver(asyncio.Protocol):
         logger.info('API: Connection lost...')
         
         self.connected = False
+        self._release_flow_control()
+        
+        # The sessions carry on without an API client
+        for session in list(self.sessions.values()):
+            session.detach()
+        self.sessions.clear()
+        self.session = None
         
         self._in_put_nowait(None)
         self._out_put_nowait(None)
     
     
     def data_received(self, data):
-        logger.debug('API: Data received: {}'.format(data.decode('utf-8')))
+        logger.debug('API: Data received: %s', data)
+        received = monotonic_ns()
         
-        self.put_incoming(data)
+        try:
+            frames = self._decoder.feed(data)
+        except apiproto.ProtocolError as e:
+            logger.error('API: Protocol error, closing connection: %s', e)
+            self.transport.close()
+            return
+        
+        for frame in frames:
+            self.put_incoming((frame, received))
     
     
     def eof_received(self):
@@ -72,21 +119,59 @@ class APIserver(asyncio.Protocol):
         self._in_put_nowait(msg)
     
     
-    def put_outgoing(self, msg):
-        self._out_put_nowait(msg)
+    def put_outgoing(self, msg, key=None):
+        # Messages with a key replace any message still queued under the same
+        # key
+        if key is None:
+            self._out_put_nowait(msg)
+        else:
+            self._out_queue.put_conflated(key, msg)
+    
+    
+    def _FIX_backlog(self, backlogged):
+        for session in self.sessions.values():
+            session.protocol.api_backlog(backlogged)
+    
+    
+    def _FIX_backpressure(self, paused, session_id=None):
+        # A FIX session's outgoing queue is full, stop reading commands
+        if paused:
+            self._pause_reading(('FIX', session_id))
+        else:
+            self._resume_reading(('FIX', session_id))
     
     
     @asyncio.coroutine
     def handle_incoming(self):
         logger.debug('API: Incoming handler started...')
         while self.connected:
-            data = yield from self._in_queue.get()
+            item = yield from self._in_queue.get()
             
-            if data is None: continue
+            if item is None: continue
             
-            command = ast.literal_eval(data.decode('utf-8'))
+            (kind, payload), received = item
             
-            logger.debug("API: Handling command '{}'".format(command['type']))
+            # Pre-encoded FIX fields skip the command dict entirely
+            if kind == apiproto.KIND_FIX:
+                yield from self.FIX_send(payload, received=received)
+                continue
+            if kind == apiproto.KIND_SESSION_FIX:
+                try:
+                    session, payload = apiproto.decode_session_fix(payload)
+                except (apiproto.ProtocolError, UnicodeDecodeError):
+                    logger.error('API: ...Invalid session ID')
+                    continue
+                yield from self.FIX_send(payload, session, received)
+                continue
+            
+            try:
+                command = apiproto.decode_command(payload)
+            except apiproto.ProtocolError as e:
+                logger.error('API: ...Invalid command')
+                logger.exception(e)
+                continue
+            
+            logger.debug("API: Handling command '%s'", command['type'])
             
             try:
                 handler = self.commands[command['type']]
@@ -116,53 +201,244 @@ class APIserver(asyncio.Protocol):
             
             logger.debug('API: Handling outgoing data')
             
+            yield from self.wait_writable()
+            if not self.connected: break
+            
             self.transport.write(data)
             
-            logger.info('API: Sent: {}'.format(data.decode('utf-8')))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info('API: Sent: %s', logs.Deferred(str, data, 'utf-8'))
         logger.debug('API: Outgoing handler stopped...')
     
     
+    def attach_session(self, session):
+        session.attach(self)
+        self.sessions[session.id] = session
+        self.session = session
+        
+        # Let it know if messages are already backing up here
+        session.protocol.api_backlog(self._out_queue.paused)
+    
+    
+    def detach_session(self, session):
+        # Called when another API connection takes the session over, or the
+        # session closes
+        self.sessions.pop(session.id, None)
+        if self.session is session:
+            self.session = None
+    
+    
+    def _get_session(self, session_id=None):
+        if session_id is None:
+            return self.session
+        session = self.sessions.get(session_id)
+        if session is None:
+            # Attach to a session started by an earlier API connection
+            session = self.registry.get_id(session_id)
+            if session is not None:
+                self.attach_session(session)
+        return session
+    
+    
+    @asyncio.coroutine
+    def FIX_send(self, fields, session_id=None, received=None):
+        session = self._get_session(session_id)
+        if session is None:
+            logger.error('API: ...No FIX connection %s',
+                    session_id or '')
+            return
+        session.protocol.metrics.api_commands += 1
+        yield from session.protocol.put_outgoing_async(fields,
+                received=received)
+    
+    
+    @asyncio.coroutine
+    def FIX_attach(self, kwargs, *args, **_kwargs):
+        if self._get_session(kwargs['session']) is None:
+            logger.error('API: ...No FIX connection %s',
+                    kwargs['session'])
+    
+    
+    @asyncio.coroutine
+    def FIX_book(self, kwargs, *args, **_kwargs):
+        # Subscribe to order book snapshots of a session started with 'book'
+        session = self._get_session(kwargs.get('session'))
+        if session is None or session.protocol.book is None:
+            logger.error('API: ...No order book for %s',
+                    kwargs.get('session', 'session'))
+            return
+        
+        symbols = kwargs.get('symbols')
+        if symbols is not None:
+            symbols = [symbol.encode('utf-8') if type(symbol) is str
+                    else symbol for symbol in symbols]
+        session.protocol.subscribe_book(symbols,
+                kwargs.get('depth', BOOK_DEPTH))
+    
+    
+    @asyncio.coroutine
+    def engine_command(self, kwargs, *args, **_kwargs):
+        # {'command': 'stats'}, for every session in this engine (or worker),
+        # or with 'session' for one; 'reset': True starts the counts again.
+        # {'command': 'recorder'} dumps the sessions' flight recorders to the
+        # log and replies with their records.
+        # The reply is an engine message, see apiproto.encode_reply.
+        command = kwargs.get('command', 'stats')
+        if command not in ('stats', 'recorder'):
+            logger.error("API: ...Unknown engine command '%s'", command)
+            return
+    
+        if 'session' in kwargs:
+            session = self._get_session(kwargs['session'])
+            if session is None:
+                logger.error('API: ...No FIX connection %s',
+                        kwargs['session'])
+                return
+            selected = [session]
+        else:
+            selected = list(self.registry)
+    
+        data = {}
+        for session in selected:
+            protocol = session.protocol
+            if command == 'recorder':
+                protocol.dump_recorder('dumped by the API')
+                data[session.id] = ([] if protocol.recorder is None
+                        else protocol.recorder.records())
+            else:
+                data[session.id] = protocol.stats()
+                if kwargs.get('reset'):
+                    protocol.metrics.reset()
+    
+        self.put_outgoing(apiproto.encode_reply(command, data))
+    
+    
+    def _rate_limiter(self, settings):
+        # 'rate_limit' for the session and 'venue_rate_limit' shared with the
+        # other sessions to settings['venue'], each as (rate, burst) or
+        # (rate, burst, period in seconds)
+        buckets = []
+        limit = settings.get('rate_limit')
+        if limit:
+            buckets.append(ratelimit.TokenBucket(*limit,
+                    name=sessions.session_id(settings['SenderCompID'],
+                            settings['TargetCompID'])))
+        limit = settings.get('venue_rate_limit')
+        if limit:
+            buckets.append(ratelimit.venue_bucket(
+                    settings.get('venue', settings['host']), *limit))
+        return ratelimit.RateLimiter(buckets) if buckets else None
+    
+    
     @asyncio.coroutine
     def FIX_connect(self, settings, *args, **kwargs):
+        key = (settings['SenderCompID'], settings['TargetCompID'])
+        session = self.registry.get(key)
+        if session is not None:
+            logger.info('API: Attaching to FIX session %s', session.id)
+            self.attach_session(session)
+            return
+        
         if settings['SSL']:
             sslcontext = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
         else:
             sslcontext = None
         
+        # Files opened for the session; once connected, the FIXclient closes
+        # them when the connection is lost
+        journal = seqstore = wirelog = None
+        connected = False
         try:
+            journal_directory = settings.get('journal', JOURNAL_DIRECTORY)
+            if journal_directory:
+                journal = OutboundJournal.open(journal_directory,
+                        settings['SenderCompID'], settings['TargetCompID'])
+            else:
+                journal = None
+            
+            # MsgSeqNums are kept with the journal unless told otherwise
+            seqstore_directory = settings.get('seqstore', journal_directory)
+            if seqstore_directory:
+                seqstore = SequenceStore.open(seqstore_directory,
+                        settings['SenderCompID'], settings['TargetCompID'],
+                        sync_every=settings.get('sync_every', 0),
+                        sync_interval=settings.get('sync_interval', 1.0),
+                        )
+                if settings.get('ResetSeqNum', False):
+                    seqstore.reset()
+            else:
+                seqstore = None
+            
+            wirelog_directory = settings.get('wirelog', WIRELOG_DIRECTORY)
+            if wirelog_directory:
+                wirelog = WireJournal.open(wirelog_directory,
+                        settings['SenderCompID'], settings['TargetCompID'],
+                        segment_size=settings.get('wirelog_segment_size',
+                                WIRELOG_SEGMENT_SIZE),
+                        )
+            else:
+                wirelog = None
+            
+            # Always on, unless 'recorder_slots' is 0
+            recorder_slots = settings.get('recorder_slots', RECORDER_SLOTS)
+            if recorder_slots:
+                recorder = FlightRecorder(recorder_slots,
+                        settings.get('recorder_slot_size', RECORDER_SLOT_SIZE))
+            else:
+                recorder = None
+            
             client = FIXclient(
                     HeartBtInt=settings['HeartBtInt'],
                     SenderCompID=settings['SenderCompID'],
-                    TargetCompID=settings['TargetCompID']
+                    TargetCompID=settings['TargetCompID'],
+                    max_batch=settings.get('max_batch', MAX_BATCH),
+                    max_delay=settings.get('max_delay', MAX_DELAY),
+                    high_water=settings.get('high_water', HIGH_WATER),
+                    low_water=settings.get('low_water', LOW_WATER),
+                    overflow=settings.get('overflow', OVERFLOW_PAUSE),
+                    journal=journal,
+                    seqstore=seqstore,
+                    book=BookBuilder() if settings.get('book') else None,
+                    limiter=self._rate_limiter(settings),
+                    wirelog=wirelog,
+                    recorder=recorder,
                     )
             
             logger.debug('API: Creating FIX connection...')
             
-            self.FIX_transport, self.FIX_protocol = yield from \
+            FIX_transport, FIX_protocol = yield from \
                     self.loop.create_connection(
                             lambda: client,
                             host=settings['host'],
                             port=settings['port'],
                             ssl=sslcontext
                             )
+            connected = True
             
-            self.commands['FIX'] = self.FIX_protocol.put_outgoing_async
-            self.FIX_protocol.api_out = self.put_outgoing
+            session = sessions.Session(key[0], key[1], FIX_protocol,
+                    FIX_transport)
+            self.registry.add(session)
+            self.attach_session(session)
             
         except Exception as e:
             logger.error('API: Problem creating FIX connection')
             logger.exception(e)
+            if not connected:
+                for opened in (journal, seqstore, wirelog):
+                    if opened is not None:
+                        opened.close()
     
     
     @asyncio.coroutine
-    def FIX_disconnect(self, *args, **kwargs):
-        try:
-            self.FIX_transport.close()
-        except AttributeError as e:
+    def FIX_disconnect(self, settings=None, *args, **kwargs):
+        session_id = settings.get('session') if settings else None
+        session = self._get_session(session_id)
+        if session is None:
             logger.debug("API: FIX connection already closed")
+            return
         
-        self.FIX_transport = None
-        self.FIX_protocol = None
+        # The registry drops the session once the connection is lost
+        session.transport.close()
     
 
 #------------------------------------------------------------------------------
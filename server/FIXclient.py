@@ -4,21 +4,73 @@ import ast
 import json
 import asyncio
 import logging
-from datetime import datetime
 
 from util import TAGS, MSGS
 from util import parse, compose
+from util import recovery
+from util import logs
+from util.clock import clock
+from util.book import DEPTH as BOOK_DEPTH
+from util.journal import ADMIN_TYPES
+from util.wirelog import INBOUND, OUTBOUND
+from util.metrics import SessionMetrics, monotonic_ns
 
-#from message import Message
+from .flow import FlowControl, WatermarkQueue, HIGH_WATER, LOW_WATER
+from . import timers
+from .sessions import session_id
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
 #------------------------------------------------------------------------------
 
-class FIXclient(asyncio.Protocol):
+# Outgoing messages are drained from the queue and written in batches of at
+# most MAX_BATCH messages. When the transport is still busy with earlier
+# writes, the handler waits up to MAX_DELAY seconds to coalesce more.
+MAX_BATCH = 64
+MAX_DELAY = 0.0
+
+# What to do with messages for the API while the API side is backlogged:
+# pause reading from the exchange, or, for market data only sessions, drop
+# market data, or conflate snapshots by Symbol (and drop incremental updates).
+OVERFLOW_PAUSE = 'pause'
+OVERFLOW_DROP = 'drop'
+OVERFLOW_CONFLATE = 'conflate'
+
+MARKET_DATA_TYPES = frozenset([b'W', b'X'])
+
+# Resent messages are written in chunks of about this many bytes, letting the
+# event loop run in between
+RESEND_CHUNK = 65536
+
+# Seconds between flushes of the wire journal
+WIRELOG_FLUSH = 1.0
+
+# Nanoseconds between automatic dumps of the flight recorder
+DUMP_INTERVAL = 1000000000
+
+# SessionRejectReason for messages a handler found malformed
+REJECT_INCORRECT_FORMAT = b'6'
+
+#------------------------------------------------------------------------------
+
+def resets_MsgSeqNums(fields):
+    # Whether outgoing fields, a list or joined, are a Logon with
+    # ResetSeqNumFlag
+    if type(fields) is bytes:
+        return fields.startswith(b'35=A\x01') and b'\x01141=Y\x01' in fields
+    if type(fields) not in (list, tuple) or not fields:
+        return False
+    return fields[0] == b'35=A\x01' and b'141=Y\x01' in fields
+
+#------------------------------------------------------------------------------
+
+class FIXclient(FlowControl, asyncio.Protocol):
     
-    def __init__(self, HeartBtInt, SenderCompID, TargetCompID):
+    def __init__(self, HeartBtInt, SenderCompID, TargetCompID,
+            max_batch=MAX_BATCH, max_delay=MAX_DELAY,
+            high_water=HIGH_WATER, low_water=LOW_WATER,
+            overflow=OVERFLOW_PAUSE, journal=None, seqstore=None, book=None,
+            limiter=None, wirelog=None, recorder=None):
         
         super().__init__()
         
@@ -26,40 +78,130 @@ class FIXclient(asyncio.Protocol):
         self.transport = None
         self.connected = False
         
-        self._in_queue = asyncio.Queue()
-        self._out_queue = asyncio.Queue()
+        # Reading from the exchange pauses while the incoming queue is full;
+        # the API stops reading commands while the outgoing queue is full.
+        self._init_flow_control()
+        self._in_queue = WatermarkQueue(high_water, low_water,
+                on_pause=lambda: self._pause_reading('queue'),
+                on_resume=lambda: self._resume_reading('queue'),
+                )
+        self._out_queue = WatermarkQueue(high_water, low_water,
+                on_pause=lambda: self._api_pause('queue', True),
+                on_resume=lambda: self._api_pause('queue', False),
+                )
         self._in_put_nowait = self._in_queue.put_nowait
         self._out_put_nowait = self._out_queue.put_nowait
         
+        self._framer = parse.FrameDecoder()
+        self._templates = compose.SessionTemplates(SenderCompID, TargetCompID)
+        
+        # util.journal.OutboundJournal of sent messages, for ResendRequests
+        self.journal = journal
+        
+        # Counters and stage latencies, see util/metrics.py
+        self.metrics = SessionMetrics()
+        
+        # util.wirelog.WireJournal of every frame sent and received
+        self.wirelog = wirelog
+        self._wirelog_flush = None
+        
+        # util.recorder.FlightRecorder of the latest frames, logged when
+        # something goes wrong
+        self.recorder = recorder
+        self._recorder_dumped = None
+        
         self._local_MsgSeqNum = 0
         self._host_MsgSeqNum = 0
         
+        # util.seqstore.SequenceStore, resume from the stored MsgSeqNums
+        self.seqstore = seqstore
+        self._sync_timer = None
+        
+        # util.ratelimit.RateLimiter for application messages. Messages over
+        # the limit are held, in order, and sent as tokens become available;
+        # session level messages are never held.
+        self.limiter = limiter
+        self.throttled = 0
+        self._held = []
+        self._throttle_timer = None
+        self._api_paused_by = set()
+        if seqstore is not None:
+            self._local_MsgSeqNum = seqstore.local
+            self._host_MsgSeqNum = seqstore.host
+        
+        # Holds messages received ahead of a MsgSeqNum gap
+        self._reorder = recovery.ReorderBuffer(self._host_MsgSeqNum + 1)
+        
         self.HeartBtInt = HeartBtInt
         self.SenderCompID = SenderCompID
         self.TargetCompID = TargetCompID
+        # Conflation keys start with it: one API connection may have several
+        # sessions queued, trading the same symbols
+        self.session_id = session_id(SenderCompID, TargetCompID)
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.overflow = overflow
         self.api_connected = None
-        self.api_out = lambda dummy: None
+        self.api_out = lambda data, key=None: None
+        self.api_backpressure = lambda paused: None
+        self._api_backlogged = False
+        self.api_dropped = 0
+        self.on_connection_lost = None
         
+        # Timers on the shared timing wheel: a TestRequest after HeartBtInt+1
+        # seconds without receiving, a Heartbeat after HeartBtInt seconds
+        # without sending
+        self._wheel = timers.wheel()
         self._recv_hbt = None
         self._send_hbt = None
-        self._last_send_time = None
-        self._last_recv_time = None
         
         self._sent_TestReqID = None
         self._recv_TestReqID = None
+        self._logout_sent = False
+        # Set while a Logon with ResetSeqNumFlag waits for the host's
+        self._reset_sent = False
+        
+        # Session level messages are handled here rather than by the API
+        # client. A handler returning True passes the message on as well.
+        self._dispatch = {
+                b'0': self.on_heartbeat,
+                b'1': self.on_test_request,
+                b'2': self.on_resend_request,
+                b'3': self.on_reject,
+                b'4': self.on_sequence_reset,
+                b'5': self.on_logout,
+                b'A': self.on_logon,
+                }
+        
+        # util.book.BookBuilder kept from the market data; the API client gets
+        # snapshots of the books it subscribes to instead of the raw messages
+        self.book = book
+        self.book_subscriptions = {}
+        if book is not None:
+            self._dispatch[b'W'] = self.on_market_data
+            self._dispatch[b'X'] = self.on_market_data
     
     
     def connection_made(self, transport):
         peername = transport.get_extra_info('peername')
-        logger.info('FIX: Connection established with {}'.format(peername))
+        logger.info('FIX: Connection established with %s', peername)
         
         self.transport = transport
         self.connected = True
+        self._framer.clear()
         
-        self._recv_hbt = self.loop.call_later(self.HeartBtInt + 1, self.test_request)
-        self._send_hbt = self.loop.call_later(self.HeartBtInt - 1, self.local_heartbeat)
-        self._last_send_time = datetime.now()
-        self._last_recv_time = datetime.now()
+        if self.journal is not None and self._local_MsgSeqNum == 0:
+            self.journal.reset()
+        
+        if self.seqstore is not None and self.seqstore.sync_interval:
+            self._sync_timer = self.loop.call_later(
+                    self.seqstore.sync_interval, self.sync_seqstore)
+        
+        self._recv_hbt = self._wheel.add(self.HeartBtInt + 1, self.test_request)
+        self._send_hbt = self._wheel.add(self.HeartBtInt, self.local_heartbeat)
+        if self.wirelog is not None:
+            self._wirelog_flush = self._wheel.add(WIRELOG_FLUSH,
+                    self.wirelog.flush)
         
         asyncio.async(self.handle_incoming_data())
         asyncio.async(self.handle_outgoing_data())
@@ -67,25 +209,68 @@ class FIXclient(asyncio.Protocol):
     
     def connection_lost(self, exc):
         logger.info('FIX: Connection lost...')
+        self.dump_recorder('connection lost')
         
         self.connected = False
+        self._release_flow_control()
         
         self._send_hbt.cancel()
         self._recv_hbt.cancel()
+        if self._throttle_timer is not None:
+            self._throttle_timer.cancel()
+        
+        if self._wirelog_flush is not None:
+            self._wirelog_flush.cancel()
+        if self.wirelog is not None:
+            self.wirelog.close()
+            self.wirelog = None
+        
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+        
+        if self._sync_timer is not None:
+            self._sync_timer.cancel()
+        if self.seqstore is not None:
+            self.seqstore.close()
+            self.seqstore = None
         
         self._in_put_nowait(None)
-        self._out_put_nowait((None, None))
+        self._out_put_nowait((None, None, None))
+        
+        if self.on_connection_lost is not None:
+            self.on_connection_lost()
         
         # Try to reconnect if in case of accidental disconnect
         pass
     
     
     def data_received(self, msg):
-        logger.debug('FIX: Data received : {}'.format(msg.decode("utf-8")))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('FIX: Data received : %s',
+                    logs.Deferred(str, msg, 'utf-8'))
         
+        received = monotonic_ns()
         self.reset_host_heartbeat()
         
-        self.put_incoming(msg)
+        metrics = self.metrics
+        metrics.bytes_in += len(msg)
+        
+        frames = self._framer.feed(msg)
+        if not frames: return
+        metrics.frame.record_since(received)
+        
+        if self.wirelog is not None:
+            mono, wall = clock.read()
+            for frame in frames:
+                self.wirelog.append(INBOUND, frame, mono, wall)
+        
+        for frame in frames:
+            self.put_incoming(frame, received)
+        
+        depth = self._in_queue.qsize()
+        if depth > metrics.in_queue_max:
+            metrics.in_queue_max = depth
     
     
     def eof_received(self):
@@ -98,170 +283,629 @@ class FIXclient(asyncio.Protocol):
         return str(self._local_MsgSeqNum).encode('utf-8')
     
     
+    def next_MsgSeqNum(self):
+        # The MsgSeqNum the next message will take, without taking it
+        return str(self._local_MsgSeqNum + 1).encode('utf-8')
+    
+    
+    def expect_host_MsgSeqNum(self, MsgSeqNum):
+        # Take 'MsgSeqNum' as the next one from the host, dropping anything
+        # held for a gap; for replaying a recording from part way through
+        self._host_MsgSeqNum = MsgSeqNum - 1
+        self._reorder = recovery.ReorderBuffer(MsgSeqNum)
+    
+    
+    def reset_MsgSeqNums(self, local=True):
+        # A Logon with ResetSeqNumFlag (141=Y) starts both sides again from
+        # 1; 'local' False keeps the outgoing side, already reset by ours
+        if local:
+            self._local_MsgSeqNum = 0
+            if self.journal is not None:
+                self.journal.reset()
+        self.expect_host_MsgSeqNum(1)
+        self.store_MsgSeqNums()
+    
+    
+    def store_MsgSeqNums(self):
+        if self.seqstore is not None:
+            self.seqstore.update(self._local_MsgSeqNum, self._host_MsgSeqNum)
+    
+    
+    def sync_seqstore(self):
+        if self.seqstore is None: return
+        self.seqstore.sync()
+        self._sync_timer = self.loop.call_later(
+                self.seqstore.sync_interval, self.sync_seqstore)
+    
+    
     def reset_host_heartbeat(self):
-        self._recv_hbt.cancel()
-        self._recv_hbt = self.loop.call_later(self.HeartBtInt + 1, self.test_request)
+        self._recv_hbt.touch()
     
     
     def reset_local_heartbeat(self):
-        self._send_hbt.cancel()
-        self._send_hbt = self.loop.call_later(self.HeartBtInt, self.local_heartbeat)
+        self._send_hbt.touch()
+    
+    
+    def _api_pause(self, reason, paused):
+        # The API client is told to stop while anything is backed up here
+        was_paused = bool(self._api_paused_by)
+        if paused:
+            self._api_paused_by.add(reason)
+        else:
+            self._api_paused_by.discard(reason)
+        if bool(self._api_paused_by) != was_paused:
+            self.api_backpressure(not was_paused)
+    
+    
+    def _throttle_wake(self):
+        # Tokens are available for the held messages again
+        self._throttle_timer = None
+        self._out_put_nowait((None, None, None))
+    
+    
+    def _rate_limit(self, batch):
+        # Remove the messages over the limit from 'batch' and hold them,
+        # behind any already held
+        held = self._held
+        n_held = len(held)
+        if held:
+            batch[:0] = held
+            held = self._held = []
+        
+        limiter = self.limiter
+        passed = []
+        wait = 0
+        for i, item in enumerate(batch):
+            msg_data = item[0]
+            if msg_data is None: continue
+            
+            if compose.message_type(msg_data) not in ADMIN_TYPES:
+                if not wait:
+                    wait = limiter.acquire()
+                if wait:
+                    held.append(item)
+                    if i >= n_held:
+                        self.throttled += 1
+                    continue
+            passed.append(item)
+        
+        if held:
+            self._api_pause('throttle', len(held) >= self._out_queue.high)
+            if self._throttle_timer is None:
+                self._throttle_timer = self.loop.call_later(
+                        wait / 1000000000, self._throttle_wake)
+        else:
+            self._api_pause('throttle', False)
+        return passed
+    
+    
+    def api_backlog(self, backlogged):
+        # Called by the API server as its outgoing queue fills and drains
+        self._api_backlogged = backlogged
+        if self.overflow == OVERFLOW_PAUSE:
+            if backlogged:
+                self._pause_reading('api')
+            else:
+                self._resume_reading('api')
+    
+    
+    def drop_api(self, data, key=None):
+        # api_out while no API client is attached
+        self.api_dropped += 1
+    
+    
+    def to_api(self, msg):
+        if self._api_backlogged and self.overflow != OVERFLOW_PAUSE:
+            MsgType = msg.MsgType
+            if MsgType in MARKET_DATA_TYPES:
+                if self.overflow == OVERFLOW_CONFLATE and MsgType == b'W':
+                    self.api_out(bytes(msg),
+                            (self.session_id, MsgType, msg.get(55)))
+                else:
+                    self.api_dropped += 1
+                return
+        
+        self.api_out(bytes(msg))
+        
+        metrics = self.metrics
+        metrics.api_messages += 1
+        if msg.received is not None:
+            metrics.tick_to_api.record_since(msg.received)
+    
     
+    # 'received' is the monotonic_ns() time the message, or the API command
+    # behind it, was read, for the latency histograms
     
-    def put_incoming(self, msg):
-        self._in_put_nowait(msg)
+    def put_incoming(self, msg, received=None):
+        self._in_put_nowait((msg, received))
     
     
-    def put_outgoing(self, msg_data, msg_name='message'):
-       self._out_put_nowait((msg_data, msg_name))
+    def put_outgoing(self, msg_data, msg_name='message', received=None):
+       self._out_put_nowait((msg_data, msg_name, received))
     
     
     @asyncio.coroutine
-    def put_incoming_async(self, msg):
-        yield from self._in_queue.put(msg)
+    def put_incoming_async(self, msg, received=None):
+        yield from self._in_queue.put((msg, received))
     
     
     @asyncio.coroutine
-    def put_outgoing_async(self, msg_data, msg_name='message'):
-        yield from self._out_queue.put((msg_data, msg_name))
+    def put_outgoing_async(self, msg_data, msg_name='message', received=None):
+        yield from self._out_queue.put((msg_data, msg_name, received))
     
     
     @asyncio.coroutine
     def handle_incoming_data(self):
         logger.debug('FIX: Incoming handler started...')
-        under_resend = False
         while self.connected:
-            msg = yield from self._in_queue.get()
+            item = yield from self._in_queue.get()
             
-            if msg is None: continue
+            if item is None: continue
+            frame, received = item
+            metrics = self.metrics
             
-            if not parse.header_is_present(msg):
-                logger.info("FIX: Message is malformed, improper header")
-                # do stuff
+            # The framer only hands over complete messages, delimited by their
+            # BodyLength. Validate the initial fields, BodyLength and CheckSum;
+            # fields are located lazily by the returned Message view.
+            try:
+                msg = parse.decode(frame)
+            except parse.ParseError as e:
+                # Its MsgSeqNum can't be trusted; the gap is noticed, and
+                # requested, when the next message arrives
+                logger.info('FIX: Invalid %s: %s', e.check, e.value)
+                metrics.parse_errors += 1
+                if e.check == parse.CHECK_CHECKSUM:
+                    metrics.checksum_failures += 1
+                self._record_in(frame, received)
+                self.dump_recorder('invalid {}'.format(e.check), False)
                 continue
+            msg.received = received
+            metrics.messages_in += 1
             
-            if not parse.checksum_is_present(msg):
-                logger.info("FIX: No checksum present, will try to build message from pieces")
-                while True:
-                    next_msg = yield from self._in_queue.get()
-                    if parse.header_is_present(next_msg):
-                        # next_msg is most likely it's own message,
-                        # msg was most likely a malformed message
-                        logger.info("FIX: Previous message was in error")
-                        
-                        # do stuff here
-                        pass
-                        
-                        break
-                        
-                    else:
-                        # Since no header is present, we will assume 'next_msg'
-                        # is part of 'msg'. They will be combined and tested.
-                        msg = msg + next_msg
-                        if parse.checksum_is_present(msg):
-                            # We will take the message to be complete
-                            break
-                        else:
-                            # We'll try again!
-                            continue
-            
-            
-            
-            # Validate the first three TAGS of the message
-            if not parse.verify_initial_fields(msg):
-                logger.info('FIX: Invalid FIX message; Error in first three TAGS')
-                if not under_resend:
-                    #under_resend = True
-                    #self.request_resend()
-                    pass
+            try:
+                MsgSeqNum, PossDupFlag, GapFillFlag = msg.values(
+                        (34, 43, 123), False)
+            except ValueError as e:
+                logger.info('FIX: Invalid header field: %s', e)
+                self._record_in(frame, received)
+                self.dump_recorder('invalid header field', False)
                 continue
-            
-            
-            # Validate the CheckSum
-            if not parse.verify_checksum(msg):
-                logger.info('FIX: Invalid checksum')
-                if not under_resend:
-                    #under_resend = True
-                    #self.request_resend()
-                    pass
+            if not MsgSeqNum:
+                logger.info('FIX: Invalid MsgSeqNum')
+                self._record_in(frame, received)
+                self.dump_recorder('invalid MsgSeqNum', False)
                 continue
             
-            # Validate the BodyLength
-            if not parse.verify_bodylength(msg):
-                logger.info('FIX: Invalid BodyLength')
-                if not under_resend:
-                    #under_resend = True
-                    #self.request_resend()
-                    pass
-                continue
+            # The host's Logon with ResetSeqNumFlag, in reply to ours or not,
+            # starts its MsgSeqNums again from 1
+            if msg.MsgType == b'A' and msg.get(141) == b'Y':
+                logger.info('FIX: MsgSeqNums reset by the host')
+                self.reset_MsgSeqNums(not self._reset_sent)
+                self._reset_sent = False
             
-            # Decompile the message to a dict with Field Names as the keys
-            try:
-                msg_dict = parse.decompile(msg)
-            except parse.ParseError as e:
-                logger.info(e)
-                if not under_resend:
-                    #under_resend = True
-                    #self.request_resend()
-                    pass
-                continue
+            # SequenceReset-Reset applies whatever its MsgSeqNum
+            if msg.MsgType == b'4' and not GapFillFlag:
+                ready = self._reorder.advance(msg.value(36, 0))
+                result = recovery.IN_ORDER
+                resend = None
+            else:
+                result, ready, resend = self._reorder.offer(
+                        MsgSeqNum, msg, PossDupFlag)
             
-            # Check to see if the MsgSeqNum is as expected
-            if int(msg_dict[b'MsgSeqNum']) != self._host_MsgSeqNum + 1:
-                logger.info('FIX: MsgSeqNum out of expected order')
-                if not under_resend:
-                    #under_resend = True
-                    #self.request_resend()
-                    pass
-                continue
+            validated = monotonic_ns()
+            if received is not None:
+                metrics.validate.record(validated - received)
+            if self.recorder is not None:
+                self._record_in(frame, received, validated)
             
-            # Increment the host MsgSeqNum counter
-            self._host_MsgSeqNum +=1
+            if resend is not None:
+                logger.info('FIX: MsgSeqNum gap, requesting %s to %s',
+                        *resend)
+                metrics.gaps += 1
+                self.dump_recorder('MsgSeqNum gap, {} to {}'.format(*resend),
+                        False)
+                self.request_resend(*resend)
             
-            # Ensure the Resend Request flag 'under_resend' is reset
-            under_resend = False
+            if result == recovery.TOO_LOW:
+                logger.error('FIX: MsgSeqNum %s lower than expected %s',
+                        MsgSeqNum, self._reorder.expected)
+                continue
+            elif result == recovery.DUPLICATE:
+                logger.debug('FIX: Duplicate MsgSeqNum %s', MsgSeqNum)
+                metrics.duplicates += 1
+                continue
+            elif result == recovery.OVERFLOW:
+                logger.info('FIX: MsgSeqNum %s too far ahead, dropped',
+                        MsgSeqNum)
             
-            # Check if the message is administrative in nature
-            #raise NotImplementedError
+            # Process everything now in sequence, in order. Handlers may add
+            # to 'ready', a GapFill releases the messages held behind it.
+            dispatch = self._dispatch
+            index = 0
+            while index < len(ready):
+                msg = ready[index]
+                index += 1
+                
+                handler = dispatch.get(msg.MsgType)
+                if handler is None:
+                    self.to_api(msg)
+                    continue
+                
+                # A malformed value is the sender's problem, not a reason to
+                # stop reading the session
+                try:
+                    passed = handler(msg, ready)
+                except (ValueError, parse.ParseError) as e:
+                    MsgSeqNum = msg.get(34)
+                    logger.warning('FIX: Invalid %s message %s: %s',
+                            msg.MsgType.decode('utf-8'),
+                            MsgSeqNum.decode('utf-8'), e)
+                    self.dump_recorder('invalid {} message'.format(
+                            msg.MsgType.decode('utf-8')), False)
+                    self.reject(MsgSeqNum, str(e).encode('utf-8'),
+                            msg.MsgType, REJECT_INCORRECT_FORMAT)
+                    continue
+                if passed:
+                    self.to_api(msg)
             
-            # If not administrative, send to client application
-            self.api_out(msg)
+            # The host MsgSeqNum is the last one processed
+            if self._host_MsgSeqNum != self._reorder.expected - 1:
+                self._host_MsgSeqNum = self._reorder.expected - 1
+                self.store_MsgSeqNums()
             
         logger.debug('FIX: Incoming handler stopped...')
     
     
+    def on_heartbeat(self, msg, ready):
+        TestReqID = msg.get(112)
+        if TestReqID is not None and TestReqID == self._sent_TestReqID:
+            self._sent_TestReqID = None
+    
+    
+    def on_test_request(self, msg, ready):
+        self._recv_TestReqID = msg.get(112)
+        self.local_heartbeat(self._recv_TestReqID)
+    
+    
+    def on_resend_request(self, msg, ready):
+        asyncio.async(self.resend(
+                msg.value(7, 1), msg.value(16, 0)))
+    
+    
+    def on_reject(self, msg, ready):
+        logger.warning('FIX: Reject of MsgSeqNum %s: %s',
+                msg.get(45), msg.get(58))
+        # It concerns a message the API client sent
+        return True
+    
+    
+    def on_sequence_reset(self, msg, ready):
+        # SequenceReset-GapFill; a Reset was applied on arrival
+        if msg.value(123):
+            ready.extend(self._reorder.advance(msg.value(36, 0)))
+    
+    
+    def on_logout(self, msg, ready):
+        logger.info('FIX: Logout received: %s', msg.get(58))
+        if self._logout_sent:
+            self.transport.close()
+        else:
+            # Confirm, the exchange closes the connection
+            self.logout()
+        return True
+    
+    
+    def on_logon(self, msg, ready):
+        logger.info('FIX: Logon accepted')
+        self._logout_sent = False
+        return True
+    
+    
+    def on_market_data(self, msg, ready):
+        try:
+            changed = self.book.apply(msg)
+        except parse.ParseError as e:
+            logger.info('FIX: Invalid market data: %s', e.value)
+            return False
+        
+        subscriptions = self.book_subscriptions
+        if not subscriptions: return False
+        
+        every = subscriptions.get(None)
+        for symbol in changed:
+            depth = subscriptions.get(symbol, every)
+            if depth is not None:
+                # Queued snapshots of a symbol are replaced by newer ones
+                self.api_out(self.book.get(symbol).snapshot(depth),
+                        (self.session_id, b'book', symbol))
+        return False
+    
+    
+    def subscribe_book(self, symbols=None, depth=BOOK_DEPTH):
+        # Publish the top 'depth' levels of 'symbols' (every symbol if None)
+        # whenever they change; depth 0 unsubscribes
+        for symbol in (None,) if symbols is None else symbols:
+            if depth:
+                self.book_subscriptions[symbol] = depth
+            else:
+                self.book_subscriptions.pop(symbol, None)
+        
+        for symbol in self.book.books if symbols is None else symbols:
+            current = self.book.get(symbol)
+            if depth and current is not None:
+                self.api_out(current.snapshot(depth),
+                        (self.session_id, b'book', symbol))
+    
+    
+    def stats(self):
+        # The session's metrics, with the current state of its queues
+        stats = self.metrics.stats()
+        stats['local_MsgSeqNum'] = self._local_MsgSeqNum
+        stats['host_MsgSeqNum'] = self._host_MsgSeqNum
+        stats['held_for_gap'] = len(self._reorder)
+        stats['in_queue'] = self._in_queue.qsize()
+        stats['out_queue'] = self._out_queue.qsize()
+        stats['api_dropped'] = self.api_dropped
+        stats['throttled'] = self.throttled
+        stats['held_by_limit'] = len(self._held)
+        if self.limiter:
+            stats['limiter'] = self.limiter.stats()
+        stats['discarded_bytes'] = self._framer.discarded
+        return stats
+    
+    
+    def _drain_outgoing(self, batch):
+        # Move whatever is already queued into 'batch', up to max_batch
+        get_nowait = self._out_queue.get_nowait
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(get_nowait())
+            except asyncio.QueueEmpty:
+                break
+    
+    
     @asyncio.coroutine
     def handle_outgoing_data(self):
         logger.debug('FIX: Outgoing handler started...')
         while self.connected:
-            msg_data, msg_name = yield from self._out_queue.get()
+            batch = [(yield from self._out_queue.get())]
+            self._drain_outgoing(batch)
             
-            if msg_data is None: continue
+            metrics = self.metrics
+            depth = len(batch) + self._out_queue.qsize()
+            if depth > metrics.out_queue_max:
+                metrics.out_queue_max = depth
+            
+            if self.max_delay and len(batch) < self.max_batch and \
+                    self.transport.get_write_buffer_size():
+                # Busy, let more messages queue up behind this batch
+                yield from asyncio.sleep(self.max_delay)
+                self._drain_outgoing(batch)
+            
+            if not self.connected: break
+            
+            if self.limiter:
+                batch = self._rate_limit(batch)
             
             logger.debug('FIX: Handling outgoing data')
             
             # XXX consider testing for MsgSeqNum so that application can pass it's own
             # msg_data['MsgSeqNum'] = self.MsgSeqNum()
             
-            try:
-                FIX_message = compose.compile_message(msg_data, self.MsgSeqNum())
-            except compose.CompileError as e:
-                logger.debug('FIX: Outgoing CompileError...')
-                logger.exception(e)
-            self.transport.write(FIX_message)
+            # Compose the whole batch into one buffer, with one SendingTime
+            buffer = bytearray()
+            mono, wall = clock.read()
+            sending_time = compose.SendingTime(wall)
+            sent = []
+            spans = []
+            journal_from = 0
+            received_at = []
+            for msg_data, msg_name, received in batch:
+                if msg_data is None: continue
+                
+                # Our Logon with ResetSeqNumFlag goes out as MsgSeqNum 1, and
+                # the journal only keeps what follows it
+                if resets_MsgSeqNums(msg_data):
+                    logger.info('FIX: Resetting MsgSeqNums')
+                    self.reset_MsgSeqNums()
+                    self._reset_sent = True
+                    journal_from = len(spans)
+                
+                start = len(buffer)
+                # The MsgSeqNum is only taken once the message compiles, a
+                # rejected message must not leave a gap
+                try:
+                    MsgType = self._templates.compile_into(buffer, msg_data,
+                            self.next_MsgSeqNum(), sending_time)
+                except compose.CompileError as e:
+                    logger.debug('FIX: Outgoing CompileError...')
+                    logger.exception(e)
+                    continue
+                self._local_MsgSeqNum += 1
+                if MsgType == b'5':
+                    self._logout_sent = True
+                sent.append(msg_name)
+                spans.append((self._local_MsgSeqNum, start, len(buffer),
+                        MsgType in ADMIN_TYPES, received))
+                if received is not None:
+                    received_at.append(received)
+            
+            if not buffer: continue
+            
+            if received_at:
+                composed = monotonic_ns()
+                for received in received_at:
+                    metrics.api_to_compose.record(composed - received)
+            
+            # Journal the batch before it goes out, so a ResendRequest can
+            # always be answered
+            if self.journal is not None:
+                view = memoryview(buffer)
+                for MsgSeqNum, start, end, admin, received in \
+                        spans[journal_from:]:
+                    self.journal.append(MsgSeqNum, view[start:end], admin)
+                view.release()
+            
+            if self.wirelog is not None:
+                for MsgSeqNum, start, end, admin, received in spans:
+                    self.wirelog.append(OUTBOUND, buffer[start:end], mono,
+                            wall)
+            
+            self.store_MsgSeqNums()
+            
+            # Hold the batch while the exchange is not accepting data
+            yield from self.wait_writable()
+            if not self.connected: break
+            
+            # The transport may keep a reference to the buffer, a new one is
+            # made for each batch
+            self.transport.write(buffer)
             self.reset_local_heartbeat()
-            logger.info('FIX: Sent {}: {}'.format(msg_name, FIX_message.decode('utf-8')))
+            
+            metrics.messages_out += len(sent)
+            metrics.bytes_out += len(buffer)
+            if received_at or self.recorder is not None:
+                written = monotonic_ns()
+                for received in received_at:
+                    metrics.api_to_wire.record(written - received)
+            if self.recorder is not None:
+                view = memoryview(buffer)
+                for MsgSeqNum, start, end, admin, received in spans:
+                    if received is None:
+                        received = mono
+                    self.recorder.record(OUTBOUND, view[start:end], written,
+                            written - received)
+                view.release()
+            
+            if logger.isEnabledFor(logging.INFO):
+                logger.info('FIX: Sent %s message(s), %s bytes: %s',
+                        len(sent), len(buffer), logs.Deferred(', '.join, sent))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('FIX: Sent: %s',
+                        logs.Deferred(str, buffer, 'utf-8'))
         
         logger.debug('FIX: Outgoing handler stopped...')
     
     
+    @asyncio.coroutine
+    def resend(self, BeginSeqNo, EndSeqNo):
+        # Answer a ResendRequest from the journal. Application messages are
+        # resent as possible duplicates, runs of admin messages (and anything
+        # not journaled) are replaced by a SequenceReset-GapFill.
+        last = self._local_MsgSeqNum
+        if EndSeqNo == 0 or EndSeqNo > last:
+            EndSeqNo = last
+        
+        logger.info('FIX: Resending %s to %s', BeginSeqNo, EndSeqNo)
+        
+        sending_time = compose.SendingTime()
+        buffer = bytearray()
+        ends = []
+        gap_start = None
+        
+        for MsgSeqNum in range(BeginSeqNo, EndSeqNo + 1):
+            if self.journal is None:
+                frame, admin = None, True
+            else:
+                frame, admin = self.journal.get(MsgSeqNum)
+            
+            if frame is None or admin:
+                if gap_start is None:
+                    gap_start = MsgSeqNum
+                continue
+            
+            if gap_start is not None:
+                self._gap_fill(buffer, gap_start, MsgSeqNum, sending_time)
+                ends.append(len(buffer))
+                gap_start = None
+            
+            buffer += compose.possible_duplicate(frame, sending_time)
+            ends.append(len(buffer))
+            
+            if len(buffer) >= RESEND_CHUNK:
+                yield from self.wait_writable()
+                if not self.connected: return
+                self._record_out(buffer, ends)
+                self.transport.write(buffer)
+                self.metrics.messages_out += len(ends)
+                self.metrics.bytes_out += len(buffer)
+                buffer = bytearray()
+                ends = []
+                # Let the rest of the engine run
+                yield from asyncio.sleep(0)
+                sending_time = compose.SendingTime()
+        
+        if gap_start is not None:
+            self._gap_fill(buffer, gap_start, EndSeqNo + 1, sending_time)
+            ends.append(len(buffer))
+        
+        if buffer:
+            yield from self.wait_writable()
+            if not self.connected: return
+            self._record_out(buffer, ends)
+            self.transport.write(buffer)
+            self.metrics.messages_out += len(ends)
+            self.metrics.bytes_out += len(buffer)
+    
+    
+    def _record_out(self, buffer, ends):
+        # Journal and record the frames of 'buffer', which end at the offsets
+        # in 'ends'
+        wirelog = self.wirelog
+        recorder = self.recorder
+        if wirelog is None and recorder is None: return
+        mono, wall = clock.read()
+        start = 0
+        for end in ends:
+            frame = buffer[start:end]
+            if wirelog is not None:
+                wirelog.append(OUTBOUND, frame, mono, wall)
+            if recorder is not None:
+                recorder.record(OUTBOUND, frame, mono)
+            start = end
+    
+    
+    def _record_in(self, frame, received, now=None):
+        if self.recorder is None: return
+        if now is None:
+            now = monotonic_ns()
+        if received is None:
+            received = now
+        self.recorder.record(INBOUND, frame, received, now - received)
+    
+    
+    def dump_recorder(self, reason, always=True):
+        # Log the flight recorder's frames. Dumps for errors, not 'always',
+        # are at most one every DUMP_INTERVAL, however many errors there are.
+        recorder = self.recorder
+        if recorder is None or not len(recorder): return
+        now = monotonic_ns()
+        if not always and self._recorder_dumped is not None and \
+                now - self._recorder_dumped < DUMP_INTERVAL:
+            return
+        self._recorder_dumped = now
+        recorder.dump(logger, 'FIX: Flight recorder {}-{}, {}'.format(
+                self.SenderCompID.decode('utf-8'),
+                self.TargetCompID.decode('utf-8'), reason))
+    
+    
+    def _gap_fill(self, buffer, MsgSeqNum, NewSeqNo, sending_time):
+        GapFill = []
+        GapFill.append(b'43=Y\x01')   # PossDupFlag
+        GapFill.append(b'122=' + sending_time + b'\x01')    # OrigSendingTime
+        GapFill.append(b'123=Y\x01')  # GapFillFlag
+        GapFill.append(b'36=' + str(NewSeqNo).encode('utf-8') + b'\x01')   # NewSeqNo
+        
+        self._templates.get(b'4').compile_into(buffer,
+                str(MsgSeqNum).encode('utf-8'), sending_time, GapFill)
+    
+    
     #@asyncio.coroutine
-    def local_heartbeat(self):
+    def local_heartbeat(self, TestReqID=None):
         HeartBeat = []
         HeartBeat.append(b'35=0\x01')   # MsgType, HeartBeat
-        HeartBeat.append(b'49=' + self.SenderCompID + b'\x01')  # SenderCompID
-        HeartBeat.append(b'56=' + self.TargetCompID + b'\x01')  # TargetCompID
-        HeartBeat.append(b'52=' + compose.SendingTime() + b'\x01')  # SendingTime
+        if TestReqID is not None:
+            HeartBeat.append(b'112=' + TestReqID + b'\x01')  # TestReqID
         
         self.put_outgoing(HeartBeat, msg_name='HeartBeat')
     
@@ -271,22 +915,47 @@ class FIXclient(asyncio.Protocol):
         self._sent_TestReqID = compose.SendingTime()
         TestReq = []
         TestReq.append(b'35=1\x01')   # MsgType, TestReq
-        TestReq.append(b'49=' + self.SenderCompID + b'\x01')  # SenderCompID
-        TestReq.append(b'56=' + self.TargetCompID + b'\x01')  # TargetCompID
-        TestReq.append(b'52=' + compose.SendingTime() + b'\x01')  # SendingTime
         TestReq.append(b'112=' + self._sent_TestReqID + b'\x01')  # TestReqID
         
         self.put_outgoing(TestReq, msg_name='Test Request')
     
     
     #@asyncio.coroutine
-    def request_resend(self, EndSeqNo=b'0'):
+    def logout(self, Text=None):
+        self._logout_sent = True
+        Logout = []
+        Logout.append(b'35=5\x01')   # MsgType, Logout
+        if Text is not None:
+            Logout.append(b'58=' + Text + b'\x01')   # Text
+        
+        self.put_outgoing(Logout, msg_name='Logout')
+    
+    
+    def reject(self, RefSeqNum, Text=None, RefMsgType=None,
+            SessionRejectReason=None):
+        # Session level Reject of the host's message 'RefSeqNum'
+        Reject = []
+        Reject.append(b'35=3\x01')   # MsgType, Reject
+        Reject.append(b'45=' + RefSeqNum + b'\x01')   # RefSeqNum
+        if RefMsgType is not None:
+            Reject.append(b'372=' + RefMsgType + b'\x01')   # RefMsgType
+        if SessionRejectReason is not None:
+            Reject.append(b'373=' + SessionRejectReason + b'\x01')
+        if Text is not None:
+            Reject.append(b'58=' + Text.replace(b'\x01', b' ') + b'\x01')
+        
+        self.put_outgoing(Reject, msg_name='Reject')
+    
+    
+    #@asyncio.coroutine
+    def request_resend(self, BeginSeqNo=None, EndSeqNo=0):
+        # EndSeqNo 0 requests everything from BeginSeqNo on
+        if BeginSeqNo is None:
+            BeginSeqNo = self._host_MsgSeqNum + 1
         ResendReq = []
-        ResendReq.append(b'35=1\x01')   # MsgType, TestReq
-        ResendReq.append(b'49=' + self.SenderCompID + b'\x01')  # SenderCompID
-        ResendReq.append(b'56=' + self.TargetCompID + b'\x01')  # TargetCompID
-        ResendReq.append(b'7=' + str(self._host_MsgSeqNum + 1).encode('utf-8') + b'\x01')   # BeginSeqNo
-        ResendReq.append(b'16=' + EndSeqNo + b'\x01')
+        ResendReq.append(b'35=2\x01')   # MsgType, ResendRequest
+        ResendReq.append(b'7=' + str(BeginSeqNo).encode('utf-8') + b'\x01')   # BeginSeqNo
+        ResendReq.append(b'16=' + str(EndSeqNo).encode('utf-8') + b'\x01')    # EndSeqNo
         
         self.put_outgoing(ResendReq, msg_name='Resend Request')
 
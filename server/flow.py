@@ -0,0 +1,141 @@
+"""
+Flow control shared by the FIX and API protocols.
+
+WatermarkQueue is an asyncio.Queue that reports when it fills up to its high
+watermark and again once it drains to its low watermark. The protocols use
+those callbacks to pause and resume reading from their transports, so a slow
+consumer anywhere along the pipeline stops the producer instead of letting
+the queues grow without bound.
+
+FlowControl is a protocol mixin holding the reading and writing state: reading
+is paused while any reason to pause it is outstanding, and writers wait on
+wait_writable while the transport's write buffer is over its limit. Any
+number of writers can wait at once; resume_writing wakes them all.
+"""
+import asyncio
+
+#------------------------------------------------------------------------------
+
+# Default watermarks, in messages
+HIGH_WATER = 1024
+LOW_WATER = 256
+
+#------------------------------------------------------------------------------
+
+class _Conflated:
+
+    __slots__ = ('key', 'item')
+
+    def __init__(self, key, item):
+        self.key = key
+        self.item = item
+
+
+class WatermarkQueue(asyncio.Queue):
+
+    def __init__(self, high=HIGH_WATER, low=LOW_WATER, on_pause=None,
+            on_resume=None, **kwargs):
+        super().__init__(**kwargs)
+
+        if low > high:
+            raise ValueError('Low watermark above high watermark')
+
+        self.high = high
+        self.low = low
+        self.on_pause = on_pause
+        self.on_resume = on_resume
+        self.paused = False
+
+        self.conflated = 0
+        self._pending = {}
+
+    def _put(self, item):
+        super()._put(item)
+        if not self.paused and self.qsize() >= self.high:
+            self.paused = True
+            if self.on_pause is not None:
+                self.on_pause()
+
+    def _get(self):
+        item = super()._get()
+        if self.paused and self.qsize() <= self.low:
+            self.paused = False
+            if self.on_resume is not None:
+                self.on_resume()
+
+        if type(item) is _Conflated:
+            del self._pending[item.key]
+            item = item.item
+        return item
+
+    def put_conflated(self, key, item):
+        # Replace the item already waiting under 'key', if any, otherwise
+        # queue it like put_nowait
+        pending = self._pending.get(key)
+        if pending is not None:
+            pending.item = item
+            self.conflated += 1
+            return
+
+        pending = _Conflated(key, item)
+        self.put_nowait(pending)
+        self._pending[key] = pending
+
+#------------------------------------------------------------------------------
+
+class FlowControl:
+    """
+    Mixin for asyncio.Protocol subclasses with a 'transport' attribute.
+    Call _init_flow_control from __init__, and _release_flow_control from
+    connection_lost.
+    """
+
+    def _init_flow_control(self):
+        self._read_paused_by = set()
+        self._write_paused = False
+        self._write_waiters = []
+
+    def _pause_reading(self, reason):
+        if not self._read_paused_by and self.transport is not None:
+            self.transport.pause_reading()
+        self._read_paused_by.add(reason)
+
+    def _resume_reading(self, reason):
+        if reason not in self._read_paused_by:
+            return
+        self._read_paused_by.discard(reason)
+        if not self._read_paused_by and self.transport is not None:
+            self.transport.resume_reading()
+
+    @property
+    def reading_paused(self):
+        return bool(self._read_paused_by)
+
+    def pause_writing(self):
+        self._write_paused = True
+
+    def resume_writing(self):
+        self._write_paused = False
+        self._wake_writers()
+
+    @asyncio.coroutine
+    def wait_writable(self):
+        if not self._write_paused:
+            return
+        waiter = asyncio.Future()
+        self._write_waiters.append(waiter)
+        yield from waiter
+
+    def _release_flow_control(self):
+        self._read_paused_by.clear()
+        self._write_paused = False
+        self._wake_writers()
+
+    def _wake_writers(self):
+        waiters = self._write_waiters
+        self._write_waiters = []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+#------------------------------------------------------------------------------
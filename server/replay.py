@@ -0,0 +1,376 @@
+"""
+Replay of recorded FIX traffic.
+
+Recorded inbound frames are fed to a FIXclient as if they had just been read
+from the exchange, so they go through the same framing, parse.decode,
+MsgSeqNum checks, session handlers and books as live traffic, and on to an
+API client if one is attached. Whatever the client writes back goes to a
+ReplayTransport, which only counts it.
+
+A source is either a wire journal directory (util/wirelog.py), replayed
+segment by segment, or a capture file of FIX messages back to back (newlines
+or other bytes in between are skipped by the framer), split into
+CAPTURE_SEGMENT byte ranges. Both are read through mmap, so files larger
+than memory are fine.
+
+    speed 0         as fast as the engine can take the frames
+    speed 1.0       paced to the recorded times, journal times or
+                    SendingTime (52) for captures; 2.0 is twice as fast
+
+replay_pool replays the parts of a source in a process pool, one part per
+task, each with its own FIXclient. The parts start at their own first
+MsgSeqNum and are paced independently; it is meant for throughput runs.
+"""
+import os
+import mmap
+import time
+import asyncio
+import logging
+import multiprocessing
+
+from util import parse, wirelog
+from util.convert import to_epoch_ns
+from util.metrics import monotonic_ns
+
+from .FIXclient import FIXclient
+from . import sessions
+
+logger = logging.getLogger(__name__)
+
+#------------------------------------------------------------------------------
+
+CAPTURE_SEGMENT = 1 << 26   # Bytes of a capture file per part
+CHUNK = 1 << 20             # Bytes of a capture handed to the framer at once
+
+# Frames fed between yields to the event loop, at full speed
+BATCH = 256
+
+HEARTBTINT = 30
+
+#------------------------------------------------------------------------------
+# Sources. A part is ('journal', directory, segment number) or ('capture',
+# path, (start, end)); its frames are (time_ns, MsgSeqNum, frame) with
+# time_ns None when unknown, MsgSeqNum 0.
+
+def parts(source):
+    if os.path.isdir(source):
+        return [('journal', source, number)
+                for number in wirelog.segment_numbers(source)]
+
+    size = os.path.getsize(source)
+    return [('capture', source, (start, min(start + CAPTURE_SEGMENT, size)))
+            for start in range(0, size, CAPTURE_SEGMENT)]
+
+
+def part_frames(part, timed=True):
+    kind, path, where = part
+    if kind == 'journal':
+        return journal_frames(path, where)
+    return capture_frames(path, where[0], where[1], timed)
+
+
+def journal_frames(directory, number):
+    reader = wirelog.WireReader(directory, [number])
+    try:
+        for direction, MsgSeqNum, mono_ns, wall_ns, frame in reader.records():
+            if direction == wirelog.INBOUND:
+                yield mono_ns, MsgSeqNum, frame
+    finally:
+        reader.close()
+
+
+def _field(frame, prefix):
+    start = frame.find(prefix)
+    if start == -1:
+        return None
+    start += len(prefix)
+    return frame[start:frame.find(b'\x01', start)]
+
+
+def _resync(data, start, end):
+    # Offset of the first message starting in [start, end), or 'end'
+    if start == 0:
+        return 0
+    # A message starting in the last bytes of the range has the rest of its
+    # '8=FIX' past 'end'
+    limit = end + len(b'8=FIX') - 1
+    pos = data.find(b'8=FIX', start, limit)
+    while pos != -1 and data[pos - 1] not in (0x01, 0x0a, 0x0d):
+        pos = data.find(b'8=FIX', pos + 1, limit)
+    return end if pos == -1 else pos
+
+
+def capture_frames(path, start=0, end=None, timed=True):
+    # Messages starting in [start, end); the last one may run past 'end'
+    with open(path, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        size = len(data)
+        if end is None or end > size:
+            end = size
+
+        framer = parse.FrameDecoder()
+        pos = _resync(data, start, end)
+        while pos < end:
+            chunk_end = min(pos + CHUNK, end)
+            for frame in framer.feed(data[pos:chunk_end]):
+                yield _capture_frame(frame, timed)
+            pos = chunk_end
+
+        # Finish the message cut by 'end', the next part starts after it
+        while len(framer) and pos < size:
+            chunk_end = min(pos + CHUNK, size)
+            frames = framer.feed(data[pos:chunk_end])
+            pos = chunk_end
+            if frames:
+                yield _capture_frame(frames[0], timed)
+                break
+    finally:
+        data.close()
+
+
+def _capture_frame(frame, timed):
+    raw = frame.tobytes()
+    MsgSeqNum = _field(raw, b'\x0134=')
+    MsgSeqNum = int(MsgSeqNum) if MsgSeqNum and MsgSeqNum.isdigit() else 0
+
+    time_ns = None
+    if timed:
+        SendingTime = _field(raw, b'\x0152=')
+        if SendingTime:
+            try:
+                time_ns = to_epoch_ns(SendingTime)
+            except ValueError:
+                pass
+    return time_ns, MsgSeqNum, frame
+
+
+def session_of(source):
+    # (SenderCompID, TargetCompID) of the recorded session, from its first
+    # inbound message, which the host sent; None for an empty source
+    for part in parts(source):
+        for time_ns, MsgSeqNum, frame in part_frames(part, timed=False):
+            msg = parse.decode(frame)
+            return msg.get(56), msg.get(49)
+    return None
+
+#------------------------------------------------------------------------------
+
+class ReplayTransport(asyncio.Transport):
+
+    def __init__(self, protocol, name, loop=None):
+        super().__init__({'peername': ('replay', name)})
+        self.loop = asyncio.get_event_loop() if loop is None else loop
+        self.protocol = protocol
+        self.written = 0
+        self._closing = False
+        self._reading = True
+        self._read_waiter = None
+
+    def write(self, data):
+        self.written += len(data)
+
+    def get_write_buffer_size(self):
+        return 0
+
+    def pause_reading(self):
+        self._reading = False
+
+    def resume_reading(self):
+        self._reading = True
+        waiter = self._read_waiter
+        if waiter is not None:
+            self._read_waiter = None
+            if not waiter.done():
+                waiter.set_result(None)
+
+    @asyncio.coroutine
+    def wait_readable(self):
+        if self._reading:
+            return
+        self._read_waiter = asyncio.Future()
+        yield from self._read_waiter
+
+    def is_closing(self):
+        return self._closing
+
+    def close(self):
+        if self._closing:
+            return
+        self._closing = True
+        self.resume_reading()
+        self.loop.call_soon(self.protocol.connection_lost, None)
+
+    abort = close
+
+#------------------------------------------------------------------------------
+
+class Replayer:
+
+    def __init__(self, client, transport, speed=0.0, batch=BATCH):
+        self.loop = asyncio.get_event_loop()
+        self.client = client
+        self.transport = transport
+        self.speed = speed
+        self.batch = batch
+
+        self.frames = 0
+        self.api_messages = 0
+        self.elapsed = 0.0
+
+        # Count the messages passed on to the API
+        to_api = client.to_api
+        def counted(msg):
+            self.api_messages += 1
+            to_api(msg)
+        client.to_api = counted
+
+    @asyncio.coroutine
+    def run(self, frames):
+        client = self.client
+        transport = self.transport
+        put_incoming = client.put_incoming
+        speed = self.speed
+        batch = self.batch
+        loop_time = self.loop.time
+
+        started = loop_time()
+        first_ns = None
+        last_MsgSeqNum = 0
+
+        for time_ns, MsgSeqNum, frame in frames:
+            if speed and time_ns is not None:
+                if first_ns is None:
+                    first_ns = time_ns
+                delay = (started + (time_ns - first_ns) / 1e9 / speed -
+                        loop_time())
+                if delay > 0:
+                    yield from asyncio.sleep(delay)
+            elif not self.frames % batch:
+                yield from asyncio.sleep(0)
+
+            if client.reading_paused:
+                yield from transport.wait_readable()
+            if transport.is_closing():
+                logger.info('Replay: Session closed by the recording')
+                break
+
+            # Start from the recording's first MsgSeqNum, and again where
+            # the host reset it
+            if MsgSeqNum and (last_MsgSeqNum == 0 or
+                    (MsgSeqNum == 1 and last_MsgSeqNum > 1)):
+                client.expect_host_MsgSeqNum(MsgSeqNum)
+            if MsgSeqNum:
+                last_MsgSeqNum = MsgSeqNum
+
+            client.reset_host_heartbeat()
+            put_incoming(frame, monotonic_ns())
+            self.frames += 1
+
+        # Let the client finish with what was fed to it
+        while client.connected and client._in_queue.qsize():
+            yield from asyncio.sleep(0)
+        yield from asyncio.sleep(0)
+
+        self.elapsed += loop_time() - started
+        return self.stats()
+
+    def stats(self):
+        return {
+            'frames': self.frames,
+            'api_messages': self.api_messages,
+            'api_dropped': self.client.api_dropped,
+            'written': self.transport.written,
+            'elapsed': self.elapsed,
+            }
+
+#------------------------------------------------------------------------------
+
+def _client(SenderCompID, TargetCompID, name, **kwargs):
+    client = FIXclient(HEARTBTINT, SenderCompID, TargetCompID, **kwargs)
+    transport = ReplayTransport(client, name)
+    client.connection_made(transport)
+    return client, transport
+
+
+@asyncio.coroutine
+def replay(source, speed=0.0, api_server=None, **kwargs):
+    """
+    Replay every part of 'source' in this process through one FIXclient.
+    With 'api_server', an asyncio server of APIserver protocols, the session
+    is registered for the API client to attach to with FIX_connect (or
+    FIX_attach), and replay starts once it has. Extra keyword arguments go
+    to FIXclient, e.g. book=BookBuilder().
+    """
+    compids = session_of(source)
+    if compids is None:
+        logger.info('Replay: Nothing to replay in %s', source)
+        return None
+
+    client, transport = _client(compids[0], compids[1], source, **kwargs)
+    session = sessions.Session(compids[0], compids[1], client, transport)
+
+    if api_server is not None:
+        sessions.registry.add(session)
+        logger.info('Replay: Waiting for an API client to attach to %s',
+                session.id)
+        while session.api is None:
+            yield from asyncio.sleep(0.05)
+
+    replayer = Replayer(client, transport, speed)
+    for part in parts(source):
+        if transport.is_closing():
+            break
+        yield from replayer.run(part_frames(part, timed=bool(speed)))
+    stats = replayer.stats()
+
+    api = session.api
+    transport.close()
+    yield from asyncio.sleep(0)
+
+    # Let the API client have everything before returning
+    if api is not None:
+        while api.connected and api._out_queue.qsize():
+            yield from asyncio.sleep(0.01)
+
+    return stats
+
+
+def replay_part(part, speed=0.0):
+    # Entry point of a pool worker
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    try:
+        client, transport = _client(b'REPLAY', b'HOST', part[1])
+        replayer = Replayer(client, transport, speed)
+        stats = loop.run_until_complete(
+                replayer.run(part_frames(part, timed=bool(speed))))
+        transport.close()
+        loop.run_until_complete(asyncio.sleep(0))
+    finally:
+        loop.close()
+    return stats
+
+
+def replay_pool(source, workers, speed=0.0):
+    # Replay the parts of 'source' in 'workers' processes; returns the
+    # combined stats, with 'elapsed' the wall time for the whole run
+    started = time.monotonic()
+    pool = multiprocessing.Pool(workers)
+    try:
+        results = pool.starmap(replay_part,
+                [(part, speed) for part in parts(source)])
+    finally:
+        pool.close()
+        pool.join()
+
+    stats = {'frames': 0, 'api_messages': 0, 'api_dropped': 0, 'written': 0}
+    for result in results:
+        for key in stats:
+            stats[key] += result[key]
+    stats['parts'] = len(results)
+    stats['elapsed'] = time.monotonic() - started
+    return stats
+
+#------------------------------------------------------------------------------
@@ -0,0 +1,203 @@
+"""
+API front end for the multi-process mode.
+
+APIrouter takes the API client connections in place of APIserver. It reads the
+same framed commands, works out which FIX session each is for, and passes it
+on to the worker process hosting that session, see supervisor.Supervisor.
+Each API connection has its own connection to each worker it uses. FIX
+messages coming back are split by parse.FrameDecoder and written to the API
+client whole, so messages from different workers never interleave.
+
+Frames without a session ID, plain KIND_FIX frames and commands without a
+'session' kwarg, are addressed to the connection's default session, the last
+one it connected or attached to, and are passed on with the session ID added.
+"""
+import asyncio
+import logging
+
+from util import apiproto, parse
+
+from .flow import FlowControl
+from .sessions import session_id
+
+logger = logging.getLogger(__name__)
+
+#------------------------------------------------------------------------------
+
+class _WorkerLink(asyncio.Protocol):
+    # Connection from an APIrouter to one worker
+
+    def __init__(self, router, path):
+        self.router = router
+        self.path = path
+        self.transport = None
+        self._pending = []
+        self._framer = parse.FrameDecoder()
+
+    def connection_made(self, transport):
+        self.transport = transport
+        if self._pending:
+            transport.write(b''.join(self._pending))
+            self._pending = []
+        if self.router.writing_paused:
+            transport.pause_reading()
+
+    def connection_lost(self, exc):
+        self.transport = None
+        self.router.link_lost(self)
+
+    def data_received(self, data):
+        frames = self._framer.feed(data)
+        if frames:
+            self.router.to_api(b''.join(frames))
+
+    def pause_writing(self):
+        self.router._pause_reading(self)
+
+    def resume_writing(self):
+        self.router._resume_reading(self)
+
+    def send(self, frame):
+        if self.transport is None:
+            # Still connecting
+            self._pending.append(frame)
+        else:
+            self.transport.write(frame)
+
+    def close(self):
+        if self.transport is not None:
+            self.transport.close()
+
+#------------------------------------------------------------------------------
+
+class APIrouter(FlowControl, asyncio.Protocol):
+
+    def __init__(self, supervisor):
+        super().__init__()
+
+        self.loop = asyncio.get_event_loop()
+        self.supervisor = supervisor
+
+        self.connected = False
+        self.transport = None
+        self.writing_paused = False
+
+        self._init_flow_control()
+        self._decoder = apiproto.Decoder()
+        self._links = {}
+        self.session = None
+
+    def connection_made(self, transport):
+        logger.info('Router: Connection established...')
+        self.connected = True
+        self.transport = transport
+
+    def connection_lost(self, exc):
+        logger.info('Router: Connection lost...')
+        self.connected = False
+        self._release_flow_control()
+
+        # The workers detach the sessions, which carry on
+        for link in list(self._links.values()):
+            link.close()
+        self._links.clear()
+
+    def data_received(self, data):
+        try:
+            frames = self._decoder.feed(data)
+        except apiproto.ProtocolError as e:
+            logger.error('Router: Protocol error, closing connection: %s', e)
+            self.transport.close()
+            return
+
+        for kind, payload in frames:
+            try:
+                self.route(kind, payload)
+            except (apiproto.ProtocolError, KeyError, TypeError,
+                    UnicodeDecodeError) as e:
+                logger.error('Router: ...Invalid command')
+                logger.exception(e)
+
+    def eof_received(self):
+        logger.info('Router: EOF received...')
+        return None
+
+    def pause_writing(self):
+        # The API client is slow, stop reading from the workers
+        self.writing_paused = True
+        for link in self._links.values():
+            if link.transport is not None:
+                link.transport.pause_reading()
+
+    def resume_writing(self):
+        self.writing_paused = False
+        for link in self._links.values():
+            if link.transport is not None:
+                link.transport.resume_reading()
+
+    def route(self, kind, payload):
+        if kind == apiproto.KIND_SESSION_FIX:
+            session, _ = apiproto.decode_session_fix(payload)
+            frame = apiproto.HEADER.pack(len(payload), kind) + payload
+
+        elif kind == apiproto.KIND_FIX:
+            session = self.session
+            frame = apiproto.encode_fix(payload, session)
+
+        else:
+            command = apiproto.decode_command(payload)
+            name = command['type']
+            kwargs = command['kwargs']
+
+            if name == 'FIX':
+                # Unframed FIX command, fields in a list
+                session = self.session
+                frame = apiproto.encode_fix(kwargs, session)
+            else:
+                if name == 'FIX_connect':
+                    session = session_id(kwargs['SenderCompID'],
+                            kwargs['TargetCompID'])
+                    self.session = session
+                elif type(kwargs) is dict and 'session' in kwargs:
+                    session = kwargs['session']
+                    if name == 'FIX_attach':
+                        self.session = session
+                else:
+                    session = self.session
+                frame = apiproto.encode_command(name, kwargs, session)
+
+        if session is None:
+            logger.error('Router: ...No FIX connection')
+            return
+
+        self._link(self.supervisor.path_for(session)).send(frame)
+
+    def _link(self, path):
+        link = self._links.get(path)
+        if link is None:
+            link = _WorkerLink(self, path)
+            self._links[path] = link
+            asyncio.async(self._connect(link))
+        return link
+
+    @asyncio.coroutine
+    def _connect(self, link):
+        try:
+            yield from self.loop.create_unix_connection(lambda: link,
+                    link.path)
+        except OSError as e:
+            logger.error('Router: Worker %s unavailable: %s',
+                    link.path, e)
+            self.link_lost(link)
+
+    def link_lost(self, link):
+        # A worker restarting; the next command connects again
+        if self._links.get(link.path) is link:
+            del self._links[link.path]
+        self._resume_reading(link)
+
+    def to_api(self, data):
+        if self.connected:
+            self.transport.write(data)
+
+#------------------------------------------------------------------------------
@@ -0,0 +1,110 @@
+"""
+Registry of the engine's FIX sessions.
+
+Sessions are keyed by (SenderCompID, TargetCompID) and named on the API side
+by their session ID, 'SenderCompID-TargetCompID'. The registry belongs to the
+engine rather than to an API connection: a session keeps running when the API
+client that started it disconnects, and a later API connection attaches to it
+again with FIX_connect (or FIX_attach) for the same CompIDs.
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+#------------------------------------------------------------------------------
+
+def session_id(SenderCompID, TargetCompID):
+    return '{}-{}'.format(SenderCompID.decode('utf-8'),
+            TargetCompID.decode('utf-8'))
+
+#------------------------------------------------------------------------------
+
+class Session:
+
+    __slots__ = ('key', 'id', 'protocol', 'transport', 'api')
+
+    def __init__(self, SenderCompID, TargetCompID, protocol, transport):
+        self.key = (SenderCompID, TargetCompID)
+        self.id = session_id(SenderCompID, TargetCompID)
+        self.protocol = protocol
+        self.transport = transport
+        # The APIserver attached, if any
+        self.api = None
+
+    def attach(self, api):
+        # Messages from the session go to 'api' from now on, taking it over
+        # from any API connection attached before
+        protocol = self.protocol
+        if self.api is not None and self.api is not api:
+            self.api._FIX_backpressure(False, self.id)
+            self.api.detach_session(self)
+        self.api = api
+
+        protocol.api_out = api.put_outgoing
+        protocol.api_backpressure = \
+                lambda paused: api._FIX_backpressure(paused, self.id)
+        if protocol._api_paused_by:
+            api._FIX_backpressure(True, self.id)
+
+    def detach(self):
+        # Until an API client attaches again, messages for it are dropped
+        self.api = None
+
+        protocol = self.protocol
+        protocol.api_out = protocol.drop_api
+        protocol.api_backpressure = lambda paused: None
+        protocol.api_backlog(False)
+
+
+class SessionRegistry:
+
+    def __init__(self):
+        self._sessions = {}
+        self._by_id = {}
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __iter__(self):
+        return iter(self._sessions.values())
+
+    def __contains__(self, key):
+        return key in self._sessions
+
+    def get(self, key):
+        # By (SenderCompID, TargetCompID)
+        return self._sessions.get(key)
+
+    def get_id(self, session_id):
+        return self._by_id.get(session_id)
+
+    def add(self, session):
+        if session.key in self._sessions:
+            raise KeyError('Session {} already exists'.format(session.id))
+        self._sessions[session.key] = session
+        self._by_id[session.id] = session
+
+        # Forget the session once its connection is gone
+        session.protocol.on_connection_lost = lambda: self.remove(session)
+
+        logger.info('Sessions: Added %s, %s open', session.id,
+                len(self._sessions))
+
+    def remove(self, session):
+        if self._sessions.get(session.key) is not session:
+            return
+        del self._sessions[session.key]
+        del self._by_id[session.id]
+        if session.api is not None:
+            session.api.detach_session(session)
+            session.api = None
+
+        logger.info('Sessions: Removed %s, %s open', session.id,
+                len(self._sessions))
+
+#------------------------------------------------------------------------------
+
+# The engine's sessions, shared by every API connection
+registry = SessionRegistry()
+
+#------------------------------------------------------------------------------
@@ -0,0 +1,193 @@
+"""
+Multi-process mode.
+
+The Supervisor starts a number of worker processes. Each runs its own event
+loop, with an APIserver listening on a local unix socket, and hosts the FIX
+sessions assigned to it. A session goes to the worker given by a hash of its
+session ID, see 'shard'. The API front end, router.APIrouter, forwards each
+command to the right worker's socket.
+
+Workers stamp a shared array with the time about once a second. A worker that
+dies, or whose stamp goes stale (a blocked event loop), is killed and started
+again. Its sessions are gone with it; the API client reconnects them, and
+they resume from their stored MsgSeqNums.
+
+Workers are forked, also when the engine restarts one from its running event
+loop. A new worker first closes the sockets it inherited, the API listener,
+the API clients and the router's links to the other workers: held open in the
+worker, they would never see EOF when the engine closes them.
+"""
+import os
+import stat
+import time
+import zlib
+import asyncio
+import logging
+import multiprocessing
+
+from .APIserver import APIserver
+
+logger = logging.getLogger(__name__)
+
+#------------------------------------------------------------------------------
+
+SOCKET_DIRECTORY = './run/'
+
+HEALTH_INTERVAL = 1.0   # Seconds between health checks, and worker stamps
+HEALTH_TIMEOUT = 5.0    # Seconds without a stamp before a worker is restarted
+
+#------------------------------------------------------------------------------
+
+def shard(session_id, workers):
+    # Stable across processes, unlike hash()
+    return zlib.crc32(session_id.encode('utf-8')) % workers
+
+
+def worker_path(directory, index):
+    return os.path.join(directory, 'worker-{}.sock'.format(index))
+
+def close_inherited_sockets():
+    # Close every socket but stdin, stdout and stderr. The rest of what a
+    # worker inherits (the log queue, the heartbeat array) are pipes and
+    # shared memory.
+    try:
+        fds = [int(fd) for fd in os.listdir('/proc/self/fd')]
+    except OSError:
+        fds = range(os.sysconf('SC_OPEN_MAX'))
+    for fd in fds:
+        if fd < 3: continue
+        try:
+            if stat.S_ISSOCK(os.fstat(fd).st_mode):
+                os.close(fd)
+        except OSError:
+            pass
+
+#------------------------------------------------------------------------------
+
+def run_worker(index, path, heartbeats, interval=HEALTH_INTERVAL):
+    # Entry point of a worker process
+    close_inherited_sockets()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    parent = os.getppid()
+
+    def heartbeat():
+        if os.getppid() != parent:
+            logger.info('Worker %s: Supervisor gone, stopping', index)
+            loop.stop()
+            return
+        heartbeats[index] = time.monotonic()
+        loop.call_later(interval, heartbeat)
+
+    if os.path.exists(path):
+        os.unlink(path)
+    server = loop.run_until_complete(loop.create_unix_server(APIserver, path))
+    heartbeat()
+
+    logger.info('Worker %s: Serving API on %s', index, path)
+
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        loop.close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+#------------------------------------------------------------------------------
+
+class Supervisor:
+
+    def __init__(self, workers, directory=SOCKET_DIRECTORY,
+            health_interval=HEALTH_INTERVAL, health_timeout=HEALTH_TIMEOUT):
+        if workers < 1:
+            raise ValueError('At least one worker is needed')
+
+        self.loop = asyncio.get_event_loop()
+        self.workers = workers
+        self.directory = directory
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self.restarts = 0
+
+        self.paths = [worker_path(directory, index)
+                for index in range(workers)]
+        self._processes = [None] * workers
+        # Written by the workers, without a lock: each owns one slot
+        self._heartbeats = multiprocessing.Array('d', workers, lock=False)
+        self._check_timer = None
+
+    def path_for(self, session_id):
+        # The unix socket of the worker hosting 'session_id'
+        return self.paths[shard(session_id, self.workers)]
+
+    def start(self):
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+        for index in range(self.workers):
+            self._start(index)
+        self._check_timer = self.loop.call_later(self.health_interval,
+                self.check)
+
+    def _start(self, index):
+        path = self.paths[index]
+        if os.path.exists(path):
+            os.unlink(path)
+
+        # Time to start up before the first stamp is due
+        self._heartbeats[index] = time.monotonic()
+
+        process = multiprocessing.Process(target=run_worker,
+                args=(index, path, self._heartbeats, self.health_interval),
+                name='FIX worker {}'.format(index),
+                daemon=True,
+                )
+        process.start()
+        self._processes[index] = process
+
+        logger.info('Supervisor: Started worker %s, pid %s', index,
+                process.pid)
+
+    @asyncio.coroutine
+    def wait_ready(self, timeout=10.0):
+        # Wait for every worker to be listening
+        deadline = time.monotonic() + timeout
+        while not all(os.path.exists(path) for path in self.paths):
+            if time.monotonic() > deadline:
+                raise TimeoutError('Workers did not start')
+            yield from asyncio.sleep(0.05)
+
+    def check(self):
+        now = time.monotonic()
+        for index, process in enumerate(self._processes):
+            if not process.is_alive():
+                logger.error('Supervisor: Worker %s exited with %s',
+                        index, process.exitcode)
+            elif now - self._heartbeats[index] > self.health_timeout:
+                logger.error('Supervisor: Worker %s unresponsive',
+                        index)
+                process.terminate()
+                process.join()
+            else:
+                continue
+
+            self.restarts += 1
+            self._start(index)
+
+        self._check_timer = self.loop.call_later(self.health_interval,
+                self.check)
+
+    def stop(self):
+        if self._check_timer is not None:
+            self._check_timer.cancel()
+        for process in self._processes:
+            if process is not None and process.is_alive():
+                process.terminate()
+        for process in self._processes:
+            if process is not None:
+                process.join()
+
+#------------------------------------------------------------------------------
@@ -0,0 +1,132 @@
+"""
+Shared timers for session heartbeats.
+
+TimingWheel is a hashed timing wheel driven by one repeating loop callback,
+every 'tick' seconds, for all the timers of an event loop. A Timer fires when
+its owner has shown no activity for 'interval' seconds: activity is recorded
+with 'touch', which only stores the wheel's current time, so it allocates
+nothing and schedules nothing however often it is called.
+
+Deadlines are checked lazily. A timer sits in the slot of the deadline it had
+when it was placed; when the wheel reaches that slot, a timer touched since
+then is moved on to its new deadline, one still past due fires. Timers fire
+within a tick of their deadline.
+"""
+import asyncio
+
+#------------------------------------------------------------------------------
+
+TICK = 0.1
+SLOTS = 512
+
+#------------------------------------------------------------------------------
+
+class Timer:
+
+    __slots__ = ('wheel', 'interval', 'callback', 'last', 'active')
+
+    def __init__(self, wheel, interval, callback):
+        self.wheel = wheel
+        self.interval = interval
+        self.callback = callback
+        self.last = wheel.now
+        self.active = True
+
+    def touch(self):
+        self.last = self.wheel.now
+
+    def cancel(self):
+        # Dropped from the wheel when its slot comes round
+        if self.active:
+            self.active = False
+            self.wheel._count -= 1
+
+
+class TimingWheel:
+
+    def __init__(self, tick=TICK, slots=SLOTS, loop=None):
+        self.loop = asyncio.get_event_loop() if loop is None else loop
+        self.tick = tick
+        self.now = self.loop.time()
+
+        self._slots = [[] for _ in range(slots)]
+        self._tick_count = int(self.now / tick)
+        self._count = 0
+        self._handle = None
+
+    def __len__(self):
+        return self._count
+
+    def add(self, interval, callback):
+        # 'callback' is called, without arguments, whenever 'interval' seconds
+        # pass without the returned Timer being touched
+        if self._handle is None:
+            self._advance_to(self.loop.time())
+            self._handle = self.loop.call_later(self.tick, self._run)
+
+        timer = Timer(self, interval, callback)
+        self._count += 1
+        self._place(timer, self.now + interval)
+        return timer
+
+    def _place(self, timer, deadline):
+        # Never behind the slot the wheel is at
+        ticks = max(int(deadline / self.tick), self._tick_count + 1)
+        slots = self._slots
+        slots[ticks % len(slots)].append(timer)
+
+    def _advance_to(self, now):
+        # Skip the slots passed while the wheel was stopped
+        self.now = now
+        self._tick_count = int(now / self.tick)
+
+    def _run(self):
+        now = self.loop.time()
+        self.now = now
+        target = int(now / self.tick)
+
+        slots = self._slots
+        size = len(slots)
+        # After a stall, visit every slot passed, but each slot only once
+        first = max(self._tick_count + 1, target - size + 1)
+        for ticks in range(first, target + 1):
+            self._tick_count = ticks
+            slot = ticks % size
+            due = slots[slot]
+            if not due: continue
+            slots[slot] = []
+
+            for timer in due:
+                if not timer.active: continue
+
+                deadline = timer.last + timer.interval
+                if deadline > now:
+                    self._place(timer, deadline)
+                    continue
+
+                # Fire, and again after another 'interval' without activity
+                timer.last = now
+                self._place(timer, now + timer.interval)
+                timer.callback()
+        self._tick_count = target
+
+        if self._count:
+            self._handle = self.loop.call_later(self.tick, self._run)
+        else:
+            self._handle = None
+            for slot in slots:
+                slot.clear()
+
+#------------------------------------------------------------------------------
+
+_wheel = None
+
+def wheel():
+    # The TimingWheel of the current event loop
+    global _wheel
+    loop = asyncio.get_event_loop()
+    if _wheel is None or _wheel.loop is not loop:
+        _wheel = TimingWheel(loop=loop)
+    return _wheel
+
+#------------------------------------------------------------------------------
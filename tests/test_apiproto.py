@@ -0,0 +1,148 @@
+import os
+import sys
+import socket
+import importlib
+import threading
+import time
+import unittest
+
+from util import apiproto, parse
+from util.compose import SessionTemplates
+from util.apiproto import (Decoder, ProtocolError, KIND_FIX, KIND_COMMAND,
+        KIND_SESSION_FIX, KIND_LEGACY)
+
+#------------------------------------------------------------------------------
+
+FIELDS = [b'35=D\x01', b'11=order1\x01', b'55=BTCUSD\x01']
+
+def load_APIclient():
+    # client/ imports the repository as a package, by its directory name
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, os.path.dirname(root))
+    try:
+        return importlib.import_module(
+                os.path.basename(root) + '.client.APIclient')
+    finally:
+        sys.path.remove(os.path.dirname(root))
+
+#------------------------------------------------------------------------------
+
+class FrameTest(unittest.TestCase):
+
+    def test_fix_round_trip(self):
+        for fields in (FIELDS, b''.join(FIELDS)):
+            frames = Decoder().feed(apiproto.encode_fix(fields))
+            self.assertEqual(frames, [(KIND_FIX, b''.join(FIELDS))])
+
+    def test_session_fix_round_trip(self):
+        frames = Decoder().feed(apiproto.encode_command('FIX', FIELDS,
+                'CLIENT-HOST'))
+        self.assertEqual(len(frames), 1)
+        kind, payload = frames[0]
+        self.assertEqual(kind, KIND_SESSION_FIX)
+        self.assertEqual(apiproto.decode_session_fix(payload),
+                ('CLIENT-HOST', b''.join(FIELDS)))
+
+    def test_command_round_trip(self):
+        data = {'command': 'stats'}
+        frames = Decoder().feed(apiproto.encode_command('engine', data,
+                'CLIENT-HOST'))
+        kind, payload = frames[0]
+        self.assertEqual(kind, KIND_COMMAND)
+        self.assertEqual(apiproto.decode_command(payload), {'type': 'engine',
+                'kwargs': {'command': 'stats', 'session': 'CLIENT-HOST'}})
+
+    def test_partial_reads(self):
+        stream = b''.join([apiproto.encode_fix(FIELDS),
+                apiproto.encode_command('engine', {'command': 'stats'}),
+                apiproto.encode_fix([b'35=F\x01'], 'A-B'),
+                apiproto.encode_fix(b'')])
+        expected = Decoder().feed(stream)
+        self.assertEqual([kind for kind, payload in expected],
+                [KIND_FIX, KIND_COMMAND, KIND_SESSION_FIX, KIND_FIX])
+
+        # One byte at a time
+        decoder = Decoder()
+        frames = []
+        for i in range(len(stream)):
+            frames += decoder.feed(stream[i:i + 1])
+        self.assertEqual(frames, expected)
+
+        # Split at every offset
+        for split in range(1, len(stream)):
+            decoder = Decoder()
+            frames = decoder.feed(stream[:split]) + \
+                    decoder.feed(stream[split:])
+            self.assertEqual(frames, expected)
+
+    def test_oversized_frame(self):
+        decoder = Decoder(max_payload=16)
+        with self.assertRaises(ProtocolError):
+            decoder.feed(apiproto.encode_fix(FIELDS))
+
+    def test_session_id_too_long(self):
+        with self.assertRaises(ProtocolError):
+            apiproto.encode_fix(FIELDS, 'X' * 256)
+
+    def test_truncated_session_id(self):
+        with self.assertRaises(ProtocolError):
+            apiproto.decode_session_fix(b'\x09A-B')
+
+    def test_legacy(self):
+        decoder = Decoder()
+        command = repr({'type': 'FIX', 'kwargs': {}}).encode('utf-8')
+        self.assertEqual(decoder.feed(command), [(KIND_LEGACY, command)])
+        self.assertTrue(decoder.legacy)
+        self.assertEqual(apiproto.decode_command(command)['type'], 'FIX')
+
+    def test_invalid_command(self):
+        for payload in (b'{', b'[1, 2]', b"{'kwargs': {}}", b'\xff'):
+            with self.assertRaises(ProtocolError):
+                apiproto.decode_command(payload)
+
+    def test_reply(self):
+        reply = apiproto.encode_reply('stats', {'messages_in': 3})
+        msg = parse.decode(reply)
+        self.assertEqual(apiproto.decode_reply(msg),
+                {'type': 'stats', 'data': {'messages_in': 3}})
+        heartbeat = SessionTemplates(b'A', b'B').compile([b'35=0\x01'], b'1',
+                b'20240102-03:04:05.678')
+        with self.assertRaises(ProtocolError):
+            apiproto.decode_reply(parse.decode(heartbeat))
+
+#------------------------------------------------------------------------------
+
+class CommandTest(unittest.TestCase):
+
+    def test_large_frame_sent_whole(self):
+        APIclient = load_APIclient()
+        client, engine = socket.socketpair()
+        self.addCleanup(client.close)
+        self.addCleanup(engine.close)
+        # As init_client leaves it
+        client.settimeout(0)
+
+        fields = [b'35=D\x01', b'58=' + b'x' * 1000000 + b'\x01']
+        received = bytearray()
+        expected = len(apiproto.encode_fix(fields))
+
+        def read():
+            # Only once the client has filled the socket buffer
+            time.sleep(0.2)
+            while len(received) < expected:
+                data = engine.recv(65536)
+                if not data:
+                    break
+                received.extend(data)
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        self.assertTrue(APIclient.command(client, 'FIX', fields))
+        reader.join(10)
+        self.assertEqual(client.gettimeout(), 0)
+        self.assertEqual(Decoder().feed(received),
+                [(KIND_FIX, b''.join(fields))])
+
+
+if __name__ == '__main__':
+    unittest.main()
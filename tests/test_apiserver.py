@@ -0,0 +1,69 @@
+import sys
+import socket
+import shutil
+import asyncio
+import tempfile
+import unittest
+from unittest import mock
+
+if sys.version_info >= (3, 7):
+    # server/ is written for the asyncio of Python 3.6 ('asyncio.async')
+    raise unittest.SkipTest('server requires Python 3.6')
+
+from server import sessions
+from server.APIserver import APIserver
+from util.journal import OutboundJournal
+from util.seqstore import SequenceStore
+from util.wirelog import WireJournal
+
+#------------------------------------------------------------------------------
+
+def closed_port():
+    # A local port nothing listens on
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+#------------------------------------------------------------------------------
+
+class ConnectTest(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.addCleanup(self.loop.close)
+        self.addCleanup(asyncio.set_event_loop, None)
+
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_failed_connection_closes_files(self):
+        registry = sessions.SessionRegistry()
+        server = APIserver(registry=registry)
+        settings = {
+                'SenderCompID': b'CLIENT', 'TargetCompID': b'HOST',
+                'HeartBtInt': 30, 'SSL': False,
+                'host': '127.0.0.1', 'port': closed_port(),
+                'journal': self.directory + '/journal',
+                'wirelog': self.directory + '/wirelog',
+                }
+
+        with mock.patch.object(OutboundJournal, 'close', autospec=True,
+                    side_effect=OutboundJournal.close) as journal_close, \
+                mock.patch.object(SequenceStore, 'close', autospec=True,
+                    side_effect=SequenceStore.close) as seqstore_close, \
+                mock.patch.object(WireJournal, 'close', autospec=True,
+                    side_effect=WireJournal.close) as wirelog_close, \
+                self.assertLogs('server.APIserver', 'ERROR'):
+            self.loop.run_until_complete(server.FIX_connect(settings))
+
+        self.assertEqual(journal_close.call_count, 1)
+        self.assertEqual(seqstore_close.call_count, 1)
+        self.assertEqual(wirelog_close.call_count, 1)
+        self.assertIsNone(registry.get((b'CLIENT', b'HOST')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+import unittest
+
+from util import parse
+from util.book import Ladder, Book, BookBuilder
+from util.compose import SessionTemplates
+
+#------------------------------------------------------------------------------
+
+TEMPLATES = SessionTemplates(b'HOST', b'CLIENT')
+
+def build(fields):
+    fields = [field + b'\x01' for field in fields]
+    return parse.decode(TEMPLATES.compile(fields, b'7',
+            b'20240102-03:04:05.678'))
+
+def snapshot(symbol, *levels):
+    # levels are (MDEntryType, price, size)
+    fields = [b'35=W', b'55=' + symbol,
+            b'268=' + str(len(levels)).encode('utf-8')]
+    for MDEntryType, price, size in levels:
+        fields += [b'269=' + MDEntryType, b'270=' + price, b'271=' + size]
+    return build(fields)
+
+def incremental(*entries):
+    # entries are (MDUpdateAction, MDEntryType, symbol or None, price, size
+    # or None)
+    fields = [b'35=X', b'268=' + str(len(entries)).encode('utf-8')]
+    for action, MDEntryType, symbol, price, size in entries:
+        fields += [b'279=' + action, b'269=' + MDEntryType]
+        if symbol is not None:
+            fields.append(b'55=' + symbol)
+        fields.append(b'270=' + price)
+        if size is not None:
+            fields.append(b'271=' + size)
+    return build(fields)
+
+#------------------------------------------------------------------------------
+
+class LadderTest(unittest.TestCase):
+
+    def test_ascending(self):
+        ladder = Ladder()
+        for price, size in ((101.0, 1.0), (100.0, 2.0), (102.0, 3.0)):
+            ladder.set(price, size)
+        self.assertEqual(ladder.top(),
+                [(100.0, 2.0), (101.0, 1.0), (102.0, 3.0)])
+        self.assertEqual(ladder.top(2), [(100.0, 2.0), (101.0, 1.0)])
+
+    def test_descending(self):
+        ladder = Ladder(descending=True)
+        for price in (99.0, 100.5, 98.0):
+            ladder.set(price, 1.0)
+        self.assertEqual([price for price, size in ladder.top()],
+                [100.5, 99.0, 98.0])
+
+    def test_update_and_delete(self):
+        ladder = Ladder(descending=True)
+        ladder.set(100.0, 1.0)
+        ladder.set(99.0, 1.0)
+        ladder.set(100.0, 5.0)
+        self.assertEqual(len(ladder), 2)
+        self.assertEqual(ladder.top(1), [(100.0, 5.0)])
+
+        ladder.delete(100.0)
+        ladder.delete(42.0)
+        self.assertEqual(ladder.top(), [(99.0, 1.0)])
+        ladder.clear()
+        self.assertEqual(ladder.top(), [])
+
+#------------------------------------------------------------------------------
+
+class BookBuilderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.builder = BookBuilder()
+        self.builder.apply(snapshot(b'BTC',
+                (b'0', b'100', b'1'), (b'0', b'99.5', b'2'),
+                (b'1', b'101', b'3'), (b'1', b'102', b'4')))
+
+    def top(self, symbol=b'BTC'):
+        book = self.builder.get(symbol)
+        return book.bids.top(), book.offers.top()
+
+    def test_snapshot(self):
+        self.assertEqual(self.top(), ([(100.0, 1.0), (99.5, 2.0)],
+                [(101.0, 3.0), (102.0, 4.0)]))
+
+    def test_snapshot_replaces(self):
+        changed = self.builder.apply(snapshot(b'BTC', (b'1', b'105', b'1')))
+        self.assertEqual(changed, {b'BTC'})
+        self.assertEqual(self.top(), ([], [(105.0, 1.0)]))
+
+    def test_new_change_delete(self):
+        changed = self.builder.apply(incremental(
+                (b'0', b'0', b'BTC', b'100.5', b'7'),
+                (b'1', b'1', None, b'101', b'0.5'),
+                (b'2', b'0', None, b'99.5', None),
+                ))
+        self.assertEqual(changed, {b'BTC'})
+        self.assertEqual(self.top(), ([(100.5, 7.0), (100.0, 1.0)],
+                [(101.0, 0.5), (102.0, 4.0)]))
+
+    def test_several_symbols(self):
+        changed = self.builder.apply(incremental(
+                (b'0', b'1', b'ETH', b'10', b'1'),
+                (b'0', b'0', None, b'9', b'1'),
+                (b'2', b'1', b'BTC', b'102', None),
+                ))
+        self.assertEqual(changed, {b'ETH', b'BTC'})
+        self.assertEqual(self.top(b'ETH'), ([(9.0, 1.0)], [(10.0, 1.0)]))
+        self.assertEqual(self.top()[1], [(101.0, 3.0)])
+
+    def test_ignored_entries(self):
+        changed = self.builder.apply(incremental(
+                # Trade entries, no book side
+                (b'0', b'2', b'BTC', b'100', b'1'),
+                # New without a size
+                (b'0', b'0', None, b'98', None),
+                # Unknown action
+                (b'5', b'0', None, b'97', b'1'),
+                # Deleting a level that is not there
+                (b'2', b'1', None, b'150', None),
+                ))
+        self.assertEqual(changed, {b'BTC'})
+        self.assertEqual(self.top(), ([(100.0, 1.0), (99.5, 2.0)],
+                [(101.0, 3.0), (102.0, 4.0)]))
+
+    def test_no_symbol(self):
+        # Entries before any Symbol have no book to go to
+        changed = self.builder.apply(incremental(
+                (b'0', b'0', None, b'100', b'1')))
+        self.assertEqual(changed, set())
+
+    def test_other_types(self):
+        self.assertEqual(self.builder.apply(build([b'35=0'])), set())
+
+    def test_malformed_group(self):
+        with self.assertRaises(parse.ParseError):
+            self.builder.apply(build([b'35=X', b'268=2', b'279=0',
+                    b'269=0', b'55=BTC', b'270=1', b'271=1']))
+
+#------------------------------------------------------------------------------
+
+class SnapshotTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        book = Book(b'BTC')
+        for price, size in ((100.0, 1.5), (99.0, 2.0), (98.0, 1e-05)):
+            book.bids.set(price, size)
+        book.offers.set(101.25, 3.0)
+
+        msg = parse.decode(book.snapshot(depth=2))
+        self.assertEqual(msg.MsgType, b'W')
+        self.assertEqual(msg.get(268), b'3')
+
+        builder = BookBuilder()
+        builder.apply(msg)
+        copy = builder.get(b'BTC')
+        self.assertEqual(copy.bids.top(), book.bids.top(2))
+        self.assertEqual(copy.offers.top(), book.offers.top())
+
+    def test_small_values(self):
+        book = Book(b'BTC')
+        book.bids.set(0.0001, 1e-05)
+        msg = parse.decode(book.snapshot())
+        self.assertEqual(msg.get(270), b'0.0001')
+        self.assertEqual(msg.get(271), b'0.00001')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import calendar
+import unittest
+from unittest import mock
+
+from util import clock as clock_module
+from util.clock import Clock, MILLISECONDS, MICROSECONDS, NANOSECONDS
+
+#------------------------------------------------------------------------------
+
+SECOND = 1000000000
+
+# 2024-01-02 03:04:05 UTC, in nanoseconds
+WALL = calendar.timegm((2024, 1, 2, 3, 4, 5)) * SECOND
+
+class FakeTime:
+
+    def __init__(self, mono, wall):
+        self.mono = mono
+        self.wall = wall
+        self.wall_reads = 0
+
+    def monotonic_ns(self):
+        return self.mono
+
+    def time_ns(self):
+        self.wall_reads += 1
+        return self.wall
+
+    def advance(self, ns, drift=0):
+        # The system clock moves by 'drift' more than the monotonic one
+        self.mono += ns
+        self.wall += ns + drift
+
+#------------------------------------------------------------------------------
+
+class ClockTest(unittest.TestCase):
+
+    def setUp(self):
+        self.time = FakeTime(5 * SECOND, WALL + 250000000)
+        patcher = mock.patch.multiple(clock_module,
+                monotonic_ns=self.time.monotonic_ns,
+                time_ns=self.time.time_ns)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_read_calibrates_once_a_second(self):
+        clock = Clock()
+        self.assertEqual(clock.read(), (5 * SECOND, WALL + 250000000))
+        self.assertEqual(self.time.wall_reads, 1)
+
+        self.time.advance(700000000)
+        self.assertEqual(clock.read()[1], WALL + 950000000)
+        self.assertEqual(self.time.wall_reads, 1)
+
+        self.time.advance(100000000)
+        self.assertEqual(clock.read()[1], WALL + SECOND + 50000000)
+        self.assertEqual(self.time.wall_reads, 2)
+
+    def test_system_clock_step(self):
+        # A step of the system clock is picked up at the next second
+        clock = Clock()
+        clock.read()
+        self.time.advance(100000000, drift=2 * SECOND)
+        self.assertEqual(clock.read()[1], WALL + 350000000)
+        self.time.advance(700000000)
+        self.assertEqual(clock.read()[1], WALL + 3 * SECOND + 50000000)
+        self.assertEqual(self.time.wall_reads, 2)
+
+    def test_sending_time(self):
+        wall = WALL + 7654321
+        self.assertEqual(Clock(MILLISECONDS).SendingTime(wall),
+                b'20240102-03:04:05.007')
+        self.assertEqual(Clock(MICROSECONDS).SendingTime(wall),
+                b'20240102-03:04:05.007654')
+        self.assertEqual(Clock(NANOSECONDS).SendingTime(wall),
+                b'20240102-03:04:05.007654321')
+
+    def test_sending_time_now(self):
+        self.assertEqual(Clock().SendingTime(), b'20240102-03:04:05.250')
+
+    def test_prefix_not_stale(self):
+        clock = Clock()
+        self.assertEqual(clock.SendingTime(WALL + 999999999),
+                b'20240102-03:04:05.999')
+        self.assertEqual(clock.SendingTime(WALL + SECOND),
+                b'20240102-03:04:06.000')
+        # Going back a second, after a clock step, is not stale either
+        self.assertEqual(clock.SendingTime(WALL + 1),
+                b'20240102-03:04:05.000')
+        self.assertEqual(clock.SendingTime(WALL + 55 * SECOND),
+                b'20240102-03:05:00.000')
+
+    def test_invalid_precision(self):
+        with self.assertRaises(ValueError):
+            Clock(4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+
+from util import parse
+from util.compose import (SessionTemplates, MessageTemplate, CompileError,
+        compile_message, possible_duplicate)
+
+#------------------------------------------------------------------------------
+
+SENDING_TIME = b'20240102-03:04:05.678'
+
+def split(message):
+    # The fields of a message, without their delimiters
+    return message.rstrip(b'\x01').split(b'\x01')
+
+def field(message, tag):
+    prefix = tag + b'='
+    for item in split(message):
+        if item.startswith(prefix):
+            return item[len(prefix):]
+
+#------------------------------------------------------------------------------
+
+class TemplateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.templates = SessionTemplates(b'CLIENT', b'HOST')
+        self.body = [b'11=order1\x01', b'55=BTCUSD\x01', b'54=1\x01',
+                b'38=100\x01', b'40=2\x01', b'44=101.25\x01']
+
+    def reference(self, MsgType, body, MsgSeqNum=b'12'):
+        # compile_message has the header fields in a different order, which
+        # changes neither BodyLength nor CheckSum
+        return compile_message([b'35=' + MsgType + b'\x01',
+                b'49=CLIENT\x01', b'56=HOST\x01',
+                b'52=' + SENDING_TIME + b'\x01'] + body, MsgSeqNum)
+
+    def test_matches_compile_message(self):
+        for body in ([], self.body, self.body * 20):
+            message = self.templates.compile([b'35=D\x01'] + body, b'12',
+                    SENDING_TIME)
+            expected = self.reference(b'D', body)
+            self.assertEqual(len(message), len(expected))
+            self.assertEqual(field(message, b'9'), field(expected, b'9'))
+            self.assertEqual(field(message, b'10'), field(expected, b'10'))
+            self.assertEqual(sorted(split(message)), sorted(split(expected)))
+
+    def test_valid_message(self):
+        message = self.templates.compile([b'35=D\x01'] + self.body, b'7',
+                SENDING_TIME)
+        msg = parse.decode(message)
+        self.assertEqual(msg.MsgType, b'D')
+        self.assertEqual(msg.MsgSeqNum, 7)
+        self.assertEqual(msg.get(49), b'CLIENT')
+        self.assertEqual(msg.get(56), b'HOST')
+        self.assertEqual(msg.get(52), SENDING_TIME)
+        self.assertEqual(msg.get(44), b'101.25')
+
+    def test_header_fields_dropped(self):
+        fields = [b'35=0\x01', b'34=99\x01', b'49=X\x01', b'52=Y\x01',
+                b'56=Z\x01', b'112=test\x01']
+        message = self.templates.compile(fields, b'3', SENDING_TIME)
+        self.assertEqual(message, self.templates.compile(
+                [b'35=0\x01', b'112=test\x01'], b'3', SENDING_TIME))
+        self.assertEqual(parse.decode(message).MsgSeqNum, 3)
+
+    def test_joined_fields(self):
+        message = self.templates.compile(b''.join([b'35=D\x01'] + self.body),
+                b'5', SENDING_TIME)
+        self.assertEqual(message, self.templates.compile(
+                [b'35=D\x01'] + self.body, b'5', SENDING_TIME))
+
+    def test_static_fields(self):
+        static = [b'98=0\x01', b'108=30\x01']
+        template = MessageTemplate(b'A', b'CLIENT', b'HOST',
+                static_fields=static)
+        message = template.compile(b'1', SENDING_TIME, [b'141=Y\x01'])
+        expected = self.reference(b'A', static + [b'141=Y\x01'], b'1')
+        self.assertEqual(field(message, b'9'), field(expected, b'9'))
+        self.assertEqual(field(message, b'10'), field(expected, b'10'))
+        parse.decode(message)
+
+    def test_compile_into(self):
+        buffer = bytearray(b'previous')
+        MsgType = self.templates.compile_into(buffer,
+                [b'35=D\x01'] + self.body, b'8', SENDING_TIME)
+        self.assertEqual(MsgType, b'D')
+        self.assertEqual(bytes(buffer[8:]), self.templates.compile(
+                [b'35=D\x01'] + self.body, b'8', SENDING_TIME))
+
+    def test_invalid_fields(self):
+        buffer = bytearray(b'previous')
+        for fields in ([b'35=D\x01', 38], [b'35=D\x01', b'11=a\x01', None],
+                [], None, {'MsgType': b'D'}):
+            with self.assertRaises(CompileError):
+                self.templates.compile_into(buffer, fields, b'1',
+                        SENDING_TIME)
+            with self.assertRaises(CompileError):
+                self.templates.compile(fields, b'1', SENDING_TIME)
+        self.assertEqual(buffer, b'previous')
+
+    def test_msgtype_first(self):
+        for fields in ([b'55=BTCUSD\x01', b'35=D\x01'], b'55=BTCUSD\x01'):
+            with self.assertRaises(CompileError):
+                self.templates.compile(fields, b'1', SENDING_TIME)
+
+#------------------------------------------------------------------------------
+
+class PossibleDuplicateTest(unittest.TestCase):
+
+    def test_restamped(self):
+        templates = SessionTemplates(b'CLIENT', b'HOST')
+        original = templates.compile([b'35=D\x01', b'11=order1\x01'], b'4',
+                SENDING_TIME)
+        resent = possible_duplicate(original, b'20240102-04:00:00.000')
+        msg = parse.decode(resent)
+        self.assertEqual(msg.MsgSeqNum, 4)
+        self.assertEqual(msg.get(43), b'Y')
+        self.assertEqual(msg.get(52), b'20240102-04:00:00.000')
+        self.assertEqual(msg.get(122), SENDING_TIME)
+        self.assertEqual(msg.get(11), b'order1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import calendar
+import unittest
+from decimal import Decimal
+
+from util import convert, dictionary
+from util.convert import (Converters, to_bool, to_decimal, fixed_point,
+        to_epoch_ns)
+
+#------------------------------------------------------------------------------
+
+# 2024-01-02 03:04:05 UTC
+SECONDS = calendar.timegm((2024, 1, 2, 3, 4, 5))
+
+class Untyped:
+    # A dictionary generated without field types
+    def __init__(self):
+        FIX = dictionary.get()
+        self.names = FIX.names
+        self.tags = FIX.tags
+        self.types = ()
+
+#------------------------------------------------------------------------------
+
+class ValueTest(unittest.TestCase):
+
+    def test_bool(self):
+        self.assertIs(to_bool(b'Y'), True)
+        self.assertIs(to_bool(b'N'), False)
+        for raw in (b'y', b'', b'YES'):
+            with self.assertRaises(ValueError):
+                to_bool(raw)
+
+    def test_decimal(self):
+        self.assertEqual(to_decimal(b'100.50'), Decimal('100.50'))
+        self.assertEqual(to_decimal(b'-0.001'), Decimal('-0.001'))
+
+    def test_fixed_point(self):
+        to_fixed = fixed_point(2)
+        for raw, value in (
+                (b'100', 10000),
+                (b'100.5', 10050),
+                (b'100.25', 10025),
+                (b'100.259', 10025),    # truncated, not rounded
+                (b'-1.5', -150),
+                (b'-0.001', 0),
+                (b'.5', 50),
+                (b'5.', 500),
+                (b'007.10', 710),
+                ):
+            self.assertEqual(to_fixed(raw), value, raw)
+        self.assertEqual(fixed_point(0)(b'12.99'), 12)
+        self.assertEqual(fixed_point(8)(b'0.00000001'), 1)
+        with self.assertRaises(ValueError):
+            to_fixed(b'1.x')
+
+    def test_timestamp(self):
+        ns = SECONDS * 1000000000
+        for raw, value in (
+                (b'20240102-03:04:05', ns),
+                (b'20240102-03:04:05.678', ns + 678000000),
+                (b'20240102-03:04:05.678901', ns + 678901000),
+                (b'20240102-03:04:05.678901234', ns + 678901234),
+                (b'20240102-03:04:05.6', ns + 600000000),
+                # Beyond nanoseconds is dropped
+                (b'20240102-03:04:05.6789012345', ns + 678901234),
+                (b'20240229-23:59:60', (calendar.timegm(
+                        (2024, 2, 29, 23, 59, 0)) + 60) * 1000000000),
+                ):
+            self.assertEqual(to_epoch_ns(raw), value, raw)
+
+    def test_invalid_timestamp(self):
+        for raw in (b'', b'2024010-03:04:05', b'20240102 03:04:05',
+                b'20240102-03-04:05', b'20240102-03:04:05,678',
+                b'20240102-03:04:05.', b'20240102-03:04:05.6x',
+                b'2024AB02-03:04:05', b'20241302-03:04:05'):
+            with self.assertRaises(ValueError, msg=raw):
+                to_epoch_ns(raw)
+
+#------------------------------------------------------------------------------
+
+class ConvertersTest(unittest.TestCase):
+
+    def test_by_type(self):
+        converters = Converters()
+        self.assertEqual(converters.convert(34, b'12'), 12)
+        self.assertEqual(converters.convert(44, b'1.5'), Decimal('1.5'))
+        self.assertIs(converters.convert(43, b'Y'), True)
+        self.assertEqual(converters.convert(52, b'20240102-03:04:05'),
+                SECONDS * 1000000000)
+        self.assertEqual(converters.convert(55, b'BTC'), b'BTC')
+
+    def test_unknown_tag(self):
+        converters = Converters()
+        self.assertEqual(converters.convert(len(converters.by_tag), b'1'),
+                b'1')
+        self.assertEqual(converters.convert(1000000, b'x'), b'x')
+
+    def test_price_scale(self):
+        converters = Converters(price_scale=4)
+        self.assertEqual(converters.convert(44, b'101.25'), 1012500)
+        self.assertEqual(converters.convert(38, b'3'), 30000)
+        self.assertEqual(converters.convert(34, b'3'), 3)
+
+    def test_common_types(self):
+        converters = Converters(Untyped())
+        self.assertEqual(converters.convert(34, b'12'), 12)
+        self.assertEqual(converters.convert(270, b'1.5'), Decimal('1.5'))
+        self.assertIs(converters.convert(141, b'N'), False)
+        self.assertEqual(converters.convert(58, b'text'), b'text')
+
+    def test_set_price_scale(self):
+        self.addCleanup(setattr, convert, '_converters', convert._converters)
+        convert.set_price_scale(2)
+        self.assertEqual(convert.converters().convert(44, b'1.5'), 150)
+        convert.set_price_scale(None)
+        self.assertEqual(convert.converters().convert(44, b'1.5'),
+                Decimal('1.5'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import pickle
+import unittest
+
+from util import TAGS, MSGS, dictionary
+from util import path as util_path
+
+#------------------------------------------------------------------------------
+
+def load(name):
+    with open(os.path.join(util_path, name), 'rb') as f:
+        return pickle.load(f)
+
+#------------------------------------------------------------------------------
+
+class LegacyPicklesTest(unittest.TestCase):
+    # The generated dictionary replaced FIXtags.pkl and FIXmsgs.pkl, which
+    # stay as the reference for the names
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tags = load('FIXtags.pkl')
+        cls.msgs = load('FIXmsgs.pkl')
+        cls.FIX = dictionary.get(b'FIX.4.4')
+
+    def test_legacy_mappings(self):
+        self.assertEqual(dict(TAGS), self.tags)
+        self.assertEqual(dict(MSGS), self.msgs)
+
+    def test_names(self):
+        names = dict((tag, name) for tag, name in self.tags.items()
+                if type(tag) is int)
+        self.assertEqual(dict((tag, name)
+                for tag, name in enumerate(self.FIX.names)
+                if name is not None), names)
+        for tag, name in names.items():
+            self.assertEqual(self.FIX.tags[name], tag)
+            self.assertEqual(self.FIX.tags[name.decode('utf-8')], tag)
+            self.assertEqual(self.FIX.prefixes[tag],
+                    str(tag).encode('utf-8') + b'=')
+
+    def test_messages(self):
+        # The pickle maps MsgType to name and name to MsgType
+        messages = self.FIX.messages
+        self.assertEqual(len([key for key in self.msgs if type(key) is bytes]),
+                2 * len(messages))
+        for MsgType, name in messages.items():
+            self.assertEqual(self.msgs[MsgType], name)
+            self.assertEqual(self.msgs[name], MsgType)
+            self.assertEqual(self.FIX.msg_types[name], MsgType)
+
+    def test_lookups(self):
+        FIX = self.FIX
+        self.assertEqual(FIX.name(35), b'MsgType')
+        self.assertIsNone(FIX.name(-1))
+        self.assertIsNone(FIX.name(100000))
+        self.assertIsNone(FIX.type(100000))
+        self.assertIs(dictionary.get(), FIX)
+
+    def test_unknown_version(self):
+        with self.assertRaises(KeyError):
+            dictionary.get(b'FIX.4.0')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,226 @@
+import sys
+import shutil
+import asyncio
+import tempfile
+import unittest
+
+if sys.version_info >= (3, 7):
+    # server/ is written for the asyncio of Python 3.6 ('asyncio.async')
+    raise unittest.SkipTest('server requires Python 3.6')
+
+from server.FIXclient import FIXclient, OVERFLOW_CONFLATE
+from util import parse
+from util.book import BookBuilder
+from util.journal import OutboundJournal
+from util.seqstore import SequenceStore
+from util.compose import SessionTemplates
+
+#------------------------------------------------------------------------------
+
+HOST = SessionTemplates(b'HOST', b'CLIENT')
+
+def host(MsgSeqNum, fields):
+    return HOST.compile(list(fields), str(MsgSeqNum).encode('utf-8'),
+            b'20240102-03:04:05.678')
+
+LOGON = [b'35=A\x01', b'98=0\x01', b'108=30\x01']
+RESET_LOGON = LOGON + [b'141=Y\x01']
+
+
+class Transport(asyncio.Transport):
+
+    def __init__(self):
+        super().__init__({'peername': ('127.0.0.1', 9880)})
+        self.written = bytearray()
+
+    def write(self, data):
+        self.written += data
+
+    def get_write_buffer_size(self):
+        return 0
+
+    def pause_reading(self):
+        pass
+
+    def resume_reading(self):
+        pass
+
+    def close(self):
+        pass
+
+#------------------------------------------------------------------------------
+
+class SessionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.addCleanup(self.loop.close)
+        self.addCleanup(asyncio.set_event_loop, None)
+        self.api = []
+        self.keys = []
+
+    def api_out(self, data, key=None):
+        self.api.append(bytes(data))
+        self.keys.append(key)
+
+    def connect(self, **kwargs):
+        client = FIXclient(30, b'CLIENT', b'HOST', **kwargs)
+        client.api_out = self.api_out
+        self.transport = Transport()
+        client.connection_made(self.transport)
+        self.addCleanup(self.disconnect, client)
+        return client
+
+    def disconnect(self, client):
+        if client.connected:
+            client.connection_lost(None)
+        self.run_loop()
+
+    def run_loop(self):
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+
+    def sent(self):
+        return [parse.decode(frame) for frame in
+                parse.FrameDecoder().feed(bytes(self.transport.written))]
+
+    def test_rejected_message_keeps_sequence(self):
+        client = self.connect()
+        client.put_outgoing([b'35=D\x01', b'11=bad\x01', 38])
+        client.put_outgoing([b'35=D\x01', b'11=good\x01'])
+        with self.assertLogs('server.FIXclient', 'ERROR'):
+            self.run_loop()
+        sent = self.sent()
+        self.assertEqual([msg.get(11) for msg in sent], [b'good'])
+        self.assertEqual(sent[0].MsgSeqNum, 1)
+        self.assertEqual(client._local_MsgSeqNum, 1)
+
+
+#------------------------------------------------------------------------------
+
+class DispatchTest(SessionTest):
+
+    def setUp(self):
+        super().setUp()
+        self.client = self.connect()
+
+    def receive(self, *messages):
+        for MsgSeqNum, fields in enumerate(messages, 1):
+            self.client.data_received(host(MsgSeqNum, fields))
+        self.run_loop()
+
+    def test_unknown_types_to_api(self):
+        self.receive([b'35=8\x01', b'11=order1\x01'],
+                [b'35=UX\x01', b'58=custom\x01'],
+                [b'35=W\x01', b'55=BTC\x01', b'268=0\x01'])
+        self.assertEqual([parse.decode(message).MsgType
+                for message in self.api], [b'8', b'UX', b'W'])
+        self.assertEqual(self.sent(), [])
+        self.assertEqual(self.client._host_MsgSeqNum, 3)
+
+    def test_session_types_handled(self):
+        with self.assertLogs('server.FIXclient', 'WARNING'):
+            self.receive([b'35=0\x01'], [b'35=1\x01', b'112=ping\x01'],
+                    [b'35=3\x01', b'45=1\x01'])
+        # Only the Reject concerns the API client
+        self.assertEqual([parse.decode(message).MsgType
+                for message in self.api], [b'3'])
+        heartbeat = self.sent()[0]
+        self.assertEqual(heartbeat.MsgType, b'0')
+        self.assertEqual(heartbeat.get(112), b'ping')
+
+    def test_malformed_session_message(self):
+        with self.assertLogs('server.FIXclient', 'WARNING'):
+            self.receive([b'35=2\x01', b'7=x\x01', b'16=0\x01'],
+                    [b'35=0\x01'])
+        reject = self.sent()[0]
+        self.assertEqual(reject.MsgType, b'3')
+        self.assertEqual(reject.get(45), b'1')
+        self.assertEqual(reject.get(372), b'2')
+        # The session carries on
+        self.assertEqual(self.client._host_MsgSeqNum, 2)
+
+#------------------------------------------------------------------------------
+
+class ConflationTest(SessionTest):
+
+    def test_book_keys(self):
+        client = self.connect(book=BookBuilder())
+        client.subscribe_book()
+        client.data_received(host(1, [b'35=W\x01', b'55=BTC\x01',
+                b'268=1\x01', b'269=0\x01', b'270=100\x01', b'271=1\x01']))
+        self.run_loop()
+        client.subscribe_book([b'BTC'], 5)
+        self.assertEqual(self.keys, [('CLIENT-HOST', b'book', b'BTC')] * 2)
+
+    def test_snapshot_keys(self):
+        client = self.connect(overflow=OVERFLOW_CONFLATE)
+        client.api_backlog(True)
+        client.data_received(host(1, [b'35=W\x01', b'55=BTC\x01',
+                b'268=0\x01']))
+        self.run_loop()
+        self.assertEqual(self.keys, [('CLIENT-HOST', b'W', b'BTC')])
+
+#------------------------------------------------------------------------------
+
+class ResetSeqNumTest(SessionTest):
+
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        # Yesterday's session ended at 10 sent, 12 received
+        store = SequenceStore.open(directory, b'CLIENT', b'HOST')
+        store.update(10, 12)
+        journal = OutboundJournal.open(directory, b'CLIENT', b'HOST')
+        self.client = self.connect(seqstore=store, journal=journal)
+        self.client.journal.append(10, b'old', False)
+
+    def assertReset(self, local, host):
+        client = self.client
+        self.assertEqual((client._local_MsgSeqNum, client._host_MsgSeqNum),
+                (local, host))
+        self.assertEqual((client.seqstore.local, client.seqstore.host),
+                (local, host))
+        self.assertEqual(client._reorder.expected, host + 1)
+        self.assertEqual(client.journal.last_seq, local)
+
+    def test_restored(self):
+        self.client.put_outgoing(LOGON)
+        self.run_loop()
+        self.assertEqual(self.sent()[0].MsgSeqNum, 11)
+        self.assertEqual(self.client._reorder.expected, 13)
+
+    def test_reset_sent(self):
+        client = self.client
+        client.put_outgoing(RESET_LOGON)
+        self.run_loop()
+        self.assertEqual(self.sent()[0].MsgSeqNum, 1)
+        self.assertReset(1, 0)
+
+        client.data_received(host(1, RESET_LOGON))
+        self.run_loop()
+        self.assertReset(1, 1)
+
+        client.data_received(host(2, [b'35=8\x01']))
+        client.put_outgoing([b'35=D\x01', b'11=order1\x01'])
+        self.run_loop()
+        self.assertEqual([msg.MsgSeqNum for msg in self.sent()], [1, 2])
+        self.assertReset(2, 2)
+        self.assertEqual([parse.decode(message).MsgType
+                for message in self.api], [b'A', b'8'])
+
+    def test_reset_received(self):
+        # The host resets unprompted; our next message is 1 as well
+        client = self.client
+        client.data_received(host(1, RESET_LOGON))
+        self.run_loop()
+        self.assertReset(0, 1)
+
+        client.put_outgoing(RESET_LOGON)
+        self.run_loop()
+        self.assertEqual(self.sent()[0].MsgSeqNum, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import math
+import unittest
+
+from util.compose import SessionTemplates
+from util.groups import decode_groups
+from util.message import Message
+from util.parse import ParseError, CHECK_FIELD
+
+#------------------------------------------------------------------------------
+
+TEMPLATES = SessionTemplates(b'HOST', b'CLIENT')
+
+def build(fields):
+    fields = [field + b'\x01' for field in fields]
+    return Message(TEMPLATES.compile(fields, b'7', b'20240102-03:04:05.678'))
+
+def incremental(*entries, count=None):
+    fields = [b'35=X', b'262=req1',
+            b'268=' + str(len(entries) if count is None else count).encode()]
+    for entry in entries:
+        fields += entry
+    return build(fields)
+
+#------------------------------------------------------------------------------
+
+class DecodeGroupsTest(unittest.TestCase):
+
+    def assertInvalid(self, msg, text):
+        with self.assertRaises(ParseError) as context:
+            decode_groups(msg)
+        self.assertEqual(context.exception.check, CHECK_FIELD)
+        self.assertIn(text, str(context.exception))
+
+    def test_regular_entries(self):
+        msg = incremental(
+                [b'279=0', b'269=0', b'55=BTC', b'270=100.5', b'271=2'],
+                [b'279=1', b'269=1', b'55=ETH', b'270=101', b'271=3.5'],
+                [b'279=2', b'269=0', b'55=BTC', b'270=99', b'271=0'])
+        group = decode_groups(msg)['NoMDEntries']
+        self.assertEqual(len(group), 3)
+        self.assertEqual(bytes(group['MDUpdateAction']), b'012')
+        self.assertEqual(bytes(group['MDEntryType']), b'010')
+        self.assertEqual(list(group['MDEntryPx']), [100.5, 101.0, 99.0])
+        self.assertEqual(list(group['MDEntrySize']), [2.0, 3.5, 0.0])
+        self.assertEqual(group['Symbol'], [b'BTC', b'ETH', b'BTC'])
+        self.assertEqual(group['MDEntryID'], [None] * 3)
+        self.assertEqual(list(group['NumberOfOrders']), [0] * 3)
+
+    def test_irregular_entries(self):
+        # Entries with different fields fill the absent ones with defaults
+        msg = incremental(
+                [b'279=0', b'269=0', b'55=BTC', b'270=100.5', b'271=2'],
+                [b'279=2', b'269=1', b'270=101'],
+                [b'279=0', b'269=1', b'270=102', b'271=1', b'346=4'])
+        group = decode_groups(msg)['NoMDEntries']
+        self.assertEqual(list(group['MDEntryPx']), [100.5, 101.0, 102.0])
+        sizes = group['MDEntrySize']
+        self.assertEqual(sizes[0], 2.0)
+        self.assertTrue(math.isnan(sizes[1]))
+        self.assertEqual(sizes[2], 1.0)
+        self.assertEqual(group['Symbol'], [b'BTC', None, None])
+        self.assertEqual(list(group['NumberOfOrders']), [0, 0, 4])
+
+    def test_last_entry_longer(self):
+        msg = incremental([b'279=0', b'269=0', b'270=1'],
+                [b'279=0', b'269=0', b'270=2', b'271=5'])
+        group = decode_groups(msg)['NoMDEntries']
+        self.assertEqual(list(group['MDEntryPx']), [1.0, 2.0])
+        self.assertTrue(math.isnan(group['MDEntrySize'][0]))
+        self.assertEqual(group['MDEntrySize'][1], 5.0)
+
+    def test_single_entry(self):
+        msg = incremental([b'279=0', b'269=1', b'270=5'])
+        group = decode_groups(msg)['NoMDEntries']
+        self.assertEqual(list(group['MDEntryPx']), [5.0])
+        self.assertEqual(bytes(group['MDEntryType']), b'1')
+
+    def test_empty_group(self):
+        group = decode_groups(incremental())['NoMDEntries']
+        self.assertEqual(len(group), 0)
+        self.assertEqual(list(group['MDEntryPx']), [])
+
+    def test_group_ends_at_other_field(self):
+        msg = build([b'35=X', b'268=1', b'279=0', b'269=0', b'270=5',
+                b'58=text', b'270=6'])
+        group = decode_groups(msg)['NoMDEntries']
+        self.assertEqual(list(group['MDEntryPx']), [5.0])
+        self.assertEqual(msg.get(58), b'text')
+
+    def test_several_groups(self):
+        msg = build([b'35=V', b'262=req1', b'263=1', b'264=0',
+                b'267=2', b'269=0', b'269=1',
+                b'146=2', b'55=BTC', b'55=ETH', b'48=E1'])
+        groups = decode_groups(msg)
+        self.assertEqual(bytes(groups['NoMDEntryTypes']['MDEntryType']),
+                b'01')
+        related = groups['NoRelatedSym']
+        self.assertEqual(related['Symbol'], [b'BTC', b'ETH'])
+        self.assertEqual(related['SecurityID'], [None, b'E1'])
+
+    def test_no_groups(self):
+        self.assertEqual(decode_groups(build([b'35=0'])), {})
+
+    def test_fewer_entries_than_count(self):
+        msg = incremental([b'279=0', b'269=0', b'270=5'], count=2)
+        self.assertInvalid(msg, 'NoMDEntries is 2, found 1 entries')
+
+    def test_more_entries_than_count(self):
+        msg = incremental([b'279=0', b'269=0', b'270=5'],
+                [b'279=0', b'269=0', b'270=6'], count=1)
+        group = decode_groups(msg)['NoMDEntries']
+        self.assertEqual(list(group['MDEntryPx']), [5.0])
+
+    def test_missing_delimiter(self):
+        msg = incremental([b'269=0', b'279=0', b'270=5'])
+        self.assertInvalid(msg, 'does not start with its delimiter')
+
+    def test_invalid_count(self):
+        self.assertInvalid(incremental(count='x'), "Invalid NoMDEntries")
+
+    def test_invalid_values(self):
+        for entry, text in (
+                ([b'279=0', b'270=abc'], "MDEntryPx in NoMDEntries: b'abc'"),
+                ([b'279=0', b'346=1.5'], "NumberOfOrders in NoMDEntries"),
+                ([b'279=01'], "MDUpdateAction in NoMDEntries: b'01'"),
+                ):
+            self.assertInvalid(incremental(
+                    [b'279=0', b'270=1', b'346=1'], entry), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from util.journal import OutboundJournal
+
+#------------------------------------------------------------------------------
+
+class OutboundJournalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'CLIENT-HOST')
+
+        self.current = None
+
+    def tearDown(self):
+        if self.current is not None:
+            self.current.close()
+        shutil.rmtree(self.directory)
+
+    def journal(self):
+        # (Re)open the journal, with small files so that appending has to
+        # grow them
+        if self.current is not None:
+            self.current.close()
+            self.current = None
+        self.current = OutboundJournal(self.path, data_size=64,
+                index_size=64)
+        return self.current
+
+    def get(self, journal, MsgSeqNum):
+        frame, admin = journal.get(MsgSeqNum)
+        if frame is None:
+            return None, admin
+        with frame:
+            return frame.tobytes(), admin
+
+    def test_append_and_get(self):
+        journal = self.journal()
+        journal.append(1, b'logon', admin=True)
+        journal.append(2, b'order' * 20)
+        self.assertEqual(len(journal), 2)
+        self.assertEqual(self.get(journal, 1), (b'logon', True))
+        self.assertEqual(self.get(journal, 2), (b'order' * 20, False))
+        self.assertEqual(self.get(journal, 0), (None, False))
+        self.assertEqual(self.get(journal, 3), (None, False))
+
+    def test_gaps(self):
+        journal = self.journal()
+        journal.append(1, b'a')
+        journal.append(20, b't')
+        self.assertEqual(journal.last_seq, 20)
+        self.assertEqual(self.get(journal, 10), (None, False))
+        self.assertEqual([MsgSeqNum for MsgSeqNum, frame, admin
+                in journal.range(1, 20) if frame is not None], [1, 20])
+
+    def test_reload(self):
+        journal = self.journal()
+        for MsgSeqNum in range(1, 101):
+            journal.append(MsgSeqNum, str(MsgSeqNum).encode('utf-8'),
+                    admin=MsgSeqNum == 1)
+        journal.flush()
+
+        journal = self.journal()
+        self.assertEqual(journal.last_seq, 100)
+        self.assertEqual(self.get(journal, 1), (b'1', True))
+        self.assertEqual(self.get(journal, 57), (b'57', False))
+        journal.append(101, b'101')
+        self.assertEqual(self.get(journal, 101), (b'101', False))
+        self.assertEqual(self.get(journal, 100), (b'100', False))
+
+    def test_reset(self):
+        journal = self.journal()
+        journal.append(1, b'a')
+        journal.append(2, b'b')
+        journal.reset()
+        self.assertEqual(journal.last_seq, 0)
+        self.assertEqual(self.get(journal, 1), (None, False))
+        journal.append(1, b'c')
+
+        journal = self.journal()
+        self.assertEqual(journal.last_seq, 1)
+        self.assertEqual(self.get(journal, 1), (b'c', False))
+        self.assertEqual(self.get(journal, 2), (None, False))
+
+    def test_open(self):
+        directory = os.path.join(self.directory, 'journal')
+        journal = OutboundJournal.open(directory, b'CLIENT', b'HOST')
+        journal.close()
+        self.assertTrue(os.path.exists(
+                os.path.join(directory, 'CLIENT-HOST.dat')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+
+from util.compose import SessionTemplates
+from util import parse
+from util.message import Message
+from util.parse import ParseError, CHECK_FIELD
+
+#------------------------------------------------------------------------------
+
+TEMPLATES = SessionTemplates(b'CLIENT', b'HOST')
+
+def build(fields, MsgSeqNum=b'7'):
+    return TEMPLATES.compile(list(fields), MsgSeqNum,
+            b'20240102-03:04:05.678')
+
+def frame(body):
+    # A message around 'body', the fields after MsgType; only the layout
+    # matters to Message, not the BodyLength and CheckSum values
+    return b'8=FIX.4.4\x019=0\x0135=D\x01' + body + b'10=000\x01'
+
+#------------------------------------------------------------------------------
+
+class MessageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.raw = build([b'35=X\x01', b'268=2\x01',
+                b'279=0\x01', b'270=100.5\x01',
+                b'279=2\x01', b'270=101\x01'])
+        self.msg = Message(self.raw)
+
+    def test_bytes(self):
+        self.assertIs(bytes(self.msg), self.raw)
+        self.assertEqual(len(self.msg), len(self.raw))
+
+    def test_decoded_frame_not_copied(self):
+        # A frame covering its whole chunk is used as is
+        frames = parse.FrameDecoder().feed(self.raw)
+        self.assertIs(bytes(parse.decode(frames[0])), self.raw)
+
+    def test_header(self):
+        self.assertEqual(self.msg.MsgType, b'X')
+        self.assertEqual(self.msg.MsgSeqNum, 7)
+        self.assertEqual(self.msg.get(8), b'FIX.4.4')
+        self.assertEqual(self.msg[49], b'CLIENT')
+
+    def test_missing(self):
+        self.assertIsNone(self.msg.get(55))
+        self.assertEqual(self.msg.get(55, b''), b'')
+        self.assertNotIn(55, self.msg)
+        self.assertRaises(KeyError, self.msg.__getitem__, 55)
+
+    def test_first_of_repeated(self):
+        self.assertEqual(self.msg.get(279), b'0')
+        self.assertEqual(self.msg.getall(279), [b'0', b'2'])
+        self.assertEqual(self.msg.getall(270), [b'100.5', b'101'])
+        self.assertEqual(self.msg.getall(55), [])
+
+    def test_iter(self):
+        fields = list(self.msg)
+        self.assertEqual(fields[0], (8, b'FIX.4.4'))
+        self.assertEqual(fields[2], (35, b'X'))
+        self.assertEqual(fields[-4:], [(279, b'0'), (270, b'100.5'),
+                (279, b'2'), (270, b'101')])
+        self.assertNotIn(10, [tag for tag, value in fields])
+
+    def test_lookups_same_after_indexing(self):
+        before = [self.msg.get(tag) for tag in (8, 34, 268, 270, 279, 55)]
+        list(self.msg)
+        after = [self.msg.get(tag) for tag in (8, 34, 268, 270, 279, 55)]
+        self.assertEqual(before, after)
+
+    def test_view(self):
+        view = self.msg.view(270)
+        self.assertIs(view.obj, self.raw)
+        self.assertEqual(bytes(view), b'100.5')
+        self.assertIsNone(self.msg.view(55))
+
+    def test_values(self):
+        self.assertEqual(self.msg.values((34, 268, 55), 0), [7, 2, 0])
+        self.assertEqual(self.msg.value(270), 100.5)
+
+    def test_value_holding_equals(self):
+        raw = frame(b'58=a=b\x0155=XY\x01')
+        msg = Message(raw)
+        self.assertEqual(msg.get(58), b'a=b')
+        self.assertEqual(list(msg)[-2:], [(58, b'a=b'), (55, b'XY')])
+        self.assertEqual(msg.get(58), b'a=b')
+
+    def test_misplaced_equals(self):
+        # One '=' too many in a value and one missing from the next field
+        # add up to the right number of '=' for the fast path
+        msg = Message(frame(b'58=1=2\x0199\x01'))
+        self.assertEqual(msg.get(58), b'1=2')
+        with self.assertRaises(ParseError) as context:
+            list(msg)
+        self.assertEqual(context.exception.check, CHECK_FIELD)
+
+    def test_malformed(self):
+        for body in (b'11abc\x01', b'=abc\x01', b'1x=abc\x01',
+                b'11=a\x01\x01'):
+            msg = Message(frame(body))
+            with self.assertRaises(ParseError) as context:
+                list(msg)
+            self.assertEqual(context.exception.check, CHECK_FIELD, body)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+
+from util.metrics import Histogram, MAX_VALUE
+
+#------------------------------------------------------------------------------
+
+class HistogramTest(unittest.TestCase):
+
+    def assertWithin(self, value, expected, precision=1 / 64):
+        self.assertLessEqual(abs(value - expected), expected * precision,
+                (value, expected))
+
+    def test_empty(self):
+        histogram = Histogram()
+        self.assertEqual(histogram.percentile(50), 0)
+        self.assertEqual(histogram.summary()['count'], 0)
+        self.assertEqual(histogram.summary()['mean'], 0)
+
+    def test_small_values_exact(self):
+        histogram = Histogram()
+        for value in range(1, 101):
+            histogram.record(value)
+        self.assertEqual(histogram.percentile(50), 50)
+        self.assertEqual(histogram.percentile(90), 90)
+        self.assertEqual(histogram.percentile(100), 100)
+        self.assertEqual(histogram.percentile(0), 1)
+
+    def test_percentiles(self):
+        histogram = Histogram()
+        for value in range(1000, 1000001, 1000):
+            histogram.record(value)
+        self.assertEqual(len(histogram), 1000)
+        self.assertWithin(histogram.percentile(50), 500000)
+        self.assertWithin(histogram.percentile(99), 990000)
+        self.assertWithin(histogram.percentile(99.9), 999000)
+        self.assertEqual(histogram.percentile(100), 1000000)
+
+    def test_upper_bound(self):
+        # A percentile is never below the true value
+        histogram = Histogram()
+        for value in (12345, 67890, 1234567):
+            histogram.record(value)
+        self.assertGreaterEqual(histogram.percentile(30), 12345)
+        self.assertGreaterEqual(histogram.percentile(60), 67890)
+        self.assertEqual(histogram.percentile(99), 1234567)
+
+    def test_clamped(self):
+        histogram = Histogram()
+        histogram.record(-5)
+        histogram.record(MAX_VALUE * 2)
+        self.assertEqual(histogram.min, 0)
+        self.assertEqual(histogram.max, MAX_VALUE)
+        self.assertEqual(histogram.percentile(100), MAX_VALUE)
+
+    def test_summary(self):
+        histogram = Histogram()
+        for value in (100, 200, 300):
+            histogram.record(value)
+        summary = histogram.summary(percentiles=(50, 99.9))
+        self.assertEqual(summary['count'], 3)
+        self.assertEqual(summary['min'], 100)
+        self.assertEqual(summary['max'], 300)
+        self.assertEqual(summary['mean'], 200)
+        self.assertWithin(summary['p50'], 200)
+        self.assertEqual(summary['p99.9'], 300)
+
+    def test_record_since(self):
+        histogram = Histogram()
+        histogram.record_since(1000, now=4000)
+        self.assertEqual(histogram.max, 3000)
+
+    def test_reset(self):
+        histogram = Histogram()
+        histogram.record(10)
+        histogram.reset()
+        self.assertEqual(len(histogram), 0)
+        self.assertIsNone(histogram.min)
+        self.assertEqual(histogram.percentile(50), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+import unittest
+
+from util import parse
+from util.compose import SessionTemplates
+from util.parse import FrameDecoder, ParseError
+
+#------------------------------------------------------------------------------
+
+TEMPLATES = SessionTemplates(b'CLIENT', b'HOST')
+
+def build(MsgSeqNum, fields=(b'35=0\x01',)):
+    return TEMPLATES.compile(list(fields), str(MsgSeqNum).encode('utf-8'),
+            b'20240102-03:04:05.678')
+
+def with_checksum(message):
+    # Replace the CheckSum of an edited message with the correct one
+    body = message[:-7]
+    return body + '10={:03d}\x01'.format(parse.checksum(body)).encode('utf-8')
+
+#------------------------------------------------------------------------------
+
+class FrameDecoderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.messages = [build(n, [b'35=D\x01', b'11=order' +
+                str(n).encode('utf-8') + b'\x01']) for n in range(1, 4)]
+        self.stream = b''.join(self.messages)
+
+    def test_whole_message(self):
+        decoder = FrameDecoder()
+        frames = decoder.feed(self.messages[0])
+        self.assertEqual([bytes(frame) for frame in frames],
+                self.messages[:1])
+        self.assertEqual(len(decoder), 0)
+
+    def test_coalesced_chunk(self):
+        frames = FrameDecoder().feed(self.stream)
+        self.assertEqual([bytes(frame) for frame in frames], self.messages)
+
+    def test_byte_by_byte(self):
+        decoder = FrameDecoder()
+        frames = []
+        for i in range(len(self.stream)):
+            frames += decoder.feed(self.stream[i:i + 1])
+        self.assertEqual([bytes(frame) for frame in frames], self.messages)
+        self.assertEqual(len(decoder), 0)
+        self.assertEqual(decoder.discarded, 0)
+
+    def test_split_across_chunks(self):
+        decoder = FrameDecoder()
+        for split in range(1, len(self.stream)):
+            frames = decoder.feed(self.stream[:split])
+            frames += decoder.feed(self.stream[split:])
+            self.assertEqual([bytes(frame) for frame in frames],
+                    self.messages, split)
+            self.assertEqual(len(decoder), 0)
+
+    def test_frames_outlive_buffer(self):
+        # Frames completed from the receive buffer are copies
+        decoder = FrameDecoder()
+        decoder.feed(self.stream[:10])
+        frames = decoder.feed(self.stream[10:])
+        decoder.feed(b'8=FIX.4.4\x019=')
+        self.assertEqual([bytes(frame) for frame in frames], self.messages)
+
+    def test_resync_after_garbage(self):
+        decoder = FrameDecoder()
+        frames = decoder.feed(b'garbage' + self.messages[0] + b'xx' +
+                self.messages[1])
+        self.assertEqual([bytes(frame) for frame in frames],
+                self.messages[:2])
+        self.assertEqual(decoder.discarded, 9)
+
+    def test_resync_on_bad_bodylength(self):
+        bad = self.messages[0].replace(b'9=', b'9=x', 1)
+        decoder = FrameDecoder()
+        frames = decoder.feed(bad + self.messages[1])
+        self.assertEqual([bytes(frame) for frame in frames],
+                self.messages[1:2])
+        self.assertEqual(decoder.discarded, len(bad))
+
+    def test_resync_on_oversized_body(self):
+        decoder = FrameDecoder(max_body_length=16)
+        frames = decoder.feed(self.messages[0])
+        self.assertEqual(frames, [])
+        self.assertEqual(decoder.discarded, len(self.messages[0]))
+
+    def test_partial_beginstring_kept(self):
+        decoder = FrameDecoder()
+        self.assertEqual(decoder.feed(b'junk8=FI'), [])
+        frames = decoder.feed(self.messages[0][4:])
+        self.assertEqual([bytes(frame) for frame in frames],
+                self.messages[:1])
+        self.assertEqual(decoder.discarded, 4)
+
+    def test_clear(self):
+        decoder = FrameDecoder()
+        decoder.feed(self.stream[:20])
+        decoder.clear()
+        self.assertEqual(len(decoder), 0)
+        frames = decoder.feed(self.messages[1])
+        self.assertEqual([bytes(frame) for frame in frames],
+                self.messages[1:2])
+
+#------------------------------------------------------------------------------
+
+class DecodeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.message = build(7, [b'35=D\x01', b'11=abc\x01', b'38=100\x01'])
+
+    def assertCheck(self, message, check):
+        with self.assertRaises(ParseError) as context:
+            parse.decode(message)
+        self.assertEqual(context.exception.check, check)
+
+    def test_valid(self):
+        msg = parse.decode(self.message)
+        self.assertEqual(msg.MsgType, b'D')
+        self.assertEqual(msg.MsgSeqNum, 7)
+        self.assertEqual(msg.get(11), b'abc')
+        self.assertEqual(msg.get(38), b'100')
+        self.assertIsNone(msg.get(44))
+        self.assertEqual(list(msg)[-2:], [(11, b'abc'), (38, b'100')])
+
+    def test_beginstring(self):
+        self.assertCheck(b'X' + self.message[1:], parse.CHECK_BEGINSTRING)
+
+    def test_bodylength_missing(self):
+        self.assertCheck(self.message.replace(b'\x019=', b'\x019x', 1),
+                parse.CHECK_BODYLENGTH)
+
+    def test_bodylength_wrong(self):
+        message = self.message.replace(b'38=100', b'38=1000')
+        self.assertCheck(with_checksum(message), parse.CHECK_BODYLENGTH)
+
+    def test_bodylength_invalid(self):
+        start = self.message.index(b'\x019=') + 3
+        end = self.message.index(b'\x01', start)
+        message = self.message[:start] + b'x' * (end - start) + \
+                self.message[end:]
+        self.assertCheck(with_checksum(message), parse.CHECK_BODYLENGTH)
+
+    def test_msgtype(self):
+        self.assertCheck(self.message.replace(b'\x0135=', b'\x0136=', 1),
+                parse.CHECK_MSGTYPE)
+
+    def test_checksum_missing(self):
+        self.assertCheck(self.message[:-1], parse.CHECK_CHECKSUM)
+
+    def test_checksum_wrong(self):
+        checksum = int(self.message[-4:-1])
+        message = self.message[:-4] + \
+                '{:03d}\x01'.format((checksum + 1) % 256).encode('utf-8')
+        self.assertCheck(message, parse.CHECK_CHECKSUM)
+
+    def test_malformed_field(self):
+        # Fields are only indexed when they are first walked
+        message = with_checksum(self.message.replace(b'11=abc', b'11xabc'))
+        msg = parse.decode(message)
+        with self.assertRaises(ParseError) as context:
+            list(msg)
+        self.assertEqual(context.exception.check, parse.CHECK_FIELD)
+
+    def test_whole_chunk_not_copied(self):
+        frames = FrameDecoder().feed(self.message)
+        msg = parse.decode(frames[0])
+        self.assertIs(bytes(msg), self.message)
+
+    def test_sliced_frame(self):
+        stream = self.message + build(8)
+        frames = FrameDecoder().feed(stream)
+        self.assertEqual([parse.decode(frame).MsgSeqNum
+                for frame in frames], [7, 8])
+
+    def test_checksum_long_message(self):
+        data = bytes(range(256)) * 5
+        self.assertEqual(parse.checksum(data), sum(data) % 256)
+        self.assertEqual(parse.checksum(data, 700), sum(data[:700]) % 256)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+
+from util.ratelimit import TokenBucket, RateLimiter
+
+#------------------------------------------------------------------------------
+
+SECOND = 1000000000
+
+def bucket(rate, burst=None, period=1.0):
+    # A full bucket whose clock starts at 0
+    bucket = TokenBucket(rate, burst, period)
+    bucket._last = 0
+    return bucket
+
+#------------------------------------------------------------------------------
+
+class TokenBucketTest(unittest.TestCase):
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, TokenBucket, 0)
+        self.assertRaises(ValueError, TokenBucket, 10, 0)
+
+    def test_burst(self):
+        limit = bucket(10, burst=3)
+        self.assertEqual([limit.consume(0) for i in range(4)],
+                [True, True, True, False])
+        self.assertEqual(limit.passed, 3)
+        self.assertEqual(limit.throttled, 1)
+
+    def test_wait(self):
+        limit = bucket(10, burst=1)
+        self.assertEqual(limit.wait(0), 0)
+        limit.take()
+        self.assertEqual(limit.wait(0), SECOND // 10)
+        self.assertEqual(limit.wait(SECOND // 20), SECOND // 20)
+        self.assertEqual(limit.wait(SECOND // 10), 0)
+
+    def test_rate(self):
+        limit = bucket(10, burst=1)
+        passed = sum(limit.consume(now)
+                for now in range(0, 2 * SECOND, SECOND // 1000))
+        self.assertEqual(passed, 20)
+
+    def test_period(self):
+        limit = bucket(2, period=60.0)
+        self.assertTrue(limit.consume(0))
+        self.assertTrue(limit.consume(0))
+        self.assertEqual(limit.wait(0), 30 * SECOND)
+
+    def test_refill_capped(self):
+        limit = bucket(10, burst=2)
+        limit.consume(0)
+        limit.consume(0)
+        later = 100 * SECOND
+        self.assertEqual([limit.consume(later) for i in range(3)],
+                [True, True, False])
+
+    def test_clock_going_back(self):
+        limit = bucket(10, burst=1)
+        limit.consume(SECOND)
+        self.assertEqual(limit.wait(0), SECOND // 10)
+
+#------------------------------------------------------------------------------
+
+class RateLimiterTest(unittest.TestCase):
+
+    def test_empty(self):
+        limiter = RateLimiter([None])
+        self.assertFalse(limiter)
+        self.assertEqual(limiter.acquire(0), 0)
+
+    def test_all_or_nothing(self):
+        session = bucket(10, burst=5)
+        venue = bucket(1, burst=1)
+        limiter = RateLimiter([session, venue])
+        self.assertEqual(limiter.acquire(0), 0)
+        self.assertEqual(limiter.acquire(0), SECOND)
+        # The session bucket kept the token it had
+        self.assertEqual(session.passed, 1)
+        self.assertEqual(session.wait(0), 0)
+        self.assertEqual(venue.throttled, 1)
+        self.assertEqual(limiter.acquire(SECOND), 0)
+        self.assertEqual(limiter.stats()['passed'], 2)
+        self.assertEqual(limiter.stats()['throttled'], 1)
+
+    def test_longest_wait(self):
+        limiter = RateLimiter([bucket(10, burst=1), bucket(4, burst=1)])
+        limiter.acquire(0)
+        self.assertEqual(limiter.acquire(0), SECOND // 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import logging
+import unittest
+
+from util.recorder import FlightRecorder
+from util.wirelog import INBOUND, OUTBOUND
+
+#------------------------------------------------------------------------------
+
+def frame(n):
+    return b'8=FIX.4.4\x0134=' + str(n).encode('utf-8') + b'\x01'
+
+#------------------------------------------------------------------------------
+
+class FlightRecorderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.recorder = FlightRecorder(slots=4, slot_size=32)
+
+    def record(self, numbers):
+        for n in numbers:
+            self.recorder.record(OUTBOUND if n % 2 else INBOUND,
+                    memoryview(frame(n)), n * 1000, n)
+
+    def assertFrames(self, numbers):
+        self.assertEqual(self.recorder.records(), [
+                (OUTBOUND if n % 2 else INBOUND, n * 1000, n,
+                len(frame(n)), frame(n)) for n in numbers])
+
+    def test_invalid(self):
+        for slots, slot_size in ((0, 32), (4, 0)):
+            with self.assertRaises(ValueError):
+                FlightRecorder(slots, slot_size)
+
+    def test_partly_filled(self):
+        self.assertEqual(self.recorder.records(), [])
+        self.record(range(1, 3))
+        self.assertEqual(len(self.recorder), 2)
+        self.assertFrames(range(1, 3))
+
+    def test_wraparound(self):
+        # The oldest frames are overwritten, in order, as it goes round
+        self.record(range(1, 5))
+        self.assertFrames(range(1, 5))
+        self.record(range(5, 7))
+        self.assertEqual(len(self.recorder), 4)
+        self.assertFrames(range(3, 7))
+        self.record(range(7, 19))
+        self.assertFrames(range(15, 19))
+
+    def test_shorter_frame_overwrites(self):
+        # A slot keeps no trace of the longer frame it held before
+        self.record([100, 101, 102, 103])
+        self.record([4])
+        self.assertEqual(self.recorder.records()[-1][4], frame(4))
+
+    def test_long_frame(self):
+        long = frame(1) + b'58=' + b'x' * 100 + b'\x01'
+        self.recorder.record(INBOUND, long, 0)
+        direction, time_ns, processing_ns, length, stored = \
+                self.recorder.records()[0]
+        self.assertEqual(length, len(long))
+        self.assertEqual(stored, long[:32])
+        self.assertTrue(self.recorder.format()[0].endswith('...'))
+
+    def test_clear(self):
+        self.record(range(1, 7))
+        self.recorder.clear()
+        self.assertEqual(len(self.recorder), 0)
+        self.assertEqual(self.recorder.format(), [])
+        self.record([7])
+        self.assertFrames([7])
+
+    def test_dump(self):
+        self.record(range(1, 7))
+        log = logging.getLogger('test.recorder')
+        with self.assertLogs(log, 'WARNING') as logs:
+            self.recorder.dump(log, 'FIX: Flight recorder CLIENT-HOST')
+        lines = logs.records[0].getMessage().splitlines()
+        self.assertEqual(lines[0],
+                'FIX: Flight recorder CLIENT-HOST, last 4 frames')
+        self.assertEqual(lines[1].split()[:3], ['OUT', '-0.003ms', 'proc'])
+        self.assertTrue(lines[1].endswith('B 8=FIX.4.4|34=3|'))
+        self.assertEqual(lines[4].split()[:2], ['IN', '0.000ms'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+
+from util.recovery import (ReorderBuffer, IN_ORDER, BUFFERED, DUPLICATE,
+        TOO_LOW, OVERFLOW)
+
+#------------------------------------------------------------------------------
+
+class ReorderBufferTest(unittest.TestCase):
+
+    def test_in_order(self):
+        buffer = ReorderBuffer()
+        for MsgSeqNum in range(1, 4):
+            self.assertEqual(buffer.offer(MsgSeqNum, MsgSeqNum),
+                    (IN_ORDER, [MsgSeqNum], None))
+        self.assertEqual(buffer.expected, 4)
+        self.assertEqual(len(buffer), 0)
+
+    def test_gap_fill(self):
+        buffer = ReorderBuffer()
+        buffer.offer(1, 'a')
+        self.assertEqual(buffer.offer(4, 'd'), (BUFFERED, (), (2, 3)))
+        self.assertEqual(buffer.offer(3, 'c'), (BUFFERED, (), None))
+        self.assertEqual(len(buffer), 2)
+        self.assertEqual(buffer.offer(2, 'b'), (IN_ORDER, ['b', 'c', 'd'],
+                None))
+        self.assertEqual(buffer.expected, 5)
+        self.assertEqual(len(buffer), 0)
+
+    def test_resend_requested_once(self):
+        buffer = ReorderBuffer()
+        self.assertEqual(buffer.offer(3, 'c')[2], (1, 2))
+        self.assertIsNone(buffer.offer(4, 'd')[2])
+        # Only the new part of a wider gap is requested
+        self.assertEqual(buffer.offer(7, 'g')[2], (5, 6))
+
+    def test_duplicates(self):
+        buffer = ReorderBuffer()
+        buffer.offer(1, 'a')
+        buffer.offer(3, 'c')
+        self.assertEqual(buffer.offer(1, 'a', PossDup=True),
+                (DUPLICATE, (), None))
+        self.assertEqual(buffer.offer(3, 'c'), (DUPLICATE, (), None))
+        self.assertEqual(buffer.duplicates, 2)
+        self.assertEqual(buffer.offer(1, 'a'), (TOO_LOW, (), None))
+
+    def test_overflow(self):
+        buffer = ReorderBuffer(capacity=8)
+        self.assertEqual(buffer.offer(9, 'i'), (OVERFLOW, (), (1, 9)))
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(buffer.offer(8, 'h'), (BUFFERED, (), None))
+
+    def test_wraps_around(self):
+        buffer = ReorderBuffer(capacity=4)
+        released = []
+        for MsgSeqNum in (2, 4, 3, 1, 6, 7, 5, 8, 10, 9):
+            result, ready, resend = buffer.offer(MsgSeqNum, MsgSeqNum)
+            released += ready
+        self.assertEqual(released, list(range(1, 11)))
+        self.assertEqual(len(buffer), 0)
+
+    def test_advance(self):
+        buffer = ReorderBuffer()
+        buffer.offer(3, 'c')
+        buffer.offer(6, 'f')
+        buffer.offer(7, 'g')
+        self.assertEqual(buffer.advance(6), ['f', 'g'])
+        self.assertEqual(buffer.expected, 8)
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(buffer.advance(5), [])
+        self.assertEqual(buffer.expected, 8)
+
+    def test_advance_raises_requested_through(self):
+        buffer = ReorderBuffer()
+        buffer.advance(10)
+        self.assertEqual(buffer.offer(12, 'l')[2], (10, 11))
+
+    def test_clear(self):
+        buffer = ReorderBuffer()
+        buffer.offer(3, 'c')
+        buffer.clear()
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(buffer.offer(1, 'a'), (IN_ORDER, ['a'], None))
+        self.assertEqual(buffer.offer(2, 'b'), (IN_ORDER, ['b'], None))
+
+
+if __name__ == '__main__':
+    unittest.main()
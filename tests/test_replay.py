@@ -0,0 +1,124 @@
+import os
+import sys
+import shutil
+import asyncio
+import tempfile
+import unittest
+
+if sys.version_info >= (3, 7):
+    # server/ is written for the asyncio of Python 3.6 ('asyncio.async')
+    raise unittest.SkipTest('server requires Python 3.6')
+
+from server import replay
+from util.compose import SessionTemplates
+from util.wirelog import WireJournal, INBOUND, OUTBOUND
+
+#------------------------------------------------------------------------------
+
+HOST = SessionTemplates(b'HOST', b'CLIENT')
+CLIENT = SessionTemplates(b'CLIENT', b'HOST')
+
+def frame(templates, MsgSeqNum, fields):
+    return templates.compile(list(fields), str(MsgSeqNum).encode('utf-8'),
+            b'20240102-03:04:05.678')
+
+def report(MsgSeqNum):
+    return frame(HOST, MsgSeqNum, [b'35=8\x01',
+            b'11=order' + str(MsgSeqNum).encode('utf-8') + b'\x01'])
+
+#------------------------------------------------------------------------------
+
+class ReplayTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.addCleanup(self.loop.close)
+        self.addCleanup(asyncio.set_event_loop, None)
+
+        # The recording starts part way into the session
+        self.reports = [report(MsgSeqNum) for MsgSeqNum in range(5, 25)]
+
+    def write_journal(self):
+        journal = WireJournal.open(self.directory, b'CLIENT', b'HOST',
+                segment_size=1000)
+        for n, data in enumerate(self.reports):
+            journal.append(INBOUND, memoryview(data), n, n)
+            # What the client sent is not replayed
+            journal.append(OUTBOUND, memoryview(frame(CLIENT, n + 1,
+                    [b'35=0\x01'])), n, n)
+        journal.close()
+        return os.path.join(self.directory, 'CLIENT-HOST')
+
+    def write_capture(self):
+        path = os.path.join(self.directory, 'capture.fix')
+        with open(path, 'wb') as f:
+            for data in self.reports:
+                f.write(data + b'\n')
+        return path
+
+    def replay(self, source):
+        return self.loop.run_until_complete(replay.replay(source))
+
+    def assertReplayed(self, stats):
+        self.assertEqual(stats['frames'], len(self.reports))
+        self.assertEqual(stats['api_messages'], len(self.reports))
+
+    def test_journal(self):
+        source = self.write_journal()
+        self.assertGreater(len(replay.parts(source)), 1)
+        self.assertEqual(replay.session_of(source), (b'CLIENT', b'HOST'))
+        self.assertReplayed(self.replay(source))
+
+    def test_capture(self):
+        source = self.write_capture()
+        self.assertEqual(replay.session_of(source), (b'CLIENT', b'HOST'))
+        self.assertReplayed(self.replay(source))
+
+    def test_capture_parts(self):
+        # Parts cut through messages; each message is in exactly one part
+        source = self.write_capture()
+        size = os.path.getsize(source)
+        for segment in (37, 100, len(self.reports[0]), 1000, size):
+            self.addCleanup(setattr, replay, 'CAPTURE_SEGMENT',
+                    replay.CAPTURE_SEGMENT)
+            replay.CAPTURE_SEGMENT = segment
+            frames = [bytes(data)
+                    for part in replay.parts(source)
+                    for time_ns, MsgSeqNum, data
+                    in replay.part_frames(part)]
+            self.assertEqual(frames, self.reports, segment)
+
+    def test_capture_frames(self):
+        source = self.write_capture()
+        frames = list(replay.capture_frames(source))
+        self.assertEqual([MsgSeqNum for time_ns, MsgSeqNum, data in frames],
+                list(range(5, 25)))
+        self.assertEqual(frames[0][0], 1704164645678000000)
+        self.assertIsNone(list(replay.capture_frames(source,
+                timed=False))[0][0])
+
+    def test_resync(self):
+        # A part starting on '8=FIX' inside a value does not start there
+        data = b'8=FIX.4.2\x019=5\x0158=x8=FIX\x01' + b'\n8=FIX.4.2\x01'
+        self.assertEqual(replay._resync(data, 0, len(data)), 0)
+        self.assertEqual(replay._resync(data, 1, len(data)),
+                data.index(b'\n8=FIX') + 1)
+        self.assertEqual(replay._resync(data, 1, 20), 20)
+        # Nor is a message starting just before the end missed
+        start = data.index(b'\n8=FIX') + 1
+        self.assertEqual(replay._resync(data, 1, start + 1), start)
+
+    def test_empty(self):
+        source = os.path.join(self.directory, 'empty.fix')
+        open(source, 'wb').close()
+        self.assertIsNone(replay.session_of(source))
+        with self.assertLogs('server.replay', 'INFO'):
+            self.assertIsNone(self.replay(source))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from util.seqstore import SequenceStore, SLOT_SIZE
+
+#------------------------------------------------------------------------------
+
+class SequenceStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'CLIENT-HOST.seq')
+
+        self.current = None
+
+    def tearDown(self):
+        if self.current is not None:
+            self.current.close()
+        shutil.rmtree(self.directory)
+
+    def store(self, **kwargs):
+        # (Re)open the store
+        if self.current is not None:
+            self.current.close()
+            self.current = None
+        self.current = SequenceStore(self.path, **kwargs)
+        return self.current
+
+    def test_new(self):
+        store = self.store()
+        self.assertEqual((store.local, store.host), (0, 0))
+
+    def test_reload(self):
+        store = self.store()
+        for n in range(1, 6):
+            store.update(n, n * 10)
+
+        store = self.store()
+        self.assertEqual((store.local, store.host), (5, 50))
+        store.update(6, 60)
+
+        store = self.store()
+        self.assertEqual((store.local, store.host), (6, 60))
+
+    def test_torn_write(self):
+        # A slot with a bad checksum is ignored in favour of the other one
+        store = self.store()
+        store.update(1, 1)
+        store.update(2, 2)
+        store.update(3, 3)
+        self.current.close()
+        self.current = None
+
+        with open(self.path, 'r+b') as f:
+            # Generation 3 went to the second slot
+            f.seek(SLOT_SIZE + 8)
+            f.write(b'\xff')
+
+        store = self.store()
+        self.assertEqual((store.local, store.host), (2, 2))
+        store.update(4, 4)
+
+        store = self.store()
+        self.assertEqual((store.local, store.host), (4, 4))
+
+    def test_reset(self):
+        store = self.store()
+        store.update(7, 8)
+        store.reset()
+
+        store = self.store()
+        self.assertEqual((store.local, store.host), (0, 0))
+
+    def test_sync_every(self):
+        store = self.store(sync_every=2)
+        store.update(1, 1)
+        self.assertEqual(store._unsynced, 1)
+        store.update(2, 2)
+        self.assertEqual(store._unsynced, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
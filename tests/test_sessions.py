@@ -0,0 +1,135 @@
+import unittest
+
+from server.sessions import Session, SessionRegistry, session_id
+
+#------------------------------------------------------------------------------
+
+class Protocol:
+    # The parts of FIXclient a Session uses
+
+    def __init__(self):
+        self.api_out = self.drop_api
+        self.api_backpressure = lambda paused: None
+        self._api_paused_by = set()
+        self.on_connection_lost = None
+        self.backlogged = []
+
+    def drop_api(self, data, key=None):
+        pass
+
+    def api_backlog(self, backlogged):
+        self.backlogged.append(backlogged)
+
+
+class API:
+    # The parts of APIserver a Session uses
+
+    def __init__(self):
+        self.received = []
+        self.backpressure = []
+        self.detached = []
+
+    def put_outgoing(self, msg, key=None):
+        self.received.append((msg, key))
+
+    def _FIX_backpressure(self, paused, session_id):
+        self.backpressure.append((paused, session_id))
+
+    def detach_session(self, session):
+        self.detached.append(session)
+
+#------------------------------------------------------------------------------
+
+class SessionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.protocol = Protocol()
+        self.session = Session(b'CLIENT', b'HOST', self.protocol, None)
+
+    def test_ids(self):
+        self.assertEqual(session_id(b'CLIENT', b'HOST'), 'CLIENT-HOST')
+        self.assertEqual(self.session.key, (b'CLIENT', b'HOST'))
+        self.assertEqual(self.session.id, 'CLIENT-HOST')
+
+    def test_attach(self):
+        api = API()
+        self.session.attach(api)
+        self.assertIs(self.session.api, api)
+        self.protocol.api_out(b'message', 'key')
+        self.assertEqual(api.received, [(b'message', 'key')])
+        self.protocol.api_backpressure(True)
+        self.assertEqual(api.backpressure, [(True, 'CLIENT-HOST')])
+
+    def test_attach_paused(self):
+        # An API attaching to a backlogged session is told at once
+        self.protocol._api_paused_by.add('queue')
+        api = API()
+        self.session.attach(api)
+        self.assertEqual(api.backpressure, [(True, 'CLIENT-HOST')])
+
+    def test_take_over(self):
+        first, second = API(), API()
+        self.session.attach(first)
+        self.session.attach(second)
+        self.assertEqual(first.detached, [self.session])
+        self.assertEqual(first.backpressure, [(False, 'CLIENT-HOST')])
+        self.protocol.api_out(b'message')
+        self.assertEqual(first.received, [])
+        self.assertEqual(second.received, [(b'message', None)])
+
+        # Attaching again to the same API changes nothing
+        self.session.attach(second)
+        self.assertEqual(second.detached, [])
+
+    def test_detach(self):
+        api = API()
+        self.session.attach(api)
+        self.session.detach()
+        self.assertIsNone(self.session.api)
+        self.protocol.api_out(b'message')
+        self.assertEqual(api.received, [])
+        self.assertEqual(self.protocol.backlogged, [False])
+
+#------------------------------------------------------------------------------
+
+class SessionRegistryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = SessionRegistry()
+        self.protocol = Protocol()
+        self.session = Session(b'CLIENT', b'HOST', self.protocol, None)
+        self.registry.add(self.session)
+
+    def test_add(self):
+        self.assertEqual(len(self.registry), 1)
+        self.assertIn((b'CLIENT', b'HOST'), self.registry)
+        self.assertIs(self.registry.get((b'CLIENT', b'HOST')), self.session)
+        self.assertIs(self.registry.get_id('CLIENT-HOST'), self.session)
+        self.assertEqual(list(self.registry), [self.session])
+
+    def test_add_twice(self):
+        other = Session(b'CLIENT', b'HOST', Protocol(), None)
+        with self.assertRaises(KeyError):
+            self.registry.add(other)
+        self.assertIs(self.registry.get_id('CLIENT-HOST'), self.session)
+
+    def test_connection_lost(self):
+        api = API()
+        self.session.attach(api)
+        self.protocol.on_connection_lost()
+        self.assertEqual(len(self.registry), 0)
+        self.assertIsNone(self.registry.get_id('CLIENT-HOST'))
+        self.assertEqual(api.detached, [self.session])
+        self.assertIsNone(self.session.api)
+
+    def test_remove_replaced(self):
+        # A session already replaced under its key is not removed again
+        self.registry.remove(self.session)
+        other = Session(b'CLIENT', b'HOST', Protocol(), None)
+        self.registry.add(other)
+        self.registry.remove(self.session)
+        self.assertIs(self.registry.get_id('CLIENT-HOST'), other)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+
+from server.timers import TimingWheel
+
+#------------------------------------------------------------------------------
+
+class Handle:
+
+    def __init__(self, when, callback):
+        self.when = when
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class Loop:
+    # Just the time and call_later of an event loop, with a manual clock
+
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.handles = []
+
+    def time(self):
+        return self.now
+
+    def call_later(self, delay, callback):
+        handle = Handle(self.now + delay, callback)
+        self.handles.append(handle)
+        return handle
+
+    def advance(self, seconds, step=1.0):
+        end = self.now + seconds
+        while self.now < end:
+            self.now += step
+            due = [handle for handle in self.handles
+                    if handle.when <= self.now and not handle.cancelled]
+            self.handles = [handle for handle in self.handles
+                    if handle not in due]
+            for handle in due:
+                handle.callback()
+
+#------------------------------------------------------------------------------
+
+class TimingWheelTest(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = Loop()
+        self.wheel = TimingWheel(tick=1.0, slots=8, loop=self.loop)
+        self.fired = []
+
+    def add(self, name, interval):
+        return self.wheel.add(interval,
+                lambda: self.fired.append((name, self.loop.now - 1000)))
+
+    def test_expiry_order(self):
+        self.add('a', 3)
+        self.add('b', 1)
+        self.add('c', 2)
+        self.loop.advance(6)
+        self.assertEqual(self.fired, [
+                ('b', 1), ('c', 2), ('b', 2), ('a', 3), ('b', 3),
+                ('c', 4), ('b', 4), ('b', 5), ('a', 6), ('c', 6), ('b', 6)])
+
+    def test_touch_postpones(self):
+        timer = self.add('a', 3)
+        for _ in range(5):
+            self.loop.advance(2)
+            timer.touch()
+        self.assertEqual(self.fired, [])
+        self.loop.advance(3)
+        self.assertEqual(self.fired, [('a', 13)])
+
+    def test_cancel(self):
+        timer = self.add('a', 2)
+        self.add('b', 3)
+        self.loop.advance(2)
+        timer.cancel()
+        timer.cancel()
+        self.assertEqual(len(self.wheel), 1)
+        self.loop.advance(4)
+        self.assertEqual(self.fired, [('a', 2), ('b', 3), ('b', 6)])
+
+    def test_stops_when_empty(self):
+        timer = self.add('a', 2)
+        timer.cancel()
+        self.loop.advance(3)
+        self.assertEqual(self.fired, [])
+        self.assertEqual(self.loop.handles, [])
+
+        # And starts again with the next timer, from the current time
+        self.add('b', 2)
+        self.loop.advance(2)
+        self.assertEqual(self.fired, [('b', 5)])
+
+    def test_longer_than_wheel(self):
+        # 20 ticks on a wheel of 8 slots goes round more than twice
+        self.add('a', 20)
+        self.loop.advance(19)
+        self.assertEqual(self.fired, [])
+        self.loop.advance(1)
+        self.assertEqual(self.fired, [('a', 20)])
+
+    def test_stall(self):
+        # A loop that stalls for longer than the wheel fires each overdue
+        # timer once, in order, when it runs again
+        self.add('a', 2)
+        self.add('b', 1)
+        self.loop.advance(20, step=20)
+        self.assertEqual(self.fired, [('b', 20), ('a', 20)])
+        self.loop.advance(2)
+        self.assertEqual(self.fired[2:], [('b', 21), ('a', 22), ('b', 22)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from util import wirelog
+from util.compose import SessionTemplates
+from util.wirelog import WireJournal, WireReader, INBOUND, OUTBOUND
+
+#------------------------------------------------------------------------------
+
+CLIENT = SessionTemplates(b'CLIENT', b'HOST')
+HOST = SessionTemplates(b'HOST', b'CLIENT')
+
+SECOND = 1000000000
+WALL = 1704164645 * SECOND      # 20240102-03:04:05
+
+def frame(templates, MsgSeqNum, fields):
+    return templates.compile(list(fields), str(MsgSeqNum).encode('utf-8'),
+            b'20240102-03:04:05.678')
+
+#------------------------------------------------------------------------------
+
+class WireJournalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, 'CLIENT-HOST')
+
+        # (direction, MsgSeqNum, mono, wall, frame), one a second
+        self.written = []
+        for n in range(1, 11):
+            if n % 2:
+                data = frame(CLIENT, n // 2 + 1, [b'35=D\x01',
+                        b'11=order' + str(n).encode('utf-8') + b'\x01'])
+                direction = OUTBOUND
+            else:
+                data = frame(HOST, n // 2, [b'35=8\x01',
+                        b'11=order' + str(n - 1).encode('utf-8') + b'\x01'])
+                direction = INBOUND
+            self.written.append((direction, int(data.split(b'\x0134=')[1]
+                    .split(b'\x01')[0]), n, WALL + n * SECOND, data))
+
+    def write(self, records, **kwargs):
+        journal = WireJournal.open(self.directory, b'CLIENT', b'HOST',
+                **kwargs)
+        for direction, MsgSeqNum, mono, wall, data in records:
+            journal.append(direction, memoryview(data), mono, wall)
+        journal.close()
+
+    def read(self):
+        reader = WireReader(self.path)
+        self.addCleanup(reader.close)
+        return reader
+
+    def assertRecords(self, records, expected):
+        self.assertEqual([record[:4] + (bytes(record[4]),)
+                for record in records], list(expected))
+
+    def test_records(self):
+        self.write(self.written)
+        reader = self.read()
+        self.assertEqual(len(reader.segments), 1)
+        self.assertEqual(reader.segments[0].session_id, 'CLIENT-HOST')
+        self.assertRecords(reader.records(), self.written)
+
+    def test_segments(self):
+        # A new segment every couple of records, and on every open
+        self.write(self.written[:6], segment_size=300)
+        self.write(self.written[6:], segment_size=300)
+        self.assertGreater(len(wirelog.segment_numbers(self.path)), 3)
+        self.assertRecords(self.read().records(), self.written)
+
+    def test_by_seq(self):
+        # A resend repeats a MsgSeqNum
+        resent = self.written[0][:3] + (WALL + 20 * SECOND,
+                self.written[0][4])
+        self.write(self.written + [resent], segment_size=600)
+        reader = self.read()
+        self.assertRecords(reader.by_seq(1, OUTBOUND),
+                [self.written[0], resent])
+        self.assertRecords(reader.by_seq(1, INBOUND), [self.written[1]])
+        self.assertRecords(reader.by_seq(1),
+                [self.written[0], self.written[1], resent])
+        self.assertRecords(reader.by_seq(99), [])
+
+    def test_by_time(self):
+        self.write(self.written, segment_size=600)
+        reader = self.read()
+        self.assertRecords(reader.by_time(WALL + 3 * SECOND,
+                WALL + 7 * SECOND), self.written[2:6])
+        self.assertRecords(reader.by_time(0, WALL), [])
+        self.assertRecords(reader.by_time(WALL + 10 * SECOND, 1 << 62),
+                self.written[9:])
+
+    def test_by_clordid(self):
+        self.write(self.written, segment_size=600)
+        reader = self.read()
+        self.assertRecords(reader.by_clordid('order3'), self.written[2:4])
+        self.assertRecords(reader.by_clordid(b'order9'), self.written[8:])
+        self.assertRecords(reader.by_clordid('missing'), [])
+
+    def test_torn_record(self):
+        # A record cut short by a crash is skipped
+        self.write(self.written[:2])
+        data = os.path.join(self.path, 'wire-000001.dat')
+        with open(data, 'r+b') as f:
+            f.truncate(os.path.getsize(data) - 10)
+        self.assertRecords(self.read().records(), self.written[:1])
+
+    def test_not_a_segment(self):
+        os.makedirs(self.path)
+        with open(os.path.join(self.path, 'wire-000001.dat'), 'wb') as f:
+            f.write(b'NOPE' + bytes(20))
+        with self.assertRaises(ValueError):
+            WireReader(self.path)
+
+    def test_command_line(self):
+        self.write(self.written)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            wirelog.main([self.path, '--clordid', 'order5'])
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn(' OUT ', lines[0])
+        self.assertIn('|11=order5|', lines[0])
+        self.assertTrue(lines[1].startswith('20240102-03:04:11.000000 IN '))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import os
-import pickle
+from collections.abc import Mapping
 
 path = str(os.path.abspath(os.path.dirname(__file__)))
 
@@ -7,12 +7,61 @@ path = str(os.path.abspath(os.path.dirname(__file__)))
 
 SOH = b'\x01'  # 'Start of Heading', follows every message field
 
+#------------------------------------------------------------------------------
+
+class _Legacy(Mapping):
+    # The old bidirectional, mixed key lookups, built from the FIX 4.4 data
+    # dictionary on first use. New code uses util.dictionary directly.
+
+    def __init__(self, build):
+        self._build = build
+        self._data = None
+
+    def _load(self):
+        if self._data is None:
+            from . import dictionary
+            self._data = self._build(dictionary.get(b'FIX.4.4'))
+        return self._data
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+
+def _build_tags(dictionary):
+    tags = {}
+    for tag, name in enumerate(dictionary.names):
+        if name is None: continue
+        number = str(tag).encode('utf-8')
+        tags[tag] = name
+        tags[number] = name
+        tags[name] = number
+        tags[name.decode('utf-8')] = number
+    return tags
+
+
+def _build_msgs(dictionary):
+    msgs = {}
+    for MsgType, name in dictionary.messages.items():
+        msgs[MsgType] = name
+        # Numeric MsgTypes were keyed by int rather than str
+        if MsgType.isdigit():
+            msgs[int(MsgType)] = name
+        else:
+            msgs[MsgType.decode('utf-8')] = name
+        msgs[name] = MsgType
+        msgs[name.decode('utf-8')] = MsgType
+    return msgs
+
 # FIX tags are keys, messages are values
-with open(path+'/FIXtags.pkl', 'rb') as f:
-    TAGS = pickle.load(f)
+TAGS = _Legacy(_build_tags)
 
 # FIX messages are keys, tags are values
-with open(path+'/FIXmsgs.pkl', 'rb') as f:
-    MSGS = pickle.load(f)
+MSGS = _Legacy(_build_msgs)
 
-#------------------------------------------------------------------------------
\ No newline at end of file
+#------------------------------------------------------------------------------
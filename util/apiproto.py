@@ -0,0 +1,170 @@
+"""
+Wire format of commands sent to the engine's API socket.
+
+Every command is a frame: a 4 byte big-endian payload length and a 1 byte
+frame kind, followed by the payload.
+
+    KIND_FIX        Pre-encoded FIX fields, MsgType first, each followed by
+                    SOH; BeginString, BodyLength, MsgSeqNum, SenderCompID,
+                    TargetCompID, SendingTime and CheckSum are added by the
+                    engine. e.g. b'35=D\\x0111=abc\\x0155=BTCUSD\\x01...'
+    KIND_SESSION_FIX
+                    The same, for a given session: a 1 byte length and the
+                    session ID, 'SenderCompID-TargetCompID', then the fields
+    KIND_COMMAND    Any other command, as the UTF-8 repr() of the command
+                    dict, {'type': <type>, 'kwargs': {...}}
+
+KIND_FIX frames and commands without a 'session' kwarg go to the session the
+connection last started or attached to.
+
+The original format, the bare repr() of the command dict with no framing, is
+still accepted as a compatibility mode. A connection whose first byte is '{'
+is taken to use it.
+
+Messages from the engine to the API client are complete FIX messages, which
+delimit themselves with their BodyLength; parse.FrameDecoder splits them.
+Replies to 'engine' commands come the same way, as user defined messages of
+MsgType REPLY_MSGTYPE whose Text (58) holds the repr() of {'type': <command>,
+'data': ...}; decode_reply reads them.
+"""
+import ast
+import struct
+
+from .parse import checksum
+from .compose import CHECKSUM_FIELDS
+
+#------------------------------------------------------------------------------
+
+HEADER = struct.Struct('!IB')
+
+KIND_FIX = 1
+KIND_COMMAND = 2
+KIND_SESSION_FIX = 3
+KIND_LEGACY = 0     # Unframed repr() of a command dict, never on the wire
+
+MAX_PAYLOAD = 1048576
+
+REPLY_MSGTYPE = b'UE'
+
+#------------------------------------------------------------------------------
+
+class ProtocolError(Exception):
+    def __init__(self, value):
+        self.value = value
+    def __str__(self):
+        return repr(self.value)
+
+#------------------------------------------------------------------------------
+
+def encode_fix(fields, session=None):
+    # 'fields' is either a list of encoded fields or their concatenation
+    if type(fields) is not bytes:
+        fields = b''.join(fields)
+    if session is None:
+        return HEADER.pack(len(fields), KIND_FIX) + fields
+
+    session = session.encode('utf-8')
+    if len(session) > 255:
+        raise ProtocolError('Session ID too long: {!r}'.format(session))
+    return (HEADER.pack(1 + len(session) + len(fields), KIND_SESSION_FIX) +
+            bytes((len(session),)) + session + fields)
+
+
+def decode_session_fix(payload):
+    # (session ID, fields) of a KIND_SESSION_FIX payload
+    end = 1 + payload[0]
+    if end > len(payload):
+        raise ProtocolError('Truncated session ID')
+    return payload[1:end].decode('utf-8'), payload[end:]
+
+
+def encode_command(command, data, session=None):
+    if command == 'FIX':
+        return encode_fix(data, session)
+
+    if session is not None:
+        data = dict(data, session=session)
+
+    payload = repr({'type': command, 'kwargs': data}).encode('utf-8')
+    return HEADER.pack(len(payload), KIND_COMMAND) + payload
+
+
+def decode_command(payload):
+    # KIND_COMMAND and KIND_LEGACY payloads
+    try:
+        command = ast.literal_eval(bytes(payload).decode('utf-8'))
+    except (ValueError, SyntaxError, UnicodeDecodeError) as e:
+        raise ProtocolError("{}, {}".format(type(e), e.args))
+    if type(command) is not dict or 'type' not in command:
+        raise ProtocolError('Invalid command: {!r}'.format(command))
+    return command
+
+
+def encode_reply(command, data, BeginString=b'FIX.4.4'):
+    body = b''.join([b'35=', REPLY_MSGTYPE, b'\x0158=',
+            repr({'type': command, 'data': data}).encode('utf-8'), b'\x01'])
+    message = b''.join([b'8=', BeginString, b'\x019=',
+            str(len(body)).encode('utf-8'), b'\x01', body])
+    return message + CHECKSUM_FIELDS[checksum(message)]
+
+
+def decode_reply(msg):
+    # The {'type': <command>, 'data': ...} of a parse.decode()d reply
+    if msg.MsgType != REPLY_MSGTYPE:
+        raise ProtocolError('Not an engine reply: {!r}'.format(msg))
+    try:
+        return ast.literal_eval(bytes(msg.get(58, b'')).decode('utf-8'))
+    except (ValueError, SyntaxError, UnicodeDecodeError) as e:
+        raise ProtocolError("{}, {}".format(type(e), e.args))
+
+#------------------------------------------------------------------------------
+
+class Decoder:
+    """
+    Incremental decoder for the API socket. 'feed' returns the complete
+    (kind, payload) pairs received so far, payloads as bytes.
+    """
+
+    __slots__ = ('_buffer', 'legacy', 'max_payload')
+
+    def __init__(self, max_payload=MAX_PAYLOAD):
+        self._buffer = bytearray()
+        self.legacy = None
+        self.max_payload = max_payload
+
+    def feed(self, data):
+        if self.legacy is None:
+            if not data:
+                return []
+            self.legacy = data[:1] == b'{'
+
+        if self.legacy:
+            # Compatibility mode, one command per chunk
+            return [(KIND_LEGACY, data)]
+
+        buffer = self._buffer
+        buffer += data
+
+        frames = []
+        size = len(buffer)
+        position = 0
+        header_size = HEADER.size
+        while size - position >= header_size:
+            length, kind = HEADER.unpack_from(buffer, position)
+            if length > self.max_payload:
+                raise ProtocolError('Frame of {} bytes exceeds {}'.format(
+                        length, self.max_payload))
+
+            end = position + header_size + length
+            if end > size:
+                break
+
+            frames.append((kind, bytes(buffer[position + header_size:end])))
+            position = end
+
+        if position:
+            del buffer[:position]
+
+        return frames
+
+#------------------------------------------------------------------------------
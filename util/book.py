@@ -0,0 +1,223 @@
+"""
+Price level order books built from market data.
+
+A Book keeps each side of a symbol's market as a Ladder: contiguous
+array('d') columns of prices and sizes, kept sorted, best price first, by
+bisect on the keys and array insert/delete. BookBuilder applies Market Data
+Snapshot/Full Refresh (35=W) and Incremental Refresh (35=X) messages to the
+books of every symbol, through the columnar repeating groups of
+util/groups.py, and reports which symbols changed.
+
+    MDEntryType         0 Bid, 1 Offer; other entry types are ignored
+    MDUpdateAction      0 New, 1 Change, 2 Delete
+
+Books are aggregated by price: New and Change set the size at a price level,
+Delete removes it. Entries keyed by MDEntryID are not tracked, nor are
+entries without a (finite) MDEntryPx, or New and Change without a size.
+
+Book.snapshot encodes the top levels as a 35=W message, for the API client.
+"""
+from array import array
+from bisect import bisect_left
+from decimal import Decimal
+from math import isfinite
+
+from . import SOH
+from .groups import decode_groups
+from .parse import checksum
+from .compose import CHECKSUM_FIELDS
+
+#------------------------------------------------------------------------------
+
+BID = 0x30      # b'0'
+OFFER = 0x31    # b'1'
+
+NEW = 0x30
+CHANGE = 0x31
+DELETE = 0x32
+
+DEPTH = 10
+
+#------------------------------------------------------------------------------
+
+def _encode_float(value):
+    # The shortest repr that reads back as 'value', in the fixed point
+    # notation of FIX Price and Qty fields: 1e-05 becomes b'0.00001'
+    text = repr(value)
+    if 'e' in text:
+        text = format(Decimal(text), 'f')
+    return text.encode('utf-8')
+
+#------------------------------------------------------------------------------
+
+class Ladder:
+
+    __slots__ = ('descending', 'keys', 'sizes')
+
+    def __init__(self, descending=False):
+        # Bids are kept as negated prices, so both sides sort ascending
+        self.descending = descending
+        self.keys = array('d')
+        self.sizes = array('d')
+
+    def __len__(self):
+        return len(self.keys)
+
+    def set(self, price, size):
+        key = -price if self.descending else price
+        keys = self.keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            self.sizes[i] = size
+        else:
+            keys.insert(i, key)
+            self.sizes.insert(i, size)
+
+    def delete(self, price):
+        key = -price if self.descending else price
+        keys = self.keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            del keys[i]
+            del self.sizes[i]
+
+    def clear(self):
+        del self.keys[:]
+        del self.sizes[:]
+
+    def top(self, depth=DEPTH):
+        # [(price, size), ...] best first
+        sign = -1.0 if self.descending else 1.0
+        sizes = self.sizes
+        return [(sign * key, sizes[i])
+                for i, key in enumerate(self.keys[:depth])]
+
+
+class Book:
+
+    __slots__ = ('symbol', 'bids', 'offers')
+
+    def __init__(self, symbol):
+        self.symbol = symbol
+        self.bids = Ladder(descending=True)
+        self.offers = Ladder()
+
+    def __repr__(self):
+        return '<Book {} {}x{}>'.format(self.symbol.decode('utf-8'),
+                len(self.bids), len(self.offers))
+
+    def side(self, MDEntryType):
+        if MDEntryType == BID:
+            return self.bids
+        if MDEntryType == OFFER:
+            return self.offers
+        return None
+
+    def clear(self):
+        self.bids.clear()
+        self.offers.clear()
+
+    def snapshot(self, depth=DEPTH, BeginString=b'FIX.4.4'):
+        # The top 'depth' levels of each side as a 35=W message
+        fields = []
+        levels = 0
+        for MDEntryType, ladder in ((b'0', self.bids), (b'1', self.offers)):
+            for price, size in ladder.top(depth):
+                fields.append(b''.join([b'269=', MDEntryType,
+                        b'\x01270=', _encode_float(price),
+                        b'\x01271=', _encode_float(size), SOH]))
+                levels += 1
+
+        body = b''.join([b'35=W\x0155=', self.symbol, b'\x01268=',
+                str(levels).encode('utf-8'), SOH] + fields)
+        message = b''.join([b'8=', BeginString, b'\x019=',
+                str(len(body)).encode('utf-8'), SOH, body])
+        return message + CHECKSUM_FIELDS[checksum(message)]
+
+#------------------------------------------------------------------------------
+
+class BookBuilder:
+
+    def __init__(self):
+        self.books = {}
+
+    def __len__(self):
+        return len(self.books)
+
+    def get(self, symbol):
+        return self.books.get(symbol)
+
+    def _book(self, symbol):
+        book = self.books.get(symbol)
+        if book is None:
+            book = self.books[symbol] = Book(symbol)
+        return book
+
+    def apply(self, msg):
+        """
+        Apply a 35=W or 35=X message.Message; returns the set of symbols
+        whose books changed. Raises parse.ParseError for malformed groups.
+        """
+        MsgType = msg.MsgType
+        if MsgType == b'W':
+            return self.apply_snapshot(msg)
+        if MsgType == b'X':
+            return self.apply_incremental(msg)
+        return set()
+
+    def apply_snapshot(self, msg):
+        symbol = msg.get(55)
+        if symbol is None:
+            return set()
+        book = self._book(symbol)
+        book.clear()
+
+        group = decode_groups(msg).get('NoMDEntries')
+        if group is not None:
+            types = group['MDEntryType']
+            prices = group['MDEntryPx']
+            sizes = group['MDEntrySize']
+            for i in range(group.count):
+                ladder = book.side(types[i])
+                if ladder is not None and isfinite(prices[i]) and \
+                        isfinite(sizes[i]):
+                    ladder.set(prices[i], sizes[i])
+        return {symbol}
+
+    def apply_incremental(self, msg):
+        group = decode_groups(msg).get('NoMDEntries')
+        if group is None:
+            return set()
+
+        actions = group['MDUpdateAction']
+        types = group['MDEntryType']
+        prices = group['MDEntryPx']
+        sizes = group['MDEntrySize']
+        symbols = group['Symbol']
+
+        changed = set()
+        symbol = None
+        book = None
+        for i in range(group.count):
+            ladder = None
+            # Entries without a Symbol continue the previous entry's
+            if symbols[i] is not None and symbols[i] != symbol:
+                symbol = bytes(symbols[i])
+                book = self._book(symbol)
+            if book is not None:
+                ladder = book.side(types[i])
+            # A NaN key would break the bisect ordering of the ladder
+            if ladder is None or not isfinite(prices[i]):
+                continue
+
+            action = actions[i]
+            if action == DELETE:
+                ladder.delete(prices[i])
+            elif (action == NEW or action == CHANGE) and isfinite(sizes[i]):
+                ladder.set(prices[i], sizes[i])
+            else:
+                continue
+            changed.add(symbol)
+        return changed
+
+#------------------------------------------------------------------------------
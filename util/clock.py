@@ -0,0 +1,91 @@
+"""
+Engine clock and SendingTime generation.
+
+Clock.read returns a (monotonic, wall) pair of nanosecond timestamps from a
+single monotonic clock read; the wall time is derived from an offset that is
+recalibrated against the system clock once a second. Latency measurements
+and SendingTime can therefore share one reading.
+
+SendingTime values (UTCTimestamp, 'YYYYMMDD-HH:MM:SS.sss') are built from an
+encoded 'YYYYMMDD-HH:MM:SS.' prefix, cached for the current second, and a
+fractional suffix. FIX 4.4 uses milliseconds; FIX 5.0 style microsecond and
+nanosecond precision is available too.
+
+monotonic_ns and time_ns are the time module's, with fallbacks for Python
+versions before 3.7; the rest of the engine takes its nanosecond timestamps
+from here.
+"""
+import time
+
+#------------------------------------------------------------------------------
+
+MILLISECONDS = 3
+MICROSECONDS = 6
+NANOSECONDS = 9
+
+_NS_PER_SECOND = 1000000000
+
+try:
+    monotonic_ns = time.monotonic_ns
+    time_ns = time.time_ns
+except AttributeError:
+    # Before Python 3.7
+    def monotonic_ns():
+        return int(time.monotonic() * _NS_PER_SECOND)
+
+    def time_ns():
+        return int(time.time() * _NS_PER_SECOND)
+
+# b'000' to b'999'
+_MILLIS = [str(i).zfill(3).encode('utf-8') for i in range(1000)]
+
+#------------------------------------------------------------------------------
+
+class Clock:
+
+    __slots__ = ('precision', '_offset', '_calibrate_at', '_second',
+            '_prefix', '_divisor')
+
+    def __init__(self, precision=MILLISECONDS):
+        if precision not in (MILLISECONDS, MICROSECONDS, NANOSECONDS):
+            raise ValueError('Invalid precision: {}'.format(precision))
+
+        self.precision = precision
+        self._divisor = 10 ** (9 - precision)
+
+        self._offset = 0
+        self._calibrate_at = 0
+        self._second = None
+        self._prefix = None
+
+    def read(self):
+        mono = monotonic_ns()
+        wall = mono + self._offset
+        if wall >= self._calibrate_at:
+            wall = time_ns()
+            self._offset = wall - mono
+            self._calibrate_at = wall - wall % _NS_PER_SECOND + _NS_PER_SECOND
+        return mono, wall
+
+    def SendingTime(self, wall=None):
+        if wall is None:
+            wall = self.read()[1]
+
+        second, fraction = divmod(wall, _NS_PER_SECOND)
+        if second != self._second:
+            self._second = second
+            self._prefix = time.strftime(
+                    '%Y%m%d-%H:%M:%S.', time.gmtime(second)).encode('utf-8')
+
+        if self.precision == MILLISECONDS:
+            return self._prefix + _MILLIS[fraction // 1000000]
+
+        return self._prefix + str(fraction // self._divisor).zfill(
+                self.precision).encode('utf-8')
+
+#------------------------------------------------------------------------------
+
+# The engine wide clock
+clock = Clock()
+
+#------------------------------------------------------------------------------
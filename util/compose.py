@@ -26,19 +26,13 @@ Order for composing the FIX message:
 
 """
 import time
-import asyncio
 import logging
-import functools
-from datetime import datetime, timedelta
 
-from . import SOH, TAGS, MSGS
+from . import SOH, dictionary
+from .parse import checksum
+from .clock import clock
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-
-console = logging.StreamHandler()
-console.setLevel(logging.DEBUG)
-logger.addHandler(console)
 
 
 #------------------------------------------------------------------------------
@@ -59,11 +53,9 @@ test_message = {
 
 #------------------------------------------------------------------------------
 
-def SendingTime():
-	sending_time = datetime.utcnow().\
-	        strftime("%Y%m%d-%H:%M:%S.%f")[:-3].encode('utf-8')
-	
-	return sending_time
+def SendingTime(wall=None):
+    # 'wall' is a nanosecond timestamp from clock.read(), defaults to now
+    return clock.SendingTime(wall)
 
 #------------------------------------------------------------------------------
 
@@ -78,7 +70,8 @@ def find_checksum_as_bytes(message):
 #------------------------------------------------------------------------------
 
 def compile_field(name=None, value=None):
-    field = TAGS[name] + b'=' + value + SOH
+    FIX = dictionary.get()
+    field = FIX.prefixes[FIX.tags[name]] + value + SOH
     
     return field
 
@@ -104,10 +97,11 @@ def get_header_fields(**kwargs):
 #------------------------------------------------------------------------------
 
 def compile_body(**kwargs):
+    FIX = dictionary.get()
     body = b''
     for field, value in kwargs.items():
         try:
-            body = body + TAGS[field] + b'=' + value + SOH
+            body = body + FIX.prefixes[FIX.tags[field]] + value + SOH
         except KeyError as e:
             pass
     
@@ -126,74 +120,6 @@ def compile_header(**kwargs):
     
     tip = tip + compile_field('BodyLength', b'')
 
-#------------------------------------------------------------------------------
-"""
-The following decorator does two things:
-1. Applies rate limiting.
-2. Applies coroutine functionality if not already present in the decorated
-   function.
-"""
-def rate_limit(rate, period=None):
-    class Limiter:
-        def __init__(self, f):
-            functools.update_wrapper(self, f)
-            
-            self.__func = f
-            self._is_coroutine = True
-            self.__calling_func = None
-            
-            try:
-                if self.__func._is_coroutine:
-                    
-                    def temp(self, *args, **kwargs):
-                        elapsed_time = datetime.now() - self._last_time_called
-                        
-                        if elapsed_time < self._min_interval:
-                            time_to_wait = self._min_interval - elapsed_time
-                            yield from asyncio.sleep(time_to_wait.total_seconds())
-                        
-                        func_return = yield from self.__func(*args, **kwargs)
-                        self._last_time_called = datetime.now()
-                        
-                        return func_return
-                        
-                    self.__calling_func = temp
-                    
-                else:
-                    raise AttributeError
-                
-            except AttributeError as e:
-                
-                def temp(self, *args, **kwargs):
-                    elapsed_time = datetime.now() - self._last_time_called
-                    
-                    if elapsed_time < self._min_interval:
-                        time_to_wait = self._min_interval - elapsed_time
-                        yield from asyncio.sleep(time_to_wait.total_seconds())
-                    
-                    func_return = self.__func(*args, **kwargs)
-                    self._last_time_called = datetime.now()
-                    
-                    return func_return
-                
-                self.__calling_func = temp
-            
-            self._rate = rate
-            self._period = period
-            
-            if not period:
-                self._min_interval = timedelta(seconds=rate)
-            else:
-                self._min_interval = timedelta(seconds=(period / rate))
-            
-            self._last_time_called = datetime.now()
-        
-        @asyncio.coroutine
-        def __call__(self, *args, **kwargs):
-            return self.__calling_func(self, *args, **kwargs)
-    
-    return Limiter
-
 #------------------------------------------------------------------------------
 
 class CompileError(Exception):
@@ -264,36 +190,189 @@ def compile_message_original(**kwargs):
 
 
 def compile_message(fields, MsgSeqNum):
+    # 'fields' is a list of encoded fields, MsgType first
     try:
-        message = b''
-        partial_message = b''
-        
-        header_start = b'8=FIX.4.4\x019='
+        partial_message = b''.join(
+                [fields[0], b'34=', MsgSeqNum, SOH] + fields[1:])
         
-        partial_message = partial_message + fields.pop(0)
+        BodyLength = str(len(partial_message)).encode('utf-8')
         
-        MsgSeqNum_field = b'34=' + MsgSeqNum + b'\x01'
+        message = b''.join([b'8=FIX.4.4\x019=', BodyLength, SOH,
+                partial_message])
         
-        partial_message += MsgSeqNum_field
+        # Add the CheckSum field to the FIX message
+        return message + CHECKSUM_FIELDS[checksum(message)]
+    
+    except Exception as e:
+        raise CompileError("{}, {}".format(type(e), e.args))
+
+def possible_duplicate(message, SendingTime):
+    """
+    Re-stamp a previously sent message for resending: PossDupFlag (43) is
+    set, SendingTime is replaced and the original becomes OrigSendingTime
+    (122). BodyLength and CheckSum are recomputed.
+    """
+    message = bytes(message)
+    
+    first_soh = message.find(SOH)
+    second_soh = message.find(SOH, first_soh + 1)
+    start = message.find(b'\x0152=', second_soh) + 1
+    if not start:
+        raise CompileError('SendingTime not found')
+    end = message.find(SOH, start)
+    
+    body = b''.join([
+            message[second_soh + 1:start],
+            b'43=Y\x0152=', SendingTime,
+            b'\x01122=', message[start + 3:end], SOH,
+            message[end + 1:-7],
+            ])
+    
+    resent = b''.join([message[:first_soh + 3],
+            str(len(body)).encode('utf-8'), SOH, body])
+    return resent + CHECKSUM_FIELDS[checksum(resent)]
+
+#------------------------------------------------------------------------------
+"""
+Precompiled message templates.
+
+The header fields that never change within a session (BeginString, MsgType,
+SenderCompID, TargetCompID) and any static body fields of a MsgType are
+encoded once, along with their partial CheckSum. Composing a message then
+only encodes MsgSeqNum, SendingTime and the variable fields, and finishes
+BodyLength and CheckSum from the cached lengths and sums.
+"""
+
+# b'10=NNN\x01' for every possible CheckSum
+CHECKSUM_FIELDS = [b'10=' + str(i).zfill(3).encode('utf-8') + SOH
+        for i in range(256)]
+
+# Header fields supplied by the template, dropped from the variable fields
+TEMPLATE_FIELDS = (b'34=', b'49=', b'52=', b'56=')
+
+class MessageTemplate:
+    
+    __slots__ = ('MsgType', '_begin', '_begin_sum', '_head', '_static',
+            '_fixed_length', '_fixed_sum')
+    
+    def __init__(self, MsgType, SenderCompID, TargetCompID,
+            BeginString=b'FIX.4.4', static_fields=()):
+        self.MsgType = MsgType
         
-        for field in fields:
-            partial_message += field
+        # Everything up to the BodyLength value
+        self._begin = b'8=' + BeginString + b'\x019='
         
-        BodyLength = len(partial_message)
+        # MsgType, SenderCompID, TargetCompID; then MsgSeqNum and SendingTime
+        # follow, then the static fields
+        self._head = b''.join([
+                b'35=', MsgType, SOH,
+                b'49=', SenderCompID, SOH,
+                b'56=', TargetCompID, SOH,
+                b'34=',
+                ])
+        self._static = b''.join(static_fields)
         
-        header = header_start + str(BodyLength).encode('utf-8') + b'\x01'
+        self._fixed_length = len(self._head) + len(self._static)
+        self._fixed_sum = sum(self._begin) + sum(self._head) + \
+                sum(self._static)
+    
+    def parts(self, MsgSeqNum, SendingTime, fields=()):
+        # The encoded pieces of a complete message, in order
+        variable = b''.join(fields)
+        seq_time = b''.join([MsgSeqNum, b'\x0152=', SendingTime, SOH])
         
-        message = header + partial_message
+        BodyLength = str(self._fixed_length + len(seq_time) +
+                len(variable)).encode('utf-8')
         
-        # Calculate the CheckSum
-        CheckSum = find_checksum_as_bytes(message)
+        CheckSum = self._fixed_sum + sum(BodyLength) + 1 + \
+                checksum(seq_time) + checksum(variable)
         
-        # Add the CheckSum field to the FIX message
-        FIX_message = message + b'10=' + CheckSum + b'\x01'
+        return (self._begin, BodyLength, SOH, self._head, seq_time,
+                self._static, variable, CHECKSUM_FIELDS[CheckSum & 255])
+    
+    def compile(self, MsgSeqNum, SendingTime, fields=()):
+        return b''.join(self.parts(MsgSeqNum, SendingTime, fields))
+    
+    def compile_into(self, buffer, MsgSeqNum, SendingTime, fields=()):
+        # Append the message to a bytearray, returning its length
+        start = len(buffer)
+        for part in self.parts(MsgSeqNum, SendingTime, fields):
+            buffer += part
+        return len(buffer) - start
+
+
+def message_type(fields):
+    # The MsgType of a field list or joined fields, None if not first
+    if type(fields) is bytes:
+        end = fields.find(SOH)
+        if not fields.startswith(b'35=') or end == -1:
+            return None
+        return fields[3:end]
+    
+    if not fields or not fields[0].startswith(b'35='):
+        return None
+    return fields[0][3:-1]
+
+
+class SessionTemplates:
+    """
+    The MessageTemplates of one session, created per MsgType on first use.
+    
+    'compile' takes the same field lists as compile_message: MsgType first,
+    then the body. MsgSeqNum, SenderCompID, SendingTime and TargetCompID in
+    the list are ignored, the template supplies them. The fields may also be
+    given already joined as one bytes object, which is used as is and must
+    not contain those header fields.
+    """
+    
+    def __init__(self, SenderCompID, TargetCompID, BeginString=b'FIX.4.4'):
+        self.SenderCompID = SenderCompID
+        self.TargetCompID = TargetCompID
+        self.BeginString = BeginString
+        self._templates = {}
+    
+    def register(self, MsgType, static_fields=()):
+        template = MessageTemplate(MsgType, self.SenderCompID,
+                self.TargetCompID, self.BeginString, static_fields)
+        self._templates[MsgType] = template
+        return template
+    
+    def get(self, MsgType):
+        try:
+            return self._templates[MsgType]
+        except KeyError:
+            return self.register(MsgType)
+    
+    def _split(self, fields):
+        if type(fields) is bytes:
+            end = fields.find(SOH)
+            if not fields.startswith(b'35=') or end == -1:
+                raise CompileError('MsgType must be the first field')
+            return self.get(fields[3:end]), (fields[end + 1:],)
         
-        return FIX_message
+        MsgType_field = fields[0]
+        if not MsgType_field.startswith(b'35='):
+            raise CompileError('MsgType must be the first field')
+        body = [field for field in fields[1:]
+                if not field.startswith(TEMPLATE_FIELDS)]
+        return self.get(MsgType_field[3:-1]), body
     
-    except Exception as e:
-        raise ParseError("{}, {}".format(type(e), e.args))
+    def compile(self, fields, MsgSeqNum, SendingTime):
+        try:
+            template, body = self._split(fields)
+            return template.compile(MsgSeqNum, SendingTime, body)
+        except (TypeError, AttributeError, LookupError) as e:
+            # A field that is not bytes, or a field list that is not a list
+            raise CompileError("{}, {}".format(type(e), e.args))
+    
+    def compile_into(self, buffer, fields, MsgSeqNum, SendingTime):
+        # Returns the MsgType of the message appended to 'buffer'; nothing is
+        # appended when the message does not compile
+        try:
+            template, body = self._split(fields)
+            template.compile_into(buffer, MsgSeqNum, SendingTime, body)
+        except (TypeError, AttributeError, LookupError) as e:
+            raise CompileError("{}, {}".format(type(e), e.args))
+        return template.MsgType
 
 #------------------------------------------------------------------------------
@@ -0,0 +1,207 @@
+"""
+Typed field values.
+
+Converters turn raw field values into Python values according to each tag's
+FIX datatype:
+
+    INT, LENGTH, SEQNUM, NUMINGROUP, ...    int
+    PRICE, QTY, AMT, FLOAT, ...             decimal.Decimal, or with a
+                                            price_scale, an int scaled by
+                                            10 ** price_scale (truncated)
+    UTCTIMESTAMP                            int, nanoseconds since the epoch
+    BOOLEAN                                 bool
+    anything else                           the raw bytes
+
+Types come from the data dictionary. A dictionary generated without them (see
+util/dictionary/generate.py) falls back on COMMON_TYPES, which covers the
+session, order and market data fields the engine deals with.
+
+Message.value and Message.values convert through the module's current
+Converters, and cache the results on the message.
+"""
+import calendar
+from decimal import Decimal
+
+from . import dictionary
+
+#------------------------------------------------------------------------------
+
+INT_TYPES = frozenset(['INT', 'LENGTH', 'SEQNUM', 'NUMINGROUP', 'TAGNUM',
+        'DAYOFMONTH'])
+DECIMAL_TYPES = frozenset(['PRICE', 'QTY', 'AMT', 'FLOAT', 'PRICEOFFSET',
+        'PERCENTAGE'])
+
+# Field name: type, for dictionaries without types
+COMMON_TYPES = {
+    'BodyLength': 'LENGTH',
+    'MsgSeqNum': 'SEQNUM',
+    'SendingTime': 'UTCTIMESTAMP',
+    'OrigSendingTime': 'UTCTIMESTAMP',
+    'PossDupFlag': 'BOOLEAN',
+    'PossResend': 'BOOLEAN',
+    'HeartBtInt': 'INT',
+    'ResetSeqNumFlag': 'BOOLEAN',
+    'MaxMessageSize': 'LENGTH',
+    'LastMsgSeqNumProcessed': 'SEQNUM',
+    'NextExpectedMsgSeqNum': 'SEQNUM',
+    'BeginSeqNo': 'SEQNUM',
+    'EndSeqNo': 'SEQNUM',
+    'NewSeqNo': 'SEQNUM',
+    'GapFillFlag': 'BOOLEAN',
+    'RefSeqNum': 'SEQNUM',
+
+    'Price': 'PRICE',
+    'StopPx': 'PRICE',
+    'AvgPx': 'PRICE',
+    'LastPx': 'PRICE',
+    'BidPx': 'PRICE',
+    'OfferPx': 'PRICE',
+    'HighPx': 'PRICE',
+    'LowPx': 'PRICE',
+    'SettlPrice': 'PRICE',
+    'PriorSettlPrice': 'PRICE',
+    'OrderQty': 'QTY',
+    'CashOrderQty': 'QTY',
+    'MinQty': 'QTY',
+    'MaxFloor': 'QTY',
+    'LastQty': 'QTY',
+    'CumQty': 'QTY',
+    'LeavesQty': 'QTY',
+    'BidSize': 'QTY',
+    'OfferSize': 'QTY',
+    'Commission': 'AMT',
+    'NetMoney': 'AMT',
+    'SettlCurrAmt': 'AMT',
+    'SettlCurrFxRate': 'FLOAT',
+    'TransactTime': 'UTCTIMESTAMP',
+    'ExpireTime': 'UTCTIMESTAMP',
+    'EffectiveTime': 'UTCTIMESTAMP',
+    'ValidUntilTime': 'UTCTIMESTAMP',
+    'NoPartyIDs': 'NUMINGROUP',
+    'NoExecs': 'NUMINGROUP',
+
+    'MarketDepth': 'INT',
+    'NoMDEntryTypes': 'NUMINGROUP',
+    'NoMDEntries': 'NUMINGROUP',
+    'NoRelatedSym': 'NUMINGROUP',
+    'NoQuoteEntries': 'NUMINGROUP',
+    'MDEntryPx': 'PRICE',
+    'MDEntrySize': 'QTY',
+    'MDEntryPositionNo': 'INT',
+    'NumberOfOrders': 'INT',
+    'TotalVolumeTraded': 'QTY',
+    }
+
+#------------------------------------------------------------------------------
+
+def to_bool(raw):
+    if raw == b'Y':
+        return True
+    if raw == b'N':
+        return False
+    raise ValueError('Invalid BOOLEAN: {!r}'.format(raw))
+
+
+def to_decimal(raw):
+    return Decimal(raw.decode('ascii'))
+
+
+def fixed_point(scale):
+    # A converter to ints scaled by 10 ** scale, extra digits truncated
+    zeros = b'0' * scale
+
+    def to_fixed(raw):
+        point = raw.find(b'.')
+        if point == -1:
+            return int(raw + zeros)
+        fraction = raw[point + 1:point + 1 + scale]
+        return int(raw[:point] + fraction + zeros[len(fraction):])
+    return to_fixed
+
+
+# b'YYYYMMDD': seconds since the epoch at its midnight
+_midnights = {}
+
+def to_epoch_ns(raw):
+    # UTCTimestamp, 'YYYYMMDD-HH:MM:SS', with any fraction of a second
+    date = raw[:8]
+    midnight = _midnights.get(date)
+    if midnight is None:
+        if len(date) != 8 or not date.isdigit():
+            raise ValueError('Invalid UTCTimestamp: {!r}'.format(raw))
+        midnight = calendar.timegm((int(date[:4]), int(date[4:6]),
+                int(date[6:]), 0, 0, 0))
+        if len(_midnights) > 1024:
+            _midnights.clear()
+        _midnights[date] = midnight
+
+    if raw[8:9] != b'-' or raw[11:12] != b':' or raw[14:15] != b':':
+        raise ValueError('Invalid UTCTimestamp: {!r}'.format(raw))
+    seconds = (midnight + int(raw[9:11]) * 3600 + int(raw[12:14]) * 60 +
+            int(raw[15:17]))
+
+    if len(raw) == 17:
+        return seconds * 1000000000
+    fraction = raw[18:27]
+    if raw[17:18] != b'.' or not fraction.isdigit():
+        raise ValueError('Invalid UTCTimestamp: {!r}'.format(raw))
+    return (seconds * 1000000000 +
+            int(fraction) * 10 ** (9 - len(fraction)))
+
+#------------------------------------------------------------------------------
+
+class Converters:
+
+    __slots__ = ('by_tag', 'price_scale')
+
+    def __init__(self, FIX=None, price_scale=None):
+        # 'FIX' is a util.dictionary.Dictionary, FIX 4.4 by default
+        if FIX is None:
+            FIX = dictionary.get()
+        self.price_scale = price_scale
+
+        if price_scale is None:
+            to_price = to_decimal
+        else:
+            to_price = fixed_point(price_scale)
+
+        by_type = {'UTCTIMESTAMP': to_epoch_ns, 'BOOLEAN': to_bool}
+        by_type.update((kind, int) for kind in INT_TYPES)
+        by_type.update((kind, to_price) for kind in DECIMAL_TYPES)
+
+        # Converter by tag number, None to leave the bytes as they are
+        by_tag = [None] * len(FIX.names)
+        if FIX.types:
+            for tag, kind in enumerate(FIX.types):
+                by_tag[tag] = by_type.get(kind)
+        else:
+            for name, kind in COMMON_TYPES.items():
+                tag = FIX.tags.get(name)
+                if tag is not None:
+                    by_tag[tag] = by_type.get(kind)
+        self.by_tag = by_tag
+
+    def convert(self, tag, raw):
+        by_tag = self.by_tag
+        converter = by_tag[tag] if tag < len(by_tag) else None
+        return raw if converter is None else converter(raw)
+
+#------------------------------------------------------------------------------
+
+_converters = None
+
+def converters():
+    # The Converters used by Message.value, built on first use
+    global _converters
+    if _converters is None:
+        _converters = Converters()
+    return _converters
+
+
+def set_price_scale(scale):
+    # Prices and quantities as Decimal (None), or as ints scaled by
+    # 10 ** scale. Messages already converted keep their cached values.
+    global _converters
+    _converters = Converters(price_scale=scale)
+
+#------------------------------------------------------------------------------
@@ -0,0 +1,91 @@
+"""
+FIX data dictionaries.
+
+Each version's dictionary is a generated module (see generate.py) of plain
+tuples and dicts, imported only when the version is first asked for:
+
+    from util import dictionary
+    FIX44 = dictionary.get(b'FIX.4.4')
+    FIX44.names[35]         # b'MsgType'
+    FIX44.tags[b'MsgType']  # 35, str names work as well
+    FIX44.messages[b'D']    # b'New Order Single'
+
+Lookups by tag number index a tuple rather than hash a key. Only FIX 4.4 is
+generated so far; add a version by generating its module from a spec and
+listing it in VERSIONS.
+"""
+import importlib
+
+#------------------------------------------------------------------------------
+
+# BeginString: module
+VERSIONS = {
+    b'FIX.4.4': 'fix44',
+    }
+
+DEFAULT = b'FIX.4.4'
+
+#------------------------------------------------------------------------------
+
+class Dictionary:
+
+    __slots__ = ('BeginString', 'names', 'types', 'messages', 'fields',
+            'tags', 'prefixes', 'msg_types')
+
+    def __init__(self, module):
+        self.BeginString = module.BeginString
+        # Tag number: name, type
+        self.names = module.NAMES
+        self.types = module.TYPES
+        # MsgType: message name, tags of its fields
+        self.messages = module.MESSAGES
+        self.fields = module.FIELDS
+
+        # Field name, bytes or str: tag number
+        tags = {}
+        for tag, name in enumerate(self.names):
+            if name is not None:
+                tags[name] = tag
+                tags[name.decode('utf-8')] = tag
+        self.tags = tags
+
+        # Tag number: b'<tag>='
+        self.prefixes = tuple(str(tag).encode('utf-8') + b'='
+                for tag in range(len(self.names)))
+
+        # Message name, bytes or str: MsgType
+        msg_types = {}
+        for MsgType, name in self.messages.items():
+            msg_types[name] = MsgType
+            msg_types[name.decode('utf-8')] = MsgType
+        self.msg_types = msg_types
+
+    def name(self, tag):
+        # None for unknown tags
+        names = self.names
+        return names[tag] if 0 <= tag < len(names) else None
+
+    def type(self, tag):
+        types = self.types
+        return types[tag] if 0 <= tag < len(types) else None
+
+#------------------------------------------------------------------------------
+
+_loaded = {}
+
+def get(BeginString=DEFAULT):
+    # KeyError for a version without a dictionary
+    dictionary = _loaded.get(BeginString)
+    if dictionary is not None:
+        return dictionary
+
+    try:
+        module = importlib.import_module('.' + VERSIONS[BeginString],
+                __name__)
+    except (KeyError, ImportError):
+        raise KeyError('No data dictionary for {!r}'.format(BeginString))
+
+    dictionary = _loaded[BeginString] = Dictionary(module)
+    return dictionary
+
+#------------------------------------------------------------------------------
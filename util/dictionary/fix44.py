@@ -0,0 +1,3148 @@
+"""
+FIX.4.4 data dictionary.
+
+Generated by util/dictionary/generate.py from FIX44.xml, with the names of
+FIXtags.pkl and FIXmsgs.pkl, do not edit.
+"""
+
+BeginString = b'FIX.4.4'
+
+# Field name by tag number, None where the tag is unassigned
+NAMES = (
+    None,
+    b'Account',  # 1
+    b'AdvId',  # 2
+    b'AdvRefID',  # 3
+    b'AdvSide',  # 4
+    b'AdvTransType',  # 5
+    b'AvgPx',  # 6
+    b'BeginSeqNo',  # 7
+    b'BeginString',  # 8
+    b'BodyLength',  # 9
+    b'CheckSum',  # 10
+    b'ClOrdID',  # 11
+    b'Commission',  # 12
+    b'CommType',  # 13
+    b'CumQty',  # 14
+    b'Currency',  # 15
+    b'EndSeqNo',  # 16
+    b'ExecID',  # 17
+    b'ExecInst',  # 18
+    b'ExecRefID',  # 19
+    b'ExecTransType',  # 20
+    b'HandlInst',  # 21
+    b'SecurityIDSource',  # 22
+    b'IOIID',  # 23
+    b'IOIOthSvc',  # 24
+    b'IOIQltyInd',  # 25
+    b'IOIRefID',  # 26
+    b'IOIQty',  # 27
+    b'IOITransType',  # 28
+    b'LastCapacity',  # 29
+    b'LastMkt',  # 30
+    b'LastPx',  # 31
+    b'LastQty',  # 32
+    b'NoLinesOfText',  # 33
+    b'MsgSeqNum',  # 34
+    b'MsgType',  # 35
+    b'NewSeqNo',  # 36
+    b'OrderID',  # 37
+    b'OrderQty',  # 38
+    b'OrdStatus',  # 39
+    b'OrdType',  # 40
+    b'OrigClOrdID',  # 41
+    b'OrigTime',  # 42
+    b'PossDupFlag',  # 43
+    b'Price',  # 44
+    b'RefSeqNum',  # 45
+    b'RelatdSym',  # 46
+    b'Rule80A',  # 47
+    b'SecurityID',  # 48
+    b'SenderCompID',  # 49
+    b'SenderSubID',  # 50
+    b'SendingDate',  # 51
+    b'SendingTime',  # 52
+    b'Quantity',  # 53
+    b'Side',  # 54
+    b'Symbol',  # 55
+    b'TargetCompID',  # 56
+    b'TargetSubID',  # 57
+    b'Text',  # 58
+    b'TimeInForce',  # 59
+    b'TransactTime',  # 60
+    b'Urgency',  # 61
+    b'ValidUntilTime',  # 62
+    b'SettlType',  # 63
+    b'SettlDate',  # 64
+    b'SymbolSfx',  # 65
+    b'ListID',  # 66
+    b'ListSeqNo',  # 67
+    b'TotNoOrders',  # 68
+    b'ListExecInst',  # 69
+    b'AllocID',  # 70
+    b'AllocTransType',  # 71
+    b'RefAllocID',  # 72
+    b'NoOrders',  # 73
+    b'AvgPxPrecision',  # 74
+    b'TradeDate',  # 75
+    b'ExecBroker',  # 76
+    b'PositionEffect',  # 77
+    b'NoAllocs',  # 78
+    b'AllocAccount',  # 79
+    b'AllocQty',  # 80
+    b'ProcessCode',  # 81
+    b'NoRpts',  # 82
+    b'RptSeq',  # 83
+    b'CxlQty',  # 84
+    b'NoDlvyInst',  # 85
+    b'DlvyInst',  # 86
+    b'AllocStatus',  # 87
+    b'AllocRejCode',  # 88
+    b'Signature',  # 89
+    b'SecureDataLen',  # 90
+    b'SecureData',  # 91
+    b'BrokerOfCredit',  # 92
+    b'SignatureLength',  # 93
+    b'EmailType',  # 94
+    b'RawDataLength',  # 95
+    b'RawData',  # 96
+    b'PossResend',  # 97
+    b'EncryptMethod',  # 98
+    b'StopPx',  # 99
+    b'ExDestination',  # 100
+    None,
+    b'CxlRejReason',  # 102
+    b'OrdRejReason',  # 103
+    b'IOIQualifier',  # 104
+    b'WaveNo',  # 105
+    b'Issuer',  # 106
+    b'SecurityDesc',  # 107
+    b'HeartBtInt',  # 108
+    b'ClientID',  # 109
+    b'MinQty',  # 110
+    b'MaxFloor',  # 111
+    b'TestReqID',  # 112
+    b'ReportToExch',  # 113
+    b'LocateReqd',  # 114
+    b'OnBehalfOfCompID',  # 115
+    b'OnBehalfOfSubID',  # 116
+    b'QuoteID',  # 117
+    b'NetMoney',  # 118
+    b'SettlCurrAmt',  # 119
+    b'SettlCurrency',  # 120
+    b'ForexReq',  # 121
+    b'OrigSendingTime',  # 122
+    b'GapFillFlag',  # 123
+    b'NoExecs',  # 124
+    b'CxlType',  # 125
+    b'ExpireTime',  # 126
+    b'DKReason',  # 127
+    b'DeliverToCompID',  # 128
+    b'DeliverToSubID',  # 129
+    b'IOINaturalFlag',  # 130
+    b'QuoteReqID',  # 131
+    b'BidPx',  # 132
+    b'OfferPx',  # 133
+    b'BidSize',  # 134
+    b'OfferSize',  # 135
+    b'NoMiscFees',  # 136
+    b'MiscFeeAmt',  # 137
+    b'MiscFeeCurr',  # 138
+    b'MiscFeeType',  # 139
+    b'PrevClosePx',  # 140
+    b'ResetSeqNumFlag',  # 141
+    b'SenderLocationID',  # 142
+    b'TargetLocationID',  # 143
+    b'OnBehalfOfLocationID',  # 144
+    b'DeliverToLocationID',  # 145
+    b'NoRelatedSym',  # 146
+    b'Subject',  # 147
+    b'Headline',  # 148
+    b'URLLink',  # 149
+    b'ExecType',  # 150
+    b'LeavesQty',  # 151
+    b'CashOrderQty',  # 152
+    b'AllocAvgPx',  # 153
+    b'AllocNetMoney',  # 154
+    b'SettlCurrFxRate',  # 155
+    b'SettlCurrFxRateCalc',  # 156
+    b'NumDaysInterest',  # 157
+    b'AccruedInterestRate',  # 158
+    b'AccruedInterestAmt',  # 159
+    b'SettlInstMode',  # 160
+    b'AllocText',  # 161
+    b'SettlInstID',  # 162
+    b'SettlInstTransType',  # 163
+    b'EmailThreadID',  # 164
+    b'SettlInstSource',  # 165
+    b'SettlLocation',  # 166
+    b'SecurityType',  # 167
+    b'EffectiveTime',  # 168
+    b'StandInstDbType',  # 169
+    b'StandInstDbName',  # 170
+    b'StandInstDbID',  # 171
+    b'SettlDeliveryType',  # 172
+    b'SettlDepositoryCode',  # 173
+    b'SettlBrkrCode',  # 174
+    b'SettlInstCode',  # 175
+    b'SecuritySettlAgentName',  # 176
+    b'SecuritySettlAgentCode',  # 177
+    b'SecuritySettlAgentAcctNum',  # 178
+    b'SecuritySettlAgentAcctName',  # 179
+    b'SecuritySettlAgentContactName',  # 180
+    b'SecuritySettlAgentContactPhone',  # 181
+    b'CashSettlAgentName',  # 182
+    b'CashSettlAgentCode',  # 183
+    b'CashSettlAgentAcctNum',  # 184
+    b'CashSettlAgentAcctName',  # 185
+    b'CashSettlAgentContactName',  # 186
+    b'CashSettlAgentContactPhone',  # 187
+    b'BidSpotRate',  # 188
+    b'BidForwardPoints',  # 189
+    b'OfferSpotRate',  # 190
+    b'OfferForwardPoints',  # 191
+    b'OrderQty2',  # 192
+    b'SettlDate2',  # 193
+    b'LastSpotRate',  # 194
+    b'LastForwardPoints',  # 195
+    b'AllocLinkID',  # 196
+    b'AllocLinkType',  # 197
+    b'SecondaryOrderID',  # 198
+    b'NoIOIQualifiers',  # 199
+    b'MaturityMonthYear',  # 200
+    b'PutOrCall',  # 201
+    b'StrikePrice',  # 202
+    b'CoveredOrUncovered',  # 203
+    b'CustomerOrFirm',  # 204
+    b'MaturityDay',  # 205
+    b'OptAttribute',  # 206
+    b'SecurityExchange',  # 207
+    b'NotifyBrokerOfCredit',  # 208
+    b'AllocHandlInst',  # 209
+    b'MaxShow',  # 210
+    b'PegOffsetValue',  # 211
+    b'XmlDataLen',  # 212
+    b'XmlData',  # 213
+    b'SettlInstRefID',  # 214
+    b'NoRoutingIDs',  # 215
+    b'RoutingType',  # 216
+    b'RoutingID',  # 217
+    b'Spread',  # 218
+    b'Benchmark',  # 219
+    b'BenchmarkCurveCurrency',  # 220
+    b'BenchmarkCurveName',  # 221
+    b'BenchmarkCurvePoint',  # 222
+    b'CouponRate',  # 223
+    b'CouponPaymentDate',  # 224
+    b'IssueDate',  # 225
+    b'RepurchaseTerm',  # 226
+    b'RepurchaseRate',  # 227
+    b'Factor',  # 228
+    b'TradeOriginationDate',  # 229
+    b'ExDate',  # 230
+    b'ContractMultiplier',  # 231
+    b'NoStipulations',  # 232
+    b'StipulationType',  # 233
+    b'StipulationValue',  # 234
+    b'YieldType',  # 235
+    b'Yield',  # 236
+    b'TotalTakedown',  # 237
+    b'Concession',  # 238
+    b'RepoCollateralSecurityType',  # 239
+    b'RedemptionDate',  # 240
+    b'UnderlyingCouponPaymentDate',  # 241
+    b'UnderlyingIssueDate',  # 242
+    b'UnderlyingRepoCollateralSecurityType',  # 243
+    b'UnderlyingRepurchaseTerm',  # 244
+    b'UnderlyingRepurchaseRate',  # 245
+    b'UnderlyingFactor',  # 246
+    b'UnderlyingRedemptionDate',  # 247
+    b'LegCouponPaymentDate',  # 248
+    b'LegIssueDate',  # 249
+    b'LegRepoCollateralSecurityType',  # 250
+    b'LegRepurchaseTerm',  # 251
+    b'LegRepurchaseRate',  # 252
+    b'LegFactor',  # 253
+    b'LegRedemptionDate',  # 254
+    b'CreditRating',  # 255
+    b'UnderlyingCreditRating',  # 256
+    b'LegCreditRating',  # 257
+    b'TradedFlatSwitch',  # 258
+    b'BasisFeatureDate',  # 259
+    b'BasisFeaturePrice',  # 260
+    None,
+    b'MDReqID',  # 262
+    b'SubscriptionRequestType',  # 263
+    b'MarketDepth',  # 264
+    b'MDUpdateType',  # 265
+    b'AggregatedBook',  # 266
+    b'NoMDEntryTypes',  # 267
+    b'NoMDEntries',  # 268
+    b'MDEntryType',  # 269
+    b'MDEntryPx',  # 270
+    b'MDEntrySize',  # 271
+    b'MDEntryDate',  # 272
+    b'MDEntryTime',  # 273
+    b'TickDirection',  # 274
+    b'MDMkt',  # 275
+    b'QuoteCondition',  # 276
+    b'TradeCondition',  # 277
+    b'MDEntryID',  # 278
+    b'MDUpdateAction',  # 279
+    b'MDEntryRefID',  # 280
+    b'MDReqRejReason',  # 281
+    b'MDEntryOriginator',  # 282
+    b'LocationID',  # 283
+    b'DeskID',  # 284
+    b'DeleteReason',  # 285
+    b'OpenCloseSettlFlag',  # 286
+    b'SellerDays',  # 287
+    b'MDEntryBuyer',  # 288
+    b'MDEntrySeller',  # 289
+    b'MDEntryPositionNo',  # 290
+    b'FinancialStatus',  # 291
+    b'CorporateAction',  # 292
+    b'DefBidSize',  # 293
+    b'DefOfferSize',  # 294
+    b'NoQuoteEntries',  # 295
+    b'NoQuoteSets',  # 296
+    b'QuoteStatus',  # 297
+    b'QuoteCancelType',  # 298
+    b'QuoteEntryID',  # 299
+    b'QuoteRejectReason',  # 300
+    b'QuoteResponseLevel',  # 301
+    b'QuoteSetID',  # 302
+    b'QuoteRequestType',  # 303
+    b'TotNoQuoteEntries',  # 304
+    b'UnderlyingSecurityIDSource',  # 305
+    b'UnderlyingIssuer',  # 306
+    b'UnderlyingSecurityDesc',  # 307
+    b'UnderlyingSecurityExchange',  # 308
+    b'UnderlyingSecurityID',  # 309
+    b'UnderlyingSecurityType',  # 310
+    b'UnderlyingSymbol',  # 311
+    b'UnderlyingSymbolSfx',  # 312
+    b'UnderlyingMaturityMonthYear',  # 313
+    b'UnderlyingMaturityDay',  # 314
+    b'UnderlyingPutOrCall',  # 315
+    b'UnderlyingStrikePrice',  # 316
+    b'UnderlyingOptAttribute',  # 317
+    b'UnderlyingCurrency',  # 318
+    b'RatioQty',  # 319
+    b'SecurityReqID',  # 320
+    b'SecurityRequestType',  # 321
+    b'SecurityResponseID',  # 322
+    b'SecurityResponseType',  # 323
+    b'SecurityStatusReqID',  # 324
+    b'UnsolicitedIndicator',  # 325
+    b'SecurityTradingStatus',  # 326
+    b'HaltReason',  # 327
+    b'InViewOfCommon',  # 328
+    b'DueToRelated',  # 329
+    b'BuyVolume',  # 330
+    b'SellVolume',  # 331
+    b'HighPx',  # 332
+    b'LowPx',  # 333
+    b'Adjustment',  # 334
+    b'TradSesReqID',  # 335
+    b'TradingSessionID',  # 336
+    b'ContraTrader',  # 337
+    b'TradSesMethod',  # 338
+    b'TradSesMode',  # 339
+    b'TradSesStatus',  # 340
+    b'TradSesStartTime',  # 341
+    b'TradSesOpenTime',  # 342
+    b'TradSesPreCloseTime',  # 343
+    b'TradSesCloseTime',  # 344
+    b'TradSesEndTime',  # 345
+    b'NumberOfOrders',  # 346
+    b'MessageEncoding',  # 347
+    b'EncodedIssuerLen',  # 348
+    b'EncodedIssuer',  # 349
+    b'EncodedSecurityDescLen',  # 350
+    b'EncodedSecurityDesc',  # 351
+    b'EncodedListExecInstLen',  # 352
+    b'EncodedListExecInst',  # 353
+    b'EncodedTextLen',  # 354
+    b'EncodedText',  # 355
+    b'EncodedSubjectLen',  # 356
+    b'EncodedSubject',  # 357
+    b'EncodedHeadlineLen',  # 358
+    b'EncodedHeadline',  # 359
+    b'EncodedAllocTextLen',  # 360
+    b'EncodedAllocText',  # 361
+    b'EncodedUnderlyingIssuerLen',  # 362
+    b'EncodedUnderlyingIssuer',  # 363
+    b'EncodedUnderlyingSecurityDescLen',  # 364
+    b'EncodedUnderlyingSecurityDesc',  # 365
+    b'AllocPrice',  # 366
+    b'QuoteSetValidUntilTime',  # 367
+    b'QuoteEntryRejectReason',  # 368
+    b'LastMsgSeqNumProcessed',  # 369
+    b'OnBehalfOfSendingTime',  # 370
+    b'RefTagID',  # 371
+    b'RefMsgType',  # 372
+    b'SessionRejectReason',  # 373
+    b'BidRequestTransType',  # 374
+    b'ContraBroker',  # 375
+    b'ComplianceID',  # 376
+    b'SolicitedFlag',  # 377
+    b'ExecRestatementReason',  # 378
+    b'BusinessRejectRefID',  # 379
+    b'BusinessRejectReason',  # 380
+    b'GrossTradeAmt',  # 381
+    b'NoContraBrokers',  # 382
+    b'MaxMessageSize',  # 383
+    b'NoMsgTypes',  # 384
+    b'MsgDirection',  # 385
+    b'NoTradingSessions',  # 386
+    b'TotalVolumeTraded',  # 387
+    b'DiscretionInst',  # 388
+    b'DiscretionOffsetValue',  # 389
+    b'BidID',  # 390
+    b'ClientBidID',  # 391
+    b'ListName',  # 392
+    b'TotNoRelatedSym',  # 393
+    b'BidType',  # 394
+    b'NumTickets',  # 395
+    b'SideValue1',  # 396
+    b'SideValue2',  # 397
+    b'NoBidDescriptors',  # 398
+    b'BidDescriptorType',  # 399
+    b'BidDescriptor',  # 400
+    b'SideValueInd',  # 401
+    b'LiquidityPctLow',  # 402
+    b'LiquidityPctHigh',  # 403
+    b'LiquidityValue',  # 404
+    b'EFPTrackingError',  # 405
+    b'FairValue',  # 406
+    b'OutsideIndexPct',  # 407
+    b'ValueOfFutures',  # 408
+    b'LiquidityIndType',  # 409
+    b'WtAverageLiquidity',  # 410
+    b'ExchangeForPhysical',  # 411
+    b'OutMainCntryUIndex',  # 412
+    b'CrossPercent',  # 413
+    b'ProgRptReqs',  # 414
+    b'ProgPeriodInterval',  # 415
+    b'IncTaxInd',  # 416
+    b'NumBidders',  # 417
+    b'BidTradeType',  # 418
+    b'BasisPxType',  # 419
+    b'NoBidComponents',  # 420
+    b'Country',  # 421
+    b'TotNoStrikes',  # 422
+    b'PriceType',  # 423
+    b'DayOrderQty',  # 424
+    b'DayCumQty',  # 425
+    b'DayAvgPx',  # 426
+    b'GTBookingInst',  # 427
+    b'NoStrikes',  # 428
+    b'ListStatusType',  # 429
+    b'NetGrossInd',  # 430
+    b'ListOrderStatus',  # 431
+    b'ExpireDate',  # 432
+    b'ListExecInstType',  # 433
+    b'CxlRejResponseTo',  # 434
+    b'UnderlyingCouponRate',  # 435
+    b'UnderlyingContractMultiplier',  # 436
+    b'ContraTradeQty',  # 437
+    b'ContraTradeTime',  # 438
+    b'ClearingFirm',  # 439
+    b'ClearingAccount',  # 440
+    b'LiquidityNumSecurities',  # 441
+    b'MultiLegReportingType',  # 442
+    b'StrikeTime',  # 443
+    b'ListStatusText',  # 444
+    b'EncodedListStatusTextLen',  # 445
+    b'EncodedListStatusText',  # 446
+    b'PartyIDSource',  # 447
+    b'PartyID',  # 448
+    b'TotalVolumeTradedDate',  # 449
+    b'TotalVolumeTraded Time',  # 450
+    b'NetChgPrevDay',  # 451
+    b'PartyRole',  # 452
+    b'NoPartyIDs',  # 453
+    b'NoSecurityAltID',  # 454
+    b'SecurityAltID',  # 455
+    b'SecurityAltIDSource',  # 456
+    b'NoUnderlyingSecurityAltID',  # 457
+    b'UnderlyingSecurityAltID',  # 458
+    b'UnderlyingSecurityAltIDSource',  # 459
+    b'Product',  # 460
+    b'CFICode',  # 461
+    b'UnderlyingProduct',  # 462
+    b'UnderlyingCFICode',  # 463
+    b'TestMessageIndicator',  # 464
+    b'QuantityType',  # 465
+    b'BookingRefID',  # 466
+    b'IndividualAllocID',  # 467
+    b'RoundingDirection',  # 468
+    b'RoundingModulus',  # 469
+    b'CountryOfIssue',  # 470
+    b'StateOrProvinceOfIssue',  # 471
+    b'LocaleOfIssue',  # 472
+    b'NoRegistDtls',  # 473
+    b'MailingDtls',  # 474
+    b'InvestorCountryOfResidence',  # 475
+    b'PaymentRef',  # 476
+    b'DistribPaymentMethod',  # 477
+    b'CashDistribCurr',  # 478
+    b'CommCurrency',  # 479
+    b'CancellationRights',  # 480
+    b'MoneyLaunderingStatus',  # 481
+    b'MailingInst',  # 482
+    b'TransBkdTime',  # 483
+    b'ExecPriceType',  # 484
+    b'ExecPriceAdjustment',  # 485
+    b'DateOfBirth',  # 486
+    b'TradeReportTransType',  # 487
+    b'CardHolderName',  # 488
+    b'CardNumber',  # 489
+    b'CardExpDate',  # 490
+    b'CardIssNum',  # 491
+    b'PaymentMethod',  # 492
+    b'RegistAcctType',  # 493
+    b'Designation',  # 494
+    b'TaxAdvantageType',  # 495
+    b'RegistRejReasonText',  # 496
+    b'FundRenewWaiv',  # 497
+    b'CashDistribAgentName',  # 498
+    b'CashDistribAgentCode',  # 499
+    b'CashDistribAgentAcctNumber',  # 500
+    b'CashDistribPayRef',  # 501
+    b'CashDistribAgentAcctName',  # 502
+    b'CardStartDate',  # 503
+    b'PaymentDate',  # 504
+    b'PaymentRemitterID',  # 505
+    b'RegistStatus',  # 506
+    b'RegistRejReasonCode',  # 507
+    b'RegistRefID',  # 508
+    b'RegistDtls',  # 509
+    b'NoDistribInsts',  # 510
+    b'RegistEmail',  # 511
+    b'DistribPercentage',  # 512
+    b'RegistID',  # 513
+    b'RegistTransType',  # 514
+    b'ExecValuationPoint',  # 515
+    b'OrderPercent',  # 516
+    b'OwnershipType',  # 517
+    b'NoContAmts',  # 518
+    b'ContAmtType',  # 519
+    b'ContAmtValue',  # 520
+    b'ContAmtCurr',  # 521
+    b'OwnerType',  # 522
+    b'PartySubID',  # 523
+    b'NestedPartyID',  # 524
+    b'NestedPartyIDSource',  # 525
+    b'SecondaryClOrdID',  # 526
+    b'SecondaryExecID',  # 527
+    b'OrderCapacity',  # 528
+    b'OrderRestrictions',  # 529
+    b'MassCancelRequestType',  # 530
+    b'MassCancelResponse',  # 531
+    b'MassCancelRejectReason',  # 532
+    b'TotalAffectedOrders',  # 533
+    b'NoAffectedOrders',  # 534
+    b'AffectedOrderID',  # 535
+    b'AffectedSecondaryOrderID',  # 536
+    b'QuoteType',  # 537
+    b'NestedPartyRole',  # 538
+    b'NoNestedPartyIDs',  # 539
+    b'TotalAccruedInterestAmt',  # 540
+    b'MaturityDate',  # 541
+    b'UnderlyingMaturityDate',  # 542
+    b'InstrRegistry',  # 543
+    b'CashMargin',  # 544
+    b'NestedPartySubID',  # 545
+    b'Scope',  # 546
+    b'MDImplicitDelete',  # 547
+    b'CrossID',  # 548
+    b'CrossType',  # 549
+    b'CrossPrioritization',  # 550
+    b'OrigCrossID',  # 551
+    b'NoSides',  # 552
+    b'Username',  # 553
+    b'Password',  # 554
+    b'NoLegs',  # 555
+    b'LegCurrency',  # 556
+    b'TotNoSecurityTypes',  # 557
+    b'NoSecurityTypes',  # 558
+    b'SecurityListRequestType',  # 559
+    b'SecurityRequestResult',  # 560
+    b'RoundLot',  # 561
+    b'MinTradeVol',  # 562
+    b'MultiLegRptTypeReq',  # 563
+    b'LegPositionEffect',  # 564
+    b'LegCoveredOrUncovered',  # 565
+    b'LegPrice',  # 566
+    b'TradSesStatusRejReason',  # 567
+    b'TradeRequestID',  # 568
+    b'TradeRequestType',  # 569
+    b'PreviouslyReported',  # 570
+    b'TradeReportID',  # 571
+    b'TradeReportRefID',  # 572
+    b'MatchStatus',  # 573
+    b'MatchType',  # 574
+    b'OddLot',  # 575
+    b'NoClearingInstructions',  # 576
+    b'ClearingInstruction',  # 577
+    b'TradeInputSource',  # 578
+    b'TradeInputDevice',  # 579
+    b'NoDates',  # 580
+    b'AccountType',  # 581
+    b'CustOrderCapacity',  # 582
+    b'ClOrdLinkID',  # 583
+    b'MassStatusReqID',  # 584
+    b'MassStatusReqType',  # 585
+    b'OrigOrdModTime',  # 586
+    b'LegSettlType',  # 587
+    b'LegSettlDate',  # 588
+    b'DayBookingInst',  # 589
+    b'BookingUnit',  # 590
+    b'PreallocMethod',  # 591
+    b'UnderlyingCountryOfIssue',  # 592
+    b'UnderlyingStateOrProvinceOfIssue',  # 593
+    b'UnderlyingLocaleOfIssue',  # 594
+    b'UnderlyingInstrRegistry',  # 595
+    b'LegCountryOfIssue',  # 596
+    b'LegStateOrProvinceOfIssue',  # 597
+    b'LegLocaleOfIssue',  # 598
+    b'LegInstrRegistry',  # 599
+    b'LegSymbol',  # 600
+    b'LegSymbolSfx',  # 601
+    b'LegSecurityID',  # 602
+    b'LegSecurityIDSource',  # 603
+    b'NoLegSecurityAltID',  # 604
+    b'LegSecurityAltID',  # 605
+    b'LegSecurityAltIDSource',  # 606
+    b'LegProduct',  # 607
+    b'LegCFICode',  # 608
+    b'LegSecurityType',  # 609
+    b'LegMaturityMonthYear',  # 610
+    b'LegMaturityDate',  # 611
+    b'LegStrikePrice',  # 612
+    b'LegOptAttribute',  # 613
+    b'LegContractMultiplier',  # 614
+    b'LegCouponRate',  # 615
+    b'LegSecurityExchange',  # 616
+    b'LegIssuer',  # 617
+    b'EncodedLegIssuerLen',  # 618
+    b'EncodedLegIssuer',  # 619
+    b'LegSecurityDesc',  # 620
+    b'EncodedLegSecurityDescLen',  # 621
+    b'EncodedLegSecurityDesc',  # 622
+    b'LegRatioQty',  # 623
+    b'LegSide',  # 624
+    b'TradingSessionSubID',  # 625
+    b'AllocType',  # 626
+    b'NoHops',  # 627
+    b'HopCompID',  # 628
+    b'HopSendingTime',  # 629
+    b'HopRefID',  # 630
+    b'MidPx',  # 631
+    b'BidYield',  # 632
+    b'MidYield',  # 633
+    b'OfferYield',  # 634
+    b'ClearingFeeIndicator',  # 635
+    b'WorkingIndicator',  # 636
+    b'LegLastPx',  # 637
+    b'PriorityIndicator',  # 638
+    b'PriceImprovement',  # 639
+    b'Price2',  # 640
+    b'LastForwardPoints2',  # 641
+    b'BidForwardPoints2',  # 642
+    b'OfferForwardPoints2',  # 643
+    b'RFQReqID',  # 644
+    b'MktBidPx',  # 645
+    b'MktOfferPx',  # 646
+    b'MinBidSize',  # 647
+    b'MinOfferSize',  # 648
+    b'QuoteStatusReqID',  # 649
+    b'LegalConfirm',  # 650
+    b'UnderlyingLastPx',  # 651
+    b'UnderlyingLastQty',  # 652
+    b'SecDefStatus',  # 653
+    b'LegRefID',  # 654
+    b'ContraLegRefID',  # 655
+    b'SettlCurrBidFxRate',  # 656
+    b'SettlCurrOfferFxRate',  # 657
+    b'QuoteRequestRejectReason',  # 658
+    b'SideComplianceID',  # 659
+    b'AcctIDSource',  # 660
+    b'AllocAcctIDSource',  # 661
+    b'BenchmarkPrice',  # 662
+    b'BenchmarkPriceType',  # 663
+    b'ConfirmID',  # 664
+    b'ConfirmStatus',  # 665
+    b'ConfirmTransType',  # 666
+    b'ContractSettlMonth',  # 667
+    b'DeliveryForm',  # 668
+    b'LastParPx',  # 669
+    b'NoLegAllocs',  # 670
+    b'LegAllocAccount',  # 671
+    b'LegIndividualAllocID',  # 672
+    b'LegAllocQty',  # 673
+    b'LegAllocAcctIDSource',  # 674
+    b'LegSettlCurrency',  # 675
+    b'LegBenchmarkCurveCurrency',  # 676
+    b'LegBenchmarkCurveName',  # 677
+    b'LegBenchmarkCurvePoint',  # 678
+    b'LegBenchmarkPrice',  # 679
+    b'LegBenchmarkPriceType',  # 680
+    b'LegBidPx',  # 681
+    b'LegIOIQty',  # 682
+    b'NoLegStipulations',  # 683
+    b'LegOfferPx',  # 684
+    b'LegOrderQty',  # 685
+    b'LegPriceType',  # 686
+    b'LegQty',  # 687
+    b'LegStipulationType',  # 688
+    b'LegStipulationValue',  # 689
+    b'LegSwapType',  # 690
+    b'Pool',  # 691
+    b'QuotePriceType',  # 692
+    b'QuoteRespID',  # 693
+    b'QuoteRespType',  # 694
+    b'QuoteQualifier',  # 695
+    b'YieldRedemptionDate',  # 696
+    b'YieldRedemptionPrice',  # 697
+    b'YieldRedemptionPriceType',  # 698
+    b'BenchmarkSecurityID',  # 699
+    b'ReversalIndicator',  # 700
+    b'YieldCalcDate',  # 701
+    b'NoPositions',  # 702
+    b'PosType',  # 703
+    b'LongQty',  # 704
+    b'ShortQty',  # 705
+    b'PosQtyStatus',  # 706
+    b'PosAmtType',  # 707
+    b'PosAmt',  # 708
+    b'PosTransType',  # 709
+    b'PosReqID',  # 710
+    b'NoUnderlyings',  # 711
+    b'PosMaintAction',  # 712
+    b'OrigPosReqRefID',  # 713
+    b'PosMaintRptRefID',  # 714
+    b'ClearingBusinessDate',  # 715
+    b'SettlSessID',  # 716
+    b'SettlSessSubID',  # 717
+    b'AdjustmentType',  # 718
+    b'ContraryInstructionIndicator',  # 719
+    b'PriorSpreadIndicator',  # 720
+    b'PosMaintRptID',  # 721
+    b'PosMaintStatus',  # 722
+    b'PosMaintResult',  # 723
+    b'PosReqType',  # 724
+    b'ResponseTransportType',  # 725
+    b'ResponseDestination',  # 726
+    b'TotalNumPosReports',  # 727
+    b'PosReqResult',  # 728
+    b'PosReqStatus',  # 729
+    b'SettlPrice',  # 730
+    b'SettlPriceType',  # 731
+    b'UnderlyingSettlPrice',  # 732
+    b'UnderlyingSettlPriceType',  # 733
+    b'PriorSettlPrice',  # 734
+    b'NoQuoteQualifiers',  # 735
+    b'AllocSettlCurrency',  # 736
+    b'AllocSettlCurrAmt',  # 737
+    b'InterestAtMaturity',  # 738
+    b'LegDatedDate',  # 739
+    b'LegPool',  # 740
+    b'AllocInterestAtMaturity',  # 741
+    b'AllocAccruedInterestAmt',  # 742
+    b'DeliveryDate',  # 743
+    b'AssignmentMethod',  # 744
+    b'AssignmentUnit',  # 745
+    b'OpenInterest',  # 746
+    b'ExerciseMethod',  # 747
+    b'TotNumTradeReports',  # 748
+    b'TradeRequestResult',  # 749
+    b'TradeRequestStatus',  # 750
+    b'TradeReportRejectReason',  # 751
+    b'SideMultiLegReportingType',  # 752
+    b'NoPosAmt',  # 753
+    b'AutoAcceptIndicator',  # 754
+    b'AllocReportID',  # 755
+    b'NoNested2PartyIDs',  # 756
+    b'Nested2PartyID',  # 757
+    b'Nested2PartyIDSource',  # 758
+    b'Nested2PartyRole',  # 759
+    b'Nested2PartySubID',  # 760
+    b'BenchmarkSecurityIDSource',  # 761
+    b'SecuritySubType',  # 762
+    b'UnderlyingSecuritySubType',  # 763
+    b'LegSecuritySubType',  # 764
+    b'AllowableOneSidednessPct',  # 765
+    b'AllowableOneSidednessValue',  # 766
+    b'AllowableOneSidednessCurr',  # 767
+    b'NoTrdRegTimestamps',  # 768
+    b'TrdRegTimestamp',  # 769
+    b'TrdRegTimestampType',  # 770
+    b'TrdRegTimestampOrigin',  # 771
+    b'ConfirmRefID',  # 772
+    b'ConfirmType',  # 773
+    b'ConfirmRejReason',  # 774
+    b'BookingType',  # 775
+    b'IndividualAllocRejCode',  # 776
+    b'SettlInstMsgID',  # 777
+    b'NoSettlInst',  # 778
+    b'LastUpdateTime',  # 779
+    b'AllocSettlInstType',  # 780
+    b'NoSettlPartyIDs',  # 781
+    b'SettlPartyID',  # 782
+    b'SettlPartyIDSource',  # 783
+    b'SettlPartyRole',  # 784
+    b'SettlPartySubID',  # 785
+    b'SettlPartySubIDType',  # 786
+    b'DlvyInstType',  # 787
+    b'TerminationType',  # 788
+    b'NextExpectedMsgSeqNum',  # 789
+    b'OrdStatusReqID',  # 790
+    b'SettlInstReqID',  # 791
+    b'SettlInstReqRejCode',  # 792
+    b'SecondaryAllocID',  # 793
+    b'AllocReportType',  # 794
+    b'AllocReportRefID',  # 795
+    b'AllocCancReplaceReason',  # 796
+    b'CopyMsgIndicator',  # 797
+    b'AllocAccountType',  # 798
+    b'OrderAvgPx',  # 799
+    b'OrderBookingQty',  # 800
+    b'NoSettlPartySubIDs',  # 801
+    b'NoPartySubIDs',  # 802
+    b'PartySubIDType',  # 803
+    b'NoNestedPartySubIDs',  # 804
+    b'NestedPartySubIDType',  # 805
+    b'NoNested2PartySubIDs',  # 806
+    b'Nested2PartySubIDType',  # 807
+    b'AllocIntermedReqType',  # 808
+    None,
+    b'UnderlyingPx',  # 810
+    b'PriceDelta',  # 811
+    b'ApplQueueMax',  # 812
+    b'ApplQueueDepth',  # 813
+    b'ApplQueueResolution',  # 814
+    b'ApplQueueAction',  # 815
+    b'NoAltMDSource',  # 816
+    b'AltMDSourceID',  # 817
+    b'SecondaryTradeReportID',  # 818
+    b'AvgPxIndicator',  # 819
+    b'TradeLinkID',  # 820
+    b'OrderInputDevice',  # 821
+    b'UnderlyingTradingSessionID',  # 822
+    b'UnderlyingTradingSessionSubID',  # 823
+    b'TradeLegRefID',  # 824
+    b'ExchangeRule',  # 825
+    b'TradeAllocIndicator',  # 826
+    b'ExpirationCycle',  # 827
+    b'TrdType',  # 828
+    b'TrdSubType',  # 829
+    b'TransferReason',  # 830
+    b'AsgnReqID',  # 831
+    b'TotNumAssignmentReports',  # 832
+    b'AsgnRptID',  # 833
+    b'ThresholdAmount',  # 834
+    b'PegMoveType',  # 835
+    b'PegOffsetType',  # 836
+    b'PegLimitType',  # 837
+    b'PegRoundDirection',  # 838
+    b'PeggedPrice',  # 839
+    b'PegScope',  # 840
+    b'DiscretionMoveType',  # 841
+    b'DiscretionOffsetType',  # 842
+    b'DiscretionLimitType',  # 843
+    b'DiscretionRoundDirection',  # 844
+    b'DiscretionPrice',  # 845
+    b'DiscretionScope',  # 846
+    b'TargetStrategy',  # 847
+    b'TargetStrategyParameters',  # 848
+    b'ParticipationRate',  # 849
+    b'TargetStrategyPerformance',  # 850
+    b'LastLiquidityInd',  # 851
+    b'PublishTrdIndicator',  # 852
+    b'ShortSaleReason',  # 853
+    b'QtyType',  # 854
+    b'SecondaryTrdType',  # 855
+    b'TradeReportType',  # 856
+    b'AllocNoOrdersType',  # 857
+    b'SharedCommission',  # 858
+    b'ConfirmReqID',  # 859
+    b'AvgParPx',  # 860
+    b'ReportedPx',  # 861
+    b'NoCapacities',  # 862
+    b'OrderCapacityQty',  # 863
+    b'NoEvents',  # 864
+    b'EventType',  # 865
+    b'EventDate',  # 866
+    b'EventPx',  # 867
+    b'EventText',  # 868
+    b'PctAtRisk',  # 869
+    b'NoInstrAttrib',  # 870
+    b'InstrAttribType',  # 871
+    b'InstrAttribValue',  # 872
+    b'DatedDate',  # 873
+    b'InterestAccrualDate',  # 874
+    b'CPProgram',  # 875
+    b'CPRegType',  # 876
+    b'UnderlyingCPProgram',  # 877
+    b'UnderlyingCPRegType',  # 878
+    b'UnderlyingQty',  # 879
+    b'TrdMatchID',  # 880
+    b'SecondaryTradeReportRefID',  # 881
+    b'UnderlyingDirtyPrice',  # 882
+    b'UnderlyingEndPrice',  # 883
+    b'UnderlyingStartValue',  # 884
+    b'UnderlyingCurrentValue',  # 885
+    b'UnderlyingEndValue',  # 886
+    b'NoUnderlyingStips',  # 887
+    b'UnderlyingStipType',  # 888
+    b'UnderlyingStipValue',  # 889
+    b'MaturityNetMoney',  # 890
+    b'MiscFeeBasis',  # 891
+    b'TotNoAllocs',  # 892
+    b'LastFragment',  # 893
+    b'CollReqID',  # 894
+    b'CollAsgnReason',  # 895
+    b'CollInquiryQualifier',  # 896
+    b'NoTrades',  # 897
+    b'MarginRatio',  # 898
+    b'MarginExcess',  # 899
+    b'TotalNetValue',  # 900
+    b'CashOutstanding',  # 901
+    b'CollAsgnID',  # 902
+    b'CollAsgnTransType',  # 903
+    b'CollRespID',  # 904
+    b'CollAsgnRespType',  # 905
+    b'CollAsgnRejectReason',  # 906
+    b'CollAsgnRefID',  # 907
+    b'CollRptID',  # 908
+    b'CollInquiryID',  # 909
+    b'CollStatus',  # 910
+    b'TotNumReports',  # 911
+    b'LastRptRequested',  # 912
+    b'AgreementDesc',  # 913
+    b'AgreementID',  # 914
+    b'AgreementDate',  # 915
+    b'StartDate',  # 916
+    b'EndDate',  # 917
+    b'AgreementCurrency',  # 918
+    b'DeliveryType',  # 919
+    b'EndAccruedInterestAmt',  # 920
+    b'StartCash',  # 921
+    b'EndCash',  # 922
+    b'UserRequestID',  # 923
+    b'UserRequestType',  # 924
+    b'NewPassword',  # 925
+    b'UserStatus',  # 926
+    b'UserStatusText',  # 927
+    b'StatusValue',  # 928
+    b'StatusText',  # 929
+    b'RefCompID',  # 930
+    b'RefSubID',  # 931
+    b'NetworkResponseID',  # 932
+    b'NetworkRequestID',  # 933
+    b'LastNetworkResponseID',  # 934
+    b'NetworkRequestType',  # 935
+    b'NoCompIDs',  # 936
+    b'NetworkStatusResponseType',  # 937
+    b'NoCollInquiryQualifier',  # 938
+    b'TrdRptStatus',  # 939
+    b'AffirmStatus',  # 940
+    b'UnderlyingStrikeCurrency',  # 941
+    b'LegStrikeCurrency',  # 942
+    b'TimeBracket',  # 943
+    b'CollAction',  # 944
+    b'CollInquiryStatus',  # 945
+    b'CollInquiryResult',  # 946
+    b'StrikeCurrency',  # 947
+    b'NoNested3PartyIDs',  # 948
+    b'Nested3PartyID',  # 949
+    b'Nested3PartyIDSource',  # 950
+    b'Nested3PartyRole',  # 951
+    b'NoNested3PartySubIDs',  # 952
+    b'Nested3PartySubID',  # 953
+    b'Nested3PartySubIDType',  # 954
+    b'LegContractSettlMonth',  # 955
+    b'LegInterestAccrualDate',  # 956
+    )
+
+# Field type by tag number, as named by the spec
+TYPES = (
+    None,
+    'STRING',
+    'STRING',
+    'STRING',
+    'CHAR',
+    'STRING',
+    'PRICE',
+    'SEQNUM',
+    'STRING',
+    'LENGTH',
+    'STRING',
+    'STRING',
+    'AMT',
+    'CHAR',
+    'QTY',
+    'CURRENCY',
+    'SEQNUM',
+    'STRING',
+    'MULTIPLEVALUESTRING',
+    'STRING',
+    None,
+    'CHAR',
+    'STRING',
+    'STRING',
+    None,
+    'CHAR',
+    'STRING',
+    'STRING',
+    'CHAR',
+    'CHAR',
+    'EXCHANGE',
+    'PRICE',
+    'QTY',
+    'NUMINGROUP',
+    'SEQNUM',
+    'STRING',
+    'SEQNUM',
+    'STRING',
+    'QTY',
+    'CHAR',
+    'CHAR',
+    'STRING',
+    'UTCTIMESTAMP',
+    'BOOLEAN',
+    'PRICE',
+    'SEQNUM',
+    None,
+    None,
+    'STRING',
+    'STRING',
+    'STRING',
+    None,
+    'UTCTIMESTAMP',
+    'QTY',
+    'CHAR',
+    'STRING',
+    'STRING',
+    'STRING',
+    'STRING',
+    'CHAR',
+    'UTCTIMESTAMP',
+    'CHAR',
+    'UTCTIMESTAMP',
+    'CHAR',
+    'LOCALMKTDATE',
+    'STRING',
+    'STRING',
+    'INT',
+    'INT',
+    'STRING',
+    'STRING',
+    'CHAR',
+    'STRING',
+    'NUMINGROUP',
+    'INT',
+    'LOCALMKTDATE',
+    None,
+    'CHAR',
+    'NUMINGROUP',
+    'STRING',
+    'QTY',
+    'CHAR',
+    'INT',
+    'INT',
+    'QTY',
+    'NUMINGROUP',
+    None,
+    'INT',
+    'INT',
+    'DATA',
+    'LENGTH',
+    'DATA',
+    None,
+    'LENGTH',
+    'CHAR',
+    'LENGTH',
+    'DATA',
+    'BOOLEAN',
+    'INT',
+    'PRICE',
+    'EXCHANGE',
+    None,
+    'INT',
+    'INT',
+    'CHAR',
+    None,
+    'STRING',
+    'STRING',
+    'INT',
+    None,
+    'QTY',
+    'QTY',
+    'STRING',
+    'BOOLEAN',
+    'BOOLEAN',
+    'STRING',
+    'STRING',
+    'STRING',
+    'AMT',
+    'AMT',
+    'CURRENCY',
+    'BOOLEAN',
+    'UTCTIMESTAMP',
+    'BOOLEAN',
+    'NUMINGROUP',
+    None,
+    'UTCTIMESTAMP',
+    'CHAR',
+    'STRING',
+    'STRING',
+    'BOOLEAN',
+    'STRING',
+    'PRICE',
+    'PRICE',
+    'QTY',
+    'QTY',
+    'NUMINGROUP',
+    'AMT',
+    'CURRENCY',
+    'STRING',
+    'PRICE',
+    'BOOLEAN',
+    'STRING',
+    'STRING',
+    'STRING',
+    'STRING',
+    'NUMINGROUP',
+    'STRING',
+    'STRING',
+    'STRING',
+    'CHAR',
+    'QTY',
+    'QTY',
+    'PRICE',
+    'AMT',
+    'FLOAT',
+    'CHAR',
+    'INT',
+    'PERCENTAGE',
+    'AMT',
+    'CHAR',
+    'STRING',
+    'STRING',
+    'CHAR',
+    'STRING',
+    'CHAR',
+    None,
+    'STRING',
+    'UTCTIMESTAMP',
+    'INT',
+    'STRING',
+    'STRING',
+    'INT',
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    'PRICE',
+    'PRICEOFFSET',
+    'PRICE',
+    'PRICEOFFSET',
+    'QTY',
+    'LOCALMKTDATE',
+    'PRICE',
+    'PRICEOFFSET',
+    'STRING',
+    'INT',
+    'STRING',
+    'NUMINGROUP',
+    'MONTHYEAR',
+    'INT',
+    'PRICE',
+    'INT',
+    None,
+    None,
+    'CHAR',
+    'EXCHANGE',
+    'BOOLEAN',
+    'INT',
+    'QTY',
+    'FLOAT',
+    'LENGTH',
+    'DATA',
+    'STRING',
+    'NUMINGROUP',
+    'INT',
+    'STRING',
+    'PRICEOFFSET',
+    None,
+    'CURRENCY',
+    'STRING',
+    'STRING',
+    'PERCENTAGE',
+    'LOCALMKTDATE',
+    'LOCALMKTDATE',
+    'INT',
+    'PERCENTAGE',
+    'FLOAT',
+    'LOCALMKTDATE',
+    'LOCALMKTDATE',
+    'FLOAT',
+    'NUMINGROUP',
+    'STRING',
+    'STRING',
+    'STRING',
+    'PERCENTAGE',
+    'AMT',
+    'AMT',
+    'STRING',
+    'LOCALMKTDATE',
+    'LOCALMKTDATE',
+    'LOCALMKTDATE',
+    'STRING',
+    'INT',
+    'PERCENTAGE',
+    'FLOAT',
+    'LOCALMKTDATE',
+    'LOCALMKTDATE',
+    'LOCALMKTDATE',
+    'STRING',
+    'INT',
+    'PERCENTAGE',
+    'FLOAT',
+    'LOCALMKTDATE',
+    'STRING',
+    'STRING',
+    'STRING',
+    'BOOLEAN',
+    'LOCALMKTDATE',
+    'PRICE',
+    None,
+    'STRING',
+    'CHAR',
+    'INT',
+    'INT',
+    'BOOLEAN',
+    'NUMINGROUP',
+    'NUMINGROUP',
+    'CHAR',
+    'PRICE',
+    'QTY',
+    'UTCDATEONLY',
+    'UTCTIMEONLY',
+    'CHAR',
+    'EXCHANGE',
+    'MULTIPLEVALUESTRING',
+    'MULTIPLEVALUESTRING',
+    'STRING',
+    'CHAR',
+    'STRING',
+    'CHAR',
+    'STRING',
+    'STRING',
+    'STRING',
+    'CHAR',
+    'MULTIPLEVALUESTRING',
+    'INT',
+    'STRING',
+    'STRING',
+    'INT',
+    'MULTIPLEVALUESTRING',
+    'MULTIPLEVALUESTRING',
+    'QTY',
+    'QTY',
+    'NUMINGROUP',
+    'NUMINGROUP',
+    'INT',
+    'INT',
+    'STRING',
+    'INT',
+    'INT',
+    'STRING',
+    'INT',
+    'INT',
+    'STRING',
+    'STRING',
+    'STRING',
+    'EXCHANGE',
+    'STRING',
+    'STRING',
+    'STRING',
+    'STRING',
+    'MONTHYEAR',
+    None,
+    'INT',
+    'PRICE',
+    'CHAR',
+    'CURRENCY',
+    None,
+    'STRING',
+    'INT',
+    'STRING',
+    'INT',
+    'STRING',
+    'BOOLEAN',
+    'INT',
+    'CHAR',
+    'BOOLEAN',
+    'BOOLEAN',
+    'QTY',
+    'QTY',
+    'PRICE',
+    'PRICE',
+    'INT',
+    'STRING',
+    'STRING',
+    'STRING',
+    'INT',
+    'INT',
+    'INT',
+    'UTCTIMESTAMP',
+    'UTCTIMESTAMP',
+    'UTCTIMESTAMP',
+    'UTCTIMESTAMP',
+    'UTCTIMESTAMP',
+    'INT',
+    'STRING',
+    'LENGTH',
+    'DATA',
+    'LENGTH',
+    'DATA',
+    'LENGTH',
+    'DATA',
+    'LENGTH',
+    'DATA',
+    'LENGTH',
+    'DATA',
+    'LENGTH',
+    'DATA',
+    'LENGTH',
+    'DATA',
+    'LENGTH',
+    'DATA',
+    'LENGTH',
+    'DATA',
+    'PRICE',
+    'UTCTIMESTAMP',
+    'INT',
+    'SEQNUM',
+    None,
+    'INT',
+    'STRING',
+    'INT',
+    'CHAR',
+    'STRING',
+    'STRING',
+    'BOOLEAN',
+    'INT',
+    'STRING',
+    'INT',
+    'AMT',
+    'NUMINGROUP',
+    'LENGTH',
+    'NUMINGROUP',
+    'CHAR',
+    'NUMINGROUP',
+    'QTY',
+    'CHAR',
+    'FLOAT',
+    'STRING',
+    'STRING',
+    'STRING',
+    'INT',
+    'INT',
+    'INT',
+    'AMT',
+    'AMT',
+    'NUMINGROUP',
+    'INT',
+    'STRING',
+    'INT',
+    'PERCENTAGE',
+    'PERCENTAGE',
+    'AMT',
+    'PERCENTAGE',
+    'AMT',
+    'PERCENTAGE',
+    'AMT',
+    'INT',
+    'PERCENTAGE',
+    'BOOLEAN',
+    'AMT',
+    'PERCENTAGE',
+    'INT',
+    'INT',
+    'INT',
+    'INT',
+    'CHAR',
+    'CHAR',
+    'NUMINGROUP',
+    'COUNTRY',
+    'INT',
+    'INT',
+    'QTY',
+    'QTY',
+    'PRICE',
+    'INT',
+    'NUMINGROUP',
+    'INT',
+    'INT',
+    'INT',
+    'LOCALMKTDATE',
+    'CHAR',
+    'CHAR',
+    'PERCENTAGE',
+    'FLOAT',
+    'QTY',
+    'UTCTIMESTAMP',
+    None,
+    None,
+    'INT',
+    'CHAR',
+    'UTCTIMESTAMP',
+    'STRING',
+    'LENGTH',
+    'DATA',
+    'CHAR',
+    'STRING',
+    None,
+    None,
+    'PRICEOFFSET',
+    'INT',
+    'NUMINGROUP',
+    'NUMINGROUP',
+    'STRING',
+    'STRING',
+    'NUMINGROUP',
+    'STRING',
+    'STRING',
+    'INT',
+    'STRING',
+    'INT',
+    'STRING',
+    'BOOLEAN',
+    None,
+    'STRING',
+    'STRING',
+    'CHAR',
+    'FLOAT',
+    'COUNTRY',
+    'STRING',
+    'STRING',
+    'NUMINGROUP',
+    'STRING',
+    'COUNTRY',
+    'STRING',
+    'INT',
+    'CURRENCY',
+    'CURRENCY',
+    'CHAR',
+    'CHAR',
+    'STRING',
+    'UTCTIMESTAMP',
+    'CHAR',
+    'FLOAT',
+    'LOCALMKTDATE',
+    'INT',
+    'STRING',
+    'STRING',
+    'LOCALMKTDATE',
+    'STRING',
+    'INT',
+    'STRING',
+    'STRING',
+    'INT',
+    'STRING',
+    'CHAR',
+    'STRING',
+    'STRING',
+    'STRING',
+    'STRING',
+    'STRING',
+    'LOCALMKTDATE',
+    'LOCALMKTDATE',
+    'STRING',
+    'CHAR',
+    'INT',
+    'STRING',
+    'STRING',
+    'NUMINGROUP',
+    'STRING',
+    'PERCENTAGE',
+    'STRING',
+    'CHAR',
+    'UTCTIMESTAMP',
+    'PERCENTAGE',
+    'CHAR',
+    'NUMINGROUP',
+    'INT',
+    'FLOAT',
+    'CURRENCY',
+    'INT',
+    'STRING',
+    'STRING',
+    'CHAR',
+    'STRING',
+    'STRING',
+    'CHAR',
+    'MULTIPLEVALUESTRING',
+    'CHAR',
+    'CHAR',
+    'STRING',
+    'INT',
+    'NUMINGROUP',
+    'STRING',
+    'STRING',
+    'INT',
+    'INT',
+    'NUMINGROUP',
+    'AMT',
+    'LOCALMKTDATE',
+    'LOCALMKTDATE',
+    'STRING',
+    'CHAR',
+    'STRING',
+    'MULTIPLEVALUESTRING',
+    'BOOLEAN',
+    'STRING',
+    'INT',
+    'INT',
+    'STRING',
+    'NUMINGROUP',
+    'STRING',
+    'STRING',
+    'NUMINGROUP',
+    'CURRENCY',
+    'INT',
+    'NUMINGROUP',
+    'INT',
+    'INT',
+    'QTY',
+    'QTY',
+    'INT',
+    'CHAR',
+    'INT',
+    'PRICE',
+    'INT',
+    'STRING',
+    'INT',
+    'BOOLEAN',
+    'STRING',
+    'STRING',
+    'CHAR',
+    'STRING',
+    'BOOLEAN',
+    'NUMINGROUP',
+    'INT',
+    'STRING',
+    'STRING',
+    'NUMINGROUP',
+    'INT',
+    'INT',
+    'STRING',
+    'STRING',
+    'INT',
+    'UTCTIMESTAMP',
+    'CHAR',
+    'LOCALMKTDATE',
+    'CHAR',
+    'CHAR',
+    'CHAR',
+    'COUNTRY',
+    'STRING',
+    'STRING',
+    'STRING',
+    'COUNTRY',
+    'STRING',
+    'STRING',
+    'STRING',
+    'STRING',
+    'STRING',
+    'STRING',
+    'STRING',
+    'NUMINGROUP',
+    'STRING',
+    'STRING',
+    'INT',
+    'STRING',
+    'STRING',
+    'MONTHYEAR',
+    'LOCALMKTDATE',
+    'PRICE',
+    'CHAR',
+    'FLOAT',
+    'PERCENTAGE',
+    'EXCHANGE',
+    'STRING',
+    'LENGTH',
+    'DATA',
+    'STRING',
+    'LENGTH',
+    'DATA',
+    'FLOAT',
+    'CHAR',
+    'STRING',
+    'INT',
+    'NUMINGROUP',
+    'STRING',
+    'UTCTIMESTAMP',
+    'SEQNUM',
+    'PRICE',
+    'PERCENTAGE',
+    'PERCENTAGE',
+    'PERCENTAGE',
+    'STRING',
+    'BOOLEAN',
+    'PRICE',
+    'INT',
+    'PRICEOFFSET',
+    'PRICE',
+    'PRICEOFFSET',
+    'PRICEOFFSET',
+    'PRICEOFFSET',
+    'STRING',
+    'PRICE',
+    'PRICE',
+    'QTY',
+    'QTY',
+    'STRING',
+    'BOOLEAN',
+    'PRICE',
+    'QTY',
+    None,
+    'STRING',
+    'STRING',
+    'FLOAT',
+    'FLOAT',
+    'INT',
+    'STRING',
+    'INT',
+    'INT',
+    'PRICE',
+    'INT',
+    'STRING',
+    'INT',
+    'INT',
+    'MONTHYEAR',
+    'INT',
+    'PRICE',
+    'NUMINGROUP',
+    'STRING',
+    'STRING',
+    'QTY',
+    'STRING',
+    'CURRENCY',
+    'CURRENCY',
+    'STRING',
+    'STRING',
+    'PRICE',
+    'INT',
+    'PRICE',
+    'STRING',
+    'NUMINGROUP',
+    'PRICE',
+    None,
+    'INT',
+    'QTY',
+    'STRING',
+    'STRING',
+    'INT',
+    'STRING',
+    'INT',
+    'STRING',
+    'INT',
+    'CHAR',
+    'LOCALMKTDATE',
+    'PRICE',
+    'INT',
+    'STRING',
+    'BOOLEAN',
+    'LOCALMKTDATE',
+    'NUMINGROUP',
+    'STRING',
+    'QTY',
+    'QTY',
+    'INT',
+    'STRING',
+    'AMT',
+    'INT',
+    'STRING',
+    'NUMINGROUP',
+    'INT',
+    'STRING',
+    'STRING',
+    'LOCALMKTDATE',
+    'STRING',
+    'STRING',
+    'INT',
+    'BOOLEAN',
+    'BOOLEAN',
+    'STRING',
+    'INT',
+    'INT',
+    'INT',
+    'INT',
+    'STRING',
+    'INT',
+    'INT',
+    'INT',
+    'PRICE',
+    'INT',
+    'PRICE',
+    'INT',
+    'PRICE',
+    'NUMINGROUP',
+    'CURRENCY',
+    'AMT',
+    'AMT',
+    'LOCALMKTDATE',
+    'STRING',
+    'AMT',
+    'AMT',
+    'LOCALMKTDATE',
+    'CHAR',
+    'QTY',
+    'AMT',
+    'CHAR',
+    'INT',
+    'INT',
+    'INT',
+    'INT',
+    'INT',
+    'NUMINGROUP',
+    'BOOLEAN',
+    'STRING',
+    'NUMINGROUP',
+    'STRING',
+    'CHAR',
+    'INT',
+    'STRING',
+    'STRING',
+    'STRING',
+    'STRING',
+    'STRING',
+    'PERCENTAGE',
+    'AMT',
+    'CURRENCY',
+    'NUMINGROUP',
+    'UTCTIMESTAMP',
+    'INT',
+    'STRING',
+    'STRING',
+    'INT',
+    'INT',
+    'INT',
+    'INT',
+    'STRING',
+    'NUMINGROUP',
+    'UTCTIMESTAMP',
+    'INT',
+    'NUMINGROUP',
+    'STRING',
+    'CHAR',
+    'INT',
+    'STRING',
+    'INT',
+    'CHAR',
+    'INT',
+    'SEQNUM',
+    'STRING',
+    'STRING',
+    'INT',
+    'STRING',
+    'INT',
+    'STRING',
+    'INT',
+    'BOOLEAN',
+    'INT',
+    'PRICE',
+    'QTY',
+    'NUMINGROUP',
+    'NUMINGROUP',
+    'INT',
+    'NUMINGROUP',
+    'INT',
+    'NUMINGROUP',
+    'INT',
+    'INT',
+    None,
+    'PRICE',
+    'FLOAT',
+    'INT',
+    'INT',
+    'INT',
+    'INT',
+    'NUMINGROUP',
+    'STRING',
+    'STRING',
+    'INT',
+    'STRING',
+    'STRING',
+    'STRING',
+    'STRING',
+    'STRING',
+    'STRING',
+    'INT',
+    'INT',
+    'INT',
+    'INT',
+    'STRING',
+    None,
+    'INT',
+    'STRING',
+    'PRICEOFFSET',
+    'INT',
+    'INT',
+    'INT',
+    'INT',
+    'PRICE',
+    'INT',
+    'INT',
+    'INT',
+    'INT',
+    'INT',
+    'PRICE',
+    'INT',
+    'INT',
+    'STRING',
+    'PERCENTAGE',
+    'FLOAT',
+    'INT',
+    'BOOLEAN',
+    'INT',
+    'INT',
+    'INT',
+    'INT',
+    'INT',
+    'AMT',
+    'STRING',
+    'PRICE',
+    'PRICE',
+    'NUMINGROUP',
+    'QTY',
+    'NUMINGROUP',
+    'INT',
+    'LOCALMKTDATE',
+    'PRICE',
+    'STRING',
+    'PERCENTAGE',
+    'NUMINGROUP',
+    'INT',
+    'STRING',
+    'LOCALMKTDATE',
+    'LOCALMKTDATE',
+    'INT',
+    'STRING',
+    'STRING',
+    'STRING',
+    'QTY',
+    'STRING',
+    'STRING',
+    'PRICE',
+    'PRICE',
+    'AMT',
+    'AMT',
+    'AMT',
+    'NUMINGROUP',
+    'STRING',
+    'STRING',
+    'AMT',
+    'INT',
+    'INT',
+    'BOOLEAN',
+    'STRING',
+    'INT',
+    'INT',
+    'NUMINGROUP',
+    'PERCENTAGE',
+    'AMT',
+    'AMT',
+    'AMT',
+    'STRING',
+    'INT',
+    'STRING',
+    'INT',
+    'INT',
+    'STRING',
+    'STRING',
+    'STRING',
+    'INT',
+    'INT',
+    'BOOLEAN',
+    'STRING',
+    'STRING',
+    'LOCALMKTDATE',
+    'LOCALMKTDATE',
+    'LOCALMKTDATE',
+    'CURRENCY',
+    'INT',
+    'AMT',
+    'AMT',
+    'AMT',
+    'STRING',
+    'INT',
+    'STRING',
+    'INT',
+    'STRING',
+    'INT',
+    'STRING',
+    'STRING',
+    'STRING',
+    'STRING',
+    'STRING',
+    'STRING',
+    'INT',
+    'NUMINGROUP',
+    'INT',
+    'NUMINGROUP',
+    'INT',
+    'INT',
+    'CURRENCY',
+    'CURRENCY',
+    'STRING',
+    'INT',
+    'INT',
+    'INT',
+    'CURRENCY',
+    'NUMINGROUP',
+    'STRING',
+    'CHAR',
+    'INT',
+    'NUMINGROUP',
+    'STRING',
+    'INT',
+    'MONTHYEAR',
+    'LOCALMKTDATE',
+    )
+
+# MsgType: message name
+MESSAGES = {
+    b'0': b'Heartbeat',
+    b'1': b'Test Request',
+    b'2': b'Resend Request',
+    b'3': b'Reject',
+    b'4': b'Sequence Reset',
+    b'5': b'Logout',
+    b'6': b'IOI',
+    b'7': b'Advertisement',
+    b'8': b'Execution Report',
+    b'9': b'Order Cancel Reject',
+    b'A': b'Logon',
+    b'B': b'News',
+    b'C': b'Email',
+    b'D': b'New Order Single',
+    b'E': b'New Order List',
+    b'F': b'Order Cancel Request',
+    b'G': b'Order Cancel/Replace Request',
+    b'H': b'Order Status Request',
+    b'J': b'Allocation Instruction',
+    b'K': b'List Cancel Request',
+    b'L': b'List Execute',
+    b'M': b'List Status Request',
+    b'N': b'List Status',
+    b'P': b'Allocation Instruction Ack',
+    b'Q': b"Don't Know Trade",
+    b'R': b'Quote Request',
+    b'S': b'Quote',
+    b'T': b'Settlement Instructions',
+    b'V': b'Market Data Request',
+    b'W': b'Market Data - Snapshot/Full Refresh',
+    b'X': b'Market Data - Incremental Refresh',
+    b'Y': b'Market Data Request Reject',
+    b'Z': b'Quote Cancel',
+    b'a': b'Quote Status Request',
+    b'b': b'Mass Quote Acknowledgement',
+    b'c': b'Security Definition Request',
+    b'd': b'Security Definition',
+    b'e': b'Security Status Request',
+    b'f': b'Security Status',
+    b'g': b'Trading Session Status Request',
+    b'h': b'Trading Session Status',
+    b'i': b'Mass Quote',
+    b'j': b'Business Message Reject',
+    b'k': b'Bid Request',
+    b'l': b'Bid Response',
+    b'm': b'List Strike Price',
+    b'n': b'XML Message',
+    b'o': b'Registration Instructions',
+    b'p': b'Registration Instructions Response',
+    b'q': b'Order Mass Cancel Request',
+    b'r': b'Order Mass Cancel Report',
+    b's': b'New Order Cross',
+    b't': b'Cross Order Cancel/Replace Request',
+    b'u': b'Cross Order Cancel Request',
+    b'v': b'Security Type Request',
+    b'w': b'Security Types',
+    b'x': b'Security List Request',
+    b'y': b'Security List',
+    b'z': b'Derivative Security List Request',
+    b'AA': b'Derivative Security List',
+    b'AB': b'New Order Multileg',
+    b'AC': b'Multileg Order Cancel/Replace',
+    b'AD': b'Trade Capture Report Request',
+    b'AE': b'Trade Capture Report',
+    b'AF': b'Order Mass Status Request',
+    b'AG': b'Quote Request Reject',
+    b'AH': b'RFQ Request',
+    b'AI': b'Quote Status Report',
+    b'AJ': b'Quote Response',
+    b'AK': b'Confirmation',
+    b'AL': b'Position Maintenance Request',
+    b'AM': b'Position Maintenance Report',
+    b'AN': b'Request For Positions',
+    b'AO': b'Request for Positions Ack',
+    b'AP': b'Position Report',
+    b'AQ': b'Trade Capture Report Request Ack',
+    b'AR': b'Trade Capture Report Ack',
+    b'AS': b'Allocation Report',
+    b'AT': b'Allocation Report Ack',
+    b'AU': b'Confirmation Ack',
+    b'AV': b'Settlement Instruction Request',
+    b'AW': b'Assignment Report',
+    b'AX': b'Collateral Request',
+    b'AY': b'Collateral Assignment',
+    b'AZ': b'Collateral Response',
+    b'BA': b'Collateral Report',
+    b'BB': b'Collateral Inquiry',
+    b'BC': b'Network Counterparty System Status Request',
+    b'BD': b'Network Counterparty System Status Response',
+    b'BE': b'User Request',
+    b'BF': b'User Response',
+    b'BG': b'Collateral Inquiry Ack',
+    b'BH': b'Confirmation Request',
+    }
+
+# MsgType: the tags of its fields, including groups
+FIELDS = {
+    b'0': frozenset([
+        112,
+        ]),
+    b'1': frozenset([
+        112,
+        ]),
+    b'2': frozenset([
+        7, 16,
+        ]),
+    b'3': frozenset([
+        45, 58, 354, 355, 371, 372, 373,
+        ]),
+    b'4': frozenset([
+        36, 123,
+        ]),
+    b'5': frozenset([
+        58, 354, 355,
+        ]),
+    b'6': frozenset([
+        15, 22, 23, 25, 26, 27, 28, 38, 44, 48, 54, 55, 58, 60, 62, 65, 104,
+        106, 107, 130, 149, 152, 167, 199, 200, 201, 202, 206, 207, 215, 216,
+        217, 218, 220, 221, 222, 223, 224, 225, 226, 227, 228, 231, 232, 233,
+        234, 235, 236, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249,
+        250, 251, 252, 253, 254, 255, 256, 257, 305, 306, 307, 308, 309, 310,
+        311, 312, 313, 315, 316, 317, 318, 348, 349, 350, 351, 354, 355, 362,
+        363, 364, 365, 423, 435, 436, 454, 455, 456, 457, 458, 459, 460, 461,
+        462, 463, 468, 469, 470, 471, 472, 516, 541, 542, 543, 555, 556, 592,
+        593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604, 605, 606,
+        607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 619, 620,
+        621, 622, 623, 624, 662, 663, 667, 682, 683, 688, 689, 691, 696, 697,
+        698, 699, 701, 711, 739, 740, 761, 762, 763, 764, 788, 810, 854, 864,
+        865, 866, 867, 868, 873, 874, 875, 876, 877, 878, 879, 882, 883, 884,
+        885, 886, 887, 888, 889, 898, 913, 914, 915, 916, 917, 918, 919, 941,
+        942, 947, 955, 956,
+        ]),
+    b'7': frozenset([
+        2, 3, 4, 5, 15, 22, 30, 44, 48, 53, 55, 58, 60, 65, 75, 106, 107, 149,
+        167, 200, 201, 202, 206, 207, 223, 224, 225, 226, 227, 228, 231, 239,
+        240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253,
+        254, 255, 256, 257, 305, 306, 307, 308, 309, 310, 311, 312, 313, 315,
+        316, 317, 318, 336, 348, 349, 350, 351, 354, 355, 362, 363, 364, 365,
+        435, 436, 454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 470, 471,
+        472, 541, 542, 543, 555, 556, 592, 593, 594, 595, 596, 597, 598, 599,
+        600, 601, 602, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613,
+        614, 615, 616, 617, 618, 619, 620, 621, 622, 623, 624, 625, 667, 691,
+        711, 739, 740, 762, 763, 764, 810, 854, 864, 865, 866, 867, 868, 873,
+        874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887, 888, 889,
+        941, 942, 947, 955, 956,
+        ]),
+    b'8': frozenset([
+        1, 6, 11, 12, 13, 14, 15, 17, 18, 19, 21, 22, 29, 30, 31, 32, 37, 38,
+        39, 40, 41, 44, 48, 54, 55, 58, 59, 60, 63, 64, 65, 66, 75, 77, 99,
+        103, 106, 107, 110, 111, 113, 118, 119, 120, 126, 136, 137, 138, 139,
+        150, 151, 152, 155, 156, 157, 158, 159, 167, 168, 192, 193, 194, 195,
+        198, 200, 201, 202, 206, 207, 210, 211, 218, 220, 221, 222, 223, 224,
+        225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238,
+        239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252,
+        253, 254, 255, 256, 257, 258, 259, 260, 305, 306, 307, 308, 309, 310,
+        311, 312, 313, 315, 316, 317, 318, 336, 337, 348, 349, 350, 351, 354,
+        355, 362, 363, 364, 365, 375, 376, 377, 378, 381, 382, 388, 389, 423,
+        424, 425, 426, 427, 432, 435, 436, 437, 438, 442, 447, 448, 452, 453,
+        454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 468, 469, 470, 471,
+        472, 479, 480, 481, 483, 484, 485, 494, 497, 513, 515, 516, 518, 519,
+        520, 521, 523, 524, 525, 526, 527, 528, 529, 538, 539, 541, 542, 543,
+        544, 545, 548, 549, 551, 555, 556, 564, 565, 566, 581, 582, 583, 584,
+        587, 588, 589, 590, 591, 592, 593, 594, 595, 596, 597, 598, 599, 600,
+        601, 602, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614,
+        615, 616, 617, 618, 619, 620, 621, 622, 623, 624, 625, 635, 636, 637,
+        638, 639, 641, 651, 652, 654, 655, 660, 662, 663, 667, 669, 683, 687,
+        688, 689, 690, 691, 693, 696, 697, 698, 699, 701, 711, 738, 739, 740,
+        761, 762, 763, 764, 775, 788, 790, 797, 802, 803, 804, 805, 810, 835,
+        836, 837, 838, 839, 840, 841, 842, 843, 844, 845, 846, 847, 848, 849,
+        850, 851, 854, 864, 865, 866, 867, 868, 873, 874, 875, 876, 877, 878,
+        879, 882, 883, 884, 885, 886, 887, 888, 889, 891, 898, 911, 912, 913,
+        914, 915, 916, 917, 918, 919, 920, 921, 922, 941, 942, 943, 947, 955,
+        956,
+        ]),
+    b'9': frozenset([
+        1, 11, 37, 39, 41, 58, 60, 66, 75, 102, 198, 229, 354, 355, 434, 526,
+        581, 583, 586, 636, 660,
+        ]),
+    b'A': frozenset([
+        95, 96, 98, 108, 141, 372, 383, 384, 385, 464, 553, 554, 789,
+        ]),
+    b'B': frozenset([
+        22, 33, 42, 48, 55, 58, 61, 65, 95, 96, 106, 107, 146, 148, 149, 167,
+        200, 201, 202, 206, 207, 215, 216, 217, 223, 224, 225, 226, 227, 228,
+        231, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251,
+        252, 253, 254, 255, 256, 257, 305, 306, 307, 308, 309, 310, 311, 312,
+        313, 315, 316, 317, 318, 348, 349, 350, 351, 354, 355, 358, 359, 362,
+        363, 364, 365, 435, 436, 454, 455, 456, 457, 458, 459, 460, 461, 462,
+        463, 470, 471, 472, 541, 542, 543, 555, 556, 592, 593, 594, 595, 596,
+        597, 598, 599, 600, 601, 602, 603, 604, 605, 606, 607, 608, 609, 610,
+        611, 612, 613, 614, 615, 616, 617, 618, 619, 620, 621, 622, 623, 624,
+        667, 691, 711, 739, 740, 762, 763, 764, 810, 864, 865, 866, 867, 868,
+        873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887, 888,
+        889, 941, 942, 947, 955, 956,
+        ]),
+    b'C': frozenset([
+        11, 22, 33, 37, 42, 48, 55, 58, 65, 94, 95, 96, 106, 107, 146, 147,
+        164, 167, 200, 201, 202, 206, 207, 215, 216, 217, 223, 224, 225, 226,
+        227, 228, 231, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249,
+        250, 251, 252, 253, 254, 255, 256, 257, 305, 306, 307, 308, 309, 310,
+        311, 312, 313, 315, 316, 317, 318, 348, 349, 350, 351, 354, 355, 356,
+        357, 362, 363, 364, 365, 435, 436, 454, 455, 456, 457, 458, 459, 460,
+        461, 462, 463, 470, 471, 472, 541, 542, 543, 555, 556, 592, 593, 594,
+        595, 596, 597, 598, 599, 600, 601, 602, 603, 604, 605, 606, 607, 608,
+        609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 619, 620, 621, 622,
+        623, 624, 667, 691, 711, 739, 740, 762, 763, 764, 810, 864, 865, 866,
+        867, 868, 873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886,
+        887, 888, 889, 941, 942, 947, 955, 956,
+        ]),
+    b'D': frozenset([
+        1, 11, 12, 13, 15, 18, 21, 22, 23, 38, 40, 44, 48, 54, 55, 58, 59, 60,
+        63, 64, 65, 70, 75, 77, 78, 79, 80, 81, 99, 100, 106, 107, 110, 111,
+        114, 117, 120, 121, 126, 140, 152, 167, 168, 192, 193, 200, 201, 202,
+        203, 206, 207, 210, 211, 218, 220, 221, 222, 223, 224, 225, 226, 227,
+        228, 229, 231, 232, 233, 234, 235, 236, 239, 240, 241, 242, 243, 244,
+        245, 246, 247, 255, 256, 305, 306, 307, 308, 309, 310, 311, 312, 313,
+        315, 316, 317, 318, 336, 348, 349, 350, 351, 354, 355, 362, 363, 364,
+        365, 376, 377, 386, 388, 389, 423, 427, 432, 435, 436, 447, 448, 452,
+        453, 454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 467, 468, 469,
+        470, 471, 472, 479, 480, 481, 494, 497, 513, 516, 523, 524, 525, 526,
+        528, 529, 538, 539, 541, 542, 543, 544, 545, 581, 582, 583, 589, 590,
+        591, 592, 593, 594, 595, 625, 635, 640, 660, 661, 662, 663, 667, 691,
+        696, 697, 698, 699, 701, 711, 736, 761, 762, 763, 775, 788, 802, 803,
+        804, 805, 810, 835, 836, 837, 838, 840, 841, 842, 843, 844, 846, 847,
+        848, 849, 854, 864, 865, 866, 867, 868, 873, 874, 875, 876, 877, 878,
+        879, 882, 883, 884, 885, 886, 887, 888, 889, 898, 913, 914, 915, 916,
+        917, 918, 919, 941, 947,
+        ]),
+    b'E': frozenset([
+        1, 11, 12, 13, 15, 18, 21, 22, 23, 38, 40, 44, 48, 54, 55, 58, 59, 60,
+        63, 64, 65, 66, 67, 68, 69, 70, 73, 75, 77, 78, 79, 80, 81, 99, 100,
+        106, 107, 110, 111, 114, 117, 120, 121, 126, 140, 152, 160, 167, 168,
+        192, 193, 200, 201, 202, 203, 206, 207, 210, 211, 218, 220, 221, 222,
+        223, 224, 225, 226, 227, 228, 229, 231, 232, 233, 234, 235, 236, 239,
+        240, 241, 242, 243, 244, 245, 246, 247, 255, 256, 305, 306, 307, 308,
+        309, 310, 311, 312, 313, 315, 316, 317, 318, 336, 348, 349, 350, 351,
+        352, 353, 354, 355, 362, 363, 364, 365, 376, 377, 386, 388, 389, 390,
+        391, 394, 401, 414, 415, 423, 427, 432, 433, 435, 436, 447, 448, 452,
+        453, 454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 467, 468, 469,
+        470, 471, 472, 479, 480, 481, 494, 497, 513, 516, 523, 524, 525, 526,
+        528, 529, 538, 539, 541, 542, 543, 544, 545, 581, 582, 583, 589, 590,
+        591, 592, 593, 594, 595, 625, 635, 640, 660, 661, 662, 663, 667, 691,
+        696, 697, 698, 699, 701, 711, 736, 761, 762, 763, 765, 766, 767, 775,
+        802, 803, 804, 805, 810, 835, 836, 837, 838, 840, 841, 842, 843, 844,
+        846, 847, 848, 849, 854, 864, 865, 866, 867, 868, 873, 874, 875, 876,
+        877, 878, 879, 882, 883, 884, 885, 886, 887, 888, 889, 893, 941, 947,
+        ]),
+    b'F': frozenset([
+        1, 11, 22, 37, 38, 41, 48, 54, 55, 58, 60, 65, 66, 106, 107, 152, 167,
+        200, 201, 202, 206, 207, 223, 224, 225, 226, 227, 228, 231, 239, 240,
+        241, 242, 243, 244, 245, 246, 247, 255, 256, 305, 306, 307, 308, 309,
+        310, 311, 312, 313, 315, 316, 317, 318, 348, 349, 350, 351, 354, 355,
+        362, 363, 364, 365, 376, 435, 436, 447, 448, 452, 453, 454, 455, 456,
+        457, 458, 459, 460, 461, 462, 463, 468, 469, 470, 471, 472, 516, 523,
+        526, 541, 542, 543, 581, 583, 586, 592, 593, 594, 595, 660, 667, 691,
+        711, 762, 763, 788, 802, 803, 810, 864, 865, 866, 867, 868, 873, 874,
+        875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887, 888, 889, 898,
+        913, 914, 915, 916, 917, 918, 919, 941, 947,
+        ]),
+    b'G': frozenset([
+        1, 11, 12, 13, 15, 18, 21, 22, 37, 38, 40, 41, 44, 48, 54, 55, 58, 59,
+        60, 63, 64, 65, 66, 70, 75, 77, 78, 79, 80, 99, 100, 106, 107, 110,
+        111, 114, 120, 121, 126, 152, 167, 168, 192, 193, 200, 201, 202, 203,
+        206, 207, 210, 211, 218, 220, 221, 222, 223, 224, 225, 226, 227, 228,
+        229, 231, 235, 236, 239, 240, 241, 242, 243, 244, 245, 246, 247, 255,
+        256, 305, 306, 307, 308, 309, 310, 311, 312, 313, 315, 316, 317, 318,
+        336, 348, 349, 350, 351, 354, 355, 362, 363, 364, 365, 376, 377, 386,
+        388, 389, 423, 427, 432, 435, 436, 447, 448, 452, 453, 454, 455, 456,
+        457, 458, 459, 460, 461, 462, 463, 467, 468, 469, 470, 471, 472, 479,
+        480, 481, 494, 497, 513, 516, 523, 524, 525, 526, 528, 529, 538, 539,
+        541, 542, 543, 544, 545, 581, 582, 583, 586, 589, 590, 591, 592, 593,
+        594, 595, 625, 635, 640, 660, 661, 662, 663, 667, 691, 696, 697, 698,
+        699, 701, 711, 736, 761, 762, 763, 775, 788, 802, 803, 804, 805, 810,
+        835, 836, 837, 838, 840, 841, 842, 843, 844, 846, 847, 848, 849, 854,
+        864, 865, 866, 867, 868, 873, 874, 875, 876, 877, 878, 879, 882, 883,
+        884, 885, 886, 887, 888, 889, 898, 913, 914, 915, 916, 917, 918, 919,
+        941, 947,
+        ]),
+    b'H': frozenset([
+        1, 11, 22, 37, 48, 54, 55, 65, 106, 107, 167, 200, 201, 202, 206, 207,
+        223, 224, 225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245,
+        246, 247, 255, 256, 305, 306, 307, 308, 309, 310, 311, 312, 313, 315,
+        316, 317, 318, 348, 349, 350, 351, 362, 363, 364, 365, 435, 436, 447,
+        448, 452, 453, 454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 470,
+        471, 472, 523, 526, 541, 542, 543, 583, 592, 593, 594, 595, 660, 667,
+        691, 711, 762, 763, 788, 790, 802, 803, 810, 864, 865, 866, 867, 868,
+        873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887, 888,
+        889, 898, 913, 914, 915, 916, 917, 918, 919, 941, 947,
+        ]),
+    b'J': frozenset([
+        6, 11, 12, 13, 15, 17, 22, 29, 30, 31, 32, 37, 38, 48, 53, 54, 55, 58,
+        60, 63, 64, 65, 66, 70, 71, 72, 73, 74, 75, 77, 78, 79, 80, 81, 85,
+        106, 107, 118, 119, 120, 124, 136, 137, 138, 139, 153, 154, 155, 156,
+        157, 158, 159, 161, 165, 167, 169, 170, 171, 172, 196, 197, 198, 200,
+        201, 202, 206, 207, 208, 209, 218, 220, 221, 222, 223, 224, 225, 226,
+        227, 228, 229, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241,
+        242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255,
+        256, 257, 305, 306, 307, 308, 309, 310, 311, 312, 313, 315, 316, 317,
+        318, 336, 348, 349, 350, 351, 354, 355, 360, 361, 362, 363, 364, 365,
+        366, 381, 423, 435, 436, 447, 448, 452, 453, 454, 455, 456, 457, 458,
+        459, 460, 461, 462, 463, 466, 467, 470, 471, 472, 479, 497, 523, 524,
+        525, 526, 527, 538, 539, 540, 541, 542, 543, 545, 555, 556, 570, 573,
+        574, 576, 577, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601, 602,
+        603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616,
+        617, 618, 619, 620, 621, 622, 623, 624, 625, 626, 650, 661, 662, 663,
+        667, 668, 669, 691, 696, 697, 698, 699, 700, 701, 711, 736, 737, 738,
+        739, 740, 741, 742, 754, 756, 757, 758, 759, 760, 761, 762, 763, 764,
+        775, 780, 781, 782, 783, 784, 785, 786, 787, 788, 793, 796, 799, 800,
+        801, 802, 803, 804, 805, 806, 807, 808, 810, 854, 857, 860, 864, 865,
+        866, 867, 868, 869, 870, 871, 872, 873, 874, 875, 876, 877, 878, 879,
+        882, 883, 884, 885, 886, 887, 888, 889, 891, 892, 893, 898, 913, 914,
+        915, 916, 917, 918, 919, 920, 921, 922, 941, 942, 947, 955, 956,
+        ]),
+    b'K': frozenset([
+        58, 60, 66, 75, 229, 354, 355,
+        ]),
+    b'L': frozenset([
+        58, 60, 66, 354, 355, 390, 391,
+        ]),
+    b'M': frozenset([
+        58, 66, 354, 355,
+        ]),
+    b'N': frozenset([
+        6, 11, 14, 39, 58, 60, 66, 68, 73, 82, 83, 84, 103, 151, 354, 355, 429,
+        431, 444, 445, 446, 526, 636, 893,
+        ]),
+    b'P': frozenset([
+        58, 60, 70, 75, 78, 79, 87, 88, 161, 167, 354, 355, 360, 361, 366, 447,
+        448, 452, 453, 460, 467, 523, 573, 626, 661, 776, 793, 802, 803, 808,
+        ]),
+    b'Q': frozenset([
+        17, 22, 31, 32, 37, 38, 48, 54, 55, 58, 65, 106, 107, 127, 152, 167,
+        198, 200, 201, 202, 206, 207, 223, 224, 225, 226, 227, 228, 231, 239,
+        240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253,
+        254, 255, 256, 257, 305, 306, 307, 308, 309, 310, 311, 312, 313, 315,
+        316, 317, 318, 348, 349, 350, 351, 354, 355, 362, 363, 364, 365, 435,
+        436, 454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 468, 469, 470,
+        471, 472, 516, 541, 542, 543, 555, 556, 592, 593, 594, 595, 596, 597,
+        598, 599, 600, 601, 602, 603, 604, 605, 606, 607, 608, 609, 610, 611,
+        612, 613, 614, 615, 616, 617, 618, 619, 620, 621, 622, 623, 624, 667,
+        691, 711, 739, 740, 762, 763, 764, 810, 864, 865, 866, 867, 868, 873,
+        874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887, 888, 889,
+        941, 942, 947, 955, 956,
+        ]),
+    b'R': frozenset([
+        1, 11, 15, 22, 38, 40, 44, 48, 54, 55, 58, 60, 62, 63, 64, 65, 106,
+        107, 126, 131, 140, 146, 152, 167, 192, 193, 200, 201, 202, 206, 207,
+        218, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 231, 232, 233,
+        234, 235, 236, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249,
+        250, 251, 252, 253, 254, 255, 256, 257, 303, 305, 306, 307, 308, 309,
+        310, 311, 312, 313, 315, 316, 317, 318, 336, 348, 349, 350, 351, 354,
+        355, 362, 363, 364, 365, 423, 435, 436, 447, 448, 452, 453, 454, 455,
+        456, 457, 458, 459, 460, 461, 462, 463, 468, 469, 470, 471, 472, 516,
+        523, 524, 525, 528, 537, 538, 539, 541, 542, 543, 545, 555, 556, 581,
+        587, 588, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603,
+        604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617,
+        618, 619, 620, 621, 622, 623, 624, 625, 640, 644, 660, 662, 663, 667,
+        676, 677, 678, 679, 680, 683, 687, 688, 689, 690, 691, 692, 695, 696,
+        697, 698, 699, 701, 711, 735, 739, 740, 761, 762, 763, 764, 788, 802,
+        803, 804, 805, 810, 854, 864, 865, 866, 867, 868, 873, 874, 875, 876,
+        877, 878, 879, 882, 883, 884, 885, 886, 887, 888, 889, 898, 913, 914,
+        915, 916, 917, 918, 919, 941, 942, 947, 955, 956,
+        ]),
+    b'S': frozenset([
+        1, 12, 13, 15, 22, 38, 40, 48, 54, 55, 58, 60, 62, 63, 64, 65, 100,
+        106, 107, 117, 131, 132, 133, 134, 135, 152, 156, 167, 188, 189, 190,
+        191, 192, 193, 200, 201, 202, 206, 207, 218, 220, 221, 222, 223, 224,
+        225, 226, 227, 228, 231, 232, 233, 234, 235, 236, 239, 240, 241, 242,
+        243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256,
+        257, 301, 305, 306, 307, 308, 309, 310, 311, 312, 313, 315, 316, 317,
+        318, 336, 348, 349, 350, 351, 354, 355, 362, 363, 364, 365, 423, 435,
+        436, 447, 448, 452, 453, 454, 455, 456, 457, 458, 459, 460, 461, 462,
+        463, 468, 469, 470, 471, 472, 516, 523, 524, 525, 528, 537, 538, 539,
+        541, 542, 543, 545, 555, 556, 581, 582, 587, 588, 592, 593, 594, 595,
+        596, 597, 598, 599, 600, 601, 602, 603, 604, 605, 606, 607, 608, 609,
+        610, 611, 612, 613, 614, 615, 616, 617, 618, 619, 620, 621, 622, 623,
+        624, 625, 631, 632, 633, 634, 642, 643, 645, 646, 647, 648, 656, 657,
+        660, 662, 663, 667, 676, 677, 678, 679, 680, 681, 683, 684, 686, 687,
+        688, 689, 690, 691, 693, 695, 696, 697, 698, 699, 701, 711, 735, 739,
+        740, 761, 762, 763, 764, 788, 802, 803, 804, 805, 810, 864, 865, 866,
+        867, 868, 873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886,
+        887, 888, 889, 898, 913, 914, 915, 916, 917, 918, 919, 941, 942, 947,
+        955, 956,
+        ]),
+    b'T': frozenset([
+        11, 54, 58, 60, 85, 126, 160, 162, 163, 165, 167, 168, 169, 170, 171,
+        172, 214, 354, 355, 447, 448, 452, 453, 460, 461, 476, 488, 489, 490,
+        491, 492, 503, 504, 505, 523, 777, 778, 779, 781, 782, 783, 784, 785,
+        786, 787, 791, 792, 801, 802, 803,
+        ]),
+    b'V': frozenset([
+        22, 48, 55, 65, 106, 107, 146, 167, 200, 201, 202, 206, 207, 223, 224,
+        225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245, 246, 247,
+        248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 262, 263, 264, 265,
+        266, 267, 269, 286, 305, 306, 307, 308, 309, 310, 311, 312, 313, 315,
+        316, 317, 318, 336, 348, 349, 350, 351, 362, 363, 364, 365, 386, 435,
+        436, 454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 470, 471, 472,
+        541, 542, 543, 546, 547, 555, 556, 592, 593, 594, 595, 596, 597, 598,
+        599, 600, 601, 602, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612,
+        613, 614, 615, 616, 617, 618, 619, 620, 621, 622, 623, 624, 625, 667,
+        691, 711, 739, 740, 762, 763, 764, 810, 812, 815, 864, 865, 866, 867,
+        868, 873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887,
+        888, 889, 941, 942, 947, 955, 956,
+        ]),
+    b'W': frozenset([
+        15, 18, 22, 37, 48, 55, 58, 59, 65, 106, 107, 110, 126, 167, 200, 201,
+        202, 206, 207, 223, 224, 225, 226, 227, 228, 231, 239, 240, 241, 242,
+        243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256,
+        257, 262, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 282, 283,
+        284, 286, 287, 288, 289, 290, 291, 292, 299, 305, 306, 307, 308, 309,
+        310, 311, 312, 313, 315, 316, 317, 318, 336, 346, 348, 349, 350, 351,
+        354, 355, 362, 363, 364, 365, 432, 435, 436, 451, 454, 455, 456, 457,
+        458, 459, 460, 461, 462, 463, 470, 471, 472, 541, 542, 543, 546, 555,
+        556, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604,
+        605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618,
+        619, 620, 621, 622, 623, 624, 625, 667, 691, 711, 739, 740, 762, 763,
+        764, 810, 811, 813, 814, 864, 865, 866, 867, 868, 873, 874, 875, 876,
+        877, 878, 879, 882, 883, 884, 885, 886, 887, 888, 889, 941, 942, 947,
+        955, 956,
+        ]),
+    b'X': frozenset([
+        15, 18, 22, 37, 48, 55, 58, 59, 65, 106, 107, 110, 126, 167, 200, 201,
+        202, 206, 207, 223, 224, 225, 226, 227, 228, 231, 239, 240, 241, 242,
+        243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256,
+        257, 262, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279,
+        280, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 299, 305,
+        306, 307, 308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 336, 346,
+        348, 349, 350, 351, 354, 355, 362, 363, 364, 365, 432, 435, 436, 451,
+        454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 470, 471, 472, 541,
+        542, 543, 546, 555, 556, 592, 593, 594, 595, 596, 597, 598, 599, 600,
+        601, 602, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614,
+        615, 616, 617, 618, 619, 620, 621, 622, 623, 624, 625, 667, 691, 711,
+        739, 740, 762, 763, 764, 810, 811, 813, 814, 864, 865, 866, 867, 868,
+        873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887, 888,
+        889, 941, 942, 947, 955, 956,
+        ]),
+    b'Y': frozenset([
+        58, 262, 281, 354, 355, 816, 817,
+        ]),
+    b'Z': frozenset([
+        1, 22, 48, 55, 65, 106, 107, 117, 131, 167, 200, 201, 202, 206, 207,
+        223, 224, 225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245,
+        246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 295, 298,
+        301, 305, 306, 307, 308, 309, 310, 311, 312, 313, 315, 316, 317, 318,
+        336, 348, 349, 350, 351, 362, 363, 364, 365, 435, 436, 447, 448, 452,
+        453, 454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 470, 471, 472,
+        523, 541, 542, 543, 555, 556, 581, 592, 593, 594, 595, 596, 597, 598,
+        599, 600, 601, 602, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612,
+        613, 614, 615, 616, 617, 618, 619, 620, 621, 622, 623, 624, 625, 660,
+        667, 691, 711, 739, 740, 762, 763, 764, 788, 802, 803, 810, 864, 865,
+        866, 867, 868, 873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885,
+        886, 887, 888, 889, 898, 913, 914, 915, 916, 917, 918, 919, 941, 942,
+        947, 955, 956,
+        ]),
+    b'a': frozenset([
+        1, 22, 48, 55, 65, 106, 107, 117, 167, 200, 201, 202, 206, 207, 223,
+        224, 225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245, 246,
+        247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 263, 305, 306,
+        307, 308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 336, 348, 349,
+        350, 351, 362, 363, 364, 365, 435, 436, 447, 448, 452, 453, 454, 455,
+        456, 457, 458, 459, 460, 461, 462, 463, 470, 471, 472, 523, 541, 542,
+        543, 555, 556, 581, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601,
+        602, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615,
+        616, 617, 618, 619, 620, 621, 622, 623, 624, 625, 649, 660, 667, 691,
+        711, 739, 740, 762, 763, 764, 788, 802, 803, 810, 864, 865, 866, 867,
+        868, 873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887,
+        888, 889, 898, 913, 914, 915, 916, 917, 918, 919, 941, 942, 947, 955,
+        956,
+        ]),
+    b'b': frozenset([
+        1, 15, 22, 40, 48, 55, 58, 60, 62, 64, 65, 106, 107, 117, 131, 132,
+        133, 134, 135, 167, 188, 189, 190, 191, 192, 193, 200, 201, 202, 206,
+        207, 223, 224, 225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244,
+        245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 295,
+        296, 297, 299, 300, 301, 302, 304, 305, 306, 307, 308, 309, 310, 311,
+        312, 313, 315, 316, 317, 318, 336, 348, 349, 350, 351, 354, 355, 362,
+        363, 364, 365, 368, 435, 436, 447, 448, 452, 453, 454, 455, 456, 457,
+        458, 459, 460, 461, 462, 463, 470, 471, 472, 523, 537, 541, 542, 543,
+        555, 556, 581, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601, 602,
+        603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616,
+        617, 618, 619, 620, 621, 622, 623, 624, 625, 631, 632, 633, 634, 642,
+        643, 660, 667, 691, 739, 740, 762, 763, 764, 802, 803, 810, 864, 865,
+        866, 867, 868, 873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885,
+        886, 887, 888, 889, 893, 941, 942, 947, 955, 956,
+        ]),
+    b'c': frozenset([
+        15, 22, 48, 55, 58, 65, 106, 107, 167, 200, 201, 202, 206, 207, 223,
+        224, 225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245, 246,
+        247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 263, 305, 306,
+        307, 308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 320, 321, 336,
+        348, 349, 350, 351, 354, 355, 362, 363, 364, 365, 435, 436, 454, 455,
+        456, 457, 458, 459, 460, 461, 462, 463, 470, 471, 472, 541, 542, 543,
+        555, 556, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603,
+        604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617,
+        618, 619, 620, 621, 622, 623, 624, 625, 667, 668, 691, 711, 739, 740,
+        762, 763, 764, 810, 827, 864, 865, 866, 867, 868, 869, 870, 871, 872,
+        873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887, 888,
+        889, 941, 942, 947, 955, 956,
+        ]),
+    b'd': frozenset([
+        15, 22, 48, 55, 58, 65, 106, 107, 167, 200, 201, 202, 206, 207, 223,
+        224, 225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245, 246,
+        247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 305, 306, 307,
+        308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 320, 322, 323, 336,
+        348, 349, 350, 351, 354, 355, 362, 363, 364, 365, 435, 436, 454, 455,
+        456, 457, 458, 459, 460, 461, 462, 463, 470, 471, 472, 541, 542, 543,
+        555, 556, 561, 562, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601,
+        602, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615,
+        616, 617, 618, 619, 620, 621, 622, 623, 624, 625, 667, 668, 691, 711,
+        739, 740, 762, 763, 764, 810, 827, 864, 865, 866, 867, 868, 869, 870,
+        871, 872, 873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886,
+        887, 888, 889, 941, 942, 947, 955, 956,
+        ]),
+    b'e': frozenset([
+        15, 22, 48, 55, 65, 106, 107, 167, 200, 201, 202, 206, 207, 223, 224,
+        225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245, 246, 247,
+        248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 263, 305, 306, 307,
+        308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 324, 336, 348, 349,
+        350, 351, 362, 363, 364, 365, 435, 436, 454, 455, 456, 457, 458, 459,
+        460, 461, 462, 463, 470, 471, 472, 541, 542, 543, 555, 556, 592, 593,
+        594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604, 605, 606, 607,
+        608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 619, 620, 621,
+        622, 623, 624, 625, 667, 668, 691, 711, 739, 740, 762, 763, 764, 810,
+        864, 865, 866, 867, 868, 869, 870, 871, 872, 873, 874, 875, 876, 877,
+        878, 879, 882, 883, 884, 885, 886, 887, 888, 889, 941, 942, 947, 955,
+        956,
+        ]),
+    b'f': frozenset([
+        15, 22, 31, 48, 55, 58, 60, 65, 106, 107, 167, 200, 201, 202, 206, 207,
+        223, 224, 225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245,
+        246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 291, 292,
+        305, 306, 307, 308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 324,
+        325, 326, 327, 328, 329, 330, 331, 332, 333, 334, 336, 348, 349, 350,
+        351, 354, 355, 362, 363, 364, 365, 435, 436, 454, 455, 456, 457, 458,
+        459, 460, 461, 462, 463, 470, 471, 472, 541, 542, 543, 555, 556, 592,
+        593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604, 605, 606,
+        607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 619, 620,
+        621, 622, 623, 624, 625, 667, 668, 691, 711, 739, 740, 762, 763, 764,
+        810, 864, 865, 866, 867, 868, 869, 870, 871, 872, 873, 874, 875, 876,
+        877, 878, 879, 882, 883, 884, 885, 886, 887, 888, 889, 941, 942, 947,
+        955, 956,
+        ]),
+    b'g': frozenset([
+        263, 335, 336, 338, 339, 625,
+        ]),
+    b'h': frozenset([
+        58, 325, 335, 336, 338, 339, 340, 341, 342, 343, 344, 345, 354, 355,
+        387, 567, 625,
+        ]),
+    b'i': frozenset([
+        1, 15, 22, 40, 48, 55, 60, 62, 64, 65, 106, 107, 117, 131, 132, 133,
+        134, 135, 167, 188, 189, 190, 191, 192, 193, 200, 201, 202, 206, 207,
+        223, 224, 225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245,
+        246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 293, 294,
+        295, 296, 299, 301, 302, 304, 305, 306, 307, 308, 309, 310, 311, 312,
+        313, 315, 316, 317, 318, 336, 348, 349, 350, 351, 362, 363, 364, 365,
+        367, 435, 436, 447, 448, 452, 453, 454, 455, 456, 457, 458, 459, 460,
+        461, 462, 463, 470, 471, 472, 523, 537, 541, 542, 543, 555, 556, 581,
+        592, 593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604, 605,
+        606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 619,
+        620, 621, 622, 623, 624, 625, 631, 632, 633, 634, 642, 643, 660, 667,
+        691, 739, 740, 762, 763, 764, 802, 803, 810, 864, 865, 866, 867, 868,
+        873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887, 888,
+        889, 893, 941, 942, 947, 955, 956,
+        ]),
+    b'j': frozenset([
+        45, 58, 354, 355, 372, 379, 380,
+        ]),
+    b'k': frozenset([
+        1, 15, 54, 58, 63, 64, 66, 75, 121, 336, 354, 355, 374, 390, 391, 392,
+        393, 394, 395, 396, 397, 398, 399, 400, 401, 402, 403, 404, 405, 406,
+        407, 408, 409, 410, 411, 412, 413, 414, 415, 416, 417, 418, 419, 420,
+        430, 441, 443, 625, 660,
+        ]),
+    b'l': frozenset([
+        12, 13, 44, 54, 58, 63, 64, 66, 336, 354, 355, 390, 391, 406, 420, 421,
+        423, 430, 479, 497, 625,
+        ]),
+    b'm': frozenset([
+        11, 15, 22, 44, 48, 54, 55, 58, 65, 66, 106, 107, 140, 167, 200, 201,
+        202, 206, 207, 223, 224, 225, 226, 227, 228, 231, 239, 240, 241, 242,
+        243, 244, 245, 246, 247, 255, 256, 305, 306, 307, 308, 309, 310, 311,
+        312, 313, 315, 316, 317, 318, 348, 349, 350, 351, 354, 355, 362, 363,
+        364, 365, 422, 428, 435, 436, 454, 455, 456, 457, 458, 459, 460, 461,
+        462, 463, 470, 471, 472, 526, 541, 542, 543, 592, 593, 594, 595, 667,
+        691, 711, 762, 763, 810, 864, 865, 866, 867, 868, 873, 874, 875, 876,
+        877, 878, 879, 882, 883, 884, 885, 886, 887, 888, 889, 893, 941, 947,
+        ]),
+    b'n': frozenset([
+        ]),
+    b'o': frozenset([
+        1, 11, 447, 448, 452, 453, 473, 474, 475, 477, 478, 482, 486, 493, 495,
+        498, 499, 500, 501, 502, 508, 509, 510, 511, 512, 513, 514, 517, 522,
+        523, 524, 525, 538, 539, 545, 660, 802, 803, 804, 805,
+        ]),
+    b'p': frozenset([
+        1, 11, 447, 448, 452, 453, 496, 506, 507, 508, 513, 514, 523, 660, 802,
+        803,
+        ]),
+    b'q': frozenset([
+        11, 22, 48, 54, 55, 58, 60, 65, 106, 107, 167, 200, 201, 202, 206, 207,
+        223, 224, 225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245,
+        246, 247, 255, 256, 305, 306, 307, 308, 309, 310, 311, 312, 313, 315,
+        316, 317, 318, 336, 348, 349, 350, 351, 354, 355, 362, 363, 364, 365,
+        435, 436, 454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 470, 471,
+        472, 526, 530, 541, 542, 543, 592, 593, 594, 595, 625, 667, 691, 762,
+        763, 810, 864, 865, 866, 867, 868, 873, 874, 875, 876, 877, 878, 879,
+        882, 883, 884, 885, 886, 887, 888, 889, 941, 947,
+        ]),
+    b'r': frozenset([
+        11, 22, 37, 41, 48, 54, 55, 58, 60, 65, 106, 107, 167, 198, 200, 201,
+        202, 206, 207, 223, 224, 225, 226, 227, 228, 231, 239, 240, 241, 242,
+        243, 244, 245, 246, 247, 255, 256, 305, 306, 307, 308, 309, 310, 311,
+        312, 313, 315, 316, 317, 318, 336, 348, 349, 350, 351, 354, 355, 362,
+        363, 364, 365, 435, 436, 454, 455, 456, 457, 458, 459, 460, 461, 462,
+        463, 470, 471, 472, 526, 530, 531, 532, 533, 534, 535, 536, 541, 542,
+        543, 592, 593, 594, 595, 625, 667, 691, 762, 763, 810, 864, 865, 866,
+        867, 868, 873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886,
+        887, 888, 889, 941, 947,
+        ]),
+    b's': frozenset([
+        1, 11, 12, 13, 15, 18, 21, 22, 23, 38, 40, 44, 48, 54, 55, 58, 59, 60,
+        63, 64, 65, 70, 75, 77, 78, 79, 80, 81, 99, 100, 106, 107, 110, 111,
+        114, 117, 120, 121, 126, 140, 152, 167, 168, 200, 201, 202, 203, 206,
+        207, 210, 211, 218, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229,
+        231, 232, 233, 234, 235, 236, 239, 240, 241, 242, 243, 244, 245, 246,
+        247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 305, 306, 307,
+        308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 336, 348, 349, 350,
+        351, 354, 355, 362, 363, 364, 365, 376, 377, 386, 388, 389, 423, 427,
+        432, 435, 436, 447, 448, 452, 453, 454, 455, 456, 457, 458, 459, 460,
+        461, 462, 463, 467, 468, 469, 470, 471, 472, 479, 480, 481, 494, 497,
+        513, 516, 523, 524, 525, 526, 528, 529, 538, 539, 541, 542, 543, 544,
+        545, 548, 549, 550, 552, 555, 556, 581, 582, 583, 589, 590, 591, 592,
+        593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604, 605, 606,
+        607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 619, 620,
+        621, 622, 623, 624, 625, 635, 659, 660, 661, 662, 663, 667, 691, 696,
+        697, 698, 699, 701, 711, 736, 739, 740, 761, 762, 763, 764, 775, 802,
+        803, 804, 805, 810, 835, 836, 837, 838, 840, 841, 842, 843, 844, 846,
+        847, 848, 849, 854, 864, 865, 866, 867, 868, 873, 874, 875, 876, 877,
+        878, 879, 882, 883, 884, 885, 886, 887, 888, 889, 941, 942, 947, 955,
+        956,
+        ]),
+    b't': frozenset([
+        1, 11, 12, 13, 15, 18, 21, 22, 23, 37, 38, 40, 44, 48, 54, 55, 58, 59,
+        60, 63, 64, 65, 70, 75, 77, 78, 79, 80, 81, 99, 100, 106, 107, 110,
+        111, 114, 117, 120, 121, 126, 140, 152, 167, 168, 200, 201, 202, 203,
+        206, 207, 210, 211, 218, 220, 221, 222, 223, 224, 225, 226, 227, 228,
+        229, 231, 232, 233, 234, 235, 236, 239, 240, 241, 242, 243, 244, 245,
+        246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 305, 306,
+        307, 308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 336, 348, 349,
+        350, 351, 354, 355, 362, 363, 364, 365, 376, 377, 386, 388, 389, 423,
+        427, 432, 435, 436, 447, 448, 452, 453, 454, 455, 456, 457, 458, 459,
+        460, 461, 462, 463, 467, 468, 469, 470, 471, 472, 479, 480, 481, 494,
+        497, 513, 516, 523, 524, 525, 526, 528, 529, 538, 539, 541, 542, 543,
+        544, 545, 548, 549, 550, 551, 552, 555, 556, 581, 582, 583, 589, 590,
+        591, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604,
+        605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618,
+        619, 620, 621, 622, 623, 624, 625, 635, 659, 660, 661, 662, 663, 667,
+        691, 696, 697, 698, 699, 701, 711, 736, 739, 740, 761, 762, 763, 764,
+        775, 802, 803, 804, 805, 810, 835, 836, 837, 838, 840, 841, 842, 843,
+        844, 846, 847, 848, 849, 854, 864, 865, 866, 867, 868, 873, 874, 875,
+        876, 877, 878, 879, 882, 883, 884, 885, 886, 887, 888, 889, 941, 942,
+        947, 955, 956,
+        ]),
+    b'u': frozenset([
+        11, 22, 37, 38, 41, 48, 54, 55, 58, 60, 65, 75, 106, 107, 152, 167,
+        200, 201, 202, 206, 207, 223, 224, 225, 226, 227, 228, 229, 231, 239,
+        240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253,
+        254, 255, 256, 257, 305, 306, 307, 308, 309, 310, 311, 312, 313, 315,
+        316, 317, 318, 348, 349, 350, 351, 354, 355, 362, 363, 364, 365, 376,
+        435, 436, 447, 448, 452, 453, 454, 455, 456, 457, 458, 459, 460, 461,
+        462, 463, 468, 469, 470, 471, 472, 516, 523, 526, 541, 542, 543, 548,
+        549, 550, 551, 552, 555, 556, 583, 586, 592, 593, 594, 595, 596, 597,
+        598, 599, 600, 601, 602, 603, 604, 605, 606, 607, 608, 609, 610, 611,
+        612, 613, 614, 615, 616, 617, 618, 619, 620, 621, 622, 623, 624, 667,
+        691, 711, 739, 740, 762, 763, 764, 802, 803, 810, 864, 865, 866, 867,
+        868, 873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887,
+        888, 889, 941, 942, 947, 955, 956,
+        ]),
+    b'v': frozenset([
+        58, 167, 320, 336, 354, 355, 460, 625, 762,
+        ]),
+    b'w': frozenset([
+        58, 167, 263, 320, 322, 323, 336, 354, 355, 460, 461, 557, 558, 625,
+        762, 893,
+        ]),
+    b'x': frozenset([
+        15, 22, 48, 55, 58, 65, 106, 107, 167, 200, 201, 202, 206, 207, 223,
+        224, 225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245, 246,
+        247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 263, 305, 306,
+        307, 308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 320, 336, 348,
+        349, 350, 351, 354, 355, 362, 363, 364, 365, 435, 436, 454, 455, 456,
+        457, 458, 459, 460, 461, 462, 463, 470, 471, 472, 541, 542, 543, 555,
+        556, 559, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603,
+        604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617,
+        618, 619, 620, 621, 622, 623, 624, 625, 667, 668, 691, 711, 739, 740,
+        762, 763, 764, 788, 810, 864, 865, 866, 867, 868, 869, 870, 871, 872,
+        873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887, 888,
+        889, 898, 913, 914, 915, 916, 917, 918, 919, 941, 942, 947, 955, 956,
+        ]),
+    b'y': frozenset([
+        15, 22, 48, 55, 58, 65, 106, 107, 146, 167, 200, 201, 202, 206, 207,
+        218, 220, 221, 222, 223, 224, 225, 226, 227, 228, 231, 232, 233, 234,
+        235, 236, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250,
+        251, 252, 253, 254, 255, 256, 257, 305, 306, 307, 308, 309, 310, 311,
+        312, 313, 315, 316, 317, 318, 320, 322, 336, 348, 349, 350, 351, 354,
+        355, 362, 363, 364, 365, 393, 435, 436, 454, 455, 456, 457, 458, 459,
+        460, 461, 462, 463, 470, 471, 472, 541, 542, 543, 555, 556, 560, 561,
+        562, 587, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603,
+        604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617,
+        618, 619, 620, 621, 622, 623, 624, 625, 662, 663, 667, 668, 676, 677,
+        678, 679, 680, 683, 688, 689, 690, 691, 696, 697, 698, 699, 701, 711,
+        739, 740, 761, 762, 763, 764, 788, 810, 827, 864, 865, 866, 867, 868,
+        869, 870, 871, 872, 873, 874, 875, 876, 877, 878, 879, 882, 883, 884,
+        885, 886, 887, 888, 889, 893, 898, 913, 914, 915, 916, 917, 918, 919,
+        941, 942, 947, 955, 956,
+        ]),
+    b'z': frozenset([
+        15, 58, 241, 242, 243, 244, 245, 246, 247, 256, 263, 305, 306, 307,
+        308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 320, 336, 354, 355,
+        362, 363, 364, 365, 435, 436, 457, 458, 459, 462, 463, 542, 559, 592,
+        593, 594, 595, 625, 762, 763, 810, 877, 878, 879, 882, 883, 884, 885,
+        886, 887, 888, 889, 941,
+        ]),
+    b'AA': frozenset([
+        15, 22, 48, 55, 58, 65, 106, 107, 146, 167, 200, 201, 202, 206, 207,
+        223, 224, 225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245,
+        246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 305, 306,
+        307, 308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 320, 322, 336,
+        348, 349, 350, 351, 354, 355, 362, 363, 364, 365, 393, 435, 436, 454,
+        455, 456, 457, 458, 459, 460, 461, 462, 463, 470, 471, 472, 541, 542,
+        543, 555, 556, 560, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601,
+        602, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615,
+        616, 617, 618, 619, 620, 621, 622, 623, 624, 625, 667, 668, 691, 739,
+        740, 762, 763, 764, 810, 827, 864, 865, 866, 867, 868, 869, 870, 871,
+        872, 873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887,
+        888, 889, 893, 941, 942, 947, 955, 956,
+        ]),
+    b'AB': frozenset([
+        1, 11, 12, 13, 15, 18, 21, 22, 23, 38, 40, 44, 48, 54, 55, 58, 59, 60,
+        63, 64, 65, 70, 75, 77, 78, 79, 80, 81, 99, 100, 106, 107, 110, 111,
+        114, 117, 120, 121, 126, 140, 152, 167, 168, 200, 201, 202, 203, 206,
+        207, 210, 211, 223, 224, 225, 226, 227, 228, 229, 231, 239, 240, 241,
+        242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255,
+        256, 257, 305, 306, 307, 308, 309, 310, 311, 312, 313, 315, 316, 317,
+        318, 336, 348, 349, 350, 351, 354, 355, 362, 363, 364, 365, 376, 377,
+        386, 388, 389, 423, 427, 432, 435, 436, 447, 448, 452, 453, 454, 455,
+        456, 457, 458, 459, 460, 461, 462, 463, 467, 468, 469, 470, 471, 472,
+        479, 480, 481, 494, 497, 513, 516, 523, 524, 525, 526, 528, 529, 538,
+        539, 541, 542, 543, 544, 545, 555, 556, 563, 564, 565, 566, 581, 582,
+        583, 587, 588, 589, 590, 591, 592, 593, 594, 595, 596, 597, 598, 599,
+        600, 601, 602, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613,
+        614, 615, 616, 617, 618, 619, 620, 621, 622, 623, 624, 625, 635, 654,
+        660, 661, 667, 670, 671, 672, 673, 674, 675, 683, 687, 688, 689, 690,
+        691, 711, 736, 739, 740, 756, 757, 758, 759, 760, 762, 763, 764, 775,
+        802, 803, 804, 805, 806, 807, 810, 835, 836, 837, 838, 840, 841, 842,
+        843, 844, 846, 847, 848, 849, 854, 864, 865, 866, 867, 868, 873, 874,
+        875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887, 888, 889, 941,
+        942, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956,
+        ]),
+    b'AC': frozenset([
+        1, 11, 12, 13, 15, 18, 21, 22, 23, 37, 38, 40, 41, 44, 48, 54, 55, 58,
+        59, 60, 63, 64, 65, 70, 75, 77, 78, 79, 80, 81, 99, 100, 106, 107, 110,
+        111, 114, 117, 120, 121, 126, 140, 152, 167, 168, 200, 201, 202, 203,
+        206, 207, 210, 211, 223, 224, 225, 226, 227, 228, 229, 231, 239, 240,
+        241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254,
+        255, 256, 257, 305, 306, 307, 308, 309, 310, 311, 312, 313, 315, 316,
+        317, 318, 336, 348, 349, 350, 351, 354, 355, 362, 363, 364, 365, 376,
+        377, 386, 388, 389, 423, 427, 432, 435, 436, 447, 448, 452, 453, 454,
+        455, 456, 457, 458, 459, 460, 461, 462, 463, 467, 468, 469, 470, 471,
+        472, 479, 480, 481, 494, 497, 513, 516, 523, 524, 525, 526, 528, 529,
+        538, 539, 541, 542, 543, 544, 545, 555, 556, 563, 564, 565, 566, 581,
+        582, 583, 586, 587, 588, 589, 590, 591, 592, 593, 594, 595, 596, 597,
+        598, 599, 600, 601, 602, 603, 604, 605, 606, 607, 608, 609, 610, 611,
+        612, 613, 614, 615, 616, 617, 618, 619, 620, 621, 622, 623, 624, 625,
+        635, 654, 660, 661, 667, 670, 671, 672, 673, 674, 675, 683, 687, 688,
+        689, 690, 691, 711, 736, 739, 740, 756, 757, 758, 759, 760, 762, 763,
+        764, 775, 802, 803, 804, 805, 806, 807, 810, 835, 836, 837, 838, 840,
+        841, 842, 843, 844, 846, 847, 848, 849, 854, 864, 865, 866, 867, 868,
+        873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887, 888,
+        889, 941, 942, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956,
+        ]),
+    b'AD': frozenset([
+        11, 17, 22, 37, 48, 54, 55, 58, 60, 65, 75, 106, 107, 150, 167, 200,
+        201, 202, 206, 207, 223, 224, 225, 226, 227, 228, 231, 239, 240, 241,
+        242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255,
+        256, 257, 263, 305, 306, 307, 308, 309, 310, 311, 312, 313, 315, 316,
+        317, 318, 336, 348, 349, 350, 351, 354, 355, 362, 363, 364, 365, 435,
+        436, 442, 447, 448, 452, 453, 454, 455, 456, 457, 458, 459, 460, 461,
+        462, 463, 470, 471, 472, 523, 541, 542, 543, 555, 556, 568, 569, 571,
+        573, 578, 579, 580, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601,
+        602, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615,
+        616, 617, 618, 619, 620, 621, 622, 623, 624, 625, 667, 668, 691, 711,
+        715, 725, 726, 739, 740, 762, 763, 764, 788, 802, 803, 810, 818, 820,
+        828, 829, 830, 855, 864, 865, 866, 867, 868, 869, 870, 871, 872, 873,
+        874, 875, 876, 877, 878, 879, 880, 882, 883, 884, 885, 886, 887, 888,
+        889, 898, 913, 914, 915, 916, 917, 918, 919, 941, 942, 943, 947, 955,
+        956,
+        ]),
+    b'AE': frozenset([
+        1, 6, 11, 12, 13, 15, 17, 18, 22, 30, 31, 32, 37, 38, 39, 40, 48, 54,
+        55, 58, 60, 63, 64, 65, 66, 70, 75, 77, 78, 79, 80, 81, 106, 107, 118,
+        119, 120, 136, 137, 138, 139, 150, 152, 155, 156, 157, 158, 159, 167,
+        194, 195, 198, 200, 201, 202, 206, 207, 218, 220, 221, 222, 223, 224,
+        225, 226, 227, 228, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239,
+        240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253,
+        254, 255, 256, 257, 263, 305, 306, 307, 308, 309, 310, 311, 312, 313,
+        315, 316, 317, 318, 325, 336, 348, 349, 350, 351, 354, 355, 362, 363,
+        364, 365, 376, 377, 378, 381, 423, 435, 436, 442, 447, 448, 452, 453,
+        454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 467, 468, 469, 470,
+        471, 472, 479, 483, 487, 497, 516, 518, 519, 520, 521, 523, 524, 525,
+        526, 527, 528, 529, 538, 539, 541, 542, 543, 545, 552, 555, 556, 564,
+        565, 566, 568, 570, 571, 572, 573, 574, 575, 576, 577, 578, 579, 581,
+        582, 587, 588, 591, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601,
+        602, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615,
+        616, 617, 618, 619, 620, 621, 622, 623, 624, 625, 637, 654, 660, 661,
+        662, 663, 667, 669, 683, 687, 688, 689, 690, 691, 696, 697, 698, 699,
+        701, 707, 708, 711, 715, 736, 738, 739, 740, 748, 752, 753, 756, 757,
+        758, 759, 760, 761, 762, 763, 764, 768, 769, 770, 771, 788, 797, 802,
+        803, 804, 805, 806, 807, 810, 818, 819, 820, 821, 822, 823, 824, 825,
+        826, 828, 829, 830, 852, 853, 854, 855, 856, 864, 865, 866, 867, 868,
+        873, 874, 875, 876, 877, 878, 879, 880, 881, 882, 883, 884, 885, 886,
+        887, 888, 889, 891, 898, 912, 913, 914, 915, 916, 917, 918, 919, 920,
+        921, 922, 941, 942, 943, 947, 955, 956,
+        ]),
+    b'AF': frozenset([
+        1, 22, 48, 54, 55, 65, 106, 107, 167, 200, 201, 202, 206, 207, 223,
+        224, 225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245, 246,
+        247, 255, 256, 305, 306, 307, 308, 309, 310, 311, 312, 313, 315, 316,
+        317, 318, 336, 348, 349, 350, 351, 362, 363, 364, 365, 435, 436, 447,
+        448, 452, 453, 454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 470,
+        471, 472, 523, 541, 542, 543, 584, 585, 592, 593, 594, 595, 625, 660,
+        667, 691, 762, 763, 802, 803, 810, 864, 865, 866, 867, 868, 873, 874,
+        875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887, 888, 889, 941,
+        947,
+        ]),
+    b'AG': frozenset([
+        1, 15, 22, 38, 40, 44, 48, 54, 55, 58, 60, 63, 64, 65, 106, 107, 126,
+        131, 140, 146, 152, 167, 192, 193, 200, 201, 202, 206, 207, 218, 220,
+        221, 222, 223, 224, 225, 226, 227, 228, 229, 231, 232, 233, 234, 235,
+        236, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251,
+        252, 253, 254, 255, 256, 257, 303, 305, 306, 307, 308, 309, 310, 311,
+        312, 313, 315, 316, 317, 318, 336, 348, 349, 350, 351, 354, 355, 362,
+        363, 364, 365, 423, 435, 436, 447, 448, 452, 453, 454, 455, 456, 457,
+        458, 459, 460, 461, 462, 463, 468, 469, 470, 471, 472, 516, 523, 524,
+        525, 537, 538, 539, 541, 542, 543, 545, 555, 556, 581, 587, 588, 592,
+        593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604, 605, 606,
+        607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 619, 620,
+        621, 622, 623, 624, 625, 640, 644, 658, 660, 662, 663, 667, 676, 677,
+        678, 679, 680, 683, 687, 688, 689, 690, 691, 692, 695, 696, 697, 698,
+        699, 701, 711, 735, 739, 740, 761, 762, 763, 764, 788, 802, 803, 804,
+        805, 810, 854, 864, 865, 866, 867, 868, 873, 874, 875, 876, 877, 878,
+        879, 882, 883, 884, 885, 886, 887, 888, 889, 898, 913, 914, 915, 916,
+        917, 918, 919, 941, 942, 947, 955, 956,
+        ]),
+    b'AH': frozenset([
+        22, 48, 55, 65, 106, 107, 140, 146, 167, 200, 201, 202, 206, 207, 223,
+        224, 225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245, 246,
+        247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 263, 303, 305,
+        306, 307, 308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 336, 348,
+        349, 350, 351, 362, 363, 364, 365, 435, 436, 454, 455, 456, 457, 458,
+        459, 460, 461, 462, 463, 470, 471, 472, 537, 541, 542, 543, 555, 556,
+        592, 593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604, 605,
+        606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 619,
+        620, 621, 622, 623, 624, 625, 644, 667, 691, 711, 739, 740, 762, 763,
+        764, 810, 864, 865, 866, 867, 868, 873, 874, 875, 876, 877, 878, 879,
+        882, 883, 884, 885, 886, 887, 888, 889, 941, 942, 947, 955, 956,
+        ]),
+    b'AI': frozenset([
+        1, 12, 13, 15, 22, 38, 40, 44, 48, 54, 55, 58, 60, 62, 63, 64, 65, 100,
+        106, 107, 117, 126, 131, 132, 133, 134, 135, 152, 156, 167, 188, 189,
+        190, 191, 192, 193, 200, 201, 202, 206, 207, 218, 220, 221, 222, 223,
+        224, 225, 226, 227, 228, 231, 232, 233, 234, 235, 236, 239, 240, 241,
+        242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255,
+        256, 257, 297, 305, 306, 307, 308, 309, 310, 311, 312, 313, 315, 316,
+        317, 318, 336, 348, 349, 350, 351, 354, 355, 362, 363, 364, 365, 423,
+        435, 436, 447, 448, 452, 453, 454, 455, 456, 457, 458, 459, 460, 461,
+        462, 463, 468, 469, 470, 471, 472, 516, 523, 524, 525, 537, 538, 539,
+        541, 542, 543, 545, 555, 556, 581, 582, 587, 588, 592, 593, 594, 595,
+        596, 597, 598, 599, 600, 601, 602, 603, 604, 605, 606, 607, 608, 609,
+        610, 611, 612, 613, 614, 615, 616, 617, 618, 619, 620, 621, 622, 623,
+        624, 625, 631, 632, 633, 634, 642, 643, 645, 646, 647, 648, 649, 656,
+        657, 660, 662, 663, 667, 683, 687, 688, 689, 690, 691, 693, 695, 696,
+        697, 698, 699, 701, 711, 735, 739, 740, 761, 762, 763, 764, 788, 802,
+        803, 804, 805, 810, 864, 865, 866, 867, 868, 873, 874, 875, 876, 877,
+        878, 879, 882, 883, 884, 885, 886, 887, 888, 889, 898, 913, 914, 915,
+        916, 917, 918, 919, 941, 942, 947, 955, 956,
+        ]),
+    b'AJ': frozenset([
+        1, 11, 12, 13, 15, 22, 23, 38, 40, 44, 48, 54, 55, 58, 60, 62, 63, 64,
+        65, 100, 106, 107, 117, 132, 133, 134, 135, 152, 156, 167, 188, 189,
+        190, 191, 192, 193, 200, 201, 202, 206, 207, 218, 220, 221, 222, 223,
+        224, 225, 226, 227, 228, 231, 232, 233, 234, 235, 236, 239, 240, 241,
+        242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255,
+        256, 257, 305, 306, 307, 308, 309, 310, 311, 312, 313, 315, 316, 317,
+        318, 336, 348, 349, 350, 351, 354, 355, 362, 363, 364, 365, 423, 435,
+        436, 447, 448, 452, 453, 454, 455, 456, 457, 458, 459, 460, 461, 462,
+        463, 468, 469, 470, 471, 472, 516, 523, 524, 525, 528, 537, 538, 539,
+        541, 542, 543, 545, 555, 556, 581, 582, 587, 588, 592, 593, 594, 595,
+        596, 597, 598, 599, 600, 601, 602, 603, 604, 605, 606, 607, 608, 609,
+        610, 611, 612, 613, 614, 615, 616, 617, 618, 619, 620, 621, 622, 623,
+        624, 625, 631, 632, 633, 634, 642, 643, 645, 646, 647, 648, 656, 657,
+        660, 662, 663, 667, 676, 677, 678, 679, 680, 681, 683, 684, 686, 687,
+        688, 689, 690, 691, 693, 694, 695, 696, 697, 698, 699, 701, 711, 735,
+        739, 740, 761, 762, 763, 764, 788, 802, 803, 804, 805, 810, 864, 865,
+        866, 867, 868, 873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885,
+        886, 887, 888, 889, 898, 913, 914, 915, 916, 917, 918, 919, 941, 942,
+        947, 955, 956,
+        ]),
+    b'AK': frozenset([
+        6, 11, 12, 13, 15, 22, 30, 37, 38, 48, 54, 55, 58, 60, 63, 64, 65, 66,
+        70, 73, 74, 75, 79, 80, 81, 85, 106, 107, 118, 119, 120, 136, 137, 138,
+        139, 155, 156, 157, 158, 159, 165, 167, 169, 170, 171, 172, 198, 200,
+        201, 202, 206, 207, 218, 220, 221, 222, 223, 224, 225, 226, 227, 228,
+        230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243,
+        244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257,
+        305, 306, 307, 308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 348,
+        349, 350, 351, 354, 355, 362, 363, 364, 365, 381, 423, 435, 436, 447,
+        448, 452, 453, 454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 467,
+        470, 471, 472, 479, 497, 523, 526, 528, 529, 541, 542, 543, 555, 556,
+        592, 593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604, 605,
+        606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 619,
+        620, 621, 622, 623, 624, 650, 661, 662, 663, 664, 665, 666, 667, 668,
+        691, 696, 697, 698, 699, 701, 711, 738, 739, 740, 756, 757, 758, 759,
+        760, 761, 762, 763, 764, 768, 769, 770, 771, 772, 773, 781, 782, 783,
+        784, 785, 786, 787, 788, 793, 797, 798, 799, 800, 801, 802, 803, 806,
+        807, 810, 854, 858, 859, 860, 861, 862, 863, 864, 865, 866, 867, 868,
+        869, 870, 871, 872, 873, 874, 875, 876, 877, 878, 879, 882, 883, 884,
+        885, 886, 887, 888, 889, 890, 891, 898, 913, 914, 915, 916, 917, 918,
+        919, 920, 921, 922, 941, 942, 947, 955, 956,
+        ]),
+    b'AL': frozenset([
+        1, 15, 22, 48, 55, 58, 60, 65, 106, 107, 167, 200, 201, 202, 206, 207,
+        223, 224, 225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245,
+        246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 305, 306,
+        307, 308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 336, 348, 349,
+        350, 351, 354, 355, 362, 363, 364, 365, 386, 435, 436, 447, 448, 452,
+        453, 454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 470, 471, 472,
+        523, 524, 525, 538, 539, 541, 542, 543, 545, 555, 556, 581, 592, 593,
+        594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604, 605, 606, 607,
+        608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 619, 620, 621,
+        622, 623, 624, 625, 660, 667, 691, 702, 703, 704, 705, 706, 709, 710,
+        711, 712, 713, 714, 715, 716, 717, 718, 719, 720, 739, 740, 762, 763,
+        764, 802, 803, 804, 805, 810, 834, 864, 865, 866, 867, 868, 873, 874,
+        875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887, 888, 889, 941,
+        942, 947, 955, 956,
+        ]),
+    b'AM': frozenset([
+        1, 15, 22, 48, 55, 58, 60, 65, 106, 107, 167, 200, 201, 202, 206, 207,
+        223, 224, 225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245,
+        246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 305, 306,
+        307, 308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 336, 348, 349,
+        350, 351, 354, 355, 362, 363, 364, 365, 386, 435, 436, 447, 448, 452,
+        453, 454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 470, 471, 472,
+        523, 524, 525, 538, 539, 541, 542, 543, 545, 555, 556, 581, 592, 593,
+        594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604, 605, 606, 607,
+        608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 619, 620, 621,
+        622, 623, 624, 625, 660, 667, 691, 702, 703, 704, 705, 706, 707, 708,
+        709, 710, 711, 712, 713, 715, 716, 717, 718, 721, 722, 723, 739, 740,
+        753, 762, 763, 764, 802, 803, 804, 805, 810, 834, 864, 865, 866, 867,
+        868, 873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887,
+        888, 889, 941, 942, 947, 955, 956,
+        ]),
+    b'AN': frozenset([
+        1, 15, 22, 48, 55, 58, 60, 65, 106, 107, 167, 200, 201, 202, 206, 207,
+        223, 224, 225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245,
+        246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 263, 305,
+        306, 307, 308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 336, 348,
+        349, 350, 351, 354, 355, 362, 363, 364, 365, 386, 435, 436, 447, 448,
+        452, 453, 454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 470, 471,
+        472, 523, 541, 542, 543, 555, 556, 573, 581, 592, 593, 594, 595, 596,
+        597, 598, 599, 600, 601, 602, 603, 604, 605, 606, 607, 608, 609, 610,
+        611, 612, 613, 614, 615, 616, 617, 618, 619, 620, 621, 622, 623, 624,
+        625, 660, 667, 691, 710, 711, 715, 716, 717, 724, 725, 726, 739, 740,
+        762, 763, 764, 802, 803, 810, 864, 865, 866, 867, 868, 873, 874, 875,
+        876, 877, 878, 879, 882, 883, 884, 885, 886, 887, 888, 889, 941, 942,
+        947, 955, 956,
+        ]),
+    b'AO': frozenset([
+        1, 15, 22, 48, 55, 58, 65, 106, 107, 167, 200, 201, 202, 206, 207, 223,
+        224, 225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245, 246,
+        247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 305, 306, 307,
+        308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 325, 348, 349, 350,
+        351, 354, 355, 362, 363, 364, 365, 435, 436, 447, 448, 452, 453, 454,
+        455, 456, 457, 458, 459, 460, 461, 462, 463, 470, 471, 472, 523, 541,
+        542, 543, 555, 556, 581, 592, 593, 594, 595, 596, 597, 598, 599, 600,
+        601, 602, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614,
+        615, 616, 617, 618, 619, 620, 621, 622, 623, 624, 660, 667, 691, 710,
+        711, 721, 725, 726, 727, 728, 729, 739, 740, 762, 763, 764, 802, 803,
+        810, 864, 865, 866, 867, 868, 873, 874, 875, 876, 877, 878, 879, 882,
+        883, 884, 885, 886, 887, 888, 889, 941, 942, 947, 955, 956,
+        ]),
+    b'AP': frozenset([
+        1, 15, 22, 48, 55, 58, 65, 106, 107, 167, 200, 201, 202, 206, 207, 223,
+        224, 225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245, 246,
+        247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 263, 305, 306,
+        307, 308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 325, 348, 349,
+        350, 351, 354, 355, 362, 363, 364, 365, 435, 436, 447, 448, 452, 453,
+        454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 470, 471, 472, 506,
+        523, 524, 525, 538, 539, 541, 542, 543, 545, 555, 556, 581, 592, 593,
+        594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604, 605, 606, 607,
+        608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 619, 620, 621,
+        622, 623, 624, 660, 667, 691, 702, 703, 704, 705, 706, 707, 708, 710,
+        711, 715, 716, 717, 721, 724, 727, 728, 730, 731, 732, 733, 734, 739,
+        740, 743, 753, 762, 763, 764, 802, 803, 804, 805, 810, 864, 865, 866,
+        867, 868, 873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886,
+        887, 888, 889, 941, 942, 947, 955, 956,
+        ]),
+    b'AQ': frozenset([
+        22, 48, 55, 58, 65, 106, 107, 167, 200, 201, 202, 206, 207, 223, 224,
+        225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245, 246, 247,
+        248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 263, 305, 306, 307,
+        308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 348, 349, 350, 351,
+        354, 355, 362, 363, 364, 365, 435, 436, 442, 454, 455, 456, 457, 458,
+        459, 460, 461, 462, 463, 470, 471, 472, 541, 542, 543, 555, 556, 568,
+        569, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604,
+        605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618,
+        619, 620, 621, 622, 623, 624, 667, 691, 711, 725, 726, 739, 740, 748,
+        749, 750, 762, 763, 764, 810, 864, 865, 866, 867, 868, 873, 874, 875,
+        876, 877, 878, 879, 882, 883, 884, 885, 886, 887, 888, 889, 941, 942,
+        947, 955, 956,
+        ]),
+    b'AR': frozenset([
+        1, 17, 22, 48, 55, 58, 60, 65, 77, 78, 79, 80, 106, 107, 150, 167, 200,
+        201, 202, 206, 207, 223, 224, 225, 226, 227, 228, 231, 239, 240, 248,
+        249, 250, 251, 252, 253, 254, 255, 257, 263, 348, 349, 350, 351, 354,
+        355, 454, 455, 456, 460, 461, 467, 470, 471, 472, 487, 524, 525, 527,
+        528, 529, 538, 539, 541, 543, 545, 555, 556, 564, 565, 566, 571, 572,
+        581, 582, 587, 588, 591, 596, 597, 598, 599, 600, 601, 602, 603, 604,
+        605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618,
+        619, 620, 621, 622, 623, 624, 635, 637, 654, 660, 661, 667, 683, 687,
+        688, 689, 690, 691, 725, 726, 736, 739, 740, 751, 756, 757, 758, 759,
+        760, 762, 764, 768, 769, 770, 771, 804, 805, 806, 807, 818, 820, 828,
+        829, 830, 855, 856, 864, 865, 866, 867, 868, 873, 874, 875, 876, 880,
+        881, 939, 942, 947, 955, 956,
+        ]),
+    b'AS': frozenset([
+        6, 11, 12, 13, 15, 17, 22, 29, 30, 31, 32, 37, 38, 48, 53, 54, 55, 58,
+        60, 63, 64, 65, 66, 70, 71, 72, 73, 74, 75, 77, 78, 79, 80, 81, 85, 87,
+        88, 106, 107, 118, 119, 120, 124, 136, 137, 138, 139, 153, 154, 155,
+        156, 157, 158, 159, 161, 165, 167, 169, 170, 171, 172, 196, 197, 198,
+        200, 201, 202, 206, 207, 208, 209, 218, 220, 221, 222, 223, 224, 225,
+        226, 227, 228, 229, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240,
+        241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254,
+        255, 256, 257, 305, 306, 307, 308, 309, 310, 311, 312, 313, 315, 316,
+        317, 318, 336, 348, 349, 350, 351, 354, 355, 360, 361, 362, 363, 364,
+        365, 366, 381, 423, 435, 436, 447, 448, 452, 453, 454, 455, 456, 457,
+        458, 459, 460, 461, 462, 463, 466, 467, 470, 471, 472, 479, 497, 523,
+        524, 525, 526, 527, 538, 539, 540, 541, 542, 543, 545, 555, 556, 570,
+        573, 574, 576, 577, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601,
+        602, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615,
+        616, 617, 618, 619, 620, 621, 622, 623, 624, 625, 650, 661, 662, 663,
+        667, 668, 669, 691, 696, 697, 698, 699, 700, 701, 711, 736, 737, 738,
+        739, 740, 741, 742, 754, 755, 756, 757, 758, 759, 760, 761, 762, 763,
+        764, 775, 780, 781, 782, 783, 784, 785, 786, 787, 788, 793, 794, 795,
+        796, 799, 800, 801, 802, 803, 804, 805, 806, 807, 808, 810, 854, 857,
+        860, 864, 865, 866, 867, 868, 869, 870, 871, 872, 873, 874, 875, 876,
+        877, 878, 879, 882, 883, 884, 885, 886, 887, 888, 889, 891, 892, 893,
+        898, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 941, 942, 947,
+        955, 956,
+        ]),
+    b'AT': frozenset([
+        58, 60, 70, 75, 78, 79, 87, 88, 161, 167, 354, 355, 360, 361, 366, 447,
+        448, 452, 453, 460, 467, 523, 573, 661, 755, 776, 793, 794, 802, 803,
+        808,
+        ]),
+    b'AU': frozenset([
+        58, 60, 75, 354, 355, 573, 664, 774, 940,
+        ]),
+    b'AV': frozenset([
+        54, 60, 79, 126, 167, 168, 169, 170, 171, 447, 448, 452, 453, 460, 461,
+        523, 661, 779, 791, 802, 803,
+        ]),
+    b'AW': frozenset([
+        1, 15, 22, 48, 55, 58, 65, 106, 107, 167, 200, 201, 202, 206, 207, 223,
+        224, 225, 226, 227, 228, 231, 239, 240, 241, 242, 243, 244, 245, 246,
+        247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 305, 306, 307,
+        308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 348, 349, 350, 351,
+        354, 355, 362, 363, 364, 365, 432, 435, 436, 447, 448, 452, 453, 454,
+        455, 456, 457, 458, 459, 460, 461, 462, 463, 470, 471, 472, 523, 524,
+        525, 538, 539, 541, 542, 543, 545, 555, 556, 581, 592, 593, 594, 595,
+        596, 597, 598, 599, 600, 601, 602, 603, 604, 605, 606, 607, 608, 609,
+        610, 611, 612, 613, 614, 615, 616, 617, 618, 619, 620, 621, 622, 623,
+        624, 667, 691, 702, 703, 704, 705, 706, 707, 708, 711, 715, 716, 717,
+        730, 731, 732, 739, 740, 744, 745, 746, 747, 753, 762, 763, 764, 802,
+        803, 804, 805, 810, 832, 833, 834, 864, 865, 866, 867, 868, 873, 874,
+        875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887, 888, 889, 912,
+        941, 942, 947, 955, 956,
+        ]),
+    b'AX': frozenset([
+        1, 11, 15, 17, 22, 37, 44, 48, 53, 54, 55, 58, 60, 64, 65, 106, 107,
+        124, 126, 136, 137, 138, 139, 159, 167, 198, 200, 201, 202, 206, 207,
+        218, 220, 221, 222, 223, 224, 225, 226, 227, 228, 231, 232, 233, 234,
+        239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252,
+        253, 254, 255, 256, 257, 305, 306, 307, 308, 309, 310, 311, 312, 313,
+        315, 316, 317, 318, 336, 348, 349, 350, 351, 354, 355, 362, 363, 364,
+        365, 423, 435, 436, 447, 448, 452, 453, 454, 455, 456, 457, 458, 459,
+        460, 461, 462, 463, 470, 471, 472, 523, 526, 541, 542, 543, 555, 556,
+        571, 581, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603,
+        604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617,
+        618, 619, 620, 621, 622, 623, 624, 625, 662, 663, 667, 691, 699, 711,
+        715, 716, 717, 739, 740, 761, 762, 763, 764, 768, 769, 770, 771, 788,
+        802, 803, 810, 818, 854, 864, 865, 866, 867, 868, 873, 874, 875, 876,
+        877, 878, 879, 882, 883, 884, 885, 886, 887, 888, 889, 891, 894, 895,
+        897, 898, 899, 900, 901, 913, 914, 915, 916, 917, 918, 919, 920, 921,
+        922, 941, 942, 944, 947, 955, 956,
+        ]),
+    b'AY': frozenset([
+        1, 11, 15, 17, 22, 37, 44, 48, 53, 54, 55, 58, 60, 64, 65, 85, 106,
+        107, 124, 126, 136, 137, 138, 139, 159, 165, 167, 169, 170, 171, 172,
+        198, 200, 201, 202, 206, 207, 218, 220, 221, 222, 223, 224, 225, 226,
+        227, 228, 231, 232, 233, 234, 239, 240, 241, 242, 243, 244, 245, 246,
+        247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 305, 306, 307,
+        308, 309, 310, 311, 312, 313, 315, 316, 317, 318, 336, 348, 349, 350,
+        351, 354, 355, 362, 363, 364, 365, 423, 435, 436, 447, 448, 452, 453,
+        454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 470, 471, 472, 523,
+        526, 541, 542, 543, 555, 556, 571, 581, 592, 593, 594, 595, 596, 597,
+        598, 599, 600, 601, 602, 603, 604, 605, 606, 607, 608, 609, 610, 611,
+        612, 613, 614, 615, 616, 617, 618, 619, 620, 621, 622, 623, 624, 625,
+        662, 663, 667, 691, 699, 711, 715, 716, 717, 739, 740, 761, 762, 763,
+        764, 768, 769, 770, 771, 781, 782, 783, 784, 785, 786, 787, 788, 801,
+        802, 803, 810, 818, 854, 864, 865, 866, 867, 868, 873, 874, 875, 876,
+        877, 878, 879, 882, 883, 884, 885, 886, 887, 888, 889, 891, 894, 895,
+        897, 898, 899, 900, 901, 902, 903, 907, 913, 914, 915, 916, 917, 918,
+        919, 920, 921, 922, 941, 942, 944, 947, 955, 956,
+        ]),
+    b'AZ': frozenset([
+        1, 11, 15, 17, 22, 37, 44, 48, 53, 54, 55, 58, 60, 64, 65, 106, 107,
+        124, 136, 137, 138, 139, 159, 167, 198, 200, 201, 202, 206, 207, 218,
+        220, 221, 222, 223, 224, 225, 226, 227, 228, 231, 232, 233, 234, 239,
+        240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253,
+        254, 255, 256, 257, 305, 306, 307, 308, 309, 310, 311, 312, 313, 315,
+        316, 317, 318, 348, 349, 350, 351, 354, 355, 362, 363, 364, 365, 423,
+        435, 436, 447, 448, 452, 453, 454, 455, 456, 457, 458, 459, 460, 461,
+        462, 463, 470, 471, 472, 523, 526, 541, 542, 543, 555, 556, 571, 581,
+        592, 593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604, 605,
+        606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 619,
+        620, 621, 622, 623, 624, 662, 663, 667, 691, 699, 711, 739, 740, 761,
+        762, 763, 764, 768, 769, 770, 771, 788, 802, 803, 810, 818, 854, 864,
+        865, 866, 867, 868, 873, 874, 875, 876, 877, 878, 879, 882, 883, 884,
+        885, 886, 887, 888, 889, 891, 894, 895, 897, 898, 899, 900, 901, 902,
+        903, 904, 905, 906, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922,
+        941, 942, 944, 947, 955, 956,
+        ]),
+    b'BA': frozenset([
+        1, 11, 15, 17, 22, 37, 44, 48, 53, 54, 55, 58, 64, 65, 85, 106, 107,
+        124, 136, 137, 138, 139, 159, 165, 167, 169, 170, 171, 172, 198, 200,
+        201, 202, 206, 207, 218, 220, 221, 222, 223, 224, 225, 226, 227, 228,
+        231, 232, 233, 234, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248,
+        249, 250, 251, 252, 253, 254, 255, 256, 257, 305, 306, 307, 308, 309,
+        310, 311, 312, 313, 315, 316, 317, 318, 336, 348, 349, 350, 351, 354,
+        355, 362, 363, 364, 365, 423, 435, 436, 447, 448, 452, 453, 454, 455,
+        456, 457, 458, 459, 460, 461, 462, 463, 470, 471, 472, 523, 526, 541,
+        542, 543, 555, 556, 571, 581, 592, 593, 594, 595, 596, 597, 598, 599,
+        600, 601, 602, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613,
+        614, 615, 616, 617, 618, 619, 620, 621, 622, 623, 624, 625, 662, 663,
+        667, 691, 699, 711, 715, 716, 717, 739, 740, 761, 762, 763, 764, 768,
+        769, 770, 771, 781, 782, 783, 784, 785, 786, 787, 788, 801, 802, 803,
+        810, 818, 854, 864, 865, 866, 867, 868, 873, 874, 875, 876, 877, 878,
+        879, 882, 883, 884, 885, 886, 887, 888, 889, 891, 897, 898, 899, 900,
+        901, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920,
+        921, 922, 941, 942, 947, 955, 956,
+        ]),
+    b'BB': frozenset([
+        1, 11, 15, 17, 22, 37, 44, 48, 53, 54, 55, 58, 64, 65, 85, 106, 107,
+        124, 159, 165, 167, 169, 170, 171, 172, 198, 200, 201, 202, 206, 207,
+        218, 220, 221, 222, 223, 224, 225, 226, 227, 228, 231, 232, 233, 234,
+        239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252,
+        253, 254, 255, 256, 257, 263, 305, 306, 307, 308, 309, 310, 311, 312,
+        313, 315, 316, 317, 318, 336, 348, 349, 350, 351, 354, 355, 362, 363,
+        364, 365, 423, 435, 436, 447, 448, 452, 453, 454, 455, 456, 457, 458,
+        459, 460, 461, 462, 463, 470, 471, 472, 523, 526, 541, 542, 543, 555,
+        556, 571, 581, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601, 602,
+        603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616,
+        617, 618, 619, 620, 621, 622, 623, 624, 625, 662, 663, 667, 691, 699,
+        711, 715, 716, 717, 725, 726, 739, 740, 761, 762, 763, 764, 768, 769,
+        770, 771, 781, 782, 783, 784, 785, 786, 787, 788, 801, 802, 803, 810,
+        818, 854, 864, 865, 866, 867, 868, 873, 874, 875, 876, 877, 878, 879,
+        882, 883, 884, 885, 886, 887, 888, 889, 896, 897, 898, 899, 900, 901,
+        909, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 938, 941, 942,
+        947, 955, 956,
+        ]),
+    b'BC': frozenset([
+        283, 284, 930, 931, 933, 935, 936,
+        ]),
+    b'BD': frozenset([
+        283, 284, 928, 929, 930, 931, 932, 933, 934, 936, 937,
+        ]),
+    b'BE': frozenset([
+        95, 96, 553, 554, 923, 924, 925,
+        ]),
+    b'BF': frozenset([
+        553, 923, 926, 927,
+        ]),
+    b'BG': frozenset([
+        1, 11, 15, 17, 22, 37, 48, 53, 55, 58, 64, 65, 106, 107, 124, 167, 198,
+        200, 201, 202, 206, 207, 223, 224, 225, 226, 227, 228, 231, 239, 240,
+        241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254,
+        255, 256, 257, 305, 306, 307, 308, 309, 310, 311, 312, 313, 315, 316,
+        317, 318, 336, 348, 349, 350, 351, 354, 355, 362, 363, 364, 365, 435,
+        436, 447, 448, 452, 453, 454, 455, 456, 457, 458, 459, 460, 461, 462,
+        463, 470, 471, 472, 523, 526, 541, 542, 543, 555, 556, 571, 581, 592,
+        593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604, 605, 606,
+        607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 619, 620,
+        621, 622, 623, 624, 625, 667, 691, 711, 715, 716, 717, 725, 726, 739,
+        740, 762, 763, 764, 788, 802, 803, 810, 818, 854, 864, 865, 866, 867,
+        868, 873, 874, 875, 876, 877, 878, 879, 882, 883, 884, 885, 886, 887,
+        888, 889, 896, 897, 898, 909, 911, 913, 914, 915, 916, 917, 918, 919,
+        938, 941, 942, 945, 946, 947, 955, 956,
+        ]),
+    b'BH': frozenset([
+        11, 37, 38, 58, 60, 66, 70, 73, 79, 198, 354, 355, 467, 526, 661, 756,
+        757, 758, 759, 760, 773, 793, 798, 799, 800, 806, 807, 859,
+        ]),
+    }
@@ -0,0 +1,185 @@
+"""
+Generates a data dictionary module for util.dictionary.
+
+    python -m util.dictionary.generate FIX44.xml util/dictionary/fix44.py \
+            --legacy-names
+    python -m util.dictionary.generate --legacy util/dictionary/fix44.py
+
+The source is a QuickFIX style spec XML, which gives each field's type and
+each message's fields (groups and components are flattened). --legacy reads
+the tag and message names from the FIXtags.pkl and FIXmsgs.pkl files the
+engine used to load at import, which have no types or message fields.
+--legacy-names takes the types and fields from the spec, but keeps the names
+of the pickles: the message names the engine has always used ('Execution
+Report' rather than 'ExecutionReport'), and the tags retired since FIX 4.2.
+
+util/dictionary/fix44.py is generated from the FIX44.xml of QuickFIX 1.16
+with --legacy-names.
+"""
+import os
+import sys
+import pickle
+import argparse
+import textwrap
+import xml.etree.ElementTree as ElementTree
+
+#------------------------------------------------------------------------------
+
+HEADER = '''"""
+{} data dictionary.
+
+{}
+"""
+
+BeginString = {!r}
+
+'''
+
+#------------------------------------------------------------------------------
+
+def from_xml(path):
+    root = ElementTree.parse(path).getroot()
+
+    major, minor = root.get('major'), root.get('minor')
+    if root.get('type') == 'FIXT':
+        BeginString = 'FIXT.{}.{}'.format(major, minor)
+    else:
+        BeginString = 'FIX.{}.{}'.format(major, minor)
+
+    names = {}
+    types = {}
+    tags = {}
+    for field in root.find('fields'):
+        tag = int(field.get('number'))
+        names[tag] = field.get('name')
+        types[tag] = field.get('type')
+        tags[field.get('name')] = tag
+
+    components = dict((component.get('name'), component)
+            for component in root.find('components') or ())
+
+    def collect(element, found):
+        for child in element:
+            if child.tag in ('field', 'group'):
+                found.add(tags[child.get('name')])
+            if child.tag == 'group':
+                collect(child, found)
+            elif child.tag == 'component':
+                collect(components[child.get('name')], found)
+        return found
+
+    messages = {}
+    fields = {}
+    for message in root.find('messages'):
+        MsgType = message.get('msgtype')
+        messages[MsgType] = message.get('name')
+        fields[MsgType] = sorted(collect(message, set()))
+
+    return BeginString, names, types, messages, fields
+
+
+def from_legacy(directory):
+    with open(os.path.join(directory, 'FIXtags.pkl'), 'rb') as f:
+        TAGS = pickle.load(f)
+    with open(os.path.join(directory, 'FIXmsgs.pkl'), 'rb') as f:
+        MSGS = pickle.load(f)
+
+    names = dict((key, value.decode('utf-8'))
+            for key, value in TAGS.items() if type(key) is int)
+    # MSGS maps both ways; of each pair, the MsgType is the shorter
+    messages = dict((key.decode('utf-8'), value.decode('utf-8'))
+            for key, value in MSGS.items()
+            if type(key) is bytes and len(key) < len(value))
+
+    return 'FIX.4.4', names, {}, messages, {}
+
+
+def with_legacy_names(data, legacy):
+    # The spec's types and fields under the names of the pickles
+    BeginString, names, types, messages, fields = data
+    merged_names = dict(names)
+    merged_names.update(legacy[1])
+    merged_messages = dict(messages)
+    merged_messages.update(legacy[3])
+    return BeginString, merged_names, types, merged_messages, fields
+
+#------------------------------------------------------------------------------
+
+def write(out, source, BeginString, names, types, messages, fields):
+    size = max(names) + 1
+
+    out.write(HEADER.format(BeginString, textwrap.fill(
+            'Generated by util/dictionary/generate.py from {}, do not '
+            'edit.'.format(source), 79), BeginString.encode('utf-8')))
+
+    out.write('# Field name by tag number, None where the tag is unassigned\n')
+    out.write('NAMES = (\n')
+    for tag in range(size):
+        name = names.get(tag)
+        value = None if name is None else name.encode('utf-8')
+        out.write('    {!r},{}\n'.format(value,
+                '' if name is None else '  # {}'.format(tag)))
+    out.write('    )\n\n')
+
+    out.write('# Field type by tag number, as named by the spec\n')
+    if types:
+        out.write('TYPES = (\n')
+        for tag in range(size):
+            out.write('    {!r},\n'.format(types.get(tag)))
+        out.write('    )\n\n')
+    else:
+        out.write('TYPES = ()  # Not in the source\n\n')
+
+    out.write('# MsgType: message name\n')
+    out.write('MESSAGES = {\n')
+    for MsgType in sorted(messages, key=lambda m: (len(m), m)):
+        out.write('    {!r}: {!r},\n'.format(MsgType.encode('utf-8'),
+                messages[MsgType].encode('utf-8')))
+    out.write('    }\n\n')
+
+    out.write('# MsgType: the tags of its fields, including groups\n')
+    if fields:
+        out.write('FIELDS = {\n')
+        for MsgType in sorted(fields, key=lambda m: (len(m), m)):
+            out.write('    {!r}: frozenset([\n'.format(
+                    MsgType.encode('utf-8')))
+            for line in textwrap.wrap(' '.join('{},'.format(tag)
+                    for tag in fields[MsgType]), 71):
+                out.write('        {}\n'.format(line))
+            out.write('        ]),\n')
+        out.write('    }\n')
+    else:
+        out.write('FIELDS = {}  # Not in the source\n')
+
+#------------------------------------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('spec', nargs='?', help='QuickFIX style spec XML')
+    parser.add_argument('output', help='module to write')
+    parser.add_argument('--legacy', action='store_true',
+            help='read the pickled tag and message names instead')
+    parser.add_argument('--legacy-names', action='store_true',
+            help='name the tags and messages of the spec as the pickles do')
+    args = parser.parse_args(argv)
+
+    directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if args.legacy:
+        data = from_legacy(directory)
+        source = 'FIXtags.pkl and FIXmsgs.pkl'
+    elif args.spec:
+        data = from_xml(args.spec)
+        source = os.path.basename(args.spec)
+        if args.legacy_names:
+            data = with_legacy_names(data, from_legacy(directory))
+            source += ', with the names of FIXtags.pkl and FIXmsgs.pkl'
+    else:
+        parser.error('a spec XML or --legacy is needed')
+
+    with open(args.output, 'w') as out:
+        write(out, source, *data)
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+#------------------------------------------------------------------------------
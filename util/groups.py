@@ -0,0 +1,277 @@
+"""
+Repeating group decoding, with columnar output.
+
+Message lookups return the first value of a tag, which is useless for
+repeating groups such as NoMDEntries (268) or NoPartyIDs (453). decode_groups
+slices each known group out of the field lists of Message.entries(), at the
+positions of its delimiter field, and returns it as a Group of columns, one
+per member field, each converted in one pass:
+
+    'd' fields (prices, sizes)   array('d'), NaN where absent
+    'i' fields (integers)        array('q'), 0 where absent
+    'c' fields (single chars)    bytearray, one byte per entry, 0 where absent
+    's' fields (strings)         list of bytes, None where absent
+
+The arrays support the buffer protocol, so numpy.frombuffer() can wrap a
+column without copying it.
+
+Group definitions are written by field and message name below and resolved
+to tags and MsgTypes through the FIX 4.4 data dictionary. The first member is
+the group's delimiter field.
+"""
+from array import array
+from bisect import bisect_right
+
+from . import dictionary
+from .parse import ParseError, CHECK_FIELD
+
+#------------------------------------------------------------------------------
+
+_MDEntry_fields = (
+        ('MDEntryPx', 'd'),
+        ('MDEntrySize', 'd'),
+        ('MDEntryDate', 's'),
+        ('MDEntryTime', 's'),
+        ('MDEntryID', 's'),
+        ('Symbol', 's'),
+        ('SecurityID', 's'),
+        ('NumberOfOrders', 'i'),
+        ('MDEntryPositionNo', 'i'),
+        )
+
+_Party_fields = (
+        ('PartyID', 's'),
+        ('PartyIDSource', 'c'),
+        ('PartyRole', 'i'),
+        )
+
+GROUP_DEFINITIONS = {
+        'Market Data - Snapshot/Full Refresh': {
+            'NoMDEntries': (('MDEntryType', 'c'),) + _MDEntry_fields,
+            },
+        'Market Data - Incremental Refresh': {
+            'NoMDEntries': (
+                ('MDUpdateAction', 'c'),
+                ('MDEntryType', 'c'),
+                ) + _MDEntry_fields,
+            },
+        'Market Data Request': {
+            'NoMDEntryTypes': (('MDEntryType', 'c'),),
+            'NoRelatedSym': (('Symbol', 's'), ('SecurityID', 's')),
+            },
+        'New Order Single': {
+            'NoPartyIDs': _Party_fields,
+            },
+        'Execution Report': {
+            'NoPartyIDs': _Party_fields,
+            },
+        }
+
+#------------------------------------------------------------------------------
+
+class GroupDefinition:
+
+    __slots__ = ('name', 'count_tag', 'delimiter', 'fields', 'kinds')
+
+    def __init__(self, name, fields):
+        self.name = name
+        tags = dictionary.get(b'FIX.4.4').tags
+        self.count_tag = tags[name]
+        self.delimiter = tags[fields[0][0]]
+        # tag: (field name, column kind)
+        self.fields = dict((tags[field], (field, kind))
+                for field, kind in fields)
+        # field name: column kind
+        self.kinds = dict(fields)
+
+
+def build_groups(definitions=GROUP_DEFINITIONS):
+    # MsgType: {count tag: GroupDefinition}
+    groups = {}
+    for msg_name, msg_groups in definitions.items():
+        MsgType = dictionary.get(b'FIX.4.4').msg_types[msg_name]
+        groups[MsgType] = dict(
+                (definition.count_tag, definition) for definition in
+                (GroupDefinition(name, fields)
+                    for name, fields in msg_groups.items()))
+    return groups
+
+GROUPS = build_groups()
+
+#------------------------------------------------------------------------------
+
+_NaN = float('nan')
+
+def _new_column(kind, count):
+    if kind == 'd':
+        return array('d', [_NaN]) * count
+    if kind == 'i':
+        return array('q', [0]) * count
+    if kind == 'c':
+        return bytearray(count)
+    return [None] * count
+
+
+class Group:
+
+    # 'columns' holds the fields found in the message; the column of a member
+    # field that no entry has is created, empty, when it is first read
+
+    __slots__ = ('name', 'count', 'columns', '_kinds')
+
+    def __init__(self, definition, count, columns=None):
+        self.name = definition.name
+        self.count = count
+        self.columns = {} if columns is None else columns
+        self._kinds = definition.kinds
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, field):
+        column = self.columns.get(field)
+        if column is None:
+            column = self.columns[field] = _new_column(self._kinds[field],
+                    self.count)
+        return column
+
+    def __repr__(self):
+        return '<Group {} x{}>'.format(self.name, self.count)
+
+#------------------------------------------------------------------------------
+
+def _column(definition, field, kind, values):
+    # Convert one member field's values, from every entry, at once
+    try:
+        if kind == 'd':
+            return array('d', map(float, values))
+        if kind == 'i':
+            return array('q', map(int, values))
+        if kind == 'c':
+            column = bytearray().join(values)
+            if len(column) != len(values):
+                raise ValueError
+            return column
+        return list(values)
+    except (ValueError, OverflowError):
+        if len(values) == 1:
+            raise ParseError('Invalid {} in {}: {!r}'.format(field,
+                    definition.name, values[0]), CHECK_FIELD)
+    # Find the value that failed, for the error
+    for value in values:
+        _column(definition, field, kind, [value])
+
+
+def _strided(definition, count, layout, values):
+    # Every entry has the fields of 'layout', in that order, so each column
+    # is a stride through the values
+    fields = definition.fields
+    width = len(layout)
+    columns = {}
+    for offset, tag in enumerate(layout):
+        field, kind = fields[tag]
+        columns[field] = _column(definition, field, kind,
+                values[offset::width])
+    return Group(definition, count, columns)
+
+
+def _decode_group(definition, count, tags, values, starts):
+    # 'tags' and 'values' cover the group's member fields, after the count;
+    # 'starts' are the positions of the delimiter field in them
+    if tags and tags[0] != definition.delimiter:
+        raise ParseError('{} entry does not start with its '
+                'delimiter'.format(definition.name), CHECK_FIELD)
+    if len(starts) != count:
+        raise ParseError('{} is {}, found {} entries'.format(
+                definition.name, count, len(starts)), CHECK_FIELD)
+    columns = {}
+    if not count:
+        return Group(definition, count, columns)
+
+    width = starts[1] if count > 1 else len(tags)
+    layout = tags[:width]
+    if tags == layout * count:
+        return _strided(definition, count, layout, values)
+
+    fields = definition.fields
+    starts.append(len(tags))
+    for tag, (field, kind) in fields.items():
+        positions = [i for i, member in enumerate(tags) if member == tag]
+        if not positions:
+            continue
+        column = columns[field] = _new_column(kind, count)
+        converted = _column(definition, field, kind,
+                [values[i] for i in positions])
+        for position, value in zip(positions, converted):
+            column[bisect_right(starts, position) - 1] = value
+    return Group(definition, count, columns)
+
+
+def decode_groups(msg, groups=None):
+    """
+    Decode the repeating groups of a message.Message.
+
+    Returns a dict of count field name to Group, for the groups defined for
+    the message's MsgType. Raises ParseError when a group's entries do not
+    match its count, or a count or value is malformed.
+
+    When every entry repeats the first one's fields in the same order, each
+    column is a stride through the values.
+    """
+    if groups is None:
+        groups = GROUPS.get(msg.MsgType)
+    if not groups:
+        return {}
+
+    tags, values = msg.entries()
+
+    decoded = {}
+    size = len(tags)
+    end = 0
+    for start in [i for i, tag in enumerate(tags) if tag in groups]:
+        if start < end:
+            continue
+        definition = groups[tags[start]]
+
+        value = values[start]
+        try:
+            count = int(value)
+        except ValueError:
+            count = -1
+        if count < 0:
+            raise ParseError('Invalid {}: {!r}'.format(definition.name,
+                    value), CHECK_FIELD)
+
+        fields = definition.fields
+        delimiter = definition.delimiter
+        start += 1
+        if count > 1 and start < size and tags[start] == delimiter:
+            # Try the entries as repeats of the first one's layout
+            try:
+                width = tags.index(delimiter, start + 1) - start
+            except ValueError:
+                width = 0
+            end = start + width * count
+            layout = tags[start:start + width]
+            if width and tags[start:end] == layout * count and \
+                    fields.keys() >= set(layout) and (end == size or
+                        tags[end] == delimiter or tags[end] not in fields):
+                decoded[definition.name] = _strided(definition, count,
+                        layout, values[start:end])
+                continue
+
+        # The group runs until the first field that is not a member, or the
+        # delimiter of an entry beyond its count
+        end = next((i for i in range(start, size) if tags[i] not in fields),
+                size)
+        starts = [i for i in range(start, end) if tags[i] == delimiter]
+        if len(starts) > count:
+            end = starts[count]
+            del starts[count:]
+        decoded[definition.name] = _decode_group(definition, count,
+                tags[start:end], values[start:end],
+                [i - start for i in starts])
+
+    return decoded
+
+#------------------------------------------------------------------------------
@@ -0,0 +1,141 @@
+"""
+Memory-mapped journal of outbound FIX messages.
+
+Each session's sent messages are appended, exactly as they went out, to a
+data file, and located through a fixed-width index file:
+
+    <name>.dat      The raw messages, back to back
+    <name>.idx      One '<QII' entry per MsgSeqNum: data offset, length and
+                    flags, at MsgSeqNum * ENTRY.size. Entry 0 is the header:
+                    the end of the data, and the last MsgSeqNum written.
+
+Both files are mapped into memory and grown by doubling, so appending is a
+copy into the map and finding a message by MsgSeqNum is a single index read.
+Messages are returned as memoryview slices of the map.
+"""
+import os
+import mmap
+import struct
+
+#------------------------------------------------------------------------------
+
+ENTRY = struct.Struct('<QII')
+
+FLAG_ADMIN = 1
+
+# Session level MsgTypes, gap filled rather than resent
+ADMIN_TYPES = frozenset([b'0', b'1', b'2', b'3', b'4', b'5', b'A'])
+
+DIRECTORY = './journal/'
+
+INITIAL_DATA_SIZE = 1 << 24
+INITIAL_INDEX_SIZE = ENTRY.size << 16
+
+#------------------------------------------------------------------------------
+
+class _MappedFile:
+
+    __slots__ = ('fd', 'map', 'size')
+
+    def __init__(self, path, initial_size):
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        size = os.fstat(self.fd).st_size
+        if size < initial_size:
+            os.ftruncate(self.fd, initial_size)
+            size = initial_size
+        self.size = size
+        self.map = mmap.mmap(self.fd, size)
+
+    def grow(self, needed):
+        size = self.size
+        while size < needed:
+            size *= 2
+        os.ftruncate(self.fd, size)
+        # Views of the old map keep it alive until they are released
+        self.map = mmap.mmap(self.fd, size)
+        self.size = size
+
+    def close(self):
+        self.map.flush()
+        try:
+            self.map.close()
+        except BufferError:
+            pass
+        os.close(self.fd)
+
+
+class OutboundJournal:
+
+    def __init__(self, path, data_size=INITIAL_DATA_SIZE,
+            index_size=INITIAL_INDEX_SIZE):
+        self.path = path
+        self._data = _MappedFile(path + '.dat', data_size)
+        self._index = _MappedFile(path + '.idx', index_size)
+
+        self._end, self.last_seq, _ = ENTRY.unpack_from(self._index.map, 0)
+
+    @classmethod
+    def open(cls, directory, SenderCompID, TargetCompID):
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        name = '{}-{}'.format(SenderCompID.decode('utf-8'),
+                TargetCompID.decode('utf-8'))
+        return cls(os.path.join(directory, name))
+
+    def __len__(self):
+        return self.last_seq
+
+    def append(self, MsgSeqNum, frame, admin=False):
+        length = len(frame)
+        offset = self._end
+        end = offset + length
+        if end > self._data.size:
+            self._data.grow(end)
+        self._data.map[offset:end] = frame
+
+        position = MsgSeqNum * ENTRY.size
+        if position + ENTRY.size > self._index.size:
+            self._index.grow(position + ENTRY.size)
+        index = self._index.map
+        ENTRY.pack_into(index, position, offset, length,
+                FLAG_ADMIN if admin else 0)
+
+        self._end = end
+        if MsgSeqNum > self.last_seq:
+            self.last_seq = MsgSeqNum
+        ENTRY.pack_into(index, 0, end, self.last_seq, 0)
+
+    def get(self, MsgSeqNum):
+        """(message, is admin) for MsgSeqNum, message None if not journaled."""
+        if MsgSeqNum < 1 or MsgSeqNum > self.last_seq:
+            return None, False
+        offset, length, flags = ENTRY.unpack_from(self._index.map,
+                MsgSeqNum * ENTRY.size)
+        if not length:
+            return None, False
+        return (memoryview(self._data.map)[offset:offset + length],
+                bool(flags & FLAG_ADMIN))
+
+    def range(self, BeginSeqNo, EndSeqNo):
+        # (MsgSeqNum, message, is admin) for BeginSeqNo to EndSeqNo inclusive
+        for MsgSeqNum in range(BeginSeqNo, EndSeqNo + 1):
+            frame, admin = self.get(MsgSeqNum)
+            yield MsgSeqNum, frame, admin
+
+    def reset(self):
+        # Forget every message, for a sequence number reset
+        index = self._index.map
+        used = min(len(index), (self.last_seq + 1) * ENTRY.size)
+        index[:used] = bytes(used)
+        self._end = 0
+        self.last_seq = 0
+
+    def flush(self):
+        self._data.map.flush()
+        self._index.map.flush()
+
+    def close(self):
+        self._data.close()
+        self._index.close()
+
+#------------------------------------------------------------------------------
@@ -0,0 +1,72 @@
+"""
+Logging off the event loop.
+
+'start' puts a QueueHandler on the root logger and a QueueListener, in a
+background thread, in front of the real handlers, so a log call on the event
+loop only appends the record to a queue. Writing to disk or the terminal, and
+in a single process formatting too, happen in the listener thread.
+
+With worker processes the queue is a multiprocessing.Queue shared with them;
+records are then formatted before they are queued, as they have to be pickled.
+
+Hot paths should still check the level before building arguments, and pass
+them to the log call rather than formatting the message. Conversions wrapped
+in Deferred run when the record is formatted, in the listener thread, instead
+of on the event loop:
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('FIX: Data received: %s',
+                logs.Deferred(str, data, 'utf-8'))
+"""
+import queue
+import logging
+import logging.handlers
+
+#------------------------------------------------------------------------------
+
+class Deferred:
+    # Log argument that formats as func(*args). The arguments must not be
+    # changed after the log call either.
+
+    __slots__ = ('func', 'args')
+
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+    def __str__(self):
+        return self.func(*self.args)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    # Same process: queue the record as it is, the listener formats it. The
+    # arguments of a log call must not be changed after the call.
+
+    def prepare(self, record):
+        return record
+
+
+def start(handlers, level=logging.DEBUG, processes=False):
+    """
+    Route the root logger's records to 'handlers' through a queue. Returns
+    the QueueListener, to stop at exit. 'processes' shares the queue with
+    processes forked later.
+    """
+    if processes:
+        import multiprocessing
+        records = multiprocessing.Queue(-1)
+        handler = logging.handlers.QueueHandler(records)
+    else:
+        records = queue.Queue(-1)
+        handler = _DeferredQueueHandler(records)
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(handler)
+
+    listener = logging.handlers.QueueListener(records, *handlers,
+            respect_handler_level=True)
+    listener.start()
+    return listener
+
+#------------------------------------------------------------------------------
@@ -0,0 +1,211 @@
+"""
+Lazy, read-only view of a received FIX message.
+
+A Message holds the raw wire bytes, and the MsgType that parse.decode found
+while validating them, and nothing else until a field is asked for. Single
+lookups search the raw bytes for the field. The full index, the fields as one
+flat list of alternating tag and value bytes in wire order, is only built
+when every field is needed (iteration, repeated tags, groups), and raises
+parse.ParseError (CHECK_FIELD) on a field that is not <tag>=<value>. bytes(msg)
+returns the original wire bytes without copying them.
+
+Typed values, converted according to each tag's FIX datatype (see
+util/convert.py), are cached on the message after the first access.
+
+Messages are normally built by parse.decode, which validates the frame first.
+"""
+from itertools import accumulate
+
+from . import SOH
+from . import convert
+
+#------------------------------------------------------------------------------
+
+# b'\x01<tag>=' search keys, built on first use
+_prefixes = {}
+
+def _prefix(tag):
+    try:
+        return _prefixes[tag]
+    except KeyError:
+        prefix = _prefixes[tag] = SOH + str(tag).encode('utf-8') + b'='
+        return prefix
+
+#------------------------------------------------------------------------------
+
+class _TagNumbers(dict):
+    # b'<tag>': int, for the tags seen so far
+
+    def __missing__(self, tag):
+        number = int(tag)
+        if len(self) < 4096:
+            self[tag] = number
+        return number
+
+_tag_numbers = _TagNumbers()
+
+# Every byte but '=' and SOH, deleted to leave the separators of the fields
+_NOT_SEPARATORS = bytes(byte for byte in range(256) if byte not in b'=\x01')
+
+#------------------------------------------------------------------------------
+
+def split_fields(raw):
+    """
+    Split 'raw', whole fields each ending with a SOH, into a flat list of
+    alternating tag and value bytes. Raises parse.ParseError (CHECK_FIELD)
+    for a field that is not <tag>=<value>.
+    """
+    # When the separators alternate '=', SOH, '=', ... SOH, every field holds
+    # exactly one '=', and swapping '=' for SOH leaves tags and values
+    # alternating. Values holding '=' take the field by field loop.
+    separators = raw.translate(None, _NOT_SEPARATORS)
+    if separators.count(b'=\x01') * 2 == len(separators):
+        fields = raw.replace(b'=', SOH).split(SOH)
+        # Nothing may follow the last SOH
+        if not fields.pop():
+            tags = fields[0::2]
+            if all(tags) and b''.join(tags).isdigit():
+                return fields
+
+    fields = []
+    end = len(raw)
+    position = 0
+    while position < end:
+        soh = raw.find(SOH, position)
+        equals = raw.find(b'=', position, soh)
+        tag = raw[position:equals]
+        if soh == -1 or equals == -1 or not tag.isdigit():
+            from .parse import ParseError, CHECK_FIELD
+            raise ParseError('Malformed field: {!r}'.format(
+                    raw[position:soh if soh != -1 else end]), CHECK_FIELD)
+        fields.append(tag)
+        fields.append(raw[equals + 1:soh])
+        position = soh + 1
+    return fields
+
+#------------------------------------------------------------------------------
+
+class Message:
+
+    __slots__ = ('_raw', '_end', '_fields', '_values', 'MsgType', 'received')
+
+    def __init__(self, raw, end=None, MsgType=None):
+        # 'raw' must be a bytes object holding exactly one message. 'end' is
+        # the offset of the CheckSum field.
+        self._raw = raw
+        self._end = len(raw) - 7 if end is None else end
+        self._fields = None
+        self._values = None
+        self.MsgType = self.get(35) if MsgType is None else MsgType
+        # monotonic_ns() time it was read off the wire, if known
+        self.received = None
+
+    def __bytes__(self):
+        return self._raw
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __repr__(self):
+        return '<Message 35={} 34={}>'.format(
+                self.get(35, b'?').decode('utf-8'),
+                self.get(34, b'?').decode('utf-8'),
+                )
+
+    def __contains__(self, tag):
+        return self.get(tag) is not None
+
+    def __getitem__(self, tag):
+        value = self.get(tag)
+        if value is None:
+            raise KeyError(tag)
+        return value
+
+    def __iter__(self):
+        # (tag, value) pairs in wire order, CheckSum excluded
+        tags, values = self.entries()
+        return zip(tags, values)
+
+    @property
+    def raw(self):
+        return memoryview(self._raw)
+
+    @property
+    def MsgSeqNum(self):
+        return int(self[34])
+
+    def get(self, tag, default=None):
+        raw = self._raw
+        if tag == 8:
+            return raw[2:raw.find(SOH)]
+        prefix = _prefixes.get(tag) or _prefix(tag)
+        position = raw.find(prefix, 0, self._end)
+        if position == -1:
+            return default
+        position += len(prefix)
+        return raw[position:raw.find(SOH, position)]
+
+    def value(self, tag, default=None):
+        # Typed value of 'tag', 'default' if absent. ValueError if malformed.
+        values = self._values
+        if values is None:
+            values = self._values = {}
+        else:
+            value = values.get(tag)
+            if value is not None:
+                return value
+
+        raw = self.get(tag)
+        if raw is None:
+            return default
+        value = values[tag] = convert.converters().convert(tag, raw)
+        return value
+
+    def values(self, tags, default=None):
+        # Typed values of several tags at once, as a list in the same order
+        value = self.value
+        return [value(tag, default) for tag in tags]
+
+    def getall(self, tag):
+        # Every value of a repeated tag, in wire order
+        tags, values = self.entries()
+        return [value for t, value in zip(tags, values) if t == tag]
+
+    def view(self, tag):
+        # Zero-copy memoryview of a value
+        span = self.find(tag)
+        if span is None:
+            return None
+        offset, length = span
+        return memoryview(self._raw)[offset:offset + length]
+
+    def entries(self):
+        # The full index as two lists in wire order: the tag numbers, and
+        # the values
+        fields = self._fields
+        if fields is None:
+            fields = self._build_index()
+        return (list(map(_tag_numbers.__getitem__, fields[0::2])),
+                fields[1::2])
+
+    def find(self, tag):
+        """(offset, length) of the first value for 'tag', or None."""
+        raw = self._raw
+        if tag == 8:
+            return 2, raw.find(SOH) - 2
+        prefix = _prefix(tag)
+        position = raw.find(prefix, 0, self._end)
+        if position == -1:
+            return None
+        offset = position + len(prefix)
+        return offset, raw.find(SOH, offset) - offset
+
+    def _build_index(self):
+        # Split the whole message, without copying it first, and drop the
+        # CheckSum field
+        fields = split_fields(self._raw)
+        del fields[-2:]
+        self._fields = fields
+        return fields
+
+#------------------------------------------------------------------------------
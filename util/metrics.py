@@ -0,0 +1,150 @@
+"""
+Latency histograms and counters.
+
+A Histogram records nanosecond values in log-linear buckets, in the style of
+HdrHistogram: values below 128 each get a bucket, above that every power of
+two is split into 64 buckets, so any value is reported to within 1/64 (about
+1.6%) of itself. Recording is an index computation and an array increment.
+Values above MAX_VALUE (about 18 minutes) count as MAX_VALUE.
+
+SessionMetrics holds a FIX session's counters and its histograms of the time
+between stages of a message's trip through the engine, all from the
+monotonic clock:
+
+    Inbound, from the data_received call that read the message
+        frame           the chunk split into messages (per chunk)
+        validate        the message decoded and its MsgSeqNum checked
+        tick_to_api     the message handed to the API connection
+
+    Outbound, from the API data_received call that read the command
+        api_to_compose  the message composed, MsgSeqNum and SendingTime set
+        api_to_wire     the batch holding it written to the transport
+"""
+from array import array
+
+from .clock import monotonic_ns
+
+#------------------------------------------------------------------------------
+
+_SUB_BITS = 6
+_SUB_BUCKETS = 1 << _SUB_BITS          # Buckets per power of two
+_LINEAR = _SUB_BUCKETS << 1            # Values below this get their own
+
+MAX_VALUE = (1 << 40) - 1
+_MAX_SHIFT = MAX_VALUE.bit_length() - _SUB_BITS - 1
+_BUCKETS = ((_MAX_SHIFT + 1) << _SUB_BITS) + _SUB_BUCKETS
+
+PERCENTILES = (50.0, 90.0, 99.0, 99.9, 99.99)
+
+#------------------------------------------------------------------------------
+
+def _highest(index):
+    # Highest value counted in bucket 'index'
+    if index < _LINEAR:
+        return index
+    shift = (index >> _SUB_BITS) - 1
+    mantissa = index - (shift << _SUB_BITS)
+    return ((mantissa + 1) << shift) - 1
+
+#------------------------------------------------------------------------------
+
+class Histogram:
+
+    __slots__ = ('counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.counts = array('Q', bytes(8 * _BUCKETS))
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def __len__(self):
+        return self.count
+
+    def record(self, value):
+        if value < _LINEAR:
+            if value < 0:
+                value = 0
+            index = value
+        else:
+            if value > MAX_VALUE:
+                value = MAX_VALUE
+            shift = value.bit_length() - _SUB_BITS - 1
+            index = (shift << _SUB_BITS) + (value >> shift)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        if self.min is None or value < self.min:
+            self.min = value
+
+    def record_since(self, start_ns, now=None):
+        if now is None:
+            now = monotonic_ns()
+        self.record(now - start_ns)
+
+    def percentile(self, q):
+        # The value at or below which 'q' percent of the values fall, to
+        # within the bucket precision; 0 when empty
+        if not self.count:
+            return 0
+        target = max(1, -(-self.count * q // 100))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            if n:
+                seen += n
+                if seen >= target:
+                    return min(_highest(index), self.max)
+        return self.max
+
+    def reset(self):
+        self.counts = array('Q', bytes(8 * _BUCKETS))
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def summary(self, percentiles=PERCENTILES):
+        # Nanoseconds
+        summary = {
+            'count': self.count,
+            'min': self.min or 0,
+            'max': self.max,
+            'mean': self.total // self.count if self.count else 0,
+            }
+        for q in percentiles:
+            summary['p{:g}'.format(q)] = self.percentile(q)
+        return summary
+
+#------------------------------------------------------------------------------
+
+class SessionMetrics:
+
+    COUNTERS = ('messages_in', 'messages_out', 'bytes_in', 'bytes_out',
+            'parse_errors', 'checksum_failures', 'gaps', 'duplicates',
+            'api_messages', 'api_commands', 'in_queue_max', 'out_queue_max')
+    HISTOGRAMS = ('frame', 'validate', 'tick_to_api', 'api_to_compose',
+            'api_to_wire')
+
+    __slots__ = COUNTERS + HISTOGRAMS + ('started',)
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+        for name in self.HISTOGRAMS:
+            setattr(self, name, Histogram())
+        self.started = monotonic_ns()
+
+    def stats(self):
+        stats = dict((name, getattr(self, name)) for name in self.COUNTERS)
+        stats['seconds'] = (monotonic_ns() - self.started) / 1e9
+        stats['latency_ns'] = dict((name, getattr(self, name).summary())
+                for name in self.HISTOGRAMS)
+        return stats
+
+#------------------------------------------------------------------------------
@@ -1,16 +1,13 @@
 import time
+import zlib
 import logging
 import asyncio
 from datetime import datetime, timedelta
 
-from . import SOH, TAGS, MSGS
+from . import SOH, dictionary
+from .message import Message
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-
-console = logging.StreamHandler()
-console.setLevel(logging.DEBUG)
-logger.addHandler(console)
 
 #------------------------------------------------------------------------------
 
@@ -130,23 +127,260 @@ def sans_first_two_fields(message):
 
 #------------------------------------------------------------------------------
 
+# Upper bounds used by the framer to decide that a header is garbage rather
+# than merely incomplete.
+MAX_BEGINSTRING_LENGTH = 16     # b'8=FIXT.1.1\x01' plus some slack
+MAX_BODYLENGTH_DIGITS = 7
+MAX_BODY_LENGTH = 1048576
+
+class FrameDecoder:
+    """
+    Incremental framer for an inbound FIX byte stream.
+    
+    Chunks handed to 'feed' are split into complete messages using the
+    BodyLength (9) field, so a chunk holding several messages, or ending
+    part way through one, is handled without guessing. Frames are returned as
+    memoryview slices; frames found wholly inside a chunk reference the chunk
+    itself and are not copied. Only the trailing partial message is kept in
+    the reusable receive buffer until the rest of it arrives.
+    
+    Bytes that can not be the start of a message are skipped up to the next
+    b'8=FIX', and counted in 'discarded'.
+    """
+    
+    __slots__ = ('_buffer', 'max_body_length', 'discarded')
+    
+    def __init__(self, max_body_length=MAX_BODY_LENGTH):
+        self._buffer = bytearray()
+        self.max_body_length = max_body_length
+        self.discarded = 0
+    
+    def __len__(self):
+        # Number of bytes waiting on the rest of a message
+        return len(self._buffer)
+    
+    def feed(self, data):
+        frames = []
+        
+        if not self._buffer:
+            view = memoryview(data)
+            consumed = self._scan(data, view, frames)
+            if consumed < len(data):
+                self._buffer += view[consumed:]
+            return frames
+        
+        # Part of a message is already buffered, the frames found here have
+        # to be copied out before the buffer is compacted.
+        buffer = self._buffer
+        buffer += data
+        with memoryview(buffer) as view:
+            spans = []
+            consumed = self._scan(buffer, None, spans)
+            for start, end in spans:
+                frames.append(memoryview(view[start:end].tobytes()))
+        del buffer[:consumed]
+        
+        return frames
+    
+    def clear(self):
+        self._buffer.clear()
+    
+    def _scan(self, data, view, frames):
+        # Append every complete frame in 'data' to 'frames', either as a slice
+        # of 'view' or, when 'view' is None, as a (start, end) pair. Returns
+        # the number of bytes consumed.
+        size = len(data)
+        pos = 0
+        
+        while pos < size:
+            end = self._frame_end(data, pos, size)
+            
+            if end is None:
+                # Incomplete, wait for more data
+                break
+            
+            if end < 0:
+                # Garbage at 'pos', resynchronise on the next BeginString
+                resync = data.find(b'8=FIX', pos + 1)
+                if resync == -1:
+                    # Keep a possible partial b'8=FIX' at the very end
+                    resync = data.find(b'8', max(pos + 1, size - 4))
+                    if resync == -1:
+                        resync = size
+                self.discarded += resync - pos
+                logger.info('FIX: Discarded %s bytes while framing',
+                        resync - pos)
+                pos = resync
+                continue
+            
+            if view is None:
+                frames.append((pos, end))
+            else:
+                frames.append(view[pos:end])
+            pos = end
+        
+        return pos
+    
+    def _frame_end(self, data, pos, size):
+        # Returns the end offset of the frame starting at 'pos', None if more
+        # data is needed, or -1 if 'pos' is not the start of a valid frame.
+        if size - pos < 2:
+            return None if data[pos] == ord(b'8') else -1
+        if data[pos] != ord(b'8') or data[pos + 1] != ord(b'='):
+            return -1
+        
+        # BeginString
+        limit = pos + MAX_BEGINSTRING_LENGTH
+        first_soh = data.find(SOH, pos, limit)
+        if first_soh == -1:
+            return None if size < limit else -1
+        
+        # BodyLength tag
+        length_start = first_soh + 3
+        if size < length_start:
+            return None
+        if data[first_soh + 1:length_start] != b'9=':
+            return -1
+        
+        # BodyLength value
+        limit = length_start + MAX_BODYLENGTH_DIGITS + 1
+        second_soh = data.find(SOH, length_start, limit)
+        if second_soh == -1:
+            return None if size < limit else -1
+        digits = data[length_start:second_soh]
+        if not digits.isdigit():
+            return -1
+        body_length = int(digits)
+        if body_length > self.max_body_length:
+            return -1
+        
+        # The CheckSum field is always b'10=NNN\x01'
+        end = second_soh + 1 + body_length + 7
+        if size < end:
+            return None
+        if data[end - 7:end - 4] != b'10=' or data[end - 1] != 1:
+            return -1
+        
+        return end
+
+#------------------------------------------------------------------------------
+
+# Checks reported by ParseError.check
+CHECK_BEGINSTRING = 'BeginString'
+CHECK_BODYLENGTH = 'BodyLength'
+CHECK_MSGTYPE = 'MsgType'
+CHECK_CHECKSUM = 'CheckSum'
+CHECK_FIELD = 'Field'
+
 class ParseError(Exception):
-    def __init__(self, value):
+    def __init__(self, value, check=None):
         self.value = value
+        self.check = check
     def __str__(self):
         return repr(self.value)
 
+#------------------------------------------------------------------------------
+
+# adler32 keeps the plain byte sum in its low 16 bits, modulo 65521. Summing at
+# most 256 bytes at a time can not wrap, so the exact sum falls out of a C
+# routine instead of a python level loop over every byte.
+CHECKSUM_BLOCK = 256
+
+def checksum(data, end=None):
+    """Sum of the bytes in data[:end], modulo 256."""
+    if end is None:
+        end = len(data)
+    if end <= CHECKSUM_BLOCK:
+        return (zlib.adler32(data[:end]) - 1) & 255
+    
+    view = memoryview(data)
+    total = 0
+    for start in range(0, end, CHECKSUM_BLOCK):
+        total += zlib.adler32(view[start:min(start + CHECKSUM_BLOCK, end)]) - 1
+    return total & 255
+
+#------------------------------------------------------------------------------
+
+def decode(message):
+    """
+    Validate a complete FIX message and index its fields.
+    
+    Replaces the verify_initial_fields, verify_checksum, verify_bodylength and
+    decompile chain. The leading 8/9/35 fields, BodyLength and CheckSum are
+    checked from fixed offsets, without a pass over the individual fields.
+    Returns a message.Message view of the frame with its MsgType already
+    set; other fields are located when they are accessed. Raises ParseError, with 'check' set to the CHECK_*
+    constant of the failed check.
+    
+    The Message works on a bytes object. A FrameDecoder frame that covers its
+    whole chunk is used without copying; a frame sliced out of a chunk that
+    held several messages is copied once, here.
+    """
+    if type(message) is not bytes:
+        chunk = message.obj if type(message) is memoryview else None
+        if type(chunk) is bytes and len(chunk) == message.nbytes:
+            message = chunk
+        else:
+            message = bytes(message)
+    
+    # BeginString
+    if not message.startswith(b'8='):
+        raise ParseError('BeginString must be the first field',
+                CHECK_BEGINSTRING)
+    first_soh = message.find(SOH)
+    
+    # BodyLength
+    if first_soh == -1 or not message.startswith(b'9=', first_soh + 1):
+        raise ParseError('BodyLength must be the second field',
+                CHECK_BODYLENGTH)
+    second_soh = message.find(SOH, first_soh + 3)
+    
+    # MsgType
+    if second_soh == -1 or not message.startswith(b'35=', second_soh + 1):
+        raise ParseError('MsgType must be the third field', CHECK_MSGTYPE)
+    MsgType_start = second_soh + 4
+    
+    # CheckSum, always the last seven bytes
+    trailer = len(message) - 7
+    if not message.startswith(b'10=', trailer) or \
+            message[-1] != 1 or message[trailer - 1] != 1:
+        raise ParseError('CheckSum field not found', CHECK_CHECKSUM)
+    
+    try:
+        body_length = int(message[first_soh + 3:second_soh])
+    except ValueError:
+        raise ParseError('Invalid BodyLength value', CHECK_BODYLENGTH)
+    if body_length != trailer - second_soh - 1:
+        raise ParseError('BodyLength is {}, expected {}'.format(
+                body_length, trailer - second_soh - 1), CHECK_BODYLENGTH)
+    
+    try:
+        recv_checksum = int(message[trailer + 3:-1])
+    except ValueError:
+        raise ParseError('Invalid CheckSum value', CHECK_CHECKSUM)
+    calc_checksum = checksum(message, trailer)
+    if recv_checksum != calc_checksum:
+        raise ParseError('CheckSum is {}, expected {}'.format(
+                recv_checksum, calc_checksum), CHECK_CHECKSUM)
+    
+    return Message(message, trailer,
+            message[MsgType_start:message.find(SOH, MsgType_start)])
+
 def decompile(message):
     sections = message.split(SOH)
     if len(sections) == 1:
         raise ParseError('Malformed FIX message')
     
     fields = {}
+    name_of = dictionary.get().name
     
     try:
         for section in sections[:-1]:
             tag, data = section.split(b'=')
-            fields[TAGS[tag]] = data
+            name = name_of(int(tag))
+            if name is None:
+                raise KeyError(tag)
+            fields[name] = data
         
         return fields
     except (ValueError, KeyError) as e:
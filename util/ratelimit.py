@@ -0,0 +1,147 @@
+"""
+Token bucket rate limiting for outgoing messages.
+
+A TokenBucket allows 'rate' messages per 'period' seconds on average, and
+bursts of up to 'burst' messages. Its state is kept in integer nanoseconds
+from clock.monotonic_ns: every nanosecond adds 'rate' to the credit, every
+message costs 'period' in nanoseconds, and the credit is capped at 'burst'
+messages' worth. Nothing is rounded, so a sender can run at exactly the
+limit.
+
+A RateLimiter combines the buckets that apply to a session, typically its own
+and one shared by every session to the same venue (see venue_bucket); a
+message passes only if every bucket has a token for it. Instead of waiting,
+a refused message gets the number of nanoseconds until it would pass, so the
+caller can hold it and try again then.
+"""
+from .clock import monotonic_ns
+
+#------------------------------------------------------------------------------
+
+_NS_PER_SECOND = 1000000000
+
+#------------------------------------------------------------------------------
+
+class TokenBucket:
+
+    __slots__ = ('name', 'rate', 'burst', 'period', '_cost', '_capacity',
+            '_credit', '_last', 'passed', 'throttled')
+
+    def __init__(self, rate, burst=None, period=1.0, name=None):
+        # 'rate' messages every 'period' seconds, bursts of up to 'burst'
+        # (by default 'rate') messages
+        if rate <= 0:
+            raise ValueError('Rate must be positive')
+        if burst is None:
+            burst = rate
+        if burst < 1:
+            raise ValueError('Burst must be at least 1')
+
+        self.name = name
+        self.rate = int(rate)
+        self.burst = int(burst)
+        self.period = period
+
+        self._cost = int(period * _NS_PER_SECOND)
+        self._capacity = self.burst * self._cost
+        # Starts full
+        self._credit = self._capacity
+        self._last = monotonic_ns()
+
+        self.passed = 0
+        self.throttled = 0
+
+    def __repr__(self):
+        return '<TokenBucket {} {}/{}s burst {}>'.format(self.name or '',
+                self.rate, self.period, self.burst)
+
+    def _refill(self, now):
+        elapsed = now - self._last
+        if elapsed > 0:
+            credit = self._credit + elapsed * self.rate
+            self._credit = min(credit, self._capacity)
+            self._last = now
+
+    def wait(self, now):
+        # Nanoseconds until a message can pass, 0 if it can now
+        self._refill(now)
+        missing = self._cost - self._credit
+        if missing <= 0:
+            return 0
+        return -(-missing // self.rate)
+
+    def take(self):
+        # Only after wait() returned 0
+        self._credit -= self._cost
+        self.passed += 1
+
+    def consume(self, now=None):
+        # Take a token if there is one; True if the message may pass
+        if now is None:
+            now = monotonic_ns()
+        if self.wait(now):
+            self.throttled += 1
+            return False
+        self.take()
+        return True
+
+#------------------------------------------------------------------------------
+
+class RateLimiter:
+
+    __slots__ = ('buckets', 'passed', 'throttled')
+
+    def __init__(self, buckets):
+        self.buckets = [bucket for bucket in buckets if bucket is not None]
+        self.passed = 0
+        self.throttled = 0
+
+    def __bool__(self):
+        return bool(self.buckets)
+
+    def acquire(self, now=None):
+        """
+        Take a token from every bucket and return 0, or, if any bucket is
+        empty, take none and return the nanoseconds until all have one.
+        """
+        if now is None:
+            now = monotonic_ns()
+
+        wait = 0
+        for bucket in self.buckets:
+            bucket_wait = bucket.wait(now)
+            if bucket_wait:
+                bucket.throttled += 1
+                if bucket_wait > wait:
+                    wait = bucket_wait
+        if wait:
+            self.throttled += 1
+            return wait
+
+        for bucket in self.buckets:
+            bucket.take()
+        self.passed += 1
+        return 0
+
+    def stats(self):
+        return {
+            'passed': self.passed,
+            'throttled': self.throttled,
+            'buckets': dict((bucket.name, (bucket.passed, bucket.throttled))
+                    for bucket in self.buckets),
+            }
+
+#------------------------------------------------------------------------------
+
+# Venue name: the TokenBucket every session to it shares, in this process
+_venues = {}
+
+def venue_bucket(venue, rate, burst=None, period=1.0):
+    # The first session to a venue sets its limit
+    bucket = _venues.get(venue)
+    if bucket is None:
+        bucket = _venues[venue] = TokenBucket(rate, burst, period,
+                name=venue)
+    return bucket
+
+#------------------------------------------------------------------------------
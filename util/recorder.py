@@ -0,0 +1,115 @@
+"""
+Flight recorder of a session's most recent frames.
+
+A FlightRecorder is a ring of 'slots' fixed size slots in one preallocated
+bytearray, with the metadata in parallel arrays. Recording a frame copies it
+into the next slot, overwriting the oldest, and stores its direction, time,
+processing time and length; nothing is allocated or formatted. Frames longer
+than 'slot_size' keep their first 'slot_size' bytes, and their full length.
+
+The contents are only formatted when dumped, after something went wrong:
+
+    FIX: Flight recorder S-T, MsgSeqNum gap 12 to 15, last 4 frames
+       IN   -2.310ms  proc   18.2us    84B 8=FIX.4.4|9=61|35=8|...
+      OUT   -1.021ms  proc   45.0us    92B 8=FIX.4.4|9=69|35=D|...
+    ...
+
+Times are relative to the newest frame. For inbound frames the processing
+time runs from the data_received call that read the frame to its MsgSeqNum
+check; for outbound frames, from the API command (or composition, for the
+engine's own messages) to the transport write.
+"""
+from array import array
+
+from .wirelog import OUTBOUND
+
+#------------------------------------------------------------------------------
+
+SLOTS = 256
+SLOT_SIZE = 1024
+
+#------------------------------------------------------------------------------
+
+class FlightRecorder:
+
+    __slots__ = ('slots', 'slot_size', '_data', '_view', '_times',
+            '_processing', '_lengths', '_directions', '_next', '_count')
+
+    def __init__(self, slots=SLOTS, slot_size=SLOT_SIZE):
+        if slots < 1 or slot_size < 1:
+            raise ValueError('Slots and slot size must be positive')
+        self.slots = slots
+        self.slot_size = slot_size
+
+        self._data = bytearray(slots * slot_size)
+        self._view = memoryview(self._data)
+        self._times = array('q', bytes(8 * slots))
+        self._processing = array('q', bytes(8 * slots))
+        self._lengths = array('I', bytes(4 * slots))
+        self._directions = bytearray(slots)
+        self._next = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def record(self, direction, frame, time_ns, processing_ns=0):
+        i = self._next
+        length = len(frame)
+        stored = length if length < self.slot_size else self.slot_size
+        offset = i * self.slot_size
+        self._view[offset:offset + stored] = frame[:stored]
+
+        self._times[i] = time_ns
+        self._processing[i] = processing_ns
+        self._lengths[i] = length
+        self._directions[i] = direction
+
+        self._next = i + 1 if i + 1 < self.slots else 0
+        if self._count < self.slots:
+            self._count += 1
+
+    def records(self):
+        # [(direction, time_ns, processing_ns, length, frame bytes), ...]
+        # oldest first; 'frame' is cut at slot_size bytes
+        slots = self.slots
+        first = (self._next - self._count) % slots
+        records = []
+        for n in range(self._count):
+            i = (first + n) % slots
+            offset = i * self.slot_size
+            length = self._lengths[i]
+            stored = length if length < self.slot_size else self.slot_size
+            records.append((self._directions[i], self._times[i],
+                    self._processing[i], length,
+                    bytes(self._data[offset:offset + stored])))
+        return records
+
+    def clear(self):
+        self._next = 0
+        self._count = 0
+
+    def format(self):
+        # The dump lines, oldest first
+        records = self.records()
+        if not records:
+            return []
+        newest = records[-1][1]
+        lines = []
+        for direction, time_ns, processing_ns, length, frame in records:
+            text = frame.replace(b'\x01', b'|').decode('utf-8', 'replace')
+            if len(frame) < length:
+                text += '...'
+            lines.append('{:>5} {:>9.3f}ms  proc {:>8.1f}us {:>6}B {}'.format(
+                    'OUT' if direction == OUTBOUND else 'IN',
+                    (time_ns - newest) / 1e6, processing_ns / 1e3, length,
+                    text))
+        return lines
+
+    def dump(self, log, title):
+        # Log the contents as one WARNING record
+        lines = self.format()
+        log.warning('%s, last %s frames\n%s', title, len(lines),
+                '\n'.join(lines))
+
+#------------------------------------------------------------------------------
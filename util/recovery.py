@@ -0,0 +1,140 @@
+"""
+Inbound sequence gap recovery.
+
+ReorderBuffer sits between message validation and processing. Messages that
+arrive ahead of the expected MsgSeqNum are held, in a ring of 'capacity'
+slots indexed by MsgSeqNum, with a bitmap marking which slots are occupied.
+Once the gap is filled the held messages are released in order.
+
+For each gap 'offer' returns the range to put in a ResendRequest exactly
+once: the highest MsgSeqNum already requested is remembered, and only the
+part of a gap above it is asked for. Messages below the expected MsgSeqNum
+are duplicates when they carry PossDupFlag=Y, and a protocol error when they
+do not.
+"""
+
+#------------------------------------------------------------------------------
+
+# 'offer' results
+IN_ORDER = 0
+BUFFERED = 1
+DUPLICATE = 2
+TOO_LOW = 3
+OVERFLOW = 4
+
+CAPACITY = 4096
+
+#------------------------------------------------------------------------------
+
+class ReorderBuffer:
+
+    __slots__ = ('expected', 'capacity', 'requested_through', 'duplicates',
+            '_slots', '_seen', '_count')
+
+    def __init__(self, expected=1, capacity=CAPACITY):
+        self.expected = expected
+        self.capacity = capacity
+        self.requested_through = expected - 1
+        self.duplicates = 0
+
+        self._slots = [None] * capacity
+        self._seen = bytearray(capacity)
+        self._count = 0
+
+    def __len__(self):
+        # Number of messages held
+        return self._count
+
+    def offer(self, MsgSeqNum, msg, PossDup=False):
+        """
+        Returns (result, ready, resend). 'ready' lists the messages that can
+        now be processed, in order. 'resend' is None, or the (BeginSeqNo,
+        EndSeqNo) to request.
+        """
+        expected = self.expected
+
+        if MsgSeqNum == expected:
+            self.expected = expected + 1
+            ready = [msg]
+            if self._count:
+                self._release(ready)
+            return IN_ORDER, ready, None
+
+        if MsgSeqNum < expected:
+            if PossDup:
+                self.duplicates += 1
+                return DUPLICATE, (), None
+            return TOO_LOW, (), None
+
+        # Ahead of sequence
+        if MsgSeqNum >= expected + self.capacity:
+            # No room to hold it, ask for it again along with the gap
+            result = OVERFLOW
+            last_missing = MsgSeqNum
+        else:
+            slot = MsgSeqNum % self.capacity
+            if self._seen[slot]:
+                self.duplicates += 1
+                return DUPLICATE, (), None
+            self._seen[slot] = 1
+            self._slots[slot] = msg
+            self._count += 1
+            result = BUFFERED
+            last_missing = MsgSeqNum - 1
+
+        resend = None
+        if last_missing > self.requested_through:
+            resend = (max(expected, self.requested_through + 1), last_missing)
+        # Held messages need not be requested either
+        if MsgSeqNum > self.requested_through:
+            self.requested_through = MsgSeqNum
+
+        return result, (), resend
+
+    def advance(self, NewSeqNo):
+        """
+        Skip ahead to NewSeqNo, for a SequenceReset. Held messages below it
+        are discarded; returns the held messages that are now in order.
+        """
+        capacity = self.capacity
+        if self._count:
+            end = min(NewSeqNo, self.expected + capacity)
+            for MsgSeqNum in range(self.expected, end):
+                slot = MsgSeqNum % capacity
+                if self._seen[slot]:
+                    self._seen[slot] = 0
+                    self._slots[slot] = None
+                    self._count -= 1
+
+        if NewSeqNo > self.expected:
+            self.expected = NewSeqNo
+        if self.requested_through < self.expected - 1:
+            self.requested_through = self.expected - 1
+
+        ready = []
+        if self._count:
+            self._release(ready)
+        return ready
+
+    def _release(self, ready):
+        capacity = self.capacity
+        seen = self._seen
+        slots = self._slots
+        expected = self.expected
+        while self._count:
+            slot = expected % capacity
+            if not seen[slot]:
+                break
+            ready.append(slots[slot])
+            slots[slot] = None
+            seen[slot] = 0
+            self._count -= 1
+            expected += 1
+        self.expected = expected
+
+    def clear(self):
+        self._slots = [None] * self.capacity
+        self._seen = bytearray(self.capacity)
+        self._count = 0
+
+#------------------------------------------------------------------------------
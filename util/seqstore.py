@@ -0,0 +1,103 @@
+"""
+Persistent MsgSeqNum store.
+
+Keeps a session's next expected sequence numbers, in both directions, in a
+small memory-mapped file, so the engine can resume after a restart without
+ResetSeqNumFlag. The file holds two fixed-layout slots:
+
+    '<QQQI' generation, local MsgSeqNum, host MsgSeqNum, crc32 of the rest
+
+Updates alternate between the slots and bump the generation, so a crash in
+the middle of an update leaves the other slot intact; loading picks the valid
+slot with the highest generation. An update is a struct.pack_into on the map.
+When it reaches the disk is set by the sync policy: after every update, after
+every N updates, or left to the caller (e.g. a periodic call to sync) and the
+operating system.
+"""
+import os
+import mmap
+import zlib
+import struct
+
+#------------------------------------------------------------------------------
+
+SLOT = struct.Struct('<QQQI')
+SLOT_SIZE = 32
+FILE_SIZE = 2 * SLOT_SIZE
+
+_CRC = struct.Struct('<QQQ')
+
+#------------------------------------------------------------------------------
+
+class SequenceStore:
+
+    __slots__ = ('path', 'sync_every', 'sync_interval', 'local', 'host',
+            '_fd', '_map', '_generation', '_unsynced')
+
+    def __init__(self, path, sync_every=0, sync_interval=None):
+        # sync_every: 1 syncs after every update, N after every N updates, 0
+        # never from update. sync_interval is only recorded here, for the
+        # owner of the event loop to schedule sync with.
+        self.path = path
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        if os.fstat(self._fd).st_size < FILE_SIZE:
+            os.ftruncate(self._fd, FILE_SIZE)
+        self._map = mmap.mmap(self._fd, FILE_SIZE)
+
+        self._generation = 0
+        self.local = 0
+        self.host = 0
+        self._unsynced = 0
+        self._load()
+
+    @classmethod
+    def open(cls, directory, SenderCompID, TargetCompID, **kwargs):
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        name = '{}-{}.seq'.format(SenderCompID.decode('utf-8'),
+                TargetCompID.decode('utf-8'))
+        return cls(os.path.join(directory, name), **kwargs)
+
+    def _load(self):
+        for position in (0, SLOT_SIZE):
+            generation, local, host, crc = SLOT.unpack_from(self._map,
+                    position)
+            if crc != zlib.crc32(_CRC.pack(generation, local, host)):
+                continue
+            if generation >= self._generation:
+                self._generation = generation
+                self.local = local
+                self.host = host
+
+    def update(self, local, host):
+        self.local = local
+        self.host = host
+
+        generation = self._generation + 1
+        self._generation = generation
+        SLOT.pack_into(self._map, (generation & 1) * SLOT_SIZE,
+                generation, local, host,
+                zlib.crc32(_CRC.pack(generation, local, host)))
+
+        if self.sync_every:
+            self._unsynced += 1
+            if self._unsynced >= self.sync_every:
+                self.sync()
+
+    def reset(self):
+        self.update(0, 0)
+        self.sync()
+
+    def sync(self):
+        self._unsynced = 0
+        self._map.flush()
+
+    def close(self):
+        self.sync()
+        self._map.close()
+        os.close(self._fd)
+
+#------------------------------------------------------------------------------
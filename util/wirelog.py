@@ -0,0 +1,377 @@
+"""
+Binary journal of every FIX frame a session sends and receives.
+
+Each session writes numbered segments to its own directory, starting a new
+segment once one reaches 'segment_size' bytes (and every time it is opened):
+
+    <directory>/<SenderCompID>-<TargetCompID>/
+        wire-000001.dat     Segment header, then the records back to back
+        wire-000001.idx     One INDEX entry per record
+        wire-000001.cid     One CLORDID entry, followed by the ClOrdID, per
+                            record with a ClOrdID (11)
+
+    HEADER      '<4sHH'     b'FIXW', format version, length of the session
+                            ID that follows
+    RECORD      '<IBxxxIqq' frame length, direction, MsgSeqNum, monotonic
+                            and wall clock nanoseconds; the frame follows
+    INDEX       '<qQIBxxx'  wall clock nanoseconds, record offset,
+                            MsgSeqNum, direction
+    CLORDID     '<QH'       record offset, ClOrdID length
+
+Writes go through buffered files and reach the disk on flush, on a segment
+change and on close. WireReader maps the segments into memory for queries.
+The first query of each kind builds a segment's lookup table from its index
+file (wall clock times, MsgSeqNums sorted with their entry numbers, or a
+ClOrdID map) and keeps it for the next ones. Run this module to search a
+journal from the command line:
+
+    python -m util.wirelog ./wirelog/SENDER-TARGET --clordid abc123
+    python -m util.wirelog ./wirelog/SENDER-TARGET --seq 1200 --direction out
+    python -m util.wirelog ./wirelog/SENDER-TARGET \\
+            --start 20240102-13:00:00 --end 20240102-13:05:00
+"""
+import os
+import sys
+import mmap
+import struct
+import argparse
+from array import array
+from bisect import bisect_left
+
+#------------------------------------------------------------------------------
+
+HEADER = struct.Struct('<4sHH')
+RECORD = struct.Struct('<IBxxxIqq')
+INDEX = struct.Struct('<qQIBxxx')
+CLORDID = struct.Struct('<QH')
+
+MAGIC = b'FIXW'
+VERSION = 1
+
+INBOUND = 0
+OUTBOUND = 1
+
+SEGMENT_SIZE = 1 << 28
+BUFFER_SIZE = 1 << 20
+
+DIRECTORY = './wirelog/'
+
+_SEGMENT_NAME = 'wire-{:06d}'
+
+#------------------------------------------------------------------------------
+
+def _field(frame, prefix):
+    # Value of the first b'\x01<tag>=' field, or None
+    start = frame.find(prefix)
+    if start == -1:
+        return None
+    start += len(prefix)
+    return frame[start:frame.find(b'\x01', start)]
+
+
+def segment_numbers(directory):
+    # Segment numbers present, in order
+    numbers = []
+    for name in os.listdir(directory):
+        if name.startswith('wire-') and name.endswith('.dat'):
+            try:
+                numbers.append(int(name[5:-4]))
+            except ValueError:
+                pass
+    return sorted(numbers)
+
+#------------------------------------------------------------------------------
+
+class WireJournal:
+
+    def __init__(self, directory, session_id, segment_size=SEGMENT_SIZE):
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        self.directory = directory
+        self.session_id = session_id
+        self.segment_size = segment_size
+
+        numbers = segment_numbers(directory)
+        self.segment = numbers[-1] if numbers else 0
+        self._data = None
+        self._index = None
+        self._clordids = None
+        self._offset = 0
+        self._next_segment()
+
+    @classmethod
+    def open(cls, directory, SenderCompID, TargetCompID, **kwargs):
+        session_id = '{}-{}'.format(SenderCompID.decode('utf-8'),
+                TargetCompID.decode('utf-8'))
+        return cls(os.path.join(directory, session_id), session_id, **kwargs)
+
+    def _next_segment(self):
+        self._close_files()
+        self.segment += 1
+        path = os.path.join(self.directory,
+                _SEGMENT_NAME.format(self.segment))
+
+        self._data = open(path + '.dat', 'wb', buffering=BUFFER_SIZE)
+        self._index = open(path + '.idx', 'wb', buffering=BUFFER_SIZE)
+        self._clordids = open(path + '.cid', 'wb', buffering=BUFFER_SIZE)
+
+        session_id = self.session_id.encode('utf-8')
+        self._data.write(HEADER.pack(MAGIC, VERSION, len(session_id)))
+        self._data.write(session_id)
+        self._offset = HEADER.size + len(session_id)
+
+    def append(self, direction, frame, mono_ns, wall_ns):
+        # 'frame' is one complete message, bytes or a memoryview of one
+        if type(frame) is not bytes:
+            frame = bytes(frame)
+
+        MsgSeqNum = _field(frame, b'\x0134=')
+        try:
+            MsgSeqNum = int(MsgSeqNum) if MsgSeqNum else 0
+        except ValueError:
+            MsgSeqNum = 0
+
+        offset = self._offset
+        self._data.write(RECORD.pack(len(frame), direction, MsgSeqNum,
+                mono_ns, wall_ns))
+        self._data.write(frame)
+        self._index.write(INDEX.pack(wall_ns, offset, MsgSeqNum, direction))
+
+        ClOrdID = _field(frame, b'\x0111=')
+        if ClOrdID:
+            self._clordids.write(CLORDID.pack(offset, len(ClOrdID)))
+            self._clordids.write(ClOrdID)
+
+        self._offset = offset + RECORD.size + len(frame)
+        if self._offset >= self.segment_size:
+            self._next_segment()
+
+    def flush(self):
+        self._data.flush()
+        self._index.flush()
+        self._clordids.flush()
+
+    def _close_files(self):
+        for f in (self._data, self._index, self._clordids):
+            if f is not None:
+                f.close()
+
+    def close(self):
+        self._close_files()
+        self._data = self._index = self._clordids = None
+
+#------------------------------------------------------------------------------
+
+class _Segment:
+
+    __slots__ = ('number', 'session_id', 'data', 'index', 'clordids',
+            '_walls', '_seqs', '_seq_entries', '_clordid_map')
+
+    def __init__(self, directory, number):
+        path = os.path.join(directory, _SEGMENT_NAME.format(number))
+        self.number = number
+        self.data = _map(path + '.dat')
+        self.index = _map(path + '.idx')
+        self.clordids = _map(path + '.cid')
+        self._walls = None
+        self._seqs = None
+        self._seq_entries = None
+        self._clordid_map = None
+
+        magic, version, length = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('{}.dat is not a wire journal segment'.format(
+                    path))
+        self.session_id = bytes(self.data[HEADER.size:HEADER.size + length]
+                ).decode('utf-8')
+
+    def __len__(self):
+        return len(self.index) // INDEX.size
+
+    def entry(self, i):
+        # (wall_ns, offset, MsgSeqNum, direction)
+        return INDEX.unpack_from(self.index, i * INDEX.size)
+
+    def record(self, offset):
+        # (direction, MsgSeqNum, mono_ns, wall_ns, frame)
+        length, direction, MsgSeqNum, mono_ns, wall_ns = \
+                RECORD.unpack_from(self.data, offset)
+        start = offset + RECORD.size
+        if start + length > len(self.data):
+            # Cut short by a crash
+            return None
+        return (direction, MsgSeqNum, mono_ns, wall_ns,
+                self.data[start:start + length])
+
+    def _column(self, typecode, position):
+        # One field of every INDEX entry as an array, 'position' counted in
+        # the field's own size, sliced out of the map without a loop
+        column = array(typecode)
+        count = len(self)
+        if not count:
+            return column
+        step = INDEX.size // column.itemsize
+        with memoryview(self.index) as view:
+            column.frombytes(view[:count * INDEX.size].cast(
+                    typecode)[position::step].tobytes())
+        if sys.byteorder != 'little':
+            column.byteswap()
+        return column
+
+    def walls(self):
+        if self._walls is None:
+            self._walls = self._column('q', 0)
+        return self._walls
+
+    def seq_entries(self, MsgSeqNum):
+        # Entry numbers of 'MsgSeqNum', in the order they were written. The
+        # MsgSeqNums are sorted once, with their entry numbers alongside.
+        if self._seqs is None:
+            seqs = self._column('I', 4)
+            entries = array('I', sorted(range(len(seqs)),
+                    key=seqs.__getitem__))
+            self._seqs = array('I', map(seqs.__getitem__, entries))
+            self._seq_entries = entries
+
+        seqs = self._seqs
+        i = bisect_left(seqs, MsgSeqNum)
+        found = []
+        while i < len(seqs) and seqs[i] == MsgSeqNum:
+            found.append(self._seq_entries[i])
+            i += 1
+        return found
+
+    def clordid_offsets(self, ClOrdID):
+        if self._clordid_map is None:
+            found = {}
+            view = self.clordids
+            position = 0
+            end = len(view) - CLORDID.size
+            while position <= end:
+                offset, length = CLORDID.unpack_from(view, position)
+                position += CLORDID.size
+                key = bytes(view[position:position + length])
+                position += length
+                found.setdefault(key, []).append(offset)
+            self._clordid_map = found
+        return self._clordid_map.get(ClOrdID, ())
+
+
+class _Empty(bytes):
+    # Stands in for the map of an empty file, which mmap refuses
+    def close(self):
+        pass
+
+
+def _map(path):
+    if not os.path.exists(path) or not os.path.getsize(path):
+        return _Empty()
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class WireReader:
+    """
+    Queries over a session's journal directory. Each method yields
+    (direction, MsgSeqNum, mono_ns, wall_ns, frame) records, in the order
+    they were written.
+    """
+
+    def __init__(self, directory, numbers=None):
+        # 'numbers' limits the reader to those segments
+        if numbers is None:
+            numbers = segment_numbers(directory)
+        self.directory = directory
+        self.segments = [_Segment(directory, number) for number in numbers]
+
+    def close(self):
+        for segment in self.segments:
+            for view in (segment.data, segment.index, segment.clordids):
+                view.close()
+
+    def records(self):
+        for segment in self.segments:
+            for i in range(len(segment)):
+                record = segment.record(segment.entry(i)[1])
+                if record is not None:
+                    yield record
+
+    def by_seq(self, MsgSeqNum, direction=None):
+        # Resends and sequence resets can give a MsgSeqNum several records
+        for segment in self.segments:
+            for i in segment.seq_entries(MsgSeqNum):
+                wall_ns, offset, seq, record_direction = segment.entry(i)
+                if direction is None or record_direction == direction:
+                    record = segment.record(offset)
+                    if record is not None:
+                        yield record
+
+    def by_time(self, start_ns, end_ns):
+        # Wall clock time, start_ns <= time < end_ns
+        for segment in self.segments:
+            walls = segment.walls()
+            if not walls or walls[-1] < start_ns or walls[0] >= end_ns:
+                continue
+            for i in range(bisect_left(walls, start_ns), len(walls)):
+                if walls[i] >= end_ns:
+                    break
+                record = segment.record(segment.entry(i)[1])
+                if record is not None:
+                    yield record
+
+    def by_clordid(self, ClOrdID):
+        if type(ClOrdID) is str:
+            ClOrdID = ClOrdID.encode('utf-8')
+        for segment in self.segments:
+            for offset in segment.clordid_offsets(ClOrdID):
+                record = segment.record(offset)
+                if record is not None:
+                    yield record
+
+#------------------------------------------------------------------------------
+
+def _format(record):
+    from datetime import datetime
+    direction, MsgSeqNum, mono_ns, wall_ns, frame = record
+    when = datetime.utcfromtimestamp(wall_ns / 1e9).strftime(
+            '%Y%m%d-%H:%M:%S.%f')
+    return '{} {} {:>8} {}'.format(when,
+            'OUT' if direction == OUTBOUND else 'IN ', MsgSeqNum,
+            bytes(frame).replace(b'\x01', b'|').decode('utf-8', 'replace'))
+
+
+def main(argv=None):
+    from .convert import to_epoch_ns
+
+    parser = argparse.ArgumentParser(description='Search a FIX wire journal')
+    parser.add_argument('directory', help="a session's journal directory")
+    parser.add_argument('--seq', type=int, help='MsgSeqNum')
+    parser.add_argument('--direction', choices=['in', 'out'])
+    parser.add_argument('--clordid', help='ClOrdID (11)')
+    parser.add_argument('--start', help='from UTC time, YYYYMMDD-HH:MM:SS')
+    parser.add_argument('--end', help='until UTC time, YYYYMMDD-HH:MM:SS')
+    args = parser.parse_args(argv)
+
+    direction = {None: None, 'in': INBOUND, 'out': OUTBOUND}[args.direction]
+
+    reader = WireReader(args.directory)
+    if args.clordid is not None:
+        records = reader.by_clordid(args.clordid)
+    elif args.seq is not None:
+        records = reader.by_seq(args.seq, direction)
+    elif args.start or args.end:
+        start = to_epoch_ns(args.start.encode('utf-8')) if args.start else 0
+        end = (to_epoch_ns(args.end.encode('utf-8')) if args.end
+                else 1 << 63)
+        records = reader.by_time(start, end)
+    else:
+        records = reader.records()
+
+    for record in records:
+        if direction is None or record[0] == direction:
+            print(_format(record))
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+#------------------------------------------------------------------------------